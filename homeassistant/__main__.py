@@ -84,6 +84,11 @@ def get_arguments() -> argparse.Namespace:
         action="store_true",
         help="Skips pip install of required packages on startup",
     )
+    parser.add_argument(
+        "--fast-yaml",
+        action="store_true",
+        help="Load YAML files with the libyaml C loader when it is available",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose logging to file."
     )
@@ -305,6 +310,7 @@ def main() -> int:
         log_no_color=args.log_no_color,
         skip_pip=args.skip_pip,
         safe_mode=args.safe_mode,
+        fast_yaml=args.fast_yaml,
         debug=args.debug,
         open_ui=args.open_ui,
     )
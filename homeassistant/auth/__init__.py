@@ -3,6 +3,7 @@ import asyncio
 from collections import OrderedDict
 from datetime import timedelta
 import logging
+from time import time
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 import jwt
@@ -20,10 +21,16 @@ from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 EVENT_USER_ADDED = "user_added"
 EVENT_USER_REMOVED = "user_removed"
 
+# Verified access tokens are cached for a short while to not decode and
+# verify the same token on each request.
+ACCESS_TOKEN_CACHE_SIZE = 256
+ACCESS_TOKEN_CACHE_TTL = 60
+
 _LOGGER = logging.getLogger(__name__)
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
+_CachedToken = Tuple[float, models.RefreshToken]
 
 
 async def auth_manager_from_config(
@@ -146,6 +153,7 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        self._access_token_cache: "OrderedDict[str, _CachedToken]" = OrderedDict()
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -279,6 +287,7 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_invalidate_access_tokens(user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -305,6 +314,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -431,6 +441,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens(refresh_token.user, refresh_token)
 
     @callback
     def async_create_access_token(
@@ -454,6 +465,19 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+        if cached is not None:
+            expires, refresh_token = cached
+            if (
+                time() < expires
+                and refresh_token.user.is_active
+                and await self.async_get_refresh_token(refresh_token.id)
+                is refresh_token
+            ):
+                self._access_token_cache.move_to_end(token)
+                return refresh_token
+            self._access_token_cache.pop(token, None)
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -471,15 +495,33 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        expires = time() + ACCESS_TOKEN_CACHE_TTL
+        if "exp" in claims:
+            expires = min(expires, claims["exp"])
+        self._access_token_cache[token] = (expires, refresh_token)
+        if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+            self._access_token_cache.popitem(last=False)
+
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(
+        self, user: models.User, refresh_token: Optional[models.RefreshToken] = None,
+    ) -> None:
+        """Remove the cached access tokens of a user or one of its refresh tokens."""
+        for token, (_, cached) in list(self._access_token_cache.items()):
+            if cached.user is user and refresh_token in (None, cached):
+                self._access_token_cache.pop(token)
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -36,6 +36,9 @@ class AuthStore:
         self.hass = hass
         self._users: Optional[Dict[str, models.User]] = None
         self._groups: Optional[Dict[str, models.Group]] = None
+        # Indexes of the refresh tokens of all users
+        self._refresh_tokens: Dict[str, models.RefreshToken] = {}
+        self._refresh_tokens_by_token: Dict[str, models.RefreshToken] = {}
         self._perm_lookup: Optional[PermissionLookup] = None
         self._store = hass.helpers.storage.Store(
             STORAGE_VERSION, STORAGE_KEY, private=True
@@ -141,6 +144,8 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        for refresh_token in user.refresh_tokens.values():
+            self._remove_refresh_token_index(refresh_token)
         self._async_schedule_save()
 
     async def async_update_user(
@@ -223,6 +228,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._add_refresh_token_index(refresh_token)
 
         self._async_schedule_save()
         return refresh_token
@@ -235,10 +241,13 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            if user.refresh_tokens.pop(refresh_token.id, None):
-                self._async_schedule_save()
-                break
+        found = self._refresh_tokens.get(refresh_token.id)
+        if found is None:
+            return
+
+        self._remove_refresh_token_index(found)
+        found.user.refresh_tokens.pop(found.id, None)
+        self._async_schedule_save()
 
     async def async_get_refresh_token(
         self, token_id: str
@@ -248,12 +257,7 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        for user in self._users.values():
-            refresh_token = user.refresh_tokens.get(token_id)
-            if refresh_token is not None:
-                return refresh_token
-
-        return None
+        return self._refresh_tokens.get(token_id)
 
     async def async_get_refresh_token_by_token(
         self, token: str
@@ -263,15 +267,29 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        found = self._refresh_tokens_by_token.get(token)
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        # The dictionary lookup compares the tokens only when their hashes
+        # match, which are randomized per process. Compare them once more in
+        # constant time before handing out the refresh token.
+        if found is None or not hmac.compare_digest(found.token, token):
+            return None
 
         return found
 
+    @callback
+    def _add_refresh_token_index(self, refresh_token: models.RefreshToken) -> None:
+        """Add a refresh token to the indexes."""
+        self._refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_tokens_by_token[refresh_token.token] = refresh_token
+
+    @callback
+    def _remove_refresh_token_index(self, refresh_token: models.RefreshToken) -> None:
+        """Remove a refresh token from the indexes."""
+        self._refresh_tokens.pop(refresh_token.id, None)
+        if self._refresh_tokens_by_token.get(refresh_token.token) is refresh_token:
+            self._refresh_tokens_by_token.pop(refresh_token.token)
+
     @callback
     def async_log_refresh_token_usage(
         self, refresh_token: models.RefreshToken, remote_ip: Optional[str] = None
@@ -471,6 +489,7 @@ class AuthStore:
                 last_used_ip=rt_dict.get("last_used_ip"),
             )
             users[rt_dict["user_id"]].refresh_tokens[token.id] = token
+            self._add_refresh_token_index(token)
 
         self._groups = groups
         self._users = users
@@ -557,6 +576,8 @@ class AuthStore:
     def _set_defaults(self) -> None:
         """Set default values for auth store."""
         self._users = OrderedDict()
+        self._refresh_tokens = {}
+        self._refresh_tokens_by_token = {}
 
         groups: Dict[str, models.Group] = OrderedDict()
         admin_group = _system_admin_group()
@@ -2,13 +2,14 @@
 import asyncio
 import contextlib
 from datetime import datetime
+import importlib
 import logging
 import logging.handlers
 import os
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 import voluptuous as vol
 import yarl
@@ -16,21 +17,24 @@ import yarl
 from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     REQUIRED_NEXT_PYTHON_DATE,
     REQUIRED_NEXT_PYTHON_VER,
 )
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_per_platform
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_freeze_setup_report,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
 from homeassistant.util.logging import async_activate_log_queue_handler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
-from homeassistant.util.yaml import clear_secret_cache
+from homeassistant.util.yaml import clear_secret_cache, enable_fast_loader
 
 if TYPE_CHECKING:
     from .runner import RuntimeConfig
@@ -41,8 +45,12 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
+# hass.data key for the seconds it took to import each integration.
+DATA_IMPORT_TIMES = "bootstrap_import_times"
 
 LOG_SLOW_STARTUP_INTERVAL = 60
+LOG_SLOW_IMPORTS = 10
+LOG_SLOW_SETUPS = 10
 
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
@@ -95,6 +103,9 @@ async def async_setup_hass(
             "Skipping pip installation of required modules. This may cause issues"
         )
 
+    if runtime_config.fast_yaml and not enable_fast_loader():
+        _LOGGER.warning("libyaml is not available, loading YAML files with Python")
+
     if not await conf_util.async_ensure_config_exists(hass):
         _LOGGER.error("Error getting configuration path")
         return None
@@ -420,6 +431,78 @@ async def async_setup_multi_components(
         )
 
 
+def _import_modules(names: List[str]) -> float:
+    """Import modules and return how long it took.
+
+    This method needs to run in an executor.
+    """
+    start = monotonic()
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except Exception:  # pylint: disable=broad-except
+            # Setting up the integration will report the error, its
+            # requirements may also not have been installed yet.
+            _LOGGER.debug("Unable to import %s ahead of setup", name, exc_info=True)
+    return monotonic() - start
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    integrations: Dict[str, loader.Integration],
+    config: Dict[str, Any],
+) -> None:
+    """Import integrations and their configured platforms in the executor.
+
+    Setting up an integration imports it inside the event loop. Importing
+    them in parallel ahead of time turns that into a sys.modules lookup.
+    """
+    modules = {
+        domain: [integration.pkg_path] for domain, integration in integrations.items()
+    }
+
+    platforms = {
+        (platform_name, domain)
+        for domain in integrations
+        for platform_name, _ in config_per_platform(config, domain)
+        if isinstance(platform_name, str)
+    }
+    platform_integrations = await asyncio.gather(
+        *(
+            loader.async_get_integration(hass, platform_name)
+            for platform_name, _ in platforms
+        ),
+        return_exceptions=True,
+    )
+    for (_, domain), integration in zip(platforms, platform_integrations):
+        if isinstance(integration, loader.Integration):
+            modules.setdefault(integration.domain, [integration.pkg_path]).append(
+                f"{integration.pkg_path}.{domain}"
+            )
+
+    import_times = hass.data[DATA_IMPORT_TIMES] = dict(
+        zip(
+            modules,
+            await asyncio.gather(
+                *(
+                    hass.async_add_executor_job(_import_modules, names)
+                    for names in modules.values()
+                )
+            ),
+        )
+    )
+
+    slowest = sorted(import_times.items(), key=lambda item: item[1], reverse=True)
+    _LOGGER.info(
+        "Imported %s integrations, slowest: %s",
+        len(import_times),
+        ", ".join(
+            f"{domain} ({duration:.2f}s)"
+            for domain, duration in slowest[:LOG_SLOW_IMPORTS]
+        ),
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: Dict[str, Any]
 ) -> None:
@@ -467,6 +550,11 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Kick off importing the integrations ahead of their setup
+    hass.async_create_task(
+        _async_preimport_integrations(hass, integration_cache, config)
+    )
+
     logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
 
     # Load logging as soon as possible
@@ -546,3 +634,37 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+
+    @core.callback
+    def _async_started(_event: core.Event) -> None:
+        """Keep the setup report of the startup."""
+        _async_log_setup_report(hass)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_started)
+
+
+@core.callback
+def _async_log_setup_report(hass: core.HomeAssistant) -> None:
+    """Freeze the setup report and log its critical path and slowest setups."""
+    report = async_freeze_setup_report(hass)
+    integrations = report["integrations"]
+    if not integrations:
+        return
+
+    def describe(domain: str) -> str:
+        """Describe the time taken by an integration and its slowest phase."""
+        timing = integrations[domain]
+        took = timing["finished"] - timing["started"]
+        if not timing["phases"]:
+            return f"{domain} ({took:.2f}s)"
+        phase = max(timing["phases"], key=timing["phases"].get)
+        return f"{domain} ({took:.2f}s, {phase} {timing['phases'][phase]:.2f}s)"
+
+    slowest = sorted(
+        integrations, key=lambda domain: integrations[domain]["busy"], reverse=True
+    )
+    _LOGGER.info(
+        "Setup critical path: %s; slowest integrations: %s",
+        " -> ".join(describe(domain) for domain in report["critical_path"]),
+        ", ".join(describe(domain) for domain in slowest[:LOG_SLOW_SETUPS]),
+    )
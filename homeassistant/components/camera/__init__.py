@@ -4,6 +4,7 @@ import base64
 import collections
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 import hashlib
 import logging
 from random import SystemRandom
@@ -50,6 +51,7 @@ from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
+from .broker import FrameBroker
 from .const import DATA_CAMERA_PREFS, DOMAIN
 from .prefs import CameraPreferences
 
@@ -153,7 +155,7 @@ async def async_get_image(hass, entity_id, timeout=10):
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await camera.frame_broker.async_get_frame()
 
             if image:
                 return Image(camera.content_type, image)
@@ -330,6 +332,7 @@ class Camera(Entity):
         self.stream_options = {}
         self.content_type = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
+        self.frame_broker = FrameBroker(self)
         self.async_update_token()
 
     @property
@@ -386,9 +389,13 @@ class Camera(Entity):
 
     async def handle_async_still_stream(self, request, interval):
         """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        with self.frame_broker.async_watch(interval):
+            return await async_get_still_stream(
+                request,
+                partial(self.frame_broker.async_get_frame, interval),
+                self.content_type,
+                interval,
+            )
 
     async def handle_async_mjpeg_stream(self, request):
         """Serve an HTTP MJPEG stream from the camera.
@@ -513,7 +520,7 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
-                image = await camera.async_camera_image()
+                image = await camera.frame_broker.async_get_frame()
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
@@ -0,0 +1,82 @@
+"""Share camera frames between the consumers of a camera."""
+import asyncio
+from contextlib import contextmanager
+from time import monotonic
+from typing import TYPE_CHECKING, Generator, List, Optional
+
+import async_timeout
+
+from homeassistant.core import callback
+
+if TYPE_CHECKING:
+    from . import Camera
+
+# A fetch that takes longer is given up so the next consumer starts a new one
+FETCH_TIMEOUT = 10
+
+
+class FrameBroker:
+    """Fetch frames of a camera once and hand them out to all consumers.
+
+    Consumers that ask for a frame while one is being fetched wait for that
+    fetch instead of starting their own. The latest frame is kept so MJPEG
+    streams that poll at an interval share frames that are less than one
+    interval old. While streams are watched, still images are served from
+    the latest frame too. The camera is only polled on behalf of consumers,
+    so nothing is fetched when nobody is watching.
+    """
+
+    def __init__(self, camera: "Camera") -> None:
+        """Initialize the frame broker."""
+        self.camera = camera
+        self._frame: Optional[bytes] = None
+        self._frame_time = 0.0
+        self._fetch: Optional[asyncio.Task] = None
+        self._stream_intervals: List[float] = []
+
+    @property
+    def still_max_age(self) -> float:
+        """Return how old a frame served as a still image can be."""
+        return min(self._stream_intervals, default=0)
+
+    async def async_get_frame(self, max_age: Optional[float] = None) -> Optional[bytes]:
+        """Return a frame that is at most max_age seconds old."""
+        if max_age is None:
+            max_age = self.still_max_age
+
+        if self._frame is not None and monotonic() - self._frame_time <= max_age:
+            return self._frame
+
+        if self._fetch is None:
+            self._fetch = self.camera.hass.async_create_task(self._async_fetch())
+            self._fetch.add_done_callback(self._async_fetch_done)
+
+        # A consumer that times out should not cancel the fetch of the others
+        return await asyncio.shield(self._fetch)
+
+    @contextmanager
+    def async_watch(self, interval: float) -> Generator[None, None, None]:
+        """Register a stream of frames at an interval while in the block."""
+        self._stream_intervals.append(interval)
+        try:
+            yield
+        finally:
+            self._stream_intervals.remove(interval)
+            if not self._stream_intervals:
+                self._frame = None
+
+    async def _async_fetch(self) -> Optional[bytes]:
+        """Fetch a frame from the camera."""
+        async with async_timeout.timeout(FETCH_TIMEOUT):
+            frame = await self.camera.async_camera_image()
+        if frame:
+            self._frame = frame
+            self._frame_time = monotonic()
+        return frame
+
+    @callback
+    def _async_fetch_done(self, task: asyncio.Task) -> None:
+        """Allow a new fetch and consume errors nobody waited for."""
+        self._fetch = None
+        if not task.cancelled():
+            task.exception()
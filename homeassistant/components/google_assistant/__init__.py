@@ -21,11 +21,13 @@ from .const import (
     CONF_PRIVATE_KEY,
     CONF_PROJECT_ID,
     CONF_REPORT_STATE,
+    CONF_REPORT_STATE_WINDOW,
     CONF_ROOM_HINT,
     CONF_SECURE_DEVICES_PIN,
     CONF_SERVICE_ACCOUNT,
     DEFAULT_EXPOSE_BY_DEFAULT,
     DEFAULT_EXPOSED_DOMAINS,
+    DEFAULT_REPORT_STATE_WINDOW,
     DOMAIN,
     SERVICE_REQUEST_SYNC,
 )
@@ -78,6 +80,9 @@ GOOGLE_ASSISTANT_SCHEMA = vol.All(
             # str on purpose, makes sure it is configured correctly.
             vol.Optional(CONF_SECURE_DEVICES_PIN): str,
             vol.Optional(CONF_REPORT_STATE, default=False): cv.boolean,
+            vol.Optional(
+                CONF_REPORT_STATE_WINDOW, default=DEFAULT_REPORT_STATE_WINDOW
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
             vol.Optional(CONF_SERVICE_ACCOUNT): GOOGLE_SERVICE_ACCOUNT,
         },
         extra=vol.PREVENT_EXTRA,
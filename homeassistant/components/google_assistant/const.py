@@ -35,11 +35,14 @@ CONF_ROOM_HINT = "room"
 CONF_ALLOW_UNLOCK = "allow_unlock"
 CONF_SECURE_DEVICES_PIN = "secure_devices_pin"
 CONF_REPORT_STATE = "report_state"
+CONF_REPORT_STATE_WINDOW = "report_state_window"
 CONF_SERVICE_ACCOUNT = "service_account"
 CONF_CLIENT_EMAIL = "client_email"
 CONF_PRIVATE_KEY = "private_key"
 
 DEFAULT_EXPOSE_BY_DEFAULT = True
+# Seconds to collect state changes before reporting them to Google together
+DEFAULT_REPORT_STATE_WINDOW = 1
 DEFAULT_EXPOSED_DOMAINS = [
     "climate",
     "cover",
@@ -25,6 +25,7 @@ from . import trait
 from .const import (
     CONF_ALIASES,
     CONF_ROOM_HINT,
+    DEFAULT_REPORT_STATE_WINDOW,
     DEVICE_CLASS_TO_GOOGLE_TYPES,
     DOMAIN,
     DOMAIN_TO_GOOGLE_TYPES,
@@ -50,6 +51,8 @@ class AbstractConfig(ABC):
         self._store = None
         self._google_sync_unsub = {}
         self._local_sdk_active = False
+        # Counters of the state reports, set while reporting state
+        self.report_state_stats = None
 
     async def async_initialize(self):
         """Perform async initialization of config."""
@@ -86,6 +89,11 @@ class AbstractConfig(ABC):
         """Return if states should be proactively reported."""
         return False
 
+    @property
+    def report_state_window(self):
+        """Return the seconds to collect state changes before reporting them."""
+        return DEFAULT_REPORT_STATE_WINDOW
+
     @property
     def local_sdk_webhook_id(self):
         """Return the local SDK webhook ID.
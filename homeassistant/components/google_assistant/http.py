@@ -23,8 +23,10 @@ from .const import (
     CONF_EXPOSED_DOMAINS,
     CONF_PRIVATE_KEY,
     CONF_REPORT_STATE,
+    CONF_REPORT_STATE_WINDOW,
     CONF_SECURE_DEVICES_PIN,
     CONF_SERVICE_ACCOUNT,
+    DEFAULT_REPORT_STATE_WINDOW,
     GOOGLE_ASSISTANT_API_ENDPOINT,
     HOMEGRAPH_SCOPE,
     HOMEGRAPH_TOKEN_URL,
@@ -97,6 +99,11 @@ class GoogleConfig(AbstractConfig):
         """Return if states should be proactively reported."""
         return self._config.get(CONF_REPORT_STATE)
 
+    @property
+    def report_state_window(self):
+        """Return the seconds to collect state changes before reporting them."""
+        return self._config.get(CONF_REPORT_STATE_WINDOW, DEFAULT_REPORT_STATE_WINDOW)
+
     def should_expose(self, state) -> bool:
         """Return if entity should be exposed."""
         expose_by_default = self._config.get(CONF_EXPOSE_BY_DEFAULT)
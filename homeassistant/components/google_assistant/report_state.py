@@ -1,5 +1,8 @@
 """Google Report State implementation."""
 import logging
+from typing import Any, Dict
+
+import attr
 
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import HomeAssistant, callback
@@ -16,15 +19,56 @@ INITIAL_REPORT_DELAY = 60
 _LOGGER = logging.getLogger(__name__)
 
 
+@attr.s(slots=True)
+class ReportStateStats:
+    """Counters of the state changes reported to Google."""
+
+    changes: int = attr.ib(default=0)
+    reports: int = attr.ib(default=0)
+
+    @property
+    def calls_saved(self) -> int:
+        """Return the number of calls saved by batching state changes."""
+        return self.changes - self.reports
+
+
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
     """Enable state reporting."""
+    # Last serialized state reported to Google per entity
+    reported: Dict[str, Any] = {}
+    # State changes that are waiting to be reported
+    pending: Dict[str, Any] = {}
+    unsub_flush = None
+    stats = google_config.report_state_stats = ReportStateStats()
+
+    async def async_flush_pending(_now):
+        """Report all pending state changes to Google at once."""
+        nonlocal unsub_flush
+        unsub_flush = None
+        states = dict(pending)
+        pending.clear()
+
+        stats.reports += 1
+        _LOGGER.debug("Reporting state for %s", states)
+
+        try:
+            await google_config.async_report_state_all({"devices": {"states": states}})
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error reporting state for %s", list(states))
+            return
+
+        reported.update(states)
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_flush
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
             return
 
         if not new_state:
+            reported.pop(changed_entity, None)
             return
 
         if not google_config.should_expose(new_state):
@@ -41,18 +85,27 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
+        # Compare with the pending or last reported state to serialize the
+        # old state only for entities that were not reported yet
+        old_data = pending.get(changed_entity, reported.get(changed_entity))
+        if old_data is None and old_state:
             old_entity = GoogleEntity(hass, google_config, old_state)
+            try:
+                old_data = old_entity.query_serialize()
+            except SmartHomeError:
+                pass
 
-            # Only report to Google if data that Google cares about has changed
-            if entity_data == old_entity.query_serialize():
-                return
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == old_data:
+            return
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        pending[changed_entity] = entity_data
+        stats.changes += 1
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        if unsub_flush is None:
+            unsub_flush = async_call_later(
+                hass, google_config.report_state_window, async_flush_pending
+            )
 
     async def inital_report(_now):
         """Report initially all states."""
@@ -71,9 +124,20 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             return
 
         await google_config.async_report_state_all({"devices": {"states": entities}})
+        reported.update(entities)
 
     async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_listener = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def async_unsub():
+        """Stop reporting state."""
+        unsub_listener()
+        if unsub_flush is not None:
+            unsub_flush()
+        pending.clear()
+
+    return async_unsub
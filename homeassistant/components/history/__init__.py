@@ -15,10 +15,18 @@ import voluptuous as vol
 from homeassistant.components import recorder
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
+from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_5MINUTE_DURATION,
+    PERIOD_HOUR,
+    PERIOD_HOUR_DURATION,
+    statistics_during_period_with_session,
+)
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
     CONF_DOMAINS,
@@ -41,6 +49,10 @@ CONF_ORDER = "use_include_order"
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
 
+# Requests for entities over a longer range are served from statistics
+STATISTICS_MIN_RANGE = timedelta(days=3)
+STATISTICS_HOURLY_MIN_RANGE = timedelta(days=14)
+
 # Not reusing from entityfilter because history does not support glob filtering
 _FILTER_SCHEMA_INNER = vol.Schema(
     {
@@ -81,7 +93,9 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # Attributes are either deduplicated or inline for rows from before
+    # the state_attributes table existed
+    func.coalesce(StateAttributes.shared_attrs, States.attributes).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
@@ -89,6 +103,13 @@ QUERY_STATES = [
 HISTORY_BAKERY = "history_bakery"
 
 
+def _query_states(session):
+    """Return a query for states with their attributes joined in."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
     with session_scope(hass=hass) as session:
@@ -115,9 +136,7 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -163,9 +182,7 @@ def _get_significant_states(
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -178,7 +195,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -199,13 +218,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](_query_states)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -266,7 +285,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -309,9 +328,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -415,6 +432,72 @@ def _sorted_states_to_json(
     return {key: val for key, val in result.items() if val}
 
 
+def _get_statistics_states(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    include_start_time_state=True,
+    minimal_response=False,
+):
+    """Return the long term statistics of entities as states.
+
+    Only entities with statistics from the start of the range are returned,
+    together with the end of their last statistics period. The mean of each
+    period is used as the state, the min and max are added to the attributes.
+    """
+    if end_time - start_time >= STATISTICS_HOURLY_MIN_RANGE:
+        period, duration = PERIOD_HOUR, PERIOD_HOUR_DURATION
+    else:
+        period, duration = PERIOD_5MINUTE, PERIOD_5MINUTE_DURATION
+
+    statistics = statistics_during_period_with_session(
+        session, start_time, end_time, entity_ids, period
+    )
+
+    result = {}
+    statistics_end = {}
+    for entity_id, entity_statistics in statistics.items():
+        if entity_statistics[0]["start"] > start_time + duration:
+            # Statistics have not been compiled for the whole range yet
+            continue
+
+        current_state = hass.states.get(entity_id)
+        attributes = dict(current_state.attributes) if current_state else {}
+        ent_results = result[entity_id] = []
+        statistics_end[entity_id] = entity_statistics[-1]["start"] + duration
+
+        for idx, stat in enumerate(entity_statistics):
+            state = str(stat["mean"])
+            stat_start = stat["start"]
+            if idx == 0 and include_start_time_state:
+                stat_start = start_time
+
+            if minimal_response and 0 < idx < len(entity_statistics) - 1:
+                ent_results.append(
+                    {
+                        STATE_KEY: state,
+                        LAST_CHANGED_KEY: process_timestamp_to_utc_isoformat(
+                            stat_start
+                        ),
+                    }
+                )
+                continue
+
+            ent_results.append(
+                State(
+                    entity_id,
+                    state,
+                    {**attributes, "min": stat["min"], "max": stat["max"]},
+                    stat_start,
+                    stat_start,
+                )
+            )
+
+    return result, statistics_end
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = get_states(hass, utc_point_in_time, (entity_id,), run)
@@ -522,19 +605,65 @@ class HistoryPeriodView(HomeAssistantView):
         timer_start = time.perf_counter()
 
         with session_scope(hass=hass) as session:
-            result = _get_significant_states(
-                hass,
-                session,
-                start_time,
-                end_time,
-                entity_ids,
-                self.filters,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-            )
+            statistics = {}
+            if entity_ids and end_time - start_time >= STATISTICS_MIN_RANGE:
+                statistics, statistics_end = _get_statistics_states(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    minimal_response,
+                )
+                state_entity_ids = [
+                    entity_id for entity_id in entity_ids if entity_id not in statistics
+                ]
+
+                # Fill in the recent states that are not compiled yet
+                entities_by_end = defaultdict(list)
+                for entity_id, stats_end in statistics_end.items():
+                    entities_by_end[stats_end].append(entity_id)
+                for stats_end, end_entity_ids in entities_by_end.items():
+                    if stats_end >= end_time:
+                        continue
+                    recent = _get_significant_states(
+                        hass,
+                        session,
+                        stats_end,
+                        end_time,
+                        end_entity_ids,
+                        self.filters,
+                        False,
+                        significant_changes_only,
+                        minimal_response,
+                    )
+                    for entity_id, states in recent.items():
+                        statistics[entity_id].extend(states)
+            else:
+                state_entity_ids = entity_ids
+
+            result = {}
+            if state_entity_ids or not entity_ids:
+                result = _get_significant_states(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    state_entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                )
 
-        result = list(result.values())
+        if statistics:
+            result.update(statistics)
+            result = [
+                result[entity_id] for entity_id in entity_ids if entity_id in result
+            ]
+        else:
+            result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
             _LOGGER.debug("Extracted %d states in %fs", sum(map(len, result)), elapsed)
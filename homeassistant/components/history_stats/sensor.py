@@ -1,5 +1,7 @@
 """Component to make instant statistics about your history."""
+from collections import deque
 import datetime
+from itertools import islice
 import logging
 import math
 
@@ -118,6 +120,14 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # Timestamps at which the entity entered or left the tracked state,
+        # the first entry holds the state at the start of the loaded period.
+        self._history = None
+        self._loaded_start = None
+        # State changes seen on the bus, handed over to update() which owns
+        # _history and runs in the executor.
+        self._pending = deque()
+
         @callback
         def start_refresh(*args):
             """Register state tracking."""
@@ -127,8 +137,14 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(event):
+                """Record the state change and refresh."""
+                self._async_record_state_change(event)
+                force_refresh()
+
             force_refresh()
-            async_track_state_change_event(self.hass, [self._entity_id], force_refresh)
+            async_track_state_change_event(self.hass, [self._entity_id], state_changed)
 
         # Delay first refresh to keep startup fast
         hass.bus.listen_once(EVENT_HOMEASSISTANT_START, start_refresh)
@@ -209,25 +225,29 @@ class HistoryStatsSensor(Entity):
             # Don't compute anything as the value cannot have changed
             return
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
+        if self._history is None or start_timestamp < self._loaded_start:
+            # The period jumped back, the changes we kept do not cover it
+            if not self._load_history(start, end, start_timestamp):
+                return
+        else:
+            self._merge_pending(self._history[-1][0])
 
-        if self._entity_id not in history_list.keys():
-            return
+        # Drop the changes that happened before the period started, keeping
+        # the last one of them as the state at the start
+        history_list = self._history
+        while len(history_list) > 1 and history_list[1][0] <= start_timestamp:
+            history_list.popleft()
+        self._loaded_start = start_timestamp
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state == self._entity_state
+        last_state = history_list[0][1]
         last_time = start_timestamp
         elapsed = 0
         count = 0
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state == self._entity_state
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in islice(history_list, 1, None):
+            if current_time > end_timestamp:
+                break
 
             if last_state:
                 elapsed += current_time - last_time
@@ -248,6 +268,51 @@ class HistoryStatsSensor(Entity):
         # Save counter
         self.count = count
 
+    def _load_history(self, start, end, start_timestamp):
+        """Load the state changes of the period from the database."""
+        history_list = history.state_changes_during_period(
+            self.hass, start, end, str(self._entity_id)
+        )
+
+        if self._entity_id not in history_list.keys():
+            return False
+
+        # Get the first state
+        last_state = history.get_state(self.hass, start, self._entity_id)
+        last_state = last_state is not None and last_state == self._entity_state
+        self._history = deque([(start_timestamp, last_state)])
+        for item in history_list.get(self._entity_id):
+            self._history.append(
+                (item.last_changed.timestamp(), item.state == self._entity_state)
+            )
+        self._loaded_start = start_timestamp
+
+        # Changes seen on the bus may already have been recorded
+        self._merge_pending(self._history[-1][0])
+        return True
+
+    def _merge_pending(self, after):
+        """Move the state changes seen on the bus since after to _history."""
+        while self._pending:
+            changed = self._pending.popleft()
+            if changed[0] > after:
+                self._history.append(changed)
+                after = changed[0]
+
+    @callback
+    def _async_record_state_change(self, event):
+        """Queue a state change of the tracked entity for the next update."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if new_state is None or (
+            old_state is not None and old_state.state == new_state.state
+        ):
+            return
+
+        self._pending.append(
+            (new_state.last_changed.timestamp(), new_state.state == self._entity_state,)
+        )
+
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
         start = None
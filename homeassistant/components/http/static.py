@@ -1,22 +1,275 @@
 """Static file handling for HTTP component."""
+import asyncio
+from collections import OrderedDict
+from email.utils import formatdate
+import mimetypes
 from pathlib import Path
+from time import monotonic
+from typing import Dict, Optional, Tuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
-from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
+from aiohttp.web import FileResponse, Response
+from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound, HTTPNotModified
 from aiohttp.web_urldispatcher import StaticResource
+import attr
+from multidict import CIMultiDict
 
 # mypy: allow-untyped-defs
 
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Precompressed variants, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Resolved files are checked on disk again after this many seconds
+REVALIDATE_TIME = 10
+# The cache is shared by all static resources
+MAX_CACHED_FILES = 1024
+# Files up to this size are kept in memory, up to MAX_CACHED_BYTES in total
+MAX_CACHED_FILE_SIZE = 256 * 1024
+MAX_CACHED_BYTES = 16 * 1024 * 1024
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Parse an Accept-Encoding header into the codings and their quality."""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+class _VariantFileResponse(FileResponse):
+    """File response that serves the given variant of a file as is."""
+
+    async def prepare(self, request):
+        """Prepare the response without the .gz lookup of FileResponse.
+
+        FileResponse serves the .gz sibling of a file to any client that
+        mentions gzip, even with a quality of 0 or for a range request.
+        """
+        if hdrs.ACCEPT_ENCODING in request.headers:
+            headers = CIMultiDict(request.headers)
+            del headers[hdrs.ACCEPT_ENCODING]
+            request = request.clone(headers=headers)
+        return await super().prepare(request)
+
+
+@attr.s(slots=True)
+class StaticFile:
+    """A resolved static file and its precompressed variants."""
+
+    etag: str = attr.ib()
+    last_modified: float = attr.ib()
+    content_type: str = attr.ib()
+    # Content encoding (None for the file itself) -> path of the variant
+    variants: Dict[Optional[str], Path] = attr.ib()
+    # Content encoding -> content of the variants that are small enough
+    bodies: Dict[Optional[str], bytes] = attr.ib()
+    checked: float = attr.ib(factory=monotonic)
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes kept in memory."""
+        return sum(len(body) for body in self.bodies.values())
+
+    def is_not_modified(self, request) -> bool:
+        """Return if the client has the current version of the file."""
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match is not None:
+            etags = {tag.strip().lstrip("W/") for tag in if_none_match.split(",")}
+            return "*" in etags or self.etag in etags
+
+        modified_since = request.if_modified_since
+        return (
+            modified_since is not None
+            and self.last_modified <= modified_since.timestamp()
+        )
+
+    def preferred_encoding(self, accept_encoding: str) -> Optional[str]:
+        """Return the encoding of the variant to serve, None for the file itself.
+
+        The accepted variant with the highest quality is preferred, in the
+        order of ENCODINGS for equal qualities.
+        """
+        accepted = _accepted_encodings(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        quality, encoding = max(
+            (
+                (accepted.get(encoding, wildcard), encoding)
+                for encoding in self.variants
+                if encoding is not None
+            ),
+            key=lambda variant: variant[0],
+            default=(0.0, None),
+        )
+        return encoding if quality > 0 else None
+
+    def response(self, request, chunk_size: int):
+        """Return the response for a request of the file."""
+        headers = {**CACHE_HEADERS, hdrs.ETAG: self.etag}
+        if len(self.variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+
+        if self.is_not_modified(request):
+            raise HTTPNotModified(headers=headers)
+
+        # Ranges refer to the file itself, FileResponse handles them
+        if hdrs.RANGE in request.headers:
+            return _VariantFileResponse(
+                self.variants[None],
+                chunk_size=chunk_size,
+                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
+                headers=headers,  # type: ignore
+            )
+
+        encoding = self.preferred_encoding(
+            request.headers.get(hdrs.ACCEPT_ENCODING, "")
+        )
+        headers[hdrs.CONTENT_TYPE] = self.content_type
+        if encoding is not None:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+
+        body = self.bodies.get(encoding)
+        if body is None:
+            return _VariantFileResponse(
+                self.variants[encoding],
+                chunk_size=chunk_size,
+                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
+                headers=headers,  # type: ignore
+            )
+
+        headers[hdrs.LAST_MODIFIED] = formatdate(self.last_modified, usegmt=True)
+        return Response(body=body, headers=headers)
+
+
+def _load_static_file(filepath: Path, previous: Optional[StaticFile]) -> StaticFile:
+    """Stat a file and its precompressed variants and read the small ones.
+
+    This method needs to run in an executor.
+    """
+    stat = filepath.stat()
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    if previous is not None and previous.etag == etag:
+        previous.checked = monotonic()
+        return previous
+
+    variants: Dict[Optional[str], Path] = {None: filepath}
+    sizes: Dict[Optional[str], int] = {None: stat.st_size}
+    for encoding, suffix in ENCODINGS:
+        variant = filepath.with_name(filepath.name + suffix)
+        if variant.is_file():
+            variants[encoding] = variant
+            sizes[encoding] = variant.stat().st_size
+
+    content_type, _ = mimetypes.guess_type(str(filepath))
+    return StaticFile(
+        etag,
+        stat.st_mtime,
+        content_type or "application/octet-stream",
+        variants,
+        {
+            encoding: variant.read_bytes()
+            for encoding, variant in variants.items()
+            if sizes[encoding] <= MAX_CACHED_FILE_SIZE
+        },
+    )
+
+
+class StaticFileCache:
+    """Bounded cache of resolved static files, least recently used first."""
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._files: "OrderedDict[Tuple[Path, str], StaticFile]" = OrderedDict()
+        self._cached_bytes = 0
+
+    def get(self, key: Tuple[Path, str]) -> Optional[StaticFile]:
+        """Return a cached static file and mark it as used."""
+        static_file = self._files.get(key)
+        if static_file is not None:
+            self._files.move_to_end(key)
+        return static_file
+
+    def remember(self, key: Tuple[Path, str], static_file: StaticFile) -> None:
+        """Cache a static file, evicting the least recently used ones."""
+        self.forget(key)
+        self._files[key] = static_file
+        self._cached_bytes += static_file.size
+
+        while (
+            len(self._files) > MAX_CACHED_FILES or self._cached_bytes > MAX_CACHED_BYTES
+        ):
+            _, evicted = self._files.popitem(last=False)
+            self._cached_bytes -= evicted.size
+
+    def forget(self, key: Tuple[Path, str]) -> None:
+        """Remove a static file from the cache."""
+        static_file = self._files.pop(key, None)
+        if static_file is not None:
+            self._cached_bytes -= static_file.size
+
+
+STATIC_FILE_CACHE = StaticFileCache()
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Resolved files are kept in a bounded cache shared by all resources
+    together with the content of the small ones, so hot files are served
+    and conditional requests are answered without touching the disk.
+    Precompressed .br and .gz siblings of a file are served to clients that
+    accept them.
+    """
 
     async def _handle(self, request):
         rel_url = request.match_info["filename"]
+        key = (self._directory, rel_url)
+        static_file = STATIC_FILE_CACHE.get(key)
+
+        if static_file is None or monotonic() - static_file.checked > REVALIDATE_TIME:
+            try:
+                filepath, is_file = await asyncio.get_running_loop().run_in_executor(
+                    None, self._resolve, rel_url, request.app.logger
+                )
+            except HTTPNotFound:
+                STATIC_FILE_CACHE.forget(key)
+                raise
+
+            # on opening a dir, load its contents if allowed
+            if not is_file:
+                STATIC_FILE_CACHE.forget(key)
+                return await super()._handle(request)
+
+            try:
+                static_file = await asyncio.get_running_loop().run_in_executor(
+                    None, _load_static_file, filepath, static_file
+                )
+            except FileNotFoundError as error:
+                STATIC_FILE_CACHE.forget(key)
+                raise HTTPNotFound() from error
+            STATIC_FILE_CACHE.remember(key, static_file)
+
+        return static_file.response(request, self._chunk_size)
+
+    def _resolve(self, rel_url: str, logger) -> Tuple[Path, bool]:
+        """Resolve the path of a request and return if it is a file.
+
+        This method needs to run in an executor.
+        """
         try:
             filename = Path(rel_url)
             if filename.anchor:
@@ -32,17 +285,11 @@ class CachingStaticResource(StaticResource):
             raise HTTPNotFound() from error
         except Exception as error:
             # perm error or other kind!
-            request.app.logger.exception(error)
+            logger.exception(error)
             raise HTTPNotFound() from error
 
-        # on opening a dir, load its contents if allowed
         if filepath.is_dir():
-            return await super()._handle(request)
+            return filepath, False
         if filepath.is_file():
-            return FileResponse(
-                filepath,
-                chunk_size=self._chunk_size,
-                # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
-            )
+            return filepath, True
         raise HTTPNotFound
@@ -1,19 +1,24 @@
 """Event parser and human readable log generator."""
+import asyncio
 from datetime import timedelta
-from itertools import groupby
+from itertools import groupby, islice
 import json
 import logging
+import threading
 
+from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 import sqlalchemy
-from sqlalchemy.orm import aliased
 import voluptuous as vol
 
 from homeassistant.components import sun
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import CONTINUOUS_DOMAINS
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -27,12 +32,14 @@ from homeassistant.const import (
     ATTR_FRIENDLY_NAME,
     ATTR_NAME,
     ATTR_SERVICE,
+    CONTENT_TYPE_JSON,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_LOGBOOK_ENTRY,
     EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
+    HTTP_INTERNAL_SERVER_ERROR,
     STATE_NOT_HOME,
     STATE_OFF,
     STATE_ON,
@@ -47,6 +54,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
@@ -56,14 +64,19 @@ ATTR_MESSAGE = "message"
 
 CONF_DOMAINS = "domains"
 CONF_ENTITIES = "entities"
-CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
 EMPTY_JSON_OBJECT = "{}"
-UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
+
+# Entries serialized per chunk of a streamed response
+STREAM_CHUNK_SIZE = 100
+# Chunks waiting to be written before the database reader blocks
+STREAM_QUEUE_SIZE = 4
+
+_CURSOR_EPOCH = dt_util.utc_from_timestamp(0)
 
 CONFIG_SCHEMA = vol.Schema(
     {DOMAIN: INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA}, extra=vol.ALLOW_EXTRA
@@ -208,22 +221,145 @@ class LogbookView(HomeAssistantView):
             if end_day is None:
                 return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
 
+        limit = request.query.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTP_BAD_REQUEST)
+
+        cursor = request.query.get("cursor")
+        if cursor is not None:
+            cursor = _decode_cursor(cursor)
+            if cursor is None:
+                return self.json_message("Invalid cursor", HTTP_BAD_REQUEST)
+
         hass = request.app["hass"]
+        page = {"next_cursor": None}
 
-        def json_events():
+        def json_chunks():
             """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_id,
-                    self.filters,
-                    self.entities_filter,
-                )
+            entries = _iter_events(
+                hass,
+                start_day,
+                end_day,
+                entity_id,
+                self.filters,
+                self.entities_filter,
+                limit,
+                cursor,
+                page,
+            )
+            return _json_stream(entries, page, limit is not None)
+
+        chunks = _async_stream_chunks(hass, json_chunks)
+        try:
+            # The first chunk holds the first entries, so errors of the
+            # query are reported before the response is started
+            first_chunk = await chunks.__anext__()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error fetching logbook entries")
+            return self.json_message(
+                "Error fetching logbook entries", HTTP_INTERNAL_SERVER_ERROR
             )
 
-        return await hass.async_add_executor_job(json_events)
+        try:
+            response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+            response.enable_compression()
+            await response.prepare(request)
+            await response.write(first_chunk)
+            # A later error aborts the connection instead of ending the JSON
+            async for chunk in chunks:
+                await response.write(chunk)
+        finally:
+            await chunks.aclose()
+
+        await response.write_eof()
+        return response
+
+
+async def _async_stream_chunks(hass, chunks):
+    """Yield the chunks generated in the executor.
+
+    The executor blocks while STREAM_QUEUE_SIZE chunks are waiting to be
+    written, keeping memory bounded regardless of the logbook period. An
+    error of the executor is raised here.
+    """
+    queue = asyncio.Queue(STREAM_QUEUE_SIZE)
+    cancel = threading.Event()
+
+    def put(chunk):
+        asyncio.run_coroutine_threadsafe(queue.put(chunk), hass.loop).result()
+
+    def produce():
+        try:
+            for chunk in chunks():
+                if cancel.is_set():
+                    return
+                put(chunk.encode("UTF-8"))
+        except Exception as err:  # pylint: disable=broad-except
+            if not cancel.is_set():
+                put(err)
+        else:
+            if not cancel.is_set():
+                put(None)
+
+    producer = hass.async_add_executor_job(produce)
+
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        # Unblock the producer if the client went away
+        cancel.set()
+        while not queue.empty():
+            queue.get_nowait()
+        await producer
+
+
+def _json_stream(entries, page, paginated):
+    """Generate the JSON for logbook entries in chunks."""
+    separator = '{"entries":[' if paginated else "["
+    entries = iter(entries)
+    while True:
+        chunk = list(islice(entries, STREAM_CHUNK_SIZE))
+        if not chunk:
+            break
+        yield separator + ",".join(
+            json.dumps(entry, cls=JSONEncoder, allow_nan=False) for entry in chunk
+        )
+        separator = ","
+
+    if separator != ",":
+        # There were no entries
+        yield separator
+
+    if paginated:
+        yield f'],"next_cursor":{json.dumps(page["next_cursor"])}}}'
+    else:
+        yield "]"
+
+
+def _encode_cursor(row):
+    """Encode the position of a row to continue a logbook page from."""
+    time_fired = process_timestamp(row.time_fired)
+    return f"{(time_fired - _CURSOR_EPOCH) // timedelta(microseconds=1)}-{row.event_id}"
+
+
+def _decode_cursor(cursor):
+    """Decode a cursor into time fired and event id or None if invalid."""
+    try:
+        microseconds, event_id = (int(part) for part in cursor.split("-", 1))
+    except ValueError:
+        return None
+    return _CURSOR_EPOCH + timedelta(microseconds=microseconds), event_id
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -389,16 +525,79 @@ def _get_events(
     hass, start_day, end_day, entity_id=None, filters=None, entities_filter=None
 ):
     """Get events for a period of time."""
+    return list(
+        _iter_events(hass, start_day, end_day, entity_id, filters, entities_filter)
+    )
+
+
+def _iter_events(
+    hass,
+    start_day,
+    end_day,
+    entity_id=None,
+    filters=None,
+    entities_filter=None,
+    limit=None,
+    cursor=None,
+    page=None,
+):
+    """Yield events for a period of time.
+
+    With a limit, a page ends with the first GROUP_BY_MINUTES window that
+    reaches limit events so the grouping does not depend on the page size.
+    The cursor to continue from is stored as next_cursor in page. It stays
+    None on the last page.
+    """
     entity_attr_cache = EntityAttributeCache(hass)
     context_lookup = {None: None}
-
-    def yield_events(query):
+    looked_up_context_ids = set()
+
+    def add_context_before_cursor(query, events):
+        """Add the context events from before the cursor to the lookup."""
+        context_ids = {
+            event.context_id
+            for event, _ in events
+            if event.context_id not in context_lookup
+        } - looked_up_context_ids
+        if not context_ids:
+            return
+        looked_up_context_ids.update(context_ids)
+        for row in query.filter(Events.context_id.in_(context_ids)):
+            context_lookup.setdefault(row.context_id, LazyEventPartialState(row))
+
+    def yield_events(query, context_query):
         """Yield Events that are not filtered away."""
+        kept = 0
+        window = None
+        last_row = None
+        # Events of the current window, with whether they are kept
+        events = []
+
+        def flush_window():
+            if context_query is not None:
+                add_context_before_cursor(context_query, events)
+            for event, keep in events:
+                context_lookup.setdefault(event.context_id, event)
+                if keep:
+                    yield event
+            events.clear()
+
         for row in query.yield_per(1000):
             event = LazyEventPartialState(row)
-            context_lookup.setdefault(event.context_id, event)
-            if _keep_event(hass, event, entities_filter):
-                yield event
+            keep = _keep_event(hass, event, entities_filter)
+            if keep:
+                event_window = event.time_fired_minute // GROUP_BY_MINUTES
+                if event_window != window:
+                    if limit is not None and kept >= limit:
+                        page["next_cursor"] = _encode_cursor(last_row)
+                        break
+                    yield from flush_window()
+                    window = event_window
+                kept += 1
+            last_row = row
+            events.append((event, keep))
+
+        yield from flush_window()
 
     with session_scope(hass=hass) as session:
         if entity_id is not None:
@@ -409,10 +608,15 @@ def _get_events(
             entity_ids = None
             apply_sql_entities_filter = True
 
-        old_state = aliased(States, name="old_state")
+        # Attributes are either deduplicated or inline for rows from before
+        # the state_attributes table existed
+        attributes = sqlalchemy.func.coalesce(
+            StateAttributes.shared_attrs, States.attributes
+        )
 
         query = (
             session.query(
+                Events.event_id,
                 Events.event_type,
                 Events.event_data,
                 Events.time_fired,
@@ -421,32 +625,20 @@ def _get_events(
                 States.state,
                 States.entity_id,
                 States.domain,
-                States.attributes,
+                attributes.label("attributes"),
             )
-            .order_by(Events.time_fired)
+            .order_by(Events.time_fired, Events.event_id)
             .outerjoin(States, (Events.event_id == States.event_id))
-            .outerjoin(old_state, (States.old_state_id == old_state.state_id))
-            # The below filter, removes state change events that do not have
-            # and old_state, new_state, or the old and
-            # new state.
-            #
-            .filter(
-                (Events.event_type != EVENT_STATE_CHANGED)
-                | (
-                    (States.state_id.isnot(None))
-                    & (old_state.state_id.isnot(None))
-                    & (States.state.isnot(None))
-                    & (States.state != old_state.state)
-                )
+            .outerjoin(
+                StateAttributes,
+                (States.attributes_id == StateAttributes.attributes_id),
             )
-            #
-            # Prefilter out continuous domains that have
-            # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
-            #
+            # The recorder flags the state changes that are shown in the
+            # logbook when writing them. These have an old and new state
+            # that differ and are not from a continuous sensor.
             .filter(
                 (Events.event_type != EVENT_STATE_CHANGED)
-                | sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS))
-                | sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON))
+                | States.significant_change.is_(True)
             )
             .filter(
                 Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
@@ -456,16 +648,7 @@ def _get_events(
 
         if entity_ids:
             query = query.filter(
-                (
-                    (States.last_updated == States.last_changed)
-                    & States.entity_id.in_(entity_ids)
-                )
-                | (States.state_id.is_(None))
-            )
-        else:
-            query = query.filter(
-                (States.last_updated == States.last_changed)
-                | (States.state_id.is_(None))
+                States.entity_id.in_(entity_ids) | (States.state_id.is_(None))
             )
 
         if apply_sql_entities_filter and filters:
@@ -475,8 +658,19 @@ def _get_events(
                     entity_filter | (Events.event_type != EVENT_STATE_CHANGED)
                 )
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        context_query = None
+        if cursor is not None:
+            # Events on earlier pages can be the context of events on this one
+            cursor_time_fired, cursor_event_id = cursor
+            after_cursor = (Events.time_fired > cursor_time_fired) | (
+                (Events.time_fired == cursor_time_fired)
+                & (Events.event_id > cursor_event_id)
+            )
+            context_query = query.filter(~after_cursor)
+            query = query.filter(after_cursor)
+
+        yield from humanify(
+            hass, yield_events(query, context_query), entity_attr_cache, context_lookup,
         )
 
 
@@ -9,7 +9,7 @@ from operator import attrgetter
 import os
 import ssl
 import time
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import attr
 import certifi
@@ -624,12 +624,16 @@ class MQTT:
         """Initialize Home Assistant MQTT client."""
         # We don't import on the top because some integrations
         # should be able to optionally rely on MQTT.
-        import paho.mqtt.client as mqtt  # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel
+        import paho.mqtt.client as mqtt
+        from paho.mqtt.matcher import MQTTMatcher
 
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: List[Subscription] = []
+        # Topic trie mapping subscribed topic filters to their subscriptions
+        self._matcher = MQTTMatcher()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -817,6 +821,7 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        self._async_track_subscription(subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -830,7 +835,7 @@ class MQTT:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if not self._async_untrack_subscription(subscription):
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -840,6 +845,27 @@ class MQTT:
 
         return async_remove
 
+    @callback
+    def _async_track_subscription(self, subscription: Subscription) -> None:
+        """Add a subscription to the topic trie."""
+        try:
+            self._matcher[subscription.topic].append(subscription)
+        except KeyError:
+            self._matcher[subscription.topic] = [subscription]
+
+    @callback
+    def _async_untrack_subscription(self, subscription: Subscription) -> bool:
+        """Remove a subscription from the topic trie.
+
+        Returns True if no subscriptions are left for the topic.
+        """
+        subscriptions = self._matcher[subscription.topic]
+        subscriptions.remove(subscription)
+        if subscriptions:
+            return False
+        del self._matcher[subscription.topic]
+        return True
+
     async def _async_unsubscribe(self, topic: str) -> None:
         """Unsubscribe from a topic.
 
@@ -929,23 +955,35 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
+        # Collect the matches first, callbacks may (un)subscribe while we dispatch
+        subscriptions = [
+            subscription
+            for topic_subscriptions in self._matcher.iter_match(msg.topic)
+            for subscription in topic_subscriptions
+        ]
+        # Payloads are decoded once per encoding, None if decoding failed
+        payloads: Dict[Optional[str], Optional[SubscribePayloadType]] = {
+            None: msg.payload
+        }
 
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
+        for subscription in subscriptions:
+            encoding = subscription.encoding
+            if encoding not in payloads:
                 try:
-                    payload = msg.payload.decode(subscription.encoding)
+                    payloads[encoding] = msg.payload.decode(encoding)
                 except (AttributeError, UnicodeDecodeError):
-                    _LOGGER.warning(
-                        "Can't decode payload %s on %s with encoding %s (for %s)",
-                        msg.payload,
-                        msg.topic,
-                        subscription.encoding,
-                        subscription.callback,
-                    )
-                    continue
+                    payloads[encoding] = None
+
+            payload = payloads[encoding]
+            if payload is None and encoding is not None:
+                _LOGGER.warning(
+                    "Can't decode payload %s on %s with encoding %s (for %s)",
+                    msg.payload,
+                    msg.topic,
+                    encoding,
+                    subscription.callback,
+                )
+                continue
 
             self.hass.async_run_job(
                 subscription.callback,
@@ -1027,20 +1065,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
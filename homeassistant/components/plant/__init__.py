@@ -3,6 +3,7 @@ from collections import deque
 from datetime import datetime, timedelta
 import logging
 
+from sqlalchemy.orm import joinedload
 import voluptuous as vol
 
 from homeassistant.components.recorder.models import States
@@ -311,6 +312,7 @@ class Plant(Entity):
         with session_scope(hass=self.hass) as session:
             query = (
                 session.query(States)
+                .options(joinedload(States.state_attributes))
                 .filter(
                     (States.entity_id == entity_id.lower())
                     and (States.last_updated > start_date)
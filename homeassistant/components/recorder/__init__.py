@@ -1,8 +1,8 @@
 """Support for recording details."""
 import asyncio
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 import concurrent.futures
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import queue
 import threading
@@ -34,9 +34,16 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
-from . import migration, purge
+from . import migration, purge, statistics
 from .const import DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from .models import (
+    Base,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    is_significant_change,
+)
 from .util import session_scope, validate_or_move_away_sqlite_database
 
 _LOGGER = logging.getLogger(__name__)
@@ -58,6 +65,12 @@ DEFAULT_DB_FILE = "home-assistant_v2.db"
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 KEEPALIVE_TIME = 30
+STATE_ATTRIBUTES_CACHE_SIZE = 2048
+# Commit at the latest after this many events. A failed commit loses all
+# events of the batch, so larger batches save little but risk more.
+MAX_PENDING_EVENTS = 250
+# Queue size from which events are committed in batches
+BACKLOG_QUEUE_SIZE = 100
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
@@ -189,6 +202,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 PurgeTask = namedtuple("PurgeTask", ["keep_days", "repack"])
 
+StatisticsTask = namedtuple("StatisticsTask", ["start"])
+
+CommitTask = namedtuple("CommitTask", [])
+
+KeepAliveTask = namedtuple("KeepAliveTask", [])
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -224,9 +243,12 @@ class Recorder(threading.Thread):
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
-        self._timechanges_seen = 0
-        self._keepalive_count = 0
-        self._old_state_ids = {}
+        self._commit_scheduled = False
+        self._old_states = {}
+        self._pending_events = 0
+        # Serialized attributes to their row in the state_attributes table
+        self.state_attributes: "OrderedDict[str, StateAttributes]" = OrderedDict()
+        self.commit_duration: Optional[float] = None
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = False
@@ -234,7 +256,9 @@ class Recorder(threading.Thread):
     @callback
     def async_initialize(self):
         """Initialize the recorder."""
-        self.hass.bus.async_listen(MATCH_ALL, self.event_listener)
+        self.hass.bus.async_listen(
+            MATCH_ALL, self.event_listener, event_filter=self._async_event_filter
+        )
 
     def do_adhoc_purge(self, **kwargs):
         """Trigger an adhoc purge retaining keep_days worth of data."""
@@ -330,10 +354,29 @@ class Recorder(threading.Thread):
                 async_purge, hour=4, minute=12, second=0
             )
 
+        @callback
+        def async_periodic_statistics(now):
+            """Trigger the statistics compilation of the last 5 minutes."""
+            self.queue.put(StatisticsTask(statistics.period_start(now)))
+
+        # Compile statistics every 5 minutes
+        self.hass.helpers.event.track_utc_time_change(
+            async_periodic_statistics, minute="/5", second=10
+        )
+
+        @callback
+        def async_keep_alive(now):
+            """Trigger the keepalive of the database connection."""
+            self.queue.put(KeepAliveTask())
+
+        self.hass.helpers.event.track_time_interval(
+            async_keep_alive, timedelta(seconds=KEEPALIVE_TIME)
+        )
+
         self.event_session = self.get_session()
         # Use a session for the event read loop
-        # with a commit every time the event time
-        # has changed. This reduces the disk io.
+        # with a commit once the commit interval
+        # has passed. This reduces the disk io.
         while True:
             event = self.queue.get()
             if event is None:
@@ -341,55 +384,70 @@ class Recorder(threading.Thread):
                 self._close_connection()
                 return
             if isinstance(event, PurgeTask):
+                # The purge runs in its own session and may delete attributes
+                # the pending states refer to, commit them first
+                self._commit_event_session_or_retry()
                 # Schedule a new purge task if this one didn't finish
                 if not purge.purge_old_data(self, event.keep_days, event.repack):
                     self.queue.put(PurgeTask(event.keep_days, event.repack))
                 continue
-            if event.event_type == EVENT_TIME_CHANGED:
-                self._keepalive_count += 1
-                if self._keepalive_count >= KEEPALIVE_TIME:
-                    self._keepalive_count = 0
-                    self._send_keep_alive()
-                if self.commit_interval:
-                    self._timechanges_seen += 1
-                    if self._timechanges_seen >= self.commit_interval:
-                        self._timechanges_seen = 0
-                        self._commit_event_session_or_retry()
+            if isinstance(event, StatisticsTask):
+                statistics.compile_statistics(self, event.start)
                 continue
-            if event.event_type in self.exclude_t:
+            if isinstance(event, KeepAliveTask):
+                self._send_keep_alive()
                 continue
-
-            entity_id = event.data.get(ATTR_ENTITY_ID)
-            if entity_id is not None:
-                if not self.entity_filter(entity_id):
+            if isinstance(event, CommitTask):
+                # With a backlog the events are committed in batches
+                # instead of on the commit interval
+                if self.queue.qsize() >= BACKLOG_QUEUE_SIZE:
+                    self.queue.put(event)
                     continue
+                self._commit_scheduled = False
+                self._commit_event_session_or_retry()
+                continue
 
             try:
-                dbevent = Events.from_event(event)
                 if event.event_type == EVENT_STATE_CHANGED:
-                    dbevent.event_data = "{}"
+                    # The state is stored in the states table
+                    dbevent = Events.from_event(event, event_data="{}")
+                else:
+                    dbevent = Events.from_event(event)
                 self.event_session.add(dbevent)
-                self.event_session.flush()
             except (TypeError, ValueError):
                 _LOGGER.warning("Event is not JSON serializable: %s", event)
+                continue
             except Exception as err:  # pylint: disable=broad-except
                 # Must catch the exception to prevent the loop from collapsing
                 _LOGGER.exception("Error adding event: %s", err)
+                continue
 
-            if dbevent and event.event_type == EVENT_STATE_CHANGED:
+            if event.event_type == EVENT_STATE_CHANGED:
                 try:
                     dbstate = States.from_event(event)
                     has_new_state = event.data.get("new_state")
-                    dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
+                    old_state = self._old_states.pop(dbstate.entity_id, None)
+                    # Rows are inserted when the session is flushed, link the
+                    # rows that are not inserted yet with the relationships
+                    if old_state is not None:
+                        if old_state.state_id is not None:
+                            dbstate.old_state_id = old_state.state_id
+                        else:
+                            dbstate.old_state = old_state
                     if not has_new_state:
                         dbstate.state = None
-                    dbstate.event_id = dbevent.event_id
+                    dbstate.significant_change = is_significant_change(
+                        dbstate.domain,
+                        dbstate.state,
+                        old_state.state if old_state is not None else None,
+                        dbstate.last_changed == dbstate.last_updated,
+                        dbstate.attributes,
+                    )
+                    dbstate.event = dbevent
+                    self._set_state_attributes(dbstate)
                     self.event_session.add(dbstate)
-                    self.event_session.flush()
                     if has_new_state:
-                        self._old_state_ids[dbstate.entity_id] = dbstate.state_id
-                    elif dbstate.entity_id in self._old_state_ids:
-                        del self._old_state_ids[dbstate.entity_id]
+                        self._old_states[dbstate.entity_id] = dbstate
                 except (TypeError, ValueError):
                     _LOGGER.warning(
                         "State is not JSON serializable: %s",
@@ -399,10 +457,61 @@ class Recorder(threading.Thread):
                     # Must catch the exception to prevent the loop from collapsing
                     _LOGGER.exception("Error adding state change: %s", err)
 
-            # If they do not have a commit interval
-            # than we commit right away
-            if not self.commit_interval:
+            self._pending_events += 1
+
+            # If they do not have a commit interval than we commit right away,
+            # with a backlog we commit once the queue is drained. Large
+            # batches are committed to bound the memory used by the session.
+            if (
+                not self.commit_interval and self.queue.qsize() < BACKLOG_QUEUE_SIZE
+            ) or self._pending_events >= MAX_PENDING_EVENTS:
                 self._commit_event_session_or_retry()
+            elif self.commit_interval and not self._commit_scheduled:
+                self._commit_scheduled = True
+                self.hass.add_job(self._async_schedule_commit)
+
+    @callback
+    def _async_schedule_commit(self):
+        """Queue a commit once the commit interval has passed."""
+
+        @callback
+        def async_commit(now):
+            """Trigger the commit of the pending events."""
+            self.queue.put(CommitTask())
+
+        self.hass.helpers.event.async_call_later(self.commit_interval, async_commit)
+
+    def _set_state_attributes(self, dbstate):
+        """Link a state to the state_attributes row of its attributes.
+
+        Recently used attributes are kept in an LRU to avoid a lookup.
+        """
+        shared_attrs = dbstate.attributes
+        dbstate.attributes = None
+
+        dbattrs = self.state_attributes.get(shared_attrs)
+        if dbattrs is not None:
+            self.state_attributes.move_to_end(shared_attrs)
+        else:
+            attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+            dbattrs = (
+                self.event_session.query(StateAttributes)
+                .filter(StateAttributes.hash == attr_hash)
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .first()
+            )
+            if dbattrs is None:
+                dbattrs = StateAttributes.from_shared_attrs(shared_attrs)
+                self.event_session.add(dbattrs)
+
+            self.state_attributes[shared_attrs] = dbattrs
+            if len(self.state_attributes) > STATE_ATTRIBUTES_CACHE_SIZE:
+                self.state_attributes.popitem(last=False)
+
+        if dbattrs.attributes_id is not None:
+            dbstate.attributes_id = dbattrs.attributes_id
+        else:
+            dbstate.state_attributes = dbattrs
 
     def _send_keep_alive(self):
         try:
@@ -445,6 +554,7 @@ class Recorder(threading.Thread):
             except Exception as err:  # pylint: disable=broad-except
                 # Must catch the exception to prevent the loop from collapsing
                 _LOGGER.exception("Error saving events: %s", err)
+                self._reopen_event_session()
                 return
 
         _LOGGER.error(
@@ -454,6 +564,8 @@ class Recorder(threading.Thread):
         self._reopen_event_session()
 
     def _reopen_event_session(self):
+        self._clear_cached_rows()
+
         try:
             self.event_session.rollback()
         except Exception as err:  # pylint: disable=broad-except
@@ -474,12 +586,31 @@ class Recorder(threading.Thread):
 
     def _commit_event_session(self):
         try:
+            timer_start = time.perf_counter()
             self.event_session.commit()
+            self.commit_duration = time.perf_counter() - timer_start
+            self._pending_events = 0
         except Exception as err:
             _LOGGER.error("Error executing query: %s", err)
             self.event_session.rollback()
+            self._clear_cached_rows()
             raise
 
+    def _clear_cached_rows(self):
+        """Forget the cached rows, they may have been rolled back."""
+        self._old_states.clear()
+        self.state_attributes.clear()
+        self._pending_events = 0
+
+    @callback
+    def _async_event_filter(self, event):
+        """Filter out events that are not recorded before they are queued."""
+        if event.event_type == EVENT_TIME_CHANGED or event.event_type in self.exclude_t:
+            return False
+
+        entity_id = event.data.get(ATTR_ENTITY_ID)
+        return entity_id is None or self.entity_filter(entity_id)
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
@@ -556,7 +687,11 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
-        self.get_session = scoped_session(sessionmaker(bind=self.engine))
+        # Objects are not expired on commit so the ids of the last states
+        # and attributes can be used without a query
+        self.get_session = scoped_session(
+            sessionmaker(bind=self.engine, expire_on_commit=False)
+        )
 
     def _close_connection(self):
         """Close the connection."""
@@ -3,3 +3,8 @@
 DATA_INSTANCE = "recorder_instance"
 SQLITE_URL_PREFIX = "sqlite://"
 DOMAIN = "recorder"
+
+# Domains of entities that change continuously, their changes with a unit of
+# measurement are not significant changes
+CONTINUOUS_DOMAINS = ["proximity", "sensor"]
+UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
@@ -1,16 +1,27 @@
 """Schema migration helpers."""
 import logging
 
-from sqlalchemy import Table, text
+from sqlalchemy import Table, func, text
 from sqlalchemy.engine import reflection
 from sqlalchemy.exc import InternalError, OperationalError, SQLAlchemyError
+from sqlalchemy.orm import Session, aliased
 
 from .const import DOMAIN
-from .models import SCHEMA_VERSION, Base, SchemaChanges
+from .models import (
+    SCHEMA_VERSION,
+    Base,
+    SchemaChanges,
+    StateAttributes,
+    States,
+    is_significant_change,
+)
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of states rows updated per transaction when backfilling a column
+BACKFILL_CHUNK_SIZE = 10000
+
 
 def migrate_schema(instance):
     """Check if the schema needs to be upgraded."""
@@ -277,10 +288,84 @@ def _apply_update(engine, new_version, old_version):
         _drop_index(engine, "states", "ix_states_entity_id")
         _create_index(engine, "events", "ix_events_event_type_time_fired")
         _drop_index(engine, "events", "ix_events_event_type")
+    elif new_version == 10:
+        # Attributes are deduplicated into the state_attributes table
+        # which is created with the other missing tables. Existing rows
+        # keep their inline attributes.
+        _add_columns(engine, "states", ["attributes_id INTEGER"])
+        _create_index(engine, "states", "ix_states_attributes_id")
+    elif new_version == 11:
+        # The statistics table is created with the other missing tables
+        pass
+    elif new_version == 12:
+        _add_columns(engine, "states", ["significant_change BOOLEAN"])
+        _backfill_significant_change(engine)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _backfill_significant_change(engine):
+    """Compute the significant_change column of existing states.
+
+    The rows are updated in chunks of state_id ranges, each in their own
+    transaction, so the migration does not hold a lock on the whole table.
+    """
+    with session_scope(session=Session(bind=engine)) as session:
+        max_state_id = session.query(func.max(States.state_id)).scalar()
+
+    if max_state_id is None:
+        return
+
+    _LOGGER.warning(
+        "Computing significant changes for %s states. Note: this can take "
+        "several minutes on large databases and slow computers. Please "
+        "be patient!",
+        max_state_id,
+    )
+
+    old_state = aliased(States, name="old_state")
+    # Attributes are either deduplicated or inline for rows from before
+    # the state_attributes table existed
+    attributes = func.coalesce(StateAttributes.shared_attrs, States.attributes)
+
+    for start in range(0, max_state_id, BACKFILL_CHUNK_SIZE):
+        with session_scope(session=Session(bind=engine)) as session:
+            rows = (
+                session.query(
+                    States.state_id,
+                    States.domain,
+                    States.state,
+                    States.last_changed,
+                    States.last_updated,
+                    attributes.label("attributes"),
+                    old_state.state.label("old_state"),
+                )
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+                .outerjoin(old_state, States.old_state_id == old_state.state_id)
+                .filter(States.state_id > start)
+                .filter(States.state_id <= start + BACKFILL_CHUNK_SIZE)
+            )
+            session.bulk_update_mappings(
+                States,
+                [
+                    {
+                        "state_id": row.state_id,
+                        "significant_change": is_significant_change(
+                            row.domain,
+                            row.state,
+                            row.old_state,
+                            row.last_changed == row.last_updated,
+                            row.attributes,
+                        ),
+                    }
+                    for row in rows
+                ],
+            )
+
+
 def _inspect_schema_version(engine, session):
     """Determine the schema version by inspecting the db structure.
 
@@ -1,11 +1,14 @@
 """Models for SQLAlchemy."""
 import json
 import logging
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
+    Float,
     ForeignKey,
     Index,
     Integer,
@@ -14,17 +17,20 @@ from sqlalchemy import (
     distinct,
 )
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import relationship
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 
+from .const import CONTINUOUS_DOMAINS, UNIT_OF_MEASUREMENT_JSON
+
 # SQLAlchemy Schema
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 12
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,10 +38,19 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
+TABLE_STATISTICS = "statistics"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 
-ALL_TABLES = [TABLE_EVENTS, TABLE_STATES, TABLE_RECORDER_RUNS, TABLE_SCHEMA_CHANGES]
+ALL_TABLES = [
+    TABLE_EVENTS,
+    TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATISTICS,
+    TABLE_RECORDER_RUNS,
+    TABLE_SCHEMA_CHANGES,
+]
 
 
 class Events(Base):  # type: ignore
@@ -59,11 +74,11 @@ class Events(Base):  # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
+    def from_event(event, event_data=None):
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data or json.dumps(event.data, cls=JSONEncoder),
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -106,6 +121,18 @@ class States(Base):  # type: ignore
     last_updated = Column(DateTime(timezone=True), default=dt_util.utcnow, index=True)
     created = Column(DateTime(timezone=True), default=dt_util.utcnow)
     old_state_id = Column(Integer)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
+    significant_change = Column(Boolean)
+    event = relationship("Events", uselist=False)
+    old_state = relationship(
+        "States",
+        primaryjoin="States.old_state_id == States.state_id",
+        foreign_keys="States.old_state_id",
+        remote_side="States.state_id",
+    )
+    state_attributes = relationship("StateAttributes")
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
@@ -139,11 +166,15 @@ class States(Base):  # type: ignore
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        attributes = self.attributes
+        # Deduplicated attributes are stored in the state_attributes table
+        if attributes is None and self.state_attributes is not None:
+            attributes = self.state_attributes.shared_attrs
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json.loads(attributes or "{}"),
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -157,6 +188,52 @@ class States(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """Deduplicated state attributes shared between state rows."""
+
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, primary_key=True)
+    hash = Column(BigInteger, index=True)
+    shared_attrs = Column(Text)
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs):
+        """Return the hash of serialized attributes used to look them up."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+    @staticmethod
+    def from_shared_attrs(shared_attrs):
+        """Create an attributes database object from serialized attributes."""
+        return StateAttributes(
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+            shared_attrs=shared_attrs,
+        )
+
+
+class Statistics(Base):  # type: ignore
+    """Downsampled statistics of numeric states."""
+
+    __tablename__ = TABLE_STATISTICS
+    id = Column(Integer, primary_key=True)
+    statistic_id = Column(String(255))
+    period = Column(String(16))
+    start = Column(DateTime(timezone=True))
+    mean = Column(Float)
+    min = Column(Float)
+    max = Column(Float)
+    created = Column(DateTime(timezone=True), default=dt_util.utcnow)
+
+    __table_args__ = (
+        # Used for fetching statistics of entities over a period
+        Index(
+            "ix_statistics_statistic_id_period_start",
+            "statistic_id",
+            "period",
+            "start",
+        ),
+    )
+
+
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
 
@@ -204,6 +281,22 @@ class SchemaChanges(Base):  # type: ignore
     changed = Column(DateTime(timezone=True), default=dt_util.utcnow)
 
 
+def is_significant_change(domain, state, old_state, changed, attributes):
+    """Return if a state row is a change that is shown in the logbook.
+
+    A change needs a previous state, a different state and to not be from
+    a continuous domain with a unit of measurement.
+    """
+    if state is None or old_state is None or not changed or state == old_state:
+        return False
+
+    return not (
+        domain in CONTINUOUS_DOMAINS
+        and attributes is not None
+        and UNIT_OF_MEASUREMENT_JSON in attributes
+    )
+
+
 def process_timestamp(ts):
     """Process a timestamp into datetime object."""
     if ts is None:
@@ -7,7 +7,8 @@ from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
-from .models import Events, RecorderRuns, States
+from .models import Events, RecorderRuns, StateAttributes, States
+from .statistics import purge_short_term_statistics
 from .util import execute, session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -62,6 +63,25 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
                 _LOGGER.debug("Purging hasn't fully completed yet")
                 return False
 
+            # Remove attributes that are no longer referenced by any state
+            deleted_rows = (
+                session.query(StateAttributes)
+                .filter(
+                    ~StateAttributes.attributes_id.in_(
+                        session.query(States.attributes_id).filter(
+                            States.attributes_id.isnot(None)
+                        )
+                    )
+                )
+                .delete(synchronize_session=False)
+            )
+            _LOGGER.debug("Deleted %s state attributes", deleted_rows)
+            if deleted_rows:
+                instance.state_attributes.clear()
+
+            deleted_rows = purge_short_term_statistics(session, dt_util.utcnow())
+            _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
+
             # Recorder runs is small, no need to batch run it
             deleted_rows = (
                 session.query(RecorderRuns)
@@ -78,7 +98,10 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             # Optimize mysql / mariadb tables to free up space on disk
             elif instance.engine.driver in ("mysqldb", "pymysql"):
                 _LOGGER.debug("Optimizing SQL DB to free space")
-                instance.engine.execute("OPTIMIZE TABLE states, events, recorder_runs")
+                instance.engine.execute(
+                    "OPTIMIZE TABLE states, state_attributes, statistics, events, "
+                    "recorder_runs"
+                )
 
     except OperationalError as err:
         # Retry when one of the following MySQL errors occurred:
@@ -0,0 +1,43 @@
+"""Entity to track the recorder queue."""
+from homeassistant.helpers.entity import Entity
+
+from .const import DATA_INSTANCE
+
+ATTR_COMMIT_LATENCY = "commit_latency"
+
+# mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
+
+
+async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
+    """Set up the recorder queue platform."""
+    async_add_entities([RecorderQueue(hass.data[DATA_INSTANCE])])
+
+
+class RecorderQueue(Entity):
+    """Entity to represent the events waiting to be recorded."""
+
+    def __init__(self, instance):
+        """Initialize the recorder queue sensor."""
+        self._instance = instance
+
+    @property
+    def name(self):
+        """Return name of entity."""
+        return "Recorder queue"
+
+    @property
+    def state(self):
+        """Return the number of events waiting in the queue."""
+        return self._instance.queue.qsize()
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement."""
+        return "events"
+
+    @property
+    def device_state_attributes(self):
+        """Return the duration of the last commit in milliseconds."""
+        if self._instance.commit_duration is None:
+            return None
+        return {ATTR_COMMIT_LATENCY: round(self._instance.commit_duration * 1000, 1)}
@@ -0,0 +1,215 @@
+"""Downsampled long term statistics of numeric states."""
+from collections import defaultdict
+from datetime import timedelta
+import json
+import logging
+import math
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+
+from .models import StateAttributes, States, Statistics, process_timestamp
+from .util import execute, session_scope
+
+_LOGGER = logging.getLogger(__name__)
+
+PERIOD_5MINUTE = "5minute"
+PERIOD_HOUR = "hour"
+
+PERIOD_5MINUTE_DURATION = timedelta(minutes=5)
+PERIOD_HOUR_DURATION = timedelta(hours=1)
+
+STATISTICS_DOMAINS = ("sensor",)
+
+# Hourly statistics are never purged
+SHORT_TERM_STATISTICS_KEEP_DAYS = 30
+
+
+def period_start(utc_now):
+    """Return the start of the last completed 5 minute period."""
+    start = utc_now.replace(
+        minute=utc_now.minute - utc_now.minute % 5, second=0, microsecond=0
+    )
+    return start - PERIOD_5MINUTE_DURATION
+
+
+def _has_unit(attributes) -> bool:
+    """Return if serialized state attributes have a unit of measurement."""
+    try:
+        return json.loads(attributes).get(ATTR_UNIT_OF_MEASUREMENT) is not None
+    except (ValueError, AttributeError):
+        return False
+
+
+def _compile_period(session, start, end):
+    """Return the mean, min and max of the numeric states during a period.
+
+    The mean is weighted by how long each value was held, until the next
+    state of the entity or the end of the period. A period that is only
+    partially covered by numeric states does not skew the mean.
+    """
+    # statistic_id -> [weighted sum, duration, min, max]
+    compiled = {}
+    # Serialized attributes -> if they have a unit of measurement
+    has_unit = {}
+    query = (
+        session.query(
+            States.entity_id,
+            States.state,
+            States.attributes,
+            StateAttributes.shared_attrs,
+            States.last_updated,
+        )
+        .outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id,
+        )
+        .filter(States.domain.in_(STATISTICS_DOMAINS))
+        .filter((States.last_updated >= start) & (States.last_updated < end))
+        .order_by(States.entity_id, States.last_updated)
+    )
+    rows = execute(query)
+    for row, next_row in zip(rows, rows[1:] + [None]):
+        entity_id = row.entity_id
+        attributes = row.attributes or row.shared_attrs or "{}"
+        if attributes not in has_unit:
+            has_unit[attributes] = _has_unit(attributes)
+        if not has_unit[attributes]:
+            continue
+
+        try:
+            value = float(row.state)
+        except (TypeError, ValueError):
+            continue
+        if not math.isfinite(value):
+            continue
+
+        # The value is held until the next state of the entity, of any kind
+        held_until = end
+        if next_row is not None and next_row.entity_id == entity_id:
+            held_until = process_timestamp(next_row.last_updated)
+        duration = (held_until - process_timestamp(row.last_updated)).total_seconds()
+
+        stat = compiled.get(entity_id)
+        if stat is None:
+            compiled[entity_id] = [value * duration, duration, value, value]
+            continue
+        stat[0] += value * duration
+        stat[1] += duration
+        stat[2] = min(stat[2], value)
+        stat[3] = max(stat[3], value)
+
+    return {
+        statistic_id: (weighted_sum / duration if duration else min_, min_, max_)
+        for statistic_id, (weighted_sum, duration, min_, max_) in compiled.items()
+    }
+
+
+def _add_statistics(session, period, start, end) -> None:
+    """Compile and add the statistics of a period that are not stored yet.
+
+    A period is compiled again after a restart or when compile runs overlap,
+    the statistics stored by the first run are kept.
+    """
+    existing = {
+        row.statistic_id
+        for row in execute(
+            session.query(Statistics.statistic_id)
+            .filter(Statistics.period == period)
+            .filter(Statistics.start == start)
+        )
+    }
+    for statistic_id, (mean, min_, max_) in _compile_period(
+        session, start, end
+    ).items():
+        if statistic_id in existing:
+            continue
+        session.add(
+            Statistics(
+                statistic_id=statistic_id,
+                period=period,
+                start=start,
+                mean=mean,
+                min=min_,
+                max=max_,
+            )
+        )
+
+
+def compile_statistics(instance, start) -> None:
+    """Compile statistics for the 5 minute period starting at start.
+
+    When the period completes an hour the hourly statistics are compiled too.
+    """
+    end = start + PERIOD_5MINUTE_DURATION
+    _LOGGER.debug("Compiling statistics for %s-%s", start, end)
+
+    try:
+        with session_scope(session=instance.get_session()) as session:
+            _add_statistics(session, PERIOD_5MINUTE, start, end)
+            if end.minute == 0:
+                _add_statistics(session, PERIOD_HOUR, end - PERIOD_HOUR_DURATION, end)
+    except SQLAlchemyError as err:
+        _LOGGER.warning("Error compiling statistics: %s", err)
+
+
+def purge_short_term_statistics(session, utc_now) -> int:
+    """Purge 5 minute statistics, independent of the states retention."""
+    purge_before = utc_now - timedelta(days=SHORT_TERM_STATISTICS_KEEP_DAYS)
+    return (
+        session.query(Statistics)
+        .filter(Statistics.period == PERIOD_5MINUTE)
+        .filter(Statistics.start < purge_before)
+        .delete(synchronize_session=False)
+    )
+
+
+def statistics_during_period(
+    hass, start_time, end_time=None, statistic_ids=None, period=PERIOD_HOUR
+):
+    """Wrap _statistics_during_period with a sql session."""
+    with session_scope(hass=hass) as session:
+        return statistics_during_period_with_session(
+            session, start_time, end_time, statistic_ids, period
+        )
+
+
+def statistics_during_period_with_session(
+    session, start_time, end_time=None, statistic_ids=None, period=PERIOD_HOUR
+):
+    """Return statistics during UTC period start_time - end_time.
+
+    The result is {'statistic_id': [list of statistics]} where each
+    statistic is a dict with the start, mean, min and max of the period.
+    """
+    query = (
+        session.query(
+            Statistics.statistic_id,
+            Statistics.start,
+            Statistics.mean,
+            Statistics.min,
+            Statistics.max,
+        )
+        .filter(Statistics.period == period)
+        .filter(Statistics.start >= start_time)
+    )
+
+    if end_time is not None:
+        query = query.filter(Statistics.start < end_time)
+
+    if statistic_ids is not None:
+        query = query.filter(Statistics.statistic_id.in_(statistic_ids))
+
+    query = query.order_by(Statistics.statistic_id, Statistics.start)
+
+    result = defaultdict(list)
+    for row in execute(query):
+        result[row.statistic_id].append(
+            {
+                "start": process_timestamp(row.start),
+                "mean": row.mean,
+                "min": row.min,
+                "max": row.max,
+            }
+        )
+    return dict(result)
@@ -1,8 +1,7 @@
 """Support for statistics for sensor values."""
-from collections import deque
 import logging
-import statistics
 
+from sqlalchemy.orm import joinedload
 import voluptuous as vol
 
 from homeassistant.components.recorder.models import States
@@ -13,6 +12,7 @@ from homeassistant.const import (
     CONF_ENTITY_ID,
     CONF_NAME,
     EVENT_HOMEASSISTANT_START,
+    STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -25,6 +25,7 @@ from homeassistant.helpers.event import (
 )
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util import dt as dt_util
+from homeassistant.util.rolling import RollingWindow
 
 from . import DOMAIN, PLATFORMS
 
@@ -97,8 +98,7 @@ class StatisticsSensor(Entity):
         self._max_age = max_age
         self._precision = precision
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
-        self.ages = deque(maxlen=self._sampling_size)
+        self._window = RollingWindow(self._sampling_size, self._max_age)
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
@@ -151,11 +151,11 @@ class StatisticsSensor(Entity):
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                value = float(new_state.state == STATE_ON)
             else:
-                self.states.append(float(new_state.state))
+                value = float(new_state.state)
 
-            self.ages.append(new_state.last_updated)
+            self._window.add(value, new_state.last_updated)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
@@ -220,23 +220,16 @@ class StatisticsSensor(Entity):
             self._max_age,
         )
 
-        while self.ages and (now - self.ages[0]) > self._max_age:
-            _LOGGER.debug(
-                "%s: purging record with datetime %s(%s)",
-                self.entity_id,
-                dt_util.as_local(self.ages[0]),
-                (now - self.ages[0]),
-            )
-            self.ages.popleft()
-            self.states.popleft()
+        purged = self._window.purge(now)
+        _LOGGER.debug("%s: purged %s records", self.entity_id, purged)
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
-        if self.ages and self._max_age:
-            # Take the oldest entry from the ages list and add the configured max_age.
+        if self._window and self._max_age:
+            # Take the oldest entry from the window and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
             # in the future when the oldest state will expire.
-            return self.ages[0] + self._max_age
+            return self._window.first[1] + self._max_age
         return None
 
     async def async_update(self):
@@ -245,37 +238,38 @@ class StatisticsSensor(Entity):
         if self._max_age is not None:
             self._purge_old()
 
-        self.count = len(self.states)
+        window = self._window
+        self.count = len(window)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if window:  # require only one data point
+                self.mean = round(window.mean, self._precision)
+                self.median = round(window.median, self._precision)
+            else:
+                _LOGGER.debug("%s: no data points", self.entity_id)
                 self.mean = self.median = STATE_UNKNOWN
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if len(window) > 1:  # require at least two data points
+                self.stdev = round(window.stdev, self._precision)
+                self.variance = round(window.variance, self._precision)
+            else:
+                _LOGGER.debug("%s: need at least two data points", self.entity_id)
                 self.stdev = self.variance = STATE_UNKNOWN
 
-            if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+            if window:
+                self.total = round(window.total, self._precision)
+                self.min = round(window.min, self._precision)
+                self.max = round(window.max, self._precision)
 
-                self.min_age = self.ages[0]
-                self.max_age = self.ages[-1]
+                first_value, self.min_age = window.first
+                last_value, self.max_age = window.last
 
-                self.change = self.states[-1] - self.states[0]
+                self.change = last_value - first_value
                 self.average_change = self.change
                 self.change_rate = 0
 
-                if len(self.states) > 1:
-                    self.average_change /= len(self.states) - 1
+                if len(window) > 1:
+                    self.average_change /= len(window) - 1
 
                     time_diff = (self.max_age - self.min_age).total_seconds()
                     if time_diff > 0:
@@ -326,8 +320,10 @@ class StatisticsSensor(Entity):
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
         with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
+            query = (
+                session.query(States)
+                .options(joinedload(States.state_attributes))
+                .filter(States.entity_id == self._entity_id.lower())
             )
 
             if self._max_age is not None:
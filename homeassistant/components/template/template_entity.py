@@ -1,5 +1,6 @@
 """TemplateEntity utility class."""
 
+from datetime import timedelta
 import logging
 from typing import Any, Callable, Optional, Union
 
@@ -14,6 +15,10 @@ from homeassistant.helpers.template import Template, result_as_boolean
 
 _LOGGER = logging.getLogger(__name__)
 
+# Templates that iterate all states or the states of a domain render at most
+# once per this time when those states change
+ITERATED_STATES_RATE_LIMIT = timedelta(seconds=1)
+
 
 class _TemplateAttribute:
     """Attribute value linked to template result."""
@@ -117,7 +122,10 @@ class _TemplateAttribute:
     def async_template_startup(self) -> None:
         """Call from containing entity when added to hass."""
         result_info = async_track_template_result(
-            self._entity.hass, self.template, self._handle_result
+            self._entity.hass,
+            self.template,
+            self._handle_result,
+            rate_limit=ITERATED_STATES_RATE_LIMIT,
         )
 
         self.async_update = result_info.async_refresh
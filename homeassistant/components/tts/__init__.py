@@ -1,5 +1,6 @@
 """Provide functionality for TTS."""
 import asyncio
+from collections import OrderedDict
 import functools as ft
 import hashlib
 import io
@@ -7,7 +8,7 @@ import logging
 import mimetypes
 import os
 import re
-from typing import Dict, Optional
+from typing import Dict, Optional, Set, Tuple
 
 from aiohttp import web
 import mutagen
@@ -51,12 +52,17 @@ BASE_URL_KEY = "tts_base_url"
 CONF_BASE_URL = "base_url"
 CONF_CACHE = "cache"
 CONF_CACHE_DIR = "cache_dir"
+CONF_CACHE_SIZE = "cache_size"
 CONF_LANG = "language"
 CONF_SERVICE_NAME = "service_name"
+CONF_MEMORY_SIZE = "memory_size"
 CONF_TIME_MEMORY = "time_memory"
 
 DEFAULT_CACHE = True
 DEFAULT_CACHE_DIR = "tts"
+# Size budgets of the file and the memory cache in MiB
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_MEMORY_SIZE = 64
 DEFAULT_TIME_MEMORY = 300
 DOMAIN = "tts"
 
@@ -85,6 +91,12 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Required(CONF_PLATFORM): vol.All(cv.string, _deprecated_platform),
         vol.Optional(CONF_CACHE, default=DEFAULT_CACHE): cv.boolean,
         vol.Optional(CONF_CACHE_DIR, default=DEFAULT_CACHE_DIR): cv.string,
+        vol.Optional(CONF_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_MEMORY_SIZE, default=DEFAULT_MEMORY_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
         vol.Optional(CONF_TIME_MEMORY, default=DEFAULT_TIME_MEMORY): vol.All(
             vol.Coerce(int), vol.Range(min=60, max=57600)
         ),
@@ -118,6 +130,8 @@ async def async_setup(hass, config):
         time_memory = conf.get(CONF_TIME_MEMORY, DEFAULT_TIME_MEMORY)
         base_url = conf.get(CONF_BASE_URL) or get_url(hass)
         hass.data[BASE_URL_KEY] = base_url
+        tts.cache_size = conf.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE) * 1024 ** 2
+        tts.memory_size = conf.get(CONF_MEMORY_SIZE, DEFAULT_MEMORY_SIZE) * 1024 ** 2
 
         await tts.async_init_cache(use_cache, cache_dir, time_memory, base_url)
     except (HomeAssistantError, KeyError):
@@ -229,7 +243,14 @@ def _hash_options(options: Dict) -> str:
 
 
 class SpeechManager:
-    """Representation of a speech store."""
+    """Representation of a speech store.
+
+    The file and the memory cache are ordered from least to most recently
+    used and evict the least recently used speech when they are over their
+    size budget. Speech in memory that was not read since its URL was last
+    handed out is kept until time_memory passes, so a burst of announcements
+    can go over the memory budget for that time.
+    """
 
     def __init__(self, hass):
         """Initialize a speech store."""
@@ -238,10 +259,19 @@ class SpeechManager:
 
         self.use_cache = DEFAULT_CACHE
         self.cache_dir = DEFAULT_CACHE_DIR
+        self.cache_size = DEFAULT_CACHE_SIZE * 1024 ** 2
+        self.memory_size = DEFAULT_MEMORY_SIZE * 1024 ** 2
         self.time_memory = DEFAULT_TIME_MEMORY
         self.base_url = None
-        self.file_cache = {}
-        self.mem_cache = {}
+        self.file_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.mem_cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._file_sizes: Dict[str, int] = {}
+        self._file_cache_bytes = 0
+        self._mem_cache_bytes = 0
+        # Speech in memory with a URL that was not read yet
+        self._mem_cache_unread: Set[str] = set()
+        # Speech that is being generated, so identical requests share it
+        self._pending: Dict[Tuple[str, bool], asyncio.Task] = {}
 
     async def async_init_cache(self, use_cache, cache_dir, time_memory, base_url):
         """Init config folder and load file cache."""
@@ -264,11 +294,22 @@ class SpeechManager:
             raise HomeAssistantError(f"Can't read cache dir {err}")
 
         if cache_files:
-            self.file_cache.update(cache_files)
+            file_stats = await self.hass.async_add_executor_job(
+                _get_cache_file_stats, self.cache_dir, cache_files
+            )
+            # Files used last were written last
+            for key in sorted(cache_files, key=lambda key: file_stats[key][0]):
+                self.file_cache[key] = cache_files[key]
+                self._file_sizes[key] = file_stats[key][1]
+                self._file_cache_bytes += file_stats[key][1]
+
+            await self._async_evict_files()
 
     async def async_clear_cache(self):
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self.mem_cache = OrderedDict()
+        self._mem_cache_bytes = 0
+        self._mem_cache_unread.clear()
 
         def remove_files():
             """Remove files from filesystem."""
@@ -279,7 +320,9 @@ class SpeechManager:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
 
         await self.hass.async_add_executor_job(remove_files)
-        self.file_cache = {}
+        self.file_cache = OrderedDict()
+        self._file_sizes = {}
+        self._file_cache_bytes = 0
 
     @callback
     def async_register_engine(self, engine, provider, config):
@@ -328,18 +371,30 @@ class SpeechManager:
             msg_hash, language.replace("_", "-"), options_key, engine
         ).lower()
 
-        # Is speech already in memory
+        # Is speech already in memory, keep it until the new URL is read
         if key in self.mem_cache:
             filename = self.mem_cache[key][MEM_CACHE_FILENAME]
+            self.mem_cache.move_to_end(key)
+            self._mem_cache_unread.add(key)
         # Is file store in file cache
         elif use_cache and key in self.file_cache:
             filename = self.file_cache[key]
+            self.file_cache.move_to_end(key)
             self.hass.async_create_task(self.async_file_to_mem(key))
-        # Load speech from provider into memory
+        # Load speech from provider into memory, unless it is already being
+        # loaded for an identical request.
         else:
-            filename = await self.async_get_tts_audio(
-                engine, key, message, use_cache, language, options
-            )
+            pending_key = (key, use_cache)
+            task = self._pending.get(pending_key)
+            if task is None:
+                task = self._pending[pending_key] = self.hass.async_create_task(
+                    self.async_get_tts_audio(
+                        engine, key, message, use_cache, language, options
+                    )
+                )
+                task.add_done_callback(lambda _: self._pending.pop(pending_key, None))
+            # Do not cancel the shared task when one of the requests is cancelled
+            filename = await asyncio.shield(task)
 
         return f"{self.base_url}/api/tts_proxy/{filename}"
 
@@ -386,9 +441,36 @@ class SpeechManager:
 
         try:
             await self.hass.async_add_executor_job(save_speech)
-            self.file_cache[key] = filename
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
+            return
+
+        self.file_cache[key] = filename
+        self.file_cache.move_to_end(key)
+        self._file_cache_bytes += len(data) - self._file_sizes.get(key, 0)
+        self._file_sizes[key] = len(data)
+        await self._async_evict_files()
+
+    async def _async_evict_files(self):
+        """Remove the least recently used files while over the size budget."""
+        evicted = []
+        while self._file_cache_bytes > self.cache_size and len(self.file_cache) > 1:
+            key, filename = self.file_cache.popitem(last=False)
+            self._file_cache_bytes -= self._file_sizes.pop(key, 0)
+            evicted.append(filename)
+
+        if not evicted:
+            return
+
+        def remove_files():
+            """Remove evicted files from filesystem."""
+            for filename in evicted:
+                try:
+                    os.remove(os.path.join(self.cache_dir, filename))
+                except OSError as err:
+                    _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+
+        await self.hass.async_add_executor_job(remove_files)
 
     async def async_file_to_mem(self, key):
         """Load voice from file cache into memory.
@@ -409,7 +491,8 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError:
-            del self.file_cache[key]
+            self.file_cache.pop(key, None)
+            self._file_cache_bytes -= self._file_sizes.pop(key, 0)
             raise HomeAssistantError(f"Can't read {voice_file}")
 
         self._async_store_to_memcache(key, filename, data)
@@ -417,15 +500,35 @@ class SpeechManager:
     @callback
     def _async_store_to_memcache(self, key, filename, data):
         """Store data to memcache and set timer to remove it."""
-        self.mem_cache[key] = {MEM_CACHE_FILENAME: filename, MEM_CACHE_VOICE: data}
+        self._async_remove_from_memcache(key)
+        entry = {MEM_CACHE_FILENAME: filename, MEM_CACHE_VOICE: data}
+        self.mem_cache[key] = entry
+        self._mem_cache_bytes += len(data)
+        self._mem_cache_unread.add(key)
+
+        # Speech that was not read yet is only removed when it expires
+        for old_key in list(self.mem_cache):
+            if self._mem_cache_bytes <= self.memory_size:
+                break
+            if old_key not in self._mem_cache_unread:
+                self._async_remove_from_memcache(old_key)
 
         @callback
         def async_remove_from_mem():
             """Cleanup memcache."""
-            self.mem_cache.pop(key, None)
+            if self.mem_cache.get(key) is entry:
+                self._async_remove_from_memcache(key)
 
         self.hass.loop.call_later(self.time_memory, async_remove_from_mem)
 
+    @callback
+    def _async_remove_from_memcache(self, key):
+        """Remove speech from memcache."""
+        entry = self.mem_cache.pop(key, None)
+        if entry is not None:
+            self._mem_cache_bytes -= len(entry[MEM_CACHE_VOICE])
+        self._mem_cache_unread.discard(key)
+
     async def async_read_tts(self, filename):
         """Read a voice file and return binary.
 
@@ -439,11 +542,15 @@ class SpeechManager:
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
-        if key not in self.mem_cache:
+        if key in self.mem_cache:
+            self.mem_cache.move_to_end(key)
+        else:
             if key not in self.file_cache:
                 raise HomeAssistantError(f"{key} not in cache!")
+            self.file_cache.move_to_end(key)
             await self.async_file_to_mem(key)
 
+        self._mem_cache_unread.discard(key)
         content, _ = mimetypes.guess_type(filename)
         return content, self.mem_cache[key][MEM_CACHE_VOICE]
 
@@ -542,6 +649,19 @@ def _get_cache_files(cache_dir):
     return cache
 
 
+def _get_cache_file_stats(cache_dir, cache_files) -> Dict[str, Tuple[float, int]]:
+    """Return the modification time and size of the cache files."""
+    stats = {}
+    for key, filename in cache_files.items():
+        try:
+            stat = os.stat(os.path.join(cache_dir, filename))
+        except OSError:
+            stats[key] = (0.0, 0)
+        else:
+            stats[key] = (stat.st_mtime, stat.st_size)
+    return stats
+
+
 class TextToSpeechUrlView(HomeAssistantView):
     """TTS view to get a url to a generated speech file."""
 
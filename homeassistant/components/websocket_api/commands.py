@@ -18,6 +18,7 @@ from homeassistant.helpers import config_validation as cv, entity
 from homeassistant.helpers.event import async_track_template_result
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_report
 
 from . import const, decorators, messages
 
@@ -39,6 +40,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_setup_report)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -67,30 +69,33 @@ def handle_subscribe_events(hass, connection, msg):
     if event_type not in SUBSCRIBE_WHITELIST and not connection.user.is_admin:
         raise Unauthorized
 
+    cache = hass.data.get(const.DATA_EVENT_MESSAGE_CACHE)
+    if cache is None:
+        cache = hass.data[const.DATA_EVENT_MESSAGE_CACHE] = messages.EventMessageCache()
+
     if event_type == EVENT_STATE_CHANGED:
 
         @callback
-        def forward_events(event):
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
+        def event_filter(event):
+            """Filter state changed events the user is not allowed to read."""
+            return connection.user.permissions.check_entity(
                 event.data["entity_id"], POLICY_READ
-            ):
-                return
-
-            connection.send_message(messages.event_message(msg["id"], event))
+            )
 
     else:
 
         @callback
-        def forward_events(event):
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
+        def event_filter(event):
+            """Filter out time changed events."""
+            return event.event_type != EVENT_TIME_CHANGED
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
+    @callback
+    def forward_events(event):
+        """Forward events to websocket."""
+        connection.send_message(cache.event_message(msg["id"], event))
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
+        event_type, forward_events, event_filter=event_filter
     )
 
     connection.send_message(messages.result_message(msg["id"]))
@@ -231,6 +236,13 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "setup/report"})
+def handle_setup_report(hass, connection, msg):
+    """Handle setup report command."""
+    connection.send_result(msg["id"], async_get_setup_report(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
@@ -44,4 +44,12 @@ SIGNAL_WEBSOCKET_DISCONNECTED = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS = f"{DOMAIN}.connections"
 
+# Data used to store the serialized event message cache
+DATA_EVENT_MESSAGE_CACHE = f"{DOMAIN}.event_message_cache"
+EVENT_MESSAGE_CACHE_SIZE = 128
+
+# Placeholder for the subscription id in cached event messages
+IDEN_TEMPLATE = "__IDEN__"
+IDEN_JSON_TEMPLATE = '"__IDEN__"'
+
 JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
@@ -1,7 +1,11 @@
 """Message templates for websocket commands."""
+from collections import OrderedDict
+from time import perf_counter
+from typing import Tuple
 
 import voluptuous as vol
 
+from homeassistant.core import Event
 from homeassistant.helpers import config_validation as cv
 
 from . import const
@@ -36,3 +40,50 @@ def error_message(iden, code, message):
 def event_message(iden, event):
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+class EventMessageCache:
+    """Cache of serialized event messages shared between subscriptions.
+
+    The same event is often forwarded to many connections. The message is
+    serialized once with a placeholder id that is swapped for the id of each
+    subscription.
+    """
+
+    def __init__(self, maxsize: int = const.EVENT_MESSAGE_CACHE_SIZE) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        self._cache: "OrderedDict[int, Tuple[Event, str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        # Seconds of serialization that were saved
+        self.time_saved = 0.0
+
+    def event_message(self, iden, event: Event):
+        """Return a serialized event message for a subscription."""
+        key = id(event)
+        cached = self._cache.get(key)
+
+        # Compare identity as well as the key, ids are reused after collection
+        if cached is not None and cached[0] is event:
+            _, dumped, duration = cached
+            self._cache.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += len(dumped)
+            self.time_saved += duration
+        else:
+            start = perf_counter()
+            try:
+                dumped = const.JSON_DUMP(event_message(const.IDEN_TEMPLATE, event))
+            except (ValueError, TypeError):
+                # Let the connection report the unserializable data
+                return event_message(iden, event)
+
+            self.misses += 1
+            self._cache[key] = (event, dumped, perf_counter() - start)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+        # The id is the first key of the message
+        return dumped.replace(const.IDEN_JSON_TEMPLATE, str(iden), 1)
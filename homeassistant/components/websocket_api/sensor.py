@@ -1,22 +1,31 @@
 """Entity to track connections to websocket API."""
+from datetime import timedelta
 
 from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 
 from .const import (
     DATA_CONNECTIONS,
+    DATA_EVENT_MESSAGE_CACHE,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
 )
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 
+ATTR_SERIALIZED_EVENTS = "serialized_events"
+ATTR_BYTES_SAVED = "bytes_saved"
+ATTR_TIME_SAVED = "time_saved"
+
+# The event serialization statistics are polled
+SCAN_INTERVAL = timedelta(minutes=1)
+
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up the API streams platform."""
     entity = APICount()
 
-    async_add_entities([entity])
+    async_add_entities([entity, EventSerializationsSaved()])
 
 
 class APICount(Entity):
@@ -58,3 +67,35 @@ class APICount(Entity):
     def _update_count(self):
         self.count = self.hass.data.get(DATA_CONNECTIONS, 0)
         self.async_write_ha_state()
+
+
+class EventSerializationsSaved(Entity):
+    """Entity to represent how often forwarded events were not serialized again."""
+
+    @property
+    def name(self):
+        """Return name of entity."""
+        return "Event serializations saved"
+
+    @property
+    def state(self):
+        """Return the number of reused event messages."""
+        cache = self.hass.data.get(DATA_EVENT_MESSAGE_CACHE)
+        return 0 if cache is None else cache.hits
+
+    @property
+    def device_state_attributes(self):
+        """Return the event serialization statistics."""
+        cache = self.hass.data.get(DATA_EVENT_MESSAGE_CACHE)
+        if cache is None:
+            return None
+        return {
+            ATTR_SERIALIZED_EVENTS: cache.misses,
+            ATTR_BYTES_SAVED: cache.bytes_saved,
+            ATTR_TIME_SAVED: round(cache.time_saved, 3),
+        }
+
+    @property
+    def unit_of_measurement(self):
+        """Return the unit of measurement."""
+        return "serializations"
@@ -56,7 +56,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, load_yaml, parse_cache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -65,6 +65,7 @@ RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
+YAML_CACHE_FILE = ".yaml_cache"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
 
@@ -305,10 +306,14 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     This function allow a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
     """
+
+    def _load_hass_yaml_config() -> Dict:
+        """Load the configuration, reusing the unchanged parsed files."""
+        with parse_cache(hass.config.path(YAML_CACHE_FILE)):
+            return load_yaml_config_file(hass.config.path(YAML_CONFIG_FILE))
+
     # Not using async_add_executor_job because this is an internal method.
-    config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
-    )
+    config = await hass.loop.run_in_executor(None, _load_hass_yaml_config)
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
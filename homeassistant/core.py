@@ -28,6 +28,7 @@ from typing import (
     Mapping,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
     cast,
@@ -583,12 +584,18 @@ class Event:
         )
 
 
+# A listener and the optional callback filter deciding if it gets an event
+_FilterableJob = Tuple[Callable, Optional[Callable[[Event], bool]]]
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
-        self._listeners: Dict[str, List[Callable]] = {}
+        self._listeners: Dict[str, List[_FilterableJob]] = {}
+        self._match_cache: Dict[str, Tuple[_FilterableJob, ...]] = {}
+        self._time_listener_added: Optional[Callable[[], None]] = None
         self._hass = hass
 
     @callback
@@ -628,12 +635,9 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        listeners = self._listeners.get(event_type, [])
-
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
-        match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        listeners = self._match_cache.get(event_type)
+        if listeners is None:
+            listeners = self._async_build_match(event_type)
 
         event = Event(event_type, event_data, origin, None, context)
 
@@ -643,9 +647,33 @@ class EventBus:
         if not listeners:
             return
 
-        for func in listeners:
+        for func, event_filter in listeners:
+            if event_filter is not None:
+                try:
+                    if not event_filter(event):
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error in event filter")
+                    continue
             self._hass.async_add_job(func, event)
 
+    @callback
+    def _async_build_match(self, event_type: str) -> Tuple[_FilterableJob, ...]:
+        """Build and cache the listeners that receive an event type.
+
+        This method must be run in the event loop.
+        """
+        listeners: List[_FilterableJob] = []
+
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        if event_type != EVENT_HOMEASSISTANT_CLOSE:
+            listeners.extend(self._listeners.get(MATCH_ALL, ()))
+        if event_type != MATCH_ALL:
+            listeners.extend(self._listeners.get(event_type, ()))
+
+        match = self._match_cache[event_type] = tuple(listeners)
+        return match
+
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -663,22 +691,42 @@ class EventBus:
         return remove_listener
 
     @callback
-    def async_listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
+    def async_listen(
+        self,
+        event_type: str,
+        listener: Callable,
+        event_filter: Optional[Callable[[Event], bool]] = None,
+    ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
         To listen to all events specify the constant ``MATCH_ALL``
         as event_type.
 
+        An optional event_filter, which must be a callback, is called with
+        the event before the listener is scheduled. The listener is only
+        scheduled when the filter returns True.
+
         This method must be run in the event loop.
         """
-        if event_type in self._listeners:
-            self._listeners[event_type].append(listener)
-        else:
-            self._listeners[event_type] = [listener]
+        return self._async_listen_filterable_job(event_type, (listener, event_filter))
+
+    @callback
+    def _async_listen_filterable_job(
+        self, event_type: str, filterable_job: _FilterableJob
+    ) -> CALLBACK_TYPE:
+        """Register a listener and filter pair for an event type.
+
+        This method must be run in the event loop.
+        """
+        self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_match(event_type)
+
+        if event_type == EVENT_TIME_CHANGED and self._time_listener_added:
+            self._time_listener_added()
 
         def remove_listener() -> None:
             """Remove the listener."""
-            self._async_remove_listener(event_type, listener)
+            self._async_remove_listener(event_type, filterable_job)
 
         return remove_listener
 
@@ -711,6 +759,7 @@ class EventBus:
 
         This method must be run in the event loop.
         """
+        filterable_job: Optional[_FilterableJob] = None
 
         @callback
         def onetime_listener(event: Event) -> None:
@@ -723,19 +772,24 @@ class EventBus:
             # multiple times as well.
             # This will make sure the second time it does nothing.
             setattr(onetime_listener, "run", True)
-            self._async_remove_listener(event_type, onetime_listener)
+            assert filterable_job is not None
+            self._async_remove_listener(event_type, filterable_job)
             self._hass.async_run_job(listener, event)
 
-        return self.async_listen(event_type, onetime_listener)
+        filterable_job = (onetime_listener, None)
+
+        return self._async_listen_filterable_job(event_type, filterable_job)
 
     @callback
-    def _async_remove_listener(self, event_type: str, listener: Callable) -> None:
+    def _async_remove_listener(
+        self, event_type: str, filterable_job: _FilterableJob
+    ) -> None:
         """Remove a listener of a specific event_type.
 
         This method must be run in the event loop.
         """
         try:
-            self._listeners[event_type].remove(listener)
+            self._listeners[event_type].remove(filterable_job)
 
             # delete event_type list if empty
             if not self._listeners[event_type]:
@@ -743,7 +797,21 @@ class EventBus:
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
-            _LOGGER.warning("Unable to remove unknown listener %s", listener)
+            _LOGGER.warning("Unable to remove unknown listener %s", filterable_job)
+            return
+
+        self._async_invalidate_match(event_type)
+
+    @callback
+    def _async_invalidate_match(self, event_type: str) -> None:
+        """Drop cached listener tuples affected by a change to event_type.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            self._match_cache.clear()
+        else:
+            self._match_cache.pop(event_type, None)
 
 
 class State:
@@ -1592,8 +1660,14 @@ class Config:
 
 
 def _async_create_timer(hass: HomeAssistant) -> None:
-    """Create a timer that will start on HOMEASSISTANT_START."""
+    """Create a timer that will start on HOMEASSISTANT_START.
+
+    The timer only ticks while there are listeners for the time changed
+    event. It starts ticking again when a listener is added.
+    """
+    # pylint: disable=protected-access
     handle = None
+    stopped = False
     timer_context = Context()
 
     def schedule_tick(now: datetime.datetime) -> None:
@@ -1607,6 +1681,7 @@ def _async_create_timer(hass: HomeAssistant) -> None:
     @callback
     def fire_time_event(target: float) -> None:
         """Fire next time event."""
+        nonlocal handle
         now = dt_util.utcnow()
 
         hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: now}, context=timer_context)
@@ -1618,14 +1693,27 @@ def _async_create_timer(hass: HomeAssistant) -> None:
                 EVENT_TIMER_OUT_OF_SYNC, {ATTR_SECONDS: late}, context=timer_context
             )
 
+        if EVENT_TIME_CHANGED not in hass.bus._listeners:
+            handle = None
+            return
+
         schedule_tick(now)
 
+    @callback
+    def time_listener_added() -> None:
+        """Start ticking again when a time changed listener is added."""
+        if handle is None and not stopped:
+            schedule_tick(dt_util.utcnow())
+
     @callback
     def stop_timer(_: Event) -> None:
         """Stop the timer."""
+        nonlocal stopped
+        stopped = True
         if handle is not None:
             handle.cancel()
 
+    hass.bus._time_listener_added = time_listener_added
     hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, stop_timer)
 
     _LOGGER.info("Timer:starting")
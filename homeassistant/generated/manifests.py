@@ -0,0 +1,10243 @@
+"""Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+"""
+
+# fmt: off
+
+MANIFESTS = {
+    "abode": {
+        "codeowners": [
+            "@shred86"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/abode",
+        "domain": "abode",
+        "homekit": {
+            "models": [
+                "Abode",
+                "Iota"
+            ]
+        },
+        "name": "Abode",
+        "requirements": [
+            "abodepy==1.1.0"
+        ]
+    },
+    "accuweather": {
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/accuweather/",
+        "domain": "accuweather",
+        "name": "AccuWeather",
+        "quality_scale": "platinum",
+        "requirements": [
+            "accuweather==0.0.9"
+        ]
+    },
+    "acer_projector": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/acer_projector",
+        "domain": "acer_projector",
+        "name": "Acer Projector",
+        "requirements": [
+            "pyserial==3.4"
+        ]
+    },
+    "acmeda": {
+        "codeowners": [
+            "@atmurray"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/acmeda",
+        "domain": "acmeda",
+        "name": "Rollease Acmeda Automate",
+        "requirements": [
+            "aiopulse==0.4.0"
+        ]
+    },
+    "actiontec": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/actiontec",
+        "domain": "actiontec",
+        "name": "Actiontec"
+    },
+    "adguard": {
+        "codeowners": [
+            "@frenck"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/adguard",
+        "domain": "adguard",
+        "name": "AdGuard Home",
+        "requirements": [
+            "adguardhome==0.4.2"
+        ]
+    },
+    "ads": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ads",
+        "domain": "ads",
+        "name": "ADS",
+        "requirements": [
+            "pyads==3.2.1"
+        ]
+    },
+    "aftership": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/aftership",
+        "domain": "aftership",
+        "name": "AfterShip",
+        "requirements": [
+            "pyaftership==0.1.2"
+        ]
+    },
+    "agent_dvr": {
+        "codeowners": [
+            "@ispysoftware"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/agent_dvr/",
+        "domain": "agent_dvr",
+        "name": "Agent DVR",
+        "requirements": [
+            "agent-py==0.0.23"
+        ]
+    },
+    "air_quality": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/air_quality",
+        "domain": "air_quality",
+        "name": "Air Quality"
+    },
+    "airly": {
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/airly",
+        "domain": "airly",
+        "name": "Airly",
+        "quality_scale": "platinum",
+        "requirements": [
+            "airly==0.0.2"
+        ]
+    },
+    "airvisual": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/airvisual",
+        "domain": "airvisual",
+        "name": "AirVisual",
+        "requirements": [
+            "pyairvisual==4.4.0"
+        ]
+    },
+    "aladdin_connect": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/aladdin_connect",
+        "domain": "aladdin_connect",
+        "name": "Aladdin Connect",
+        "requirements": [
+            "aladdin_connect==0.3"
+        ]
+    },
+    "alarm_control_panel": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/alarm_control_panel",
+        "domain": "alarm_control_panel",
+        "name": "Alarm Control Panel",
+        "quality_scale": "internal"
+    },
+    "alarmdecoder": {
+        "codeowners": [
+            "@ajschmidt8"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/alarmdecoder",
+        "domain": "alarmdecoder",
+        "name": "AlarmDecoder",
+        "requirements": [
+            "adext==0.3"
+        ]
+    },
+    "alert": {
+        "after_dependencies": [
+            "notify"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/alert",
+        "domain": "alert",
+        "name": "Alert",
+        "quality_scale": "internal"
+    },
+    "alexa": {
+        "after_dependencies": [
+            "camera"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud",
+            "@ochlocracy"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/alexa",
+        "domain": "alexa",
+        "name": "Amazon Alexa"
+    },
+    "almond": {
+        "codeowners": [
+            "@gcampax",
+            "@balloob"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http",
+            "conversation"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/almond",
+        "domain": "almond",
+        "name": "Almond",
+        "requirements": [
+            "pyalmond==0.0.2"
+        ]
+    },
+    "alpha_vantage": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/alpha_vantage",
+        "domain": "alpha_vantage",
+        "name": "Alpha Vantage",
+        "requirements": [
+            "alpha_vantage==2.2.0"
+        ]
+    },
+    "amazon_polly": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/amazon_polly",
+        "domain": "amazon_polly",
+        "name": "Amazon Polly",
+        "requirements": [
+            "boto3==1.9.252"
+        ]
+    },
+    "ambiclimate": {
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ambiclimate",
+        "domain": "ambiclimate",
+        "name": "Ambiclimate",
+        "requirements": [
+            "ambiclimate==0.2.1"
+        ]
+    },
+    "ambient_station": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ambient_station",
+        "domain": "ambient_station",
+        "name": "Ambient Weather Station",
+        "requirements": [
+            "aioambient==1.2.1"
+        ]
+    },
+    "amcrest": {
+        "codeowners": [
+            "@pnbruckner"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/amcrest",
+        "domain": "amcrest",
+        "name": "Amcrest",
+        "requirements": [
+            "amcrest==1.7.0"
+        ]
+    },
+    "ampio": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ampio",
+        "domain": "ampio",
+        "name": "Ampio Smart Smog System",
+        "requirements": [
+            "asmog==0.0.6"
+        ]
+    },
+    "android_ip_webcam": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/android_ip_webcam",
+        "domain": "android_ip_webcam",
+        "name": "Android IP Webcam",
+        "requirements": [
+            "pydroid-ipcam==0.8"
+        ]
+    },
+    "androidtv": {
+        "codeowners": [
+            "@JeffLIrion"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/androidtv",
+        "domain": "androidtv",
+        "name": "Android TV",
+        "requirements": [
+            "adb-shell[async]==0.2.1",
+            "androidtv[async]==0.0.49",
+            "pure-python-adb[async]==0.3.0.dev0"
+        ]
+    },
+    "anel_pwrctrl": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/anel_pwrctrl",
+        "domain": "anel_pwrctrl",
+        "name": "Anel NET-PwrCtrl",
+        "requirements": [
+            "anel_pwrctrl-homeassistant==0.0.1.dev2"
+        ]
+    },
+    "anthemav": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/anthemav",
+        "domain": "anthemav",
+        "name": "Anthem A/V Receivers",
+        "requirements": [
+            "anthemav==1.1.10"
+        ]
+    },
+    "apache_kafka": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/apache_kafka",
+        "domain": "apache_kafka",
+        "name": "Apache Kafka",
+        "requirements": [
+            "aiokafka==0.6.0"
+        ]
+    },
+    "apcupsd": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/apcupsd",
+        "domain": "apcupsd",
+        "name": "apcupsd",
+        "requirements": [
+            "apcaccess==0.0.13"
+        ]
+    },
+    "api": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/api",
+        "domain": "api",
+        "name": "Home Assistant API",
+        "quality_scale": "internal"
+    },
+    "apns": {
+        "after_dependencies": [
+            "device_tracker"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/apns",
+        "domain": "apns",
+        "name": "Apple Push Notification Service (APNS)",
+        "requirements": [
+            "apns2==0.3.0"
+        ]
+    },
+    "apple_tv": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [],
+        "dependencies": [
+            "configurator"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/apple_tv",
+        "domain": "apple_tv",
+        "name": "Apple TV",
+        "requirements": [
+            "pyatv==0.3.13"
+        ]
+    },
+    "apprise": {
+        "codeowners": [
+            "@caronc"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/apprise",
+        "domain": "apprise",
+        "name": "Apprise",
+        "requirements": [
+            "apprise==0.8.7"
+        ]
+    },
+    "aprs": {
+        "codeowners": [
+            "@PhilRW"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/aprs",
+        "domain": "aprs",
+        "name": "APRS",
+        "requirements": [
+            "aprslib==0.6.46",
+            "geopy==1.21.0"
+        ]
+    },
+    "aqualogic": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/aqualogic",
+        "domain": "aqualogic",
+        "name": "AquaLogic",
+        "requirements": [
+            "aqualogic==1.0"
+        ]
+    },
+    "aquostv": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/aquostv",
+        "domain": "aquostv",
+        "name": "Sharp Aquos TV",
+        "requirements": [
+            "sharp_aquos_rc==0.3.2"
+        ]
+    },
+    "arcam_fmj": {
+        "codeowners": [
+            "@elupus"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/arcam_fmj",
+        "domain": "arcam_fmj",
+        "name": "Arcam FMJ Receivers",
+        "requirements": [
+            "arcam-fmj==0.5.1"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+                "manufacturer": "ARCAM"
+            }
+        ]
+    },
+    "arduino": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/arduino",
+        "domain": "arduino",
+        "name": "Arduino",
+        "requirements": [
+            "PyMata==2.20"
+        ]
+    },
+    "arest": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/arest",
+        "domain": "arest",
+        "name": "aREST"
+    },
+    "arlo": {
+        "codeowners": [],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/arlo",
+        "domain": "arlo",
+        "name": "Arlo",
+        "requirements": [
+            "pyarlo==0.2.3"
+        ]
+    },
+    "arris_tg2492lg": {
+        "codeowners": [
+            "@vanbalken"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/arris_tg2492lg",
+        "domain": "arris_tg2492lg",
+        "name": "Arris TG2492LG",
+        "requirements": [
+            "arris-tg2492lg==1.0.0"
+        ]
+    },
+    "aruba": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/aruba",
+        "domain": "aruba",
+        "name": "Aruba",
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "arwn": {
+        "codeowners": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/arwn",
+        "domain": "arwn",
+        "name": "Ambient Radio Weather Network"
+    },
+    "asterisk_cdr": {
+        "codeowners": [],
+        "dependencies": [
+            "asterisk_mbox"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/asterisk_cdr",
+        "domain": "asterisk_cdr",
+        "name": "Asterisk Call Detail Records"
+    },
+    "asterisk_mbox": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/asterisk_mbox",
+        "domain": "asterisk_mbox",
+        "name": "Asterisk Voicemail",
+        "requirements": [
+            "asterisk_mbox==0.5.0"
+        ]
+    },
+    "asuswrt": {
+        "codeowners": [
+            "@kennedyshead"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/asuswrt",
+        "domain": "asuswrt",
+        "name": "ASUSWRT",
+        "requirements": [
+            "aioasuswrt==1.2.7"
+        ]
+    },
+    "atag": {
+        "codeowners": [
+            "@MatsNL"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/atag/",
+        "domain": "atag",
+        "name": "Atag",
+        "requirements": [
+            "pyatag==0.3.3.4"
+        ]
+    },
+    "aten_pe": {
+        "codeowners": [
+            "@mtdcr"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/aten_pe",
+        "domain": "aten_pe",
+        "name": "ATEN Rack PDU",
+        "requirements": [
+            "atenpdu==0.3.0"
+        ]
+    },
+    "atome": {
+        "codeowners": [
+            "@baqs"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/atome",
+        "domain": "atome",
+        "name": "Atome Linky",
+        "requirements": [
+            "pyatome==0.1.1"
+        ]
+    },
+    "august": {
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "configurator"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/august",
+        "domain": "august",
+        "name": "August",
+        "requirements": [
+            "py-august==0.25.0"
+        ]
+    },
+    "aurora": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/aurora",
+        "domain": "aurora",
+        "name": "Aurora"
+    },
+    "aurora_abb_powerone": {
+        "codeowners": [
+            "@davet2001"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/aurora_abb_powerone/",
+        "domain": "aurora_abb_powerone",
+        "name": "Aurora ABB Solar PV",
+        "requirements": [
+            "aurorapy==0.2.6"
+        ]
+    },
+    "auth": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/auth",
+        "domain": "auth",
+        "name": "Auth",
+        "quality_scale": "internal"
+    },
+    "automation": {
+        "after_dependencies": [
+            "device_automation",
+            "webhook"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/automation",
+        "domain": "automation",
+        "name": "Automation",
+        "quality_scale": "internal"
+    },
+    "avea": {
+        "codeowners": [
+            "@pattyland"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/avea",
+        "domain": "avea",
+        "name": "Elgato Avea",
+        "requirements": [
+            "avea==1.4"
+        ]
+    },
+    "avion": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/avion",
+        "domain": "avion",
+        "name": "Avi-on",
+        "requirements": [
+            "avion==0.10"
+        ]
+    },
+    "avri": {
+        "codeowners": [
+            "@timvancann"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/avri",
+        "domain": "avri",
+        "name": "Avri",
+        "requirements": [
+            "avri-api==0.1.7",
+            "pycountry==19.8.18"
+        ]
+    },
+    "awair": {
+        "codeowners": [
+            "@ahayworth",
+            "@danielsjf"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/awair",
+        "domain": "awair",
+        "name": "Awair",
+        "requirements": [
+            "python_awair==0.1.1"
+        ]
+    },
+    "aws": {
+        "codeowners": [
+            "@awarecan"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/aws",
+        "domain": "aws",
+        "name": "Amazon Web Services (AWS)",
+        "requirements": [
+            "aiobotocore==0.11.1"
+        ]
+    },
+    "axis": {
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "codeowners": [
+            "@Kane610"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/axis",
+        "domain": "axis",
+        "name": "Axis",
+        "requirements": [
+            "axis==33"
+        ],
+        "zeroconf": [
+            "_axis-video._tcp.local."
+        ]
+    },
+    "azure_devops": {
+        "codeowners": [
+            "@timmo001"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/azure_devops",
+        "domain": "azure_devops",
+        "name": "Azure DevOps",
+        "requirements": [
+            "aioazuredevops==1.3.5"
+        ]
+    },
+    "azure_event_hub": {
+        "codeowners": [
+            "@eavanvalkenburg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/azure_event_hub",
+        "domain": "azure_event_hub",
+        "name": "Azure Event Hub",
+        "requirements": [
+            "azure-eventhub==5.1.0"
+        ]
+    },
+    "azure_service_bus": {
+        "codeowners": [
+            "@hfurubotten"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/azure_service_bus",
+        "domain": "azure_service_bus",
+        "name": "Azure Service Bus",
+        "requirements": [
+            "azure-servicebus==0.50.1"
+        ]
+    },
+    "baidu": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/baidu",
+        "domain": "baidu",
+        "name": "Baidu",
+        "requirements": [
+            "baidu-aip==1.6.6"
+        ]
+    },
+    "bayesian": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bayesian",
+        "domain": "bayesian",
+        "name": "Bayesian",
+        "quality_scale": "internal"
+    },
+    "bbb_gpio": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bbb_gpio",
+        "domain": "bbb_gpio",
+        "name": "BeagleBone Black GPIO",
+        "requirements": [
+            "Adafruit_BBIO==1.1.1"
+        ]
+    },
+    "bbox": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bbox",
+        "domain": "bbox",
+        "name": "Bbox",
+        "requirements": [
+            "pybbox==0.0.5-alpha"
+        ]
+    },
+    "beewi_smartclim": {
+        "codeowners": [
+            "@alemuro"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/beewi_smartclim",
+        "domain": "beewi_smartclim",
+        "name": "BeeWi SmartClim BLE sensor",
+        "requirements": [
+            "beewi_smartclim==0.0.7"
+        ]
+    },
+    "bh1750": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bh1750",
+        "domain": "bh1750",
+        "name": "BH1750",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "binary_sensor": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/binary_sensor",
+        "domain": "binary_sensor",
+        "name": "Binary Sensor",
+        "quality_scale": "internal"
+    },
+    "bitcoin": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/bitcoin",
+        "domain": "bitcoin",
+        "name": "Bitcoin",
+        "requirements": [
+            "blockchain==1.4.4"
+        ]
+    },
+    "bizkaibus": {
+        "codeowners": [
+            "@UgaitzEtxebarria"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/bizkaibus",
+        "domain": "bizkaibus",
+        "name": "Bizkaibus",
+        "requirements": [
+            "bizkaibus==0.1.1"
+        ]
+    },
+    "blackbird": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/blackbird",
+        "domain": "blackbird",
+        "name": "Monoprice Blackbird Matrix Switch",
+        "requirements": [
+            "pyblackbird==0.5"
+        ]
+    },
+    "blebox": {
+        "codeowners": [
+            "@gadgetmobile"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/blebox",
+        "domain": "blebox",
+        "name": "BleBox devices",
+        "requirements": [
+            "blebox_uniapi==1.3.2"
+        ]
+    },
+    "blink": {
+        "codeowners": [
+            "@fronzbot"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/blink",
+        "domain": "blink",
+        "name": "Blink",
+        "requirements": [
+            "blinkpy==0.16.3"
+        ]
+    },
+    "blinksticklight": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/blinksticklight",
+        "domain": "blinksticklight",
+        "name": "BlinkStick",
+        "requirements": [
+            "blinkstick==1.1.8"
+        ]
+    },
+    "blinkt": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/blinkt",
+        "domain": "blinkt",
+        "name": "Blinkt!",
+        "requirements": [
+            "blinkt==0.1.0"
+        ]
+    },
+    "blockchain": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/blockchain",
+        "domain": "blockchain",
+        "name": "Blockchain.com",
+        "requirements": [
+            "python-blockchain-api==0.0.2"
+        ]
+    },
+    "bloomsky": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bloomsky",
+        "domain": "bloomsky",
+        "name": "BloomSky"
+    },
+    "bluesound": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bluesound",
+        "domain": "bluesound",
+        "name": "Bluesound",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "bluetooth_le_tracker": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bluetooth_le_tracker",
+        "domain": "bluetooth_le_tracker",
+        "name": "Bluetooth LE Tracker",
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ]
+    },
+    "bluetooth_tracker": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bluetooth_tracker",
+        "domain": "bluetooth_tracker",
+        "name": "Bluetooth Tracker",
+        "requirements": [
+            "bt_proximity==0.2",
+            "pybluez==0.22"
+        ]
+    },
+    "bme280": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bme280",
+        "domain": "bme280",
+        "name": "Bosch BME280 Environmental Sensor",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "bme680": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bme680",
+        "domain": "bme680",
+        "name": "Bosch BME680 Environmental Sensor",
+        "requirements": [
+            "bme680==1.0.5",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "bmp280": {
+        "codeowners": [
+            "@belidzs"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/bmp280",
+        "domain": "bmp280",
+        "name": "Bosch BMP280 Environmental Sensor",
+        "quality_scale": "silver",
+        "requirements": [
+            "adafruit-circuitpython-bmp280==3.1.1",
+            "RPi.GPIO==0.7.0"
+        ]
+    },
+    "bmw_connected_drive": {
+        "codeowners": [
+            "@gerard33",
+            "@rikroe"
+        ],
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/bmw_connected_drive",
+        "domain": "bmw_connected_drive",
+        "name": "BMW Connected Drive",
+        "requirements": [
+            "bimmer_connected==0.7.7"
+        ]
+    },
+    "bom": {
+        "codeowners": [
+            "@maddenp"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/bom",
+        "domain": "bom",
+        "name": "Australian Bureau of Meteorology (BOM)",
+        "requirements": [
+            "bomradarloop==0.1.5"
+        ]
+    },
+    "bond": {
+        "codeowners": [
+            "@prystupa"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/bond",
+        "domain": "bond",
+        "name": "Bond",
+        "quality_scale": "platinum",
+        "requirements": [
+            "bond-api==0.1.8"
+        ],
+        "zeroconf": [
+            "_bond._tcp.local."
+        ]
+    },
+    "braviatv": {
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/braviatv",
+        "domain": "braviatv",
+        "name": "Sony Bravia TV",
+        "requirements": [
+            "bravia-tv==1.0.6"
+        ]
+    },
+    "broadlink": {
+        "codeowners": [
+            "@danielhiversen",
+            "@felipediel"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/broadlink",
+        "domain": "broadlink",
+        "name": "Broadlink",
+        "requirements": [
+            "broadlink==0.14.1"
+        ]
+    },
+    "brother": {
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/brother",
+        "domain": "brother",
+        "name": "Brother Printer",
+        "quality_scale": "platinum",
+        "requirements": [
+            "brother==0.1.15"
+        ],
+        "zeroconf": [
+            "_printer._tcp.local."
+        ]
+    },
+    "brottsplatskartan": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/brottsplatskartan",
+        "domain": "brottsplatskartan",
+        "name": "Brottsplatskartan",
+        "requirements": [
+            "brottsplatskartan==0.0.1"
+        ]
+    },
+    "browser": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/browser",
+        "domain": "browser",
+        "name": "Browser",
+        "quality_scale": "internal"
+    },
+    "brunt": {
+        "codeowners": [
+            "@eavanvalkenburg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/brunt",
+        "domain": "brunt",
+        "name": "Brunt Blind Engine",
+        "requirements": [
+            "brunt==0.1.3"
+        ]
+    },
+    "bsblan": {
+        "codeowners": [
+            "@liudger"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/bsblan",
+        "domain": "bsblan",
+        "name": "BSB-Lan",
+        "requirements": [
+            "bsblan==0.3.7"
+        ]
+    },
+    "bt_home_hub_5": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/bt_home_hub_5",
+        "domain": "bt_home_hub_5",
+        "name": "BT Home Hub 5",
+        "requirements": [
+            "bthomehub5-devicelist==0.1.1"
+        ]
+    },
+    "bt_smarthub": {
+        "codeowners": [
+            "@jxwolstenholme"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/bt_smarthub",
+        "domain": "bt_smarthub",
+        "name": "BT Smart Hub",
+        "requirements": [
+            "btsmarthub_devicelist==0.2.0"
+        ]
+    },
+    "buienradar": {
+        "codeowners": [
+            "@mjj4791",
+            "@ties"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/buienradar",
+        "domain": "buienradar",
+        "name": "Buienradar",
+        "requirements": [
+            "buienradar==1.0.4"
+        ]
+    },
+    "caldav": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/caldav",
+        "domain": "caldav",
+        "name": "CalDAV",
+        "requirements": [
+            "caldav==0.6.1"
+        ]
+    },
+    "calendar": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/calendar",
+        "domain": "calendar",
+        "name": "Calendar"
+    },
+    "camera": {
+        "after_dependencies": [
+            "media_player"
+        ],
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/camera",
+        "domain": "camera",
+        "name": "Camera",
+        "quality_scale": "internal"
+    },
+    "canary": {
+        "codeowners": [],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/canary",
+        "domain": "canary",
+        "name": "Canary",
+        "requirements": [
+            "py-canary==0.5.0"
+        ]
+    },
+    "cast": {
+        "after_dependencies": [
+            "cloud",
+            "tts",
+            "zeroconf"
+        ],
+        "codeowners": [
+            "@emontnemery"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/cast",
+        "domain": "cast",
+        "name": "Google Cast",
+        "requirements": [
+            "pychromecast==7.2.1"
+        ],
+        "zeroconf": [
+            "_googlecast._tcp.local."
+        ]
+    },
+    "cert_expiry": {
+        "codeowners": [
+            "@Cereal2nd",
+            "@jjlawren"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/cert_expiry",
+        "domain": "cert_expiry",
+        "name": "Certificate Expiry"
+    },
+    "channels": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/channels",
+        "domain": "channels",
+        "name": "Channels",
+        "requirements": [
+            "pychannels==1.0.0"
+        ]
+    },
+    "circuit": {
+        "codeowners": [
+            "@braam"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/circuit",
+        "domain": "circuit",
+        "name": "Unify Circuit",
+        "requirements": [
+            "circuit-webhook==1.0.1"
+        ]
+    },
+    "cisco_ios": {
+        "codeowners": [
+            "@fbradyirl"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/cisco_ios",
+        "domain": "cisco_ios",
+        "name": "Cisco IOS",
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "cisco_mobility_express": {
+        "codeowners": [
+            "@fbradyirl"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/cisco_mobility_express",
+        "domain": "cisco_mobility_express",
+        "name": "Cisco Mobility Express",
+        "requirements": [
+            "ciscomobilityexpress==0.3.3"
+        ]
+    },
+    "cisco_webex_teams": {
+        "codeowners": [
+            "@fbradyirl"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/cisco_webex_teams",
+        "domain": "cisco_webex_teams",
+        "name": "Cisco Webex Teams",
+        "requirements": [
+            "webexteamssdk==1.1.1"
+        ]
+    },
+    "citybikes": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/citybikes",
+        "domain": "citybikes",
+        "name": "CityBikes"
+    },
+    "clementine": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/clementine",
+        "domain": "clementine",
+        "name": "Clementine Music Player",
+        "requirements": [
+            "python-clementine-remote==1.0.1"
+        ]
+    },
+    "clickatell": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/clickatell",
+        "domain": "clickatell",
+        "name": "Clickatell"
+    },
+    "clicksend": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/clicksend",
+        "domain": "clicksend",
+        "name": "ClickSend SMS"
+    },
+    "clicksend_tts": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/clicksend_tts",
+        "domain": "clicksend_tts",
+        "name": "ClickSend TTS"
+    },
+    "climate": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/climate",
+        "domain": "climate",
+        "name": "Climate",
+        "quality_scale": "internal"
+    },
+    "cloud": {
+        "after_dependencies": [
+            "google_assistant"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud"
+        ],
+        "dependencies": [
+            "http",
+            "webhook",
+            "alexa"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/cloud",
+        "domain": "cloud",
+        "name": "Home Assistant Cloud",
+        "requirements": [
+            "hass-nabucasa==0.35.0"
+        ]
+    },
+    "cloudflare": {
+        "codeowners": [
+            "@ludeeus"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/cloudflare",
+        "domain": "cloudflare",
+        "name": "Cloudflare",
+        "requirements": [
+            "pycfdns==0.0.1"
+        ]
+    },
+    "cmus": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/cmus",
+        "domain": "cmus",
+        "name": "cmus",
+        "requirements": [
+            "pycmus==0.1.1"
+        ]
+    },
+    "co2signal": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/co2signal",
+        "domain": "co2signal",
+        "name": "CO2 Signal",
+        "requirements": [
+            "co2signal==0.4.2"
+        ]
+    },
+    "coinbase": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/coinbase",
+        "domain": "coinbase",
+        "name": "Coinbase",
+        "requirements": [
+            "coinbase==2.1.0"
+        ]
+    },
+    "coinmarketcap": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/coinmarketcap",
+        "domain": "coinmarketcap",
+        "name": "CoinMarketCap",
+        "requirements": [
+            "coinmarketcap==5.0.3"
+        ]
+    },
+    "comed_hourly_pricing": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/comed_hourly_pricing",
+        "domain": "comed_hourly_pricing",
+        "name": "ComEd Hourly Pricing"
+    },
+    "comfoconnect": {
+        "codeowners": [
+            "@michaelarnauts"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/comfoconnect",
+        "domain": "comfoconnect",
+        "name": "Zehnder ComfoAir Q",
+        "requirements": [
+            "pycomfoconnect==0.3"
+        ]
+    },
+    "command_line": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/command_line",
+        "domain": "command_line",
+        "name": "Command Line"
+    },
+    "concord232": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/concord232",
+        "domain": "concord232",
+        "name": "Concord232",
+        "requirements": [
+            "concord232==0.15"
+        ]
+    },
+    "config": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/config",
+        "domain": "config",
+        "name": "Configuration",
+        "quality_scale": "internal"
+    },
+    "configurator": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/configurator",
+        "domain": "configurator",
+        "name": "Configurator",
+        "quality_scale": "internal"
+    },
+    "control4": {
+        "codeowners": [
+            "@lawtancool"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/control4",
+        "domain": "control4",
+        "name": "Control4",
+        "requirements": [
+            "pyControl4==0.0.6"
+        ],
+        "ssdp": [
+            {
+                "st": "c4:director"
+            }
+        ]
+    },
+    "conversation": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/conversation",
+        "domain": "conversation",
+        "name": "Conversation",
+        "quality_scale": "internal"
+    },
+    "coolmaster": {
+        "codeowners": [
+            "@OnFreund"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/coolmaster",
+        "domain": "coolmaster",
+        "name": "CoolMasterNet",
+        "requirements": [
+            "pycoolmasternet-async==0.1.0"
+        ]
+    },
+    "coronavirus": {
+        "codeowners": [
+            "@home_assistant/core"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/coronavirus",
+        "domain": "coronavirus",
+        "name": "Coronavirus (COVID-19)",
+        "requirements": [
+            "coronavirus==1.1.1"
+        ]
+    },
+    "counter": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/counter",
+        "domain": "counter",
+        "name": "Counter",
+        "quality_scale": "internal"
+    },
+    "cover": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/cover",
+        "domain": "cover",
+        "name": "Cover",
+        "quality_scale": "internal"
+    },
+    "cppm_tracker": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/cppm_tracker",
+        "domain": "cppm_tracker",
+        "name": "Aruba ClearPass",
+        "requirements": [
+            "clearpasspy==1.0.2"
+        ]
+    },
+    "cpuspeed": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/cpuspeed",
+        "domain": "cpuspeed",
+        "name": "CPU Speed",
+        "requirements": [
+            "py-cpuinfo==7.0.0"
+        ]
+    },
+    "crimereports": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/crimereports",
+        "domain": "crimereports",
+        "name": "Crime Reports",
+        "requirements": [
+            "crimereports==1.0.1"
+        ]
+    },
+    "cups": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/cups",
+        "domain": "cups",
+        "name": "CUPS",
+        "requirements": [
+            "pycups==1.9.73"
+        ]
+    },
+    "currencylayer": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/currencylayer",
+        "domain": "currencylayer",
+        "name": "currencylayer"
+    },
+    "daikin": {
+        "codeowners": [
+            "@fredrike"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/daikin",
+        "domain": "daikin",
+        "name": "Daikin AC",
+        "quality_scale": "platinum",
+        "requirements": [
+            "pydaikin==2.3.1"
+        ],
+        "zeroconf": [
+            "_dkapi._tcp.local."
+        ]
+    },
+    "danfoss_air": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/danfoss_air",
+        "domain": "danfoss_air",
+        "name": "Danfoss Air",
+        "requirements": [
+            "pydanfossair==0.1.0"
+        ]
+    },
+    "darksky": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/darksky",
+        "domain": "darksky",
+        "name": "Dark Sky",
+        "requirements": [
+            "python-forecastio==1.4.0"
+        ]
+    },
+    "datadog": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/datadog",
+        "domain": "datadog",
+        "name": "Datadog",
+        "requirements": [
+            "datadog==0.15.0"
+        ]
+    },
+    "ddwrt": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ddwrt",
+        "domain": "ddwrt",
+        "name": "DD-WRT"
+    },
+    "debugpy": {
+        "codeowners": [
+            "@frenck"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/debugpy",
+        "domain": "debugpy",
+        "name": "Remote Python Debugger",
+        "quality_scale": "internal",
+        "requirements": [
+            "debugpy==1.0.0rc2"
+        ]
+    },
+    "deconz": {
+        "codeowners": [
+            "@Kane610"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/deconz",
+        "domain": "deconz",
+        "name": "deCONZ",
+        "quality_scale": "platinum",
+        "requirements": [
+            "pydeconz==72"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Royal Philips Electronics"
+            }
+        ]
+    },
+    "decora": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/decora",
+        "domain": "decora",
+        "name": "Leviton Decora",
+        "requirements": [
+            "bluepy==1.3.0",
+            "decora==0.6"
+        ]
+    },
+    "decora_wifi": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/decora_wifi",
+        "domain": "decora_wifi",
+        "name": "Leviton Decora Wi-Fi",
+        "requirements": [
+            "decora_wifi==1.4"
+        ]
+    },
+    "default_config": {
+        "codeowners": [],
+        "dependencies": [
+            "automation",
+            "cloud",
+            "frontend",
+            "history",
+            "logbook",
+            "map",
+            "mobile_app",
+            "person",
+            "scene",
+            "script",
+            "ssdp",
+            "sun",
+            "system_health",
+            "tag",
+            "updater",
+            "zeroconf",
+            "zone",
+            "input_boolean",
+            "input_datetime",
+            "input_text",
+            "input_number",
+            "input_select"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/default_config",
+        "domain": "default_config",
+        "name": "Default Config"
+    },
+    "delijn": {
+        "codeowners": [
+            "@bollewolle",
+            "@Emilv2"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/delijn",
+        "domain": "delijn",
+        "name": "De Lijn",
+        "requirements": [
+            "pydelijn==0.6.0"
+        ]
+    },
+    "deluge": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/deluge",
+        "domain": "deluge",
+        "name": "Deluge",
+        "requirements": [
+            "deluge-client==1.7.1"
+        ]
+    },
+    "demo": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "conversation",
+            "zone",
+            "group"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/demo",
+        "domain": "demo",
+        "name": "Demo",
+        "quality_scale": "internal"
+    },
+    "denon": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/denon",
+        "domain": "denon",
+        "name": "Denon Network Receivers"
+    },
+    "denonavr": {
+        "codeowners": [
+            "@scarface-4711",
+            "@starkillerOG"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/denonavr",
+        "domain": "denonavr",
+        "name": "Denon AVR Network Receivers",
+        "requirements": [
+            "denonavr==0.9.4",
+            "getmac==0.8.2"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+                "manufacturer": "Denon"
+            },
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+                "manufacturer": "DENON"
+            },
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+                "manufacturer": "DENON PROFESSIONAL"
+            },
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+                "manufacturer": "Marantz"
+            },
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+                "manufacturer": "Denon"
+            },
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+                "manufacturer": "DENON"
+            },
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+                "manufacturer": "DENON PROFESSIONAL"
+            },
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+                "manufacturer": "Marantz"
+            },
+            {
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1",
+                "manufacturer": "Denon"
+            },
+            {
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1",
+                "manufacturer": "DENON"
+            },
+            {
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1",
+                "manufacturer": "DENON PROFESSIONAL"
+            },
+            {
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1",
+                "manufacturer": "Marantz"
+            }
+        ]
+    },
+    "derivative": {
+        "codeowners": [
+            "@afaucogney"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/derivative",
+        "domain": "derivative",
+        "name": "Derivative"
+    },
+    "deutsche_bahn": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/deutsche_bahn",
+        "domain": "deutsche_bahn",
+        "name": "Deutsche Bahn",
+        "requirements": [
+            "schiene==0.23"
+        ]
+    },
+    "device_automation": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/device_automation",
+        "domain": "device_automation",
+        "name": "Device Automation",
+        "quality_scale": "internal"
+    },
+    "device_sun_light_trigger": {
+        "after_dependencies": [
+            "device_tracker",
+            "group",
+            "light",
+            "person"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/device_sun_light_trigger",
+        "domain": "device_sun_light_trigger",
+        "name": "Presence-based Lights",
+        "quality_scale": "internal"
+    },
+    "device_tracker": {
+        "after_dependencies": [],
+        "codeowners": [],
+        "dependencies": [
+            "zone"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/device_tracker",
+        "domain": "device_tracker",
+        "name": "Device Tracker",
+        "quality_scale": "internal"
+    },
+    "devolo_home_control": {
+        "codeowners": [
+            "@2Fake",
+            "@Shutgun"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/devolo_home_control",
+        "domain": "devolo_home_control",
+        "name": "devolo Home Control",
+        "quality_scale": "silver",
+        "requirements": [
+            "devolo-home-control-api==0.13.0"
+        ]
+    },
+    "dexcom": {
+        "codeowners": [
+            "@gagebenne"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dexcom",
+        "domain": "dexcom",
+        "name": "Dexcom",
+        "requirements": [
+            "pydexcom==0.2.0"
+        ]
+    },
+    "dht": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dht",
+        "domain": "dht",
+        "name": "DHT Sensor",
+        "requirements": [
+            "Adafruit-DHT==1.4.0"
+        ]
+    },
+    "dialogflow": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/dialogflow",
+        "domain": "dialogflow",
+        "name": "Dialogflow"
+    },
+    "digital_ocean": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/digital_ocean",
+        "domain": "digital_ocean",
+        "name": "Digital Ocean",
+        "requirements": [
+            "python-digitalocean==1.13.2"
+        ]
+    },
+    "digitalloggers": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/digitalloggers",
+        "domain": "digitalloggers",
+        "name": "Digital Loggers",
+        "requirements": [
+            "dlipower==0.7.165"
+        ]
+    },
+    "directv": {
+        "codeowners": [
+            "@ctalkington"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/directv",
+        "domain": "directv",
+        "name": "DirecTV",
+        "quality_scale": "gold",
+        "requirements": [
+            "directv==0.3.0"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1",
+                "manufacturer": "DIRECTV"
+            }
+        ]
+    },
+    "discogs": {
+        "codeowners": [
+            "@thibmaek"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/discogs",
+        "domain": "discogs",
+        "name": "Discogs",
+        "requirements": [
+            "discogs_client==2.3.0"
+        ]
+    },
+    "discord": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/discord",
+        "domain": "discord",
+        "name": "Discord",
+        "requirements": [
+            "discord.py==1.4.1"
+        ]
+    },
+    "discovery": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/discovery",
+        "domain": "discovery",
+        "name": "Discovery",
+        "quality_scale": "internal",
+        "requirements": [
+            "netdisco==2.8.2"
+        ]
+    },
+    "dlib_face_detect": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dlib_face_detect",
+        "domain": "dlib_face_detect",
+        "name": "Dlib Face Detect",
+        "requirements": [
+            "face_recognition==1.2.3"
+        ]
+    },
+    "dlib_face_identify": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dlib_face_identify",
+        "domain": "dlib_face_identify",
+        "name": "Dlib Face Identify",
+        "requirements": [
+            "face_recognition==1.2.3"
+        ]
+    },
+    "dlink": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dlink",
+        "domain": "dlink",
+        "name": "D-Link Wi-Fi Smart Plugs",
+        "requirements": [
+            "pyW215==0.7.0"
+        ]
+    },
+    "dlna_dmr": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dlna_dmr",
+        "domain": "dlna_dmr",
+        "name": "DLNA Digital Media Renderer",
+        "requirements": [
+            "async-upnp-client==0.14.13"
+        ]
+    },
+    "dnsip": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dnsip",
+        "domain": "dnsip",
+        "name": "DNS IP",
+        "requirements": [
+            "aiodns==2.0.0"
+        ]
+    },
+    "dominos": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/dominos",
+        "domain": "dominos",
+        "name": "Dominos Pizza",
+        "requirements": [
+            "pizzapi==0.0.3"
+        ]
+    },
+    "doods": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/doods",
+        "domain": "doods",
+        "name": "DOODS - Dedicated Open Object Detection Service",
+        "requirements": [
+            "pydoods==1.0.2",
+            "pillow==7.2.0"
+        ]
+    },
+    "doorbird": {
+        "codeowners": [
+            "@oblogic7",
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/doorbird",
+        "domain": "doorbird",
+        "name": "DoorBird",
+        "requirements": [
+            "doorbirdpy==2.1.0"
+        ],
+        "zeroconf": [
+            "_axis-video._tcp.local."
+        ]
+    },
+    "dovado": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dovado",
+        "domain": "dovado",
+        "name": "Dovado",
+        "requirements": [
+            "dovado==0.4.1"
+        ]
+    },
+    "downloader": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/downloader",
+        "domain": "downloader",
+        "name": "Downloader",
+        "quality_scale": "internal"
+    },
+    "dsmr": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dsmr",
+        "domain": "dsmr",
+        "name": "DSMR Slimme Meter",
+        "requirements": [
+            "dsmr_parser==0.18"
+        ]
+    },
+    "dsmr_reader": {
+        "codeowners": [
+            "@depl0y"
+        ],
+        "dependencies": [
+            "mqtt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/dsmr_reader",
+        "domain": "dsmr_reader",
+        "name": "DSMR Reader"
+    },
+    "dte_energy_bridge": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dte_energy_bridge",
+        "domain": "dte_energy_bridge",
+        "name": "DTE Energy Bridge"
+    },
+    "dublin_bus_transport": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/dublin_bus_transport",
+        "domain": "dublin_bus_transport",
+        "name": "Dublin Bus"
+    },
+    "duckdns": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/duckdns",
+        "domain": "duckdns",
+        "name": "Duck DNS"
+    },
+    "dunehd": {
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dunehd",
+        "domain": "dunehd",
+        "name": "Dune HD",
+        "requirements": [
+            "pdunehd==1.3.2"
+        ]
+    },
+    "dwd_weather_warnings": {
+        "codeowners": [
+            "@runningman84",
+            "@stephan192",
+            "@Hummel95"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/dwd_weather_warnings",
+        "domain": "dwd_weather_warnings",
+        "name": "Deutsche Wetter Dienst (DWD) Weather Warnings",
+        "requirements": [
+            "dwdwfsapi==1.0.2"
+        ]
+    },
+    "dweet": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/dweet",
+        "domain": "dweet",
+        "name": "dweet.io",
+        "requirements": [
+            "dweepy==0.3.0"
+        ]
+    },
+    "dynalite": {
+        "codeowners": [
+            "@ziv1234"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dynalite",
+        "domain": "dynalite",
+        "name": "Philips Dynalite",
+        "requirements": [
+            "dynalite_devices==0.1.45"
+        ]
+    },
+    "dyson": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [
+            "@etheralm"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/dyson",
+        "domain": "dyson",
+        "name": "Dyson",
+        "requirements": [
+            "libpurecool==0.6.3"
+        ]
+    },
+    "eafm": {
+        "codeowners": [
+            "@Jc2k"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/eafm",
+        "domain": "eafm",
+        "name": "Environment Agency Flood Gauges",
+        "requirements": [
+            "aioeafm==0.1.2"
+        ]
+    },
+    "ebox": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ebox",
+        "domain": "ebox",
+        "name": "EBox",
+        "requirements": [
+            "pyebox==1.1.4"
+        ]
+    },
+    "ebusd": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ebusd",
+        "domain": "ebusd",
+        "name": "ebusd",
+        "requirements": [
+            "ebusdpy==0.0.16"
+        ]
+    },
+    "ecoal_boiler": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ecoal_boiler",
+        "domain": "ecoal_boiler",
+        "name": "eSterownik eCoal.pl Boiler",
+        "requirements": [
+            "ecoaliface==0.4.0"
+        ]
+    },
+    "ecobee": {
+        "codeowners": [
+            "@marthoc"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ecobee",
+        "domain": "ecobee",
+        "name": "ecobee",
+        "requirements": [
+            "python-ecobee-api==0.2.7"
+        ]
+    },
+    "econet": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/econet",
+        "domain": "econet",
+        "name": "Rheem EcoNET Water Products",
+        "requirements": [
+            "pyeconet==0.0.11"
+        ]
+    },
+    "ecovacs": {
+        "codeowners": [
+            "@OverloadUT"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ecovacs",
+        "domain": "ecovacs",
+        "name": "Ecovacs",
+        "requirements": [
+            "sucks==0.9.4"
+        ]
+    },
+    "eddystone_temperature": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/eddystone_temperature",
+        "domain": "eddystone_temperature",
+        "name": "Eddystone",
+        "requirements": [
+            "beacontools[scan]==1.2.3",
+            "construct==2.9.45"
+        ]
+    },
+    "edimax": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/edimax",
+        "domain": "edimax",
+        "name": "Edimax",
+        "requirements": [
+            "pyedimax==0.2.1"
+        ]
+    },
+    "edl21": {
+        "codeowners": [
+            "@mtdcr"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/edl21",
+        "domain": "edl21",
+        "name": "EDL21",
+        "requirements": [
+            "pysml==0.0.2"
+        ]
+    },
+    "ee_brightbox": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ee_brightbox",
+        "domain": "ee_brightbox",
+        "name": "EE Bright Box",
+        "requirements": [
+            "eebrightbox==0.0.4"
+        ]
+    },
+    "efergy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/efergy",
+        "domain": "efergy",
+        "name": "Efergy"
+    },
+    "egardia": {
+        "codeowners": [
+            "@jeroenterheerdt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/egardia",
+        "domain": "egardia",
+        "name": "Egardia",
+        "requirements": [
+            "pythonegardia==1.0.40"
+        ]
+    },
+    "eight_sleep": {
+        "codeowners": [
+            "@mezz64"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/eight_sleep",
+        "domain": "eight_sleep",
+        "name": "Eight Sleep",
+        "requirements": [
+            "pyeight==0.1.4"
+        ]
+    },
+    "elgato": {
+        "codeowners": [
+            "@frenck"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/elgato",
+        "domain": "elgato",
+        "name": "Elgato Key Light",
+        "quality_scale": "platinum",
+        "requirements": [
+            "elgato==0.2.0"
+        ],
+        "zeroconf": [
+            "_elg._tcp.local."
+        ]
+    },
+    "eliqonline": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/eliqonline",
+        "domain": "eliqonline",
+        "name": "Eliqonline",
+        "requirements": [
+            "eliqonline==1.2.2"
+        ]
+    },
+    "elkm1": {
+        "codeowners": [
+            "@gwww",
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/elkm1",
+        "domain": "elkm1",
+        "name": "Elk-M1 Control",
+        "requirements": [
+            "elkm1-lib==0.7.19"
+        ]
+    },
+    "elv": {
+        "codeowners": [
+            "@majuss"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/pca",
+        "domain": "elv",
+        "name": "ELV PCA",
+        "requirements": [
+            "pypca==0.0.7"
+        ]
+    },
+    "emby": {
+        "codeowners": [
+            "@mezz64"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/emby",
+        "domain": "emby",
+        "name": "Emby",
+        "requirements": [
+            "pyemby==1.6"
+        ]
+    },
+    "emoncms": {
+        "codeowners": [
+            "@borpin"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/emoncms",
+        "domain": "emoncms",
+        "name": "Emoncms"
+    },
+    "emoncms_history": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/emoncms_history",
+        "domain": "emoncms_history",
+        "name": "Emoncms History"
+    },
+    "emulated_hue": {
+        "after_dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/emulated_hue",
+        "domain": "emulated_hue",
+        "name": "Emulated Hue",
+        "quality_scale": "internal",
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ]
+    },
+    "emulated_roku": {
+        "codeowners": [],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/emulated_roku",
+        "domain": "emulated_roku",
+        "name": "Emulated Roku",
+        "requirements": [
+            "emulated_roku==0.2.1"
+        ]
+    },
+    "enigma2": {
+        "codeowners": [
+            "@fbradyirl"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/enigma2",
+        "domain": "enigma2",
+        "name": "Enigma2 (OpenWebif)",
+        "requirements": [
+            "openwebifpy==3.1.1"
+        ]
+    },
+    "enocean": {
+        "codeowners": [
+            "@bdurrer"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/enocean",
+        "domain": "enocean",
+        "name": "EnOcean",
+        "requirements": [
+            "enocean==0.50"
+        ]
+    },
+    "enphase_envoy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/enphase_envoy",
+        "domain": "enphase_envoy",
+        "name": "Enphase Envoy",
+        "requirements": [
+            "envoy_reader==0.16.1"
+        ]
+    },
+    "entur_public_transport": {
+        "codeowners": [
+            "@hfurubotten"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/entur_public_transport",
+        "domain": "entur_public_transport",
+        "name": "Entur",
+        "requirements": [
+            "enturclient==0.2.1"
+        ]
+    },
+    "environment_canada": {
+        "codeowners": [
+            "@michaeldavie"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/environment_canada",
+        "domain": "environment_canada",
+        "name": "Environment Canada",
+        "requirements": [
+            "env_canada==0.2.0"
+        ]
+    },
+    "envirophat": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/envirophat",
+        "domain": "envirophat",
+        "name": "Enviro pHAT",
+        "requirements": [
+            "envirophat==0.0.6",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "envisalink": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/envisalink",
+        "domain": "envisalink",
+        "name": "Envisalink",
+        "requirements": [
+            "pyenvisalink==4.0"
+        ]
+    },
+    "ephember": {
+        "codeowners": [
+            "@ttroy50"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ephember",
+        "domain": "ephember",
+        "name": "EPH Controls",
+        "requirements": [
+            "pyephember==0.3.1"
+        ]
+    },
+    "epson": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/epson",
+        "domain": "epson",
+        "name": "Epson",
+        "requirements": [
+            "epson-projector==0.1.3"
+        ]
+    },
+    "epsonworkforce": {
+        "codeowners": [
+            "@ThaStealth"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/epsonworkforce",
+        "domain": "epsonworkforce",
+        "name": "Epson Workforce",
+        "requirements": [
+            "epsonprinter==0.0.9"
+        ]
+    },
+    "eq3btsmart": {
+        "codeowners": [
+            "@rytilahti"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/eq3btsmart",
+        "domain": "eq3btsmart",
+        "name": "EQ3 Bluetooth Smart Thermostats",
+        "requirements": [
+            "construct==2.9.45",
+            "python-eq3bt==0.1.11"
+        ]
+    },
+    "esphome": {
+        "codeowners": [
+            "@OttoWinter"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/esphome",
+        "domain": "esphome",
+        "name": "ESPHome",
+        "requirements": [
+            "aioesphomeapi==2.6.1"
+        ],
+        "zeroconf": [
+            "_esphomelib._tcp.local."
+        ]
+    },
+    "essent": {
+        "codeowners": [
+            "@TheLastProject"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/essent",
+        "domain": "essent",
+        "name": "Essent",
+        "requirements": [
+            "PyEssent==0.13"
+        ]
+    },
+    "etherscan": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/etherscan",
+        "domain": "etherscan",
+        "name": "Etherscan",
+        "requirements": [
+            "python-etherscan-api==0.0.3"
+        ]
+    },
+    "eufy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/eufy",
+        "domain": "eufy",
+        "name": "eufy",
+        "requirements": [
+            "lakeside==0.12"
+        ]
+    },
+    "everlights": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/everlights",
+        "domain": "everlights",
+        "name": "EverLights",
+        "requirements": [
+            "pyeverlights==0.1.0"
+        ]
+    },
+    "evohome": {
+        "codeowners": [
+            "@zxdavb"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/evohome",
+        "domain": "evohome",
+        "name": "Honeywell Total Connect Comfort (Europe)",
+        "requirements": [
+            "evohome-async==0.3.5.post1"
+        ]
+    },
+    "ezviz": {
+        "codeowners": [
+            "@baqs"
+        ],
+        "disabled": "Dependency contains code that breaks Home Assistant.",
+        "documentation": "https://www.home-assistant.io/integrations/ezviz",
+        "domain": "ezviz",
+        "name": "Ezviz",
+        "requirements": [
+            "pyezviz==0.1.5"
+        ]
+    },
+    "facebook": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/facebook",
+        "domain": "facebook",
+        "name": "Facebook Messenger"
+    },
+    "facebox": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/facebox",
+        "domain": "facebox",
+        "name": "Facebox"
+    },
+    "fail2ban": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fail2ban",
+        "domain": "fail2ban",
+        "name": "Fail2Ban"
+    },
+    "familyhub": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/familyhub",
+        "domain": "familyhub",
+        "name": "Samsung Family Hub",
+        "requirements": [
+            "python-family-hub-local==0.0.2"
+        ]
+    },
+    "fan": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fan",
+        "domain": "fan",
+        "name": "Fan",
+        "quality_scale": "internal"
+    },
+    "fastdotcom": {
+        "codeowners": [
+            "@rohankapoorcom"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/fastdotcom",
+        "domain": "fastdotcom",
+        "name": "Fast.com",
+        "requirements": [
+            "fastdotcom==0.0.3"
+        ]
+    },
+    "feedreader": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/feedreader",
+        "domain": "feedreader",
+        "name": "Feedreader",
+        "requirements": [
+            "feedparser-homeassistant==5.2.2.dev1"
+        ]
+    },
+    "ffmpeg": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg",
+        "domain": "ffmpeg",
+        "name": "FFmpeg",
+        "requirements": [
+            "ha-ffmpeg==2.0"
+        ]
+    },
+    "ffmpeg_motion": {
+        "codeowners": [],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg_motion",
+        "domain": "ffmpeg_motion",
+        "name": "FFmpeg Motion"
+    },
+    "ffmpeg_noise": {
+        "codeowners": [],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg_noise",
+        "domain": "ffmpeg_noise",
+        "name": "FFmpeg Noise"
+    },
+    "fibaro": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fibaro",
+        "domain": "fibaro",
+        "name": "Fibaro",
+        "requirements": [
+            "fiblary3==0.1.7"
+        ]
+    },
+    "fido": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fido",
+        "domain": "fido",
+        "name": "Fido",
+        "requirements": [
+            "pyfido==2.1.1"
+        ]
+    },
+    "file": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/file",
+        "domain": "file",
+        "name": "File"
+    },
+    "filesize": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/filesize",
+        "domain": "filesize",
+        "name": "File Size"
+    },
+    "filter": {
+        "codeowners": [
+            "@dgomes"
+        ],
+        "dependencies": [
+            "history"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/filter",
+        "domain": "filter",
+        "name": "Filter",
+        "quality_scale": "internal"
+    },
+    "fints": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fints",
+        "domain": "fints",
+        "name": "FinTS",
+        "requirements": [
+            "fints==1.0.1"
+        ]
+    },
+    "firmata": {
+        "codeowners": [
+            "@DaAwesomeP"
+        ],
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/firmata",
+        "domain": "firmata",
+        "name": "Firmata",
+        "requirements": [
+            "pymata-express==1.13"
+        ]
+    },
+    "fitbit": {
+        "codeowners": [],
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/fitbit",
+        "domain": "fitbit",
+        "name": "Fitbit",
+        "requirements": [
+            "fitbit==0.3.1"
+        ]
+    },
+    "fixer": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/fixer",
+        "domain": "fixer",
+        "name": "Fixer",
+        "requirements": [
+            "fixerio==1.0.0a0"
+        ]
+    },
+    "fleetgo": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fleetgo",
+        "domain": "fleetgo",
+        "name": "FleetGO",
+        "requirements": [
+            "ritassist==0.9.2"
+        ]
+    },
+    "flexit": {
+        "codeowners": [],
+        "dependencies": [
+            "modbus"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/flexit",
+        "domain": "flexit",
+        "name": "Flexit",
+        "requirements": [
+            "pyflexit==0.3"
+        ]
+    },
+    "flic": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/flic",
+        "domain": "flic",
+        "name": "Flic",
+        "requirements": [
+            "pyflic-homeassistant==0.4.dev0"
+        ]
+    },
+    "flick_electric": {
+        "codeowners": [
+            "@ZephireNZ"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/flick_electric/",
+        "domain": "flick_electric",
+        "name": "Flick Electric",
+        "requirements": [
+            "PyFlick==0.0.2"
+        ]
+    },
+    "flo": {
+        "codeowners": [
+            "@dmulcahey"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/flo",
+        "domain": "flo",
+        "homekit": {},
+        "name": "Flo",
+        "requirements": [
+            "aioflo==0.4.0"
+        ],
+        "ssdp": [],
+        "zeroconf": []
+    },
+    "flock": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/flock",
+        "domain": "flock",
+        "name": "Flock"
+    },
+    "flume": {
+        "codeowners": [
+            "@ChrisMandich",
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/flume/",
+        "domain": "flume",
+        "name": "Flume",
+        "requirements": [
+            "pyflume==0.5.5"
+        ]
+    },
+    "flunearyou": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/flunearyou",
+        "domain": "flunearyou",
+        "name": "Flu Near You",
+        "requirements": [
+            "pyflunearyou==1.0.7"
+        ]
+    },
+    "flux": {
+        "after_dependencies": [
+            "light"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/flux",
+        "domain": "flux",
+        "name": "Flux",
+        "quality_scale": "internal"
+    },
+    "flux_led": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/flux_led",
+        "domain": "flux_led",
+        "name": "Flux LED/MagicLight",
+        "requirements": [
+            "flux_led==0.22"
+        ]
+    },
+    "folder": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/folder",
+        "domain": "folder",
+        "name": "Folder"
+    },
+    "folder_watcher": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/folder_watcher",
+        "domain": "folder_watcher",
+        "name": "Folder Watcher",
+        "quality_scale": "internal",
+        "requirements": [
+            "watchdog==0.8.3"
+        ]
+    },
+    "foobot": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/foobot",
+        "domain": "foobot",
+        "name": "Foobot",
+        "requirements": [
+            "foobot_async==0.3.2"
+        ]
+    },
+    "forked_daapd": {
+        "codeowners": [
+            "@uvjustin"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/forked-daapd",
+        "domain": "forked_daapd",
+        "name": "forked-daapd",
+        "requirements": [
+            "pyforked-daapd==0.1.10",
+            "pylibrespot-java==0.1.0"
+        ],
+        "zeroconf": [
+            "_daap._tcp.local."
+        ]
+    },
+    "fortios": {
+        "codeowners": [
+            "@kimfrellsen"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/fortios/",
+        "domain": "fortios",
+        "name": "FortiOS",
+        "requirements": [
+            "fortiosapi==0.10.8"
+        ]
+    },
+    "foscam": {
+        "codeowners": [
+            "@skgsergio"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/foscam",
+        "domain": "foscam",
+        "name": "Foscam",
+        "requirements": [
+            "libpyfoscam==1.0"
+        ]
+    },
+    "foursquare": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/foursquare",
+        "domain": "foursquare",
+        "name": "Foursquare"
+    },
+    "free_mobile": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/free_mobile",
+        "domain": "free_mobile",
+        "name": "Free Mobile",
+        "requirements": [
+            "freesms==0.1.2"
+        ]
+    },
+    "freebox": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [
+            "@snoof85",
+            "@Quentame"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/freebox",
+        "domain": "freebox",
+        "name": "Freebox",
+        "requirements": [
+            "aiofreepybox==0.0.8"
+        ]
+    },
+    "freedns": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/freedns",
+        "domain": "freedns",
+        "name": "FreeDNS"
+    },
+    "fritz": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fritz",
+        "domain": "fritz",
+        "name": "AVM FRITZ!Box",
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ]
+    },
+    "fritzbox": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox",
+        "domain": "fritzbox",
+        "name": "AVM FRITZ!Box",
+        "requirements": [
+            "pyfritzhome==0.4.2"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:fritzbox:1"
+            }
+        ]
+    },
+    "fritzbox_callmonitor": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox_callmonitor",
+        "domain": "fritzbox_callmonitor",
+        "name": "AVM FRITZ!Box Call Monitor",
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ]
+    },
+    "fritzbox_netmonitor": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox_netmonitor",
+        "domain": "fritzbox_netmonitor",
+        "name": "AVM FRITZ!Box Net Monitor",
+        "requirements": [
+            "fritzconnection==1.2.0"
+        ]
+    },
+    "fronius": {
+        "codeowners": [
+            "@nielstron"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/fronius",
+        "domain": "fronius",
+        "name": "Fronius",
+        "requirements": [
+            "pyfronius==0.4.6"
+        ]
+    },
+    "frontend": {
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "dependencies": [
+            "api",
+            "auth",
+            "config",
+            "device_automation",
+            "http",
+            "lovelace",
+            "onboarding",
+            "search",
+            "system_log",
+            "websocket_api"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/frontend",
+        "domain": "frontend",
+        "name": "Home Assistant Frontend",
+        "quality_scale": "internal",
+        "requirements": [
+            "home-assistant-frontend==20200824.0"
+        ]
+    },
+    "frontier_silicon": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/frontier_silicon",
+        "domain": "frontier_silicon",
+        "name": "Frontier Silicon",
+        "requirements": [
+            "afsapi==0.0.4"
+        ]
+    },
+    "futurenow": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/futurenow",
+        "domain": "futurenow",
+        "name": "P5 FutureNow",
+        "requirements": [
+            "pyfnip==0.2"
+        ]
+    },
+    "garadget": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/garadget",
+        "domain": "garadget",
+        "name": "Garadget"
+    },
+    "garmin_connect": {
+        "codeowners": [
+            "@cyberjunky"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/garmin_connect",
+        "domain": "garmin_connect",
+        "name": "Garmin Connect",
+        "requirements": [
+            "garminconnect==0.1.13"
+        ]
+    },
+    "gc100": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/gc100",
+        "domain": "gc100",
+        "name": "Global Cach\u00e9 GC-100",
+        "requirements": [
+            "python-gc100==1.0.3a"
+        ]
+    },
+    "gdacs": {
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gdacs",
+        "domain": "gdacs",
+        "name": "Global Disaster Alert and Coordination System (GDACS)",
+        "quality_scale": "platinum",
+        "requirements": [
+            "aio_georss_gdacs==0.3"
+        ]
+    },
+    "geizhals": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/geizhals",
+        "domain": "geizhals",
+        "name": "Geizhals",
+        "requirements": [
+            "geizhals==0.0.9"
+        ]
+    },
+    "generic": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/generic",
+        "domain": "generic",
+        "name": "Generic"
+    },
+    "generic_thermostat": {
+        "codeowners": [],
+        "dependencies": [
+            "sensor",
+            "switch"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/generic_thermostat",
+        "domain": "generic_thermostat",
+        "name": "Generic Thermostat"
+    },
+    "geniushub": {
+        "codeowners": [
+            "@zxdavb"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/geniushub",
+        "domain": "geniushub",
+        "name": "Genius Hub",
+        "requirements": [
+            "geniushub-client==0.6.30"
+        ]
+    },
+    "geo_json_events": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/geo_json_events",
+        "domain": "geo_json_events",
+        "name": "GeoJSON",
+        "requirements": [
+            "geojson_client==0.4"
+        ]
+    },
+    "geo_location": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/geo_location",
+        "domain": "geo_location",
+        "name": "Geolocation"
+    },
+    "geo_rss_events": {
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/geo_rss_events",
+        "domain": "geo_rss_events",
+        "name": "GeoRSS",
+        "requirements": [
+            "georss_generic_client==0.3"
+        ]
+    },
+    "geofency": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/geofency",
+        "domain": "geofency",
+        "name": "Geofency"
+    },
+    "geonetnz_quakes": {
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geonetnz_quakes",
+        "domain": "geonetnz_quakes",
+        "name": "GeoNet NZ Quakes",
+        "quality_scale": "platinum",
+        "requirements": [
+            "aio_geojson_geonetnz_quakes==0.12"
+        ]
+    },
+    "geonetnz_volcano": {
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geonetnz_volcano",
+        "domain": "geonetnz_volcano",
+        "name": "GeoNet NZ Volcano",
+        "requirements": [
+            "aio_geojson_geonetnz_volcano==0.5"
+        ]
+    },
+    "gios": {
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gios",
+        "domain": "gios",
+        "name": "GIO\u015a",
+        "requirements": [
+            "gios==0.1.1"
+        ]
+    },
+    "github": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/github",
+        "domain": "github",
+        "name": "GitHub",
+        "requirements": [
+            "PyGithub==1.43.8"
+        ]
+    },
+    "gitlab_ci": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/gitlab_ci",
+        "domain": "gitlab_ci",
+        "name": "GitLab-CI",
+        "requirements": [
+            "python-gitlab==1.6.0"
+        ]
+    },
+    "gitter": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/gitter",
+        "domain": "gitter",
+        "name": "Gitter",
+        "requirements": [
+            "gitterpy==0.1.7"
+        ]
+    },
+    "glances": {
+        "codeowners": [
+            "@fabaff",
+            "@engrbm87"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/glances",
+        "domain": "glances",
+        "name": "Glances",
+        "requirements": [
+            "glances_api==0.2.0"
+        ]
+    },
+    "gntp": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/gntp",
+        "domain": "gntp",
+        "name": "Growl (GnGNTP)",
+        "requirements": [
+            "gntp==1.0.3"
+        ]
+    },
+    "goalfeed": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/goalfeed",
+        "domain": "goalfeed",
+        "name": "Goalfeed",
+        "requirements": [
+            "pysher==1.0.1"
+        ]
+    },
+    "gogogate2": {
+        "codeowners": [
+            "@vangorra"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gogogate2",
+        "domain": "gogogate2",
+        "name": "Gogogate2",
+        "requirements": [
+            "gogogate2-api==1.0.4"
+        ]
+    },
+    "google": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/google",
+        "domain": "google",
+        "name": "Google Calendars",
+        "requirements": [
+            "google-api-python-client==1.6.4",
+            "httplib2==0.10.3",
+            "oauth2client==4.0.0"
+        ]
+    },
+    "google_assistant": {
+        "after_dependencies": [
+            "camera"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/google_assistant",
+        "domain": "google_assistant",
+        "name": "Google Assistant"
+    },
+    "google_cloud": {
+        "codeowners": [
+            "@lufton"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/google_cloud",
+        "domain": "google_cloud",
+        "name": "Google Cloud Platform",
+        "requirements": [
+            "google-cloud-texttospeech==0.4.0"
+        ]
+    },
+    "google_domains": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/google_domains",
+        "domain": "google_domains",
+        "name": "Google Domains"
+    },
+    "google_maps": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/google_maps",
+        "domain": "google_maps",
+        "name": "Google Maps",
+        "requirements": [
+            "locationsharinglib==4.1.0"
+        ]
+    },
+    "google_pubsub": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/google_pubsub",
+        "domain": "google_pubsub",
+        "name": "Google Pub/Sub",
+        "requirements": [
+            "google-cloud-pubsub==0.39.1"
+        ]
+    },
+    "google_translate": {
+        "codeowners": [
+            "@awarecan"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/google_translate",
+        "domain": "google_translate",
+        "name": "Google Translate Text-to-Speech",
+        "requirements": [
+            "gTTS-token==1.1.3"
+        ]
+    },
+    "google_travel_time": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/google_travel_time",
+        "domain": "google_travel_time",
+        "name": "Google Maps Travel Time",
+        "requirements": [
+            "googlemaps==2.5.1"
+        ]
+    },
+    "google_wifi": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/google_wifi",
+        "domain": "google_wifi",
+        "name": "Google Wifi"
+    },
+    "gpmdp": {
+        "codeowners": [],
+        "dependencies": [
+            "configurator"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/gpmdp",
+        "domain": "gpmdp",
+        "name": "Google Play Music Desktop Player (GPMDP)",
+        "requirements": [
+            "websocket-client==0.54.0"
+        ]
+    },
+    "gpsd": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/gpsd",
+        "domain": "gpsd",
+        "name": "GPSD",
+        "requirements": [
+            "gps3==0.33.3"
+        ]
+    },
+    "gpslogger": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/gpslogger",
+        "domain": "gpslogger",
+        "name": "GPSLogger"
+    },
+    "graphite": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/graphite",
+        "domain": "graphite",
+        "name": "Graphite"
+    },
+    "greeneye_monitor": {
+        "codeowners": [
+            "@jkeljo"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/greeneye_monitor",
+        "domain": "greeneye_monitor",
+        "name": "GreenEye Monitor (GEM)",
+        "requirements": [
+            "greeneye_monitor==2.0"
+        ]
+    },
+    "greenwave": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/greenwave",
+        "domain": "greenwave",
+        "name": "Greenwave Reality",
+        "requirements": [
+            "greenwavereality==0.5.1"
+        ]
+    },
+    "griddy": {
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/griddy",
+        "domain": "griddy",
+        "name": "Griddy Power",
+        "requirements": [
+            "griddypower==0.1.0"
+        ]
+    },
+    "group": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/group",
+        "domain": "group",
+        "name": "Group",
+        "quality_scale": "internal"
+    },
+    "growatt_server": {
+        "codeowners": [
+            "@indykoning"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/growatt_server/",
+        "domain": "growatt_server",
+        "name": "Growatt",
+        "requirements": [
+            "growattServer==0.1.1"
+        ]
+    },
+    "gstreamer": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/gstreamer",
+        "domain": "gstreamer",
+        "name": "GStreamer",
+        "requirements": [
+            "gstreamer-player==1.1.2"
+        ]
+    },
+    "gtfs": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/gtfs",
+        "domain": "gtfs",
+        "name": "General Transit Feed Specification (GTFS)",
+        "requirements": [
+            "pygtfs==0.1.5"
+        ]
+    },
+    "guardian": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/guardian",
+        "domain": "guardian",
+        "homekit": {},
+        "name": "Elexa Guardian",
+        "requirements": [
+            "aioguardian==1.0.1"
+        ],
+        "ssdp": [],
+        "zeroconf": [
+            "_api._udp.local."
+        ]
+    },
+    "habitica": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/habitica",
+        "domain": "habitica",
+        "name": "Habitica",
+        "requirements": [
+            "habitipy==0.2.0"
+        ]
+    },
+    "hangouts": {
+        "codeowners": [],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hangouts",
+        "domain": "hangouts",
+        "name": "Google Hangouts",
+        "requirements": [
+            "hangups==0.4.9"
+        ]
+    },
+    "harman_kardon_avr": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/harman_kardon_avr",
+        "domain": "harman_kardon_avr",
+        "name": "Harman Kardon AVR",
+        "requirements": [
+            "hkavr==0.0.5"
+        ]
+    },
+    "harmony": {
+        "codeowners": [
+            "@ehendrix23",
+            "@bramkragten",
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/harmony",
+        "domain": "harmony",
+        "name": "Logitech Harmony Hub",
+        "requirements": [
+            "aioharmony==0.2.6"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:myharmony-com:device:harmony:1",
+                "manufacturer": "Logitech"
+            }
+        ]
+    },
+    "hassio": {
+        "after_dependencies": [
+            "panel_custom"
+        ],
+        "codeowners": [
+            "@home-assistant/hass-io"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/hassio",
+        "domain": "hassio",
+        "name": "Hass.io"
+    },
+    "haveibeenpwned": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/haveibeenpwned",
+        "domain": "haveibeenpwned",
+        "name": "HaveIBeenPwned"
+    },
+    "hddtemp": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/hddtemp",
+        "domain": "hddtemp",
+        "name": "hddtemp"
+    },
+    "hdmi_cec": {
+        "codeowners": [],
+        "disabled": "Dependency contains code that breaks Home Assistant.",
+        "documentation": "https://www.home-assistant.io/integrations/hdmi_cec",
+        "domain": "hdmi_cec",
+        "name": "HDMI-CEC",
+        "requirements": [
+            "pyCEC==0.4.13"
+        ]
+    },
+    "heatmiser": {
+        "codeowners": [
+            "@andylockran"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/heatmiser",
+        "domain": "heatmiser",
+        "name": "Heatmiser",
+        "requirements": [
+            "heatmiserV3==1.1.18"
+        ]
+    },
+    "heos": {
+        "codeowners": [
+            "@andrewsayre"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/heos",
+        "domain": "heos",
+        "name": "Denon HEOS",
+        "requirements": [
+            "pyheos==0.6.0"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-denon-com:device:ACT-Denon:1"
+            }
+        ]
+    },
+    "here_travel_time": {
+        "codeowners": [
+            "@eifinger"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/here_travel_time",
+        "domain": "here_travel_time",
+        "name": "HERE Travel Time",
+        "requirements": [
+            "herepy==2.0.0"
+        ]
+    },
+    "hikvision": {
+        "codeowners": [
+            "@mezz64"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/hikvision",
+        "domain": "hikvision",
+        "name": "Hikvision",
+        "requirements": [
+            "pyhik==0.2.7"
+        ]
+    },
+    "hikvisioncam": {
+        "codeowners": [
+            "@fbradyirl"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/hikvisioncam",
+        "domain": "hikvisioncam",
+        "name": "Hikvision",
+        "requirements": [
+            "hikvision==0.4"
+        ]
+    },
+    "hisense_aehw4a1": {
+        "codeowners": [
+            "@bannhead"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hisense_aehw4a1",
+        "domain": "hisense_aehw4a1",
+        "name": "Hisense AEH-W4A1",
+        "requirements": [
+            "pyaehw4a1==0.3.9"
+        ]
+    },
+    "history": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "http",
+            "recorder"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/history",
+        "domain": "history",
+        "name": "History",
+        "quality_scale": "internal"
+    },
+    "history_stats": {
+        "codeowners": [],
+        "dependencies": [
+            "history"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/history_stats",
+        "domain": "history_stats",
+        "name": "History Stats",
+        "quality_scale": "internal"
+    },
+    "hitron_coda": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/hitron_coda",
+        "domain": "hitron_coda",
+        "name": "Rogers Hitron CODA"
+    },
+    "hive": {
+        "codeowners": [
+            "@Rendili",
+            "@KJonline"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/hive",
+        "domain": "hive",
+        "name": "Hive",
+        "requirements": [
+            "pyhiveapi==0.2.20.1"
+        ]
+    },
+    "hlk_sw16": {
+        "codeowners": [
+            "@jameshilliard"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hlk_sw16",
+        "domain": "hlk_sw16",
+        "name": "Hi-Link HLK-SW16",
+        "requirements": [
+            "hlk-sw16==0.0.9"
+        ]
+    },
+    "home_connect": {
+        "codeowners": [
+            "@DavidMStraub"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/home_connect",
+        "domain": "home_connect",
+        "name": "Home Connect",
+        "requirements": [
+            "homeconnect==0.5"
+        ]
+    },
+    "homeassistant": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/homeassistant",
+        "domain": "homeassistant",
+        "name": "Home Assistant Core Integration",
+        "quality_scale": "internal"
+    },
+    "homekit": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http",
+            "camera",
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/homekit",
+        "domain": "homekit",
+        "name": "HomeKit",
+        "requirements": [
+            "HAP-python==3.0.0",
+            "fnvhash==0.1.0",
+            "PyQRCode==1.2.1",
+            "base36==0.1.1",
+            "PyTurboJPEG==1.4.0"
+        ]
+    },
+    "homekit_controller": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [
+            "@Jc2k"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/homekit_controller",
+        "domain": "homekit_controller",
+        "name": "HomeKit Controller",
+        "requirements": [
+            "aiohomekit[IP]==0.2.49"
+        ],
+        "zeroconf": [
+            "_hap._tcp.local."
+        ]
+    },
+    "homematic": {
+        "codeowners": [
+            "@pvizeli",
+            "@danielperna84"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/homematic",
+        "domain": "homematic",
+        "name": "Homematic",
+        "requirements": [
+            "pyhomematic==0.1.68"
+        ]
+    },
+    "homematicip_cloud": {
+        "codeowners": [
+            "@SukramJ"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/homematicip_cloud",
+        "domain": "homematicip_cloud",
+        "name": "HomematicIP Cloud",
+        "quality_scale": "platinum",
+        "requirements": [
+            "homematicip==0.10.19"
+        ]
+    },
+    "homeworks": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/homeworks",
+        "domain": "homeworks",
+        "name": "Lutron Homeworks",
+        "requirements": [
+            "pyhomeworks==0.0.6"
+        ]
+    },
+    "honeywell": {
+        "codeowners": [
+            "@zxdavb"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/honeywell",
+        "domain": "honeywell",
+        "name": "Honeywell Total Connect Comfort (US)",
+        "requirements": [
+            "somecomfort==0.5.2"
+        ]
+    },
+    "horizon": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/horizon",
+        "domain": "horizon",
+        "name": "Unitymedia Horizon HD Recorder",
+        "requirements": [
+            "horimote==0.4.1"
+        ]
+    },
+    "hp_ilo": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/hp_ilo",
+        "domain": "hp_ilo",
+        "name": "HP Integrated Lights-Out (ILO)",
+        "requirements": [
+            "python-hpilo==4.3"
+        ]
+    },
+    "html5": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/html5",
+        "domain": "html5",
+        "name": "HTML5 Push Notifications",
+        "requirements": [
+            "pywebpush==1.9.2"
+        ]
+    },
+    "http": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/http",
+        "domain": "http",
+        "name": "HTTP",
+        "quality_scale": "internal",
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ]
+    },
+    "htu21d": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/htu21d",
+        "domain": "htu21d",
+        "name": "HTU21D(F) Sensor",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "huawei_lte": {
+        "codeowners": [
+            "@scop",
+            "@fphammerle"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/huawei_lte",
+        "domain": "huawei_lte",
+        "name": "Huawei LTE",
+        "requirements": [
+            "getmac==0.8.2",
+            "huawei-lte-api==1.4.12",
+            "stringcase==1.2.0",
+            "url-normalize==1.4.1"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "manufacturer": "Huawei"
+            }
+        ]
+    },
+    "huawei_router": {
+        "codeowners": [
+            "@abmantis"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/huawei_router",
+        "domain": "huawei_router",
+        "name": "Huawei Router"
+    },
+    "hue": {
+        "codeowners": [
+            "@balloob",
+            "@frenck"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hue",
+        "domain": "hue",
+        "homekit": {
+            "models": [
+                "BSB002"
+            ]
+        },
+        "name": "Philips Hue",
+        "quality_scale": "platinum",
+        "requirements": [
+            "aiohue==2.1.0"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Royal Philips Electronics",
+                "modelName": "Philips hue bridge 2012"
+            },
+            {
+                "manufacturer": "Royal Philips Electronics",
+                "modelName": "Philips hue bridge 2015"
+            },
+            {
+                "manufacturer": "Signify",
+                "modelName": "Philips hue bridge 2015"
+            }
+        ]
+    },
+    "humidifier": {
+        "codeowners": [
+            "@home-assistant/core",
+            "@Shulyaka"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/humidifier",
+        "domain": "humidifier",
+        "name": "Humidifier",
+        "quality_scale": "internal"
+    },
+    "hunterdouglas_powerview": {
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hunterdouglas_powerview",
+        "domain": "hunterdouglas_powerview",
+        "homekit": {
+            "models": [
+                "PowerView"
+            ]
+        },
+        "name": "Hunter Douglas PowerView",
+        "requirements": [
+            "aiopvapi==1.6.14"
+        ]
+    },
+    "hvv_departures": {
+        "codeowners": [
+            "@vigonotion"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hvv_departures",
+        "domain": "hvv_departures",
+        "name": "HVV Departures",
+        "requirements": [
+            "pygti==0.6.0"
+        ]
+    },
+    "hydrawise": {
+        "codeowners": [
+            "@ptcryan"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/hydrawise",
+        "domain": "hydrawise",
+        "name": "Hunter Hydrawise",
+        "requirements": [
+            "hydrawiser==0.2"
+        ]
+    },
+    "hyperion": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/hyperion",
+        "domain": "hyperion",
+        "name": "Hyperion"
+    },
+    "ialarm": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ialarm",
+        "domain": "ialarm",
+        "name": "Antifurto365 iAlarm",
+        "requirements": [
+            "pyialarm==0.3"
+        ]
+    },
+    "iammeter": {
+        "codeowners": [
+            "@lewei50"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/iammeter",
+        "domain": "iammeter",
+        "name": "IamMeter",
+        "requirements": [
+            "iammeter==0.1.7"
+        ]
+    },
+    "iaqualink": {
+        "codeowners": [
+            "@flz"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/iaqualink/",
+        "domain": "iaqualink",
+        "name": "Jandy iAqualink",
+        "requirements": [
+            "iaqualink==0.3.4"
+        ]
+    },
+    "icloud": {
+        "codeowners": [
+            "@Quentame"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/icloud",
+        "domain": "icloud",
+        "name": "Apple iCloud",
+        "requirements": [
+            "pyicloud==0.9.7"
+        ]
+    },
+    "idteck_prox": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/idteck_prox",
+        "domain": "idteck_prox",
+        "name": "IDTECK Proximity Reader",
+        "requirements": [
+            "rfk101py==0.0.1"
+        ]
+    },
+    "ifttt": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ifttt",
+        "domain": "ifttt",
+        "name": "IFTTT",
+        "requirements": [
+            "pyfttt==0.3"
+        ]
+    },
+    "iglo": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/iglo",
+        "domain": "iglo",
+        "name": "iGlo",
+        "requirements": [
+            "iglo==1.2.7"
+        ]
+    },
+    "ign_sismologia": {
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ign_sismologia",
+        "domain": "ign_sismologia",
+        "name": "IGN Sismolog\u00eda",
+        "requirements": [
+            "georss_ign_sismologia_client==0.2"
+        ]
+    },
+    "ihc": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ihc",
+        "domain": "ihc",
+        "name": "IHC Controller",
+        "requirements": [
+            "defusedxml==0.6.0",
+            "ihcsdk==2.7.0"
+        ]
+    },
+    "image": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "config_flow": False,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/image",
+        "domain": "image",
+        "homekit": {},
+        "name": "Image",
+        "requirements": [
+            "pillow==7.2.0"
+        ],
+        "ssdp": [],
+        "zeroconf": []
+    },
+    "image_processing": {
+        "codeowners": [],
+        "dependencies": [
+            "camera"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/image_processing",
+        "domain": "image_processing",
+        "name": "Image Processing"
+    },
+    "imap": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/imap",
+        "domain": "imap",
+        "name": "IMAP",
+        "requirements": [
+            "aioimaplib==0.7.15"
+        ]
+    },
+    "imap_email_content": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/imap_email_content",
+        "domain": "imap_email_content",
+        "name": "IMAP Email Content"
+    },
+    "incomfort": {
+        "codeowners": [
+            "@zxdavb"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/incomfort",
+        "domain": "incomfort",
+        "name": "Intergas InComfort/Intouch Lan2RF gateway",
+        "requirements": [
+            "incomfort-client==0.4.0"
+        ]
+    },
+    "influxdb": {
+        "codeowners": [
+            "@fabaff",
+            "@mdegat01"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/influxdb",
+        "domain": "influxdb",
+        "name": "InfluxDB",
+        "requirements": [
+            "influxdb==5.2.3",
+            "influxdb-client==1.8.0"
+        ]
+    },
+    "input_boolean": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/input_boolean",
+        "domain": "input_boolean",
+        "name": "Input Boolean",
+        "quality_scale": "internal"
+    },
+    "input_datetime": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/input_datetime",
+        "domain": "input_datetime",
+        "name": "Input Datetime",
+        "quality_scale": "internal"
+    },
+    "input_number": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/input_number",
+        "domain": "input_number",
+        "name": "Input Number",
+        "quality_scale": "internal"
+    },
+    "input_select": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/input_select",
+        "domain": "input_select",
+        "name": "Input Select",
+        "quality_scale": "internal"
+    },
+    "input_text": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/input_text",
+        "domain": "input_text",
+        "name": "Input Text",
+        "quality_scale": "internal"
+    },
+    "insteon": {
+        "codeowners": [
+            "@teharris1"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/insteon",
+        "domain": "insteon",
+        "name": "Insteon",
+        "requirements": [
+            "pyinsteon==1.0.7"
+        ]
+    },
+    "integration": {
+        "codeowners": [
+            "@dgomes"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/integration",
+        "domain": "integration",
+        "name": "Integration - Riemann sum integral",
+        "quality_scale": "internal"
+    },
+    "intent": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "config_flow": False,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/intent",
+        "domain": "intent",
+        "name": "Intent"
+    },
+    "intent_script": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/intent_script",
+        "domain": "intent_script",
+        "name": "Intent Script",
+        "quality_scale": "internal"
+    },
+    "intesishome": {
+        "codeowners": [
+            "@jnimmo"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/intesishome",
+        "domain": "intesishome",
+        "name": "IntesisHome",
+        "requirements": [
+            "pyintesishome==1.7.5"
+        ]
+    },
+    "ios": {
+        "codeowners": [
+            "@robbiet480"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "device_tracker",
+            "http",
+            "zeroconf"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ios",
+        "domain": "ios",
+        "name": "Home Assistant iOS"
+    },
+    "iota": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/iota",
+        "domain": "iota",
+        "name": "IOTA",
+        "requirements": [
+            "pyota==2.0.5"
+        ]
+    },
+    "iperf3": {
+        "codeowners": [
+            "@rohankapoorcom"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/iperf3",
+        "domain": "iperf3",
+        "name": "Iperf3",
+        "requirements": [
+            "iperf3==0.1.11"
+        ]
+    },
+    "ipma": {
+        "codeowners": [
+            "@dgomes",
+            "@abmantis"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ipma",
+        "domain": "ipma",
+        "name": "Instituto Portugu\u00eas do Mar e Atmosfera (IPMA)",
+        "requirements": [
+            "pyipma==2.0.5"
+        ]
+    },
+    "ipp": {
+        "codeowners": [
+            "@ctalkington"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ipp",
+        "domain": "ipp",
+        "name": "Internet Printing Protocol (IPP)",
+        "quality_scale": "platinum",
+        "requirements": [
+            "pyipp==0.11.0"
+        ],
+        "zeroconf": [
+            "_ipps._tcp.local.",
+            "_ipp._tcp.local."
+        ]
+    },
+    "iqvia": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/iqvia",
+        "domain": "iqvia",
+        "name": "IQVIA",
+        "requirements": [
+            "numpy==1.19.1",
+            "pyiqvia==0.2.1"
+        ]
+    },
+    "irish_rail_transport": {
+        "codeowners": [
+            "@ttroy50"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/irish_rail_transport",
+        "domain": "irish_rail_transport",
+        "name": "Irish Rail Transport",
+        "requirements": [
+            "pyirishrail==0.0.2"
+        ]
+    },
+    "islamic_prayer_times": {
+        "codeowners": [
+            "@engrbm87"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/islamic_prayer_times",
+        "domain": "islamic_prayer_times",
+        "name": "Islamic Prayer Times",
+        "requirements": [
+            "prayer_times_calculator==0.0.3"
+        ]
+    },
+    "iss": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/iss",
+        "domain": "iss",
+        "name": "International Space Station (ISS)",
+        "requirements": [
+            "pyiss==1.0.1"
+        ]
+    },
+    "isy994": {
+        "codeowners": [
+            "@bdraco",
+            "@shbatm"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/isy994",
+        "domain": "isy994",
+        "name": "Universal Devices ISY994",
+        "requirements": [
+            "pyisy==2.0.2"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:udi-com:device:X_Insteon_Lighting_Device:1",
+                "manufacturer": "Universal Devices Inc."
+            }
+        ]
+    },
+    "itach": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/itach",
+        "domain": "itach",
+        "name": "Global Cach\u00e9 iTach TCP/IP to IR",
+        "requirements": [
+            "pyitachip2ir==0.0.7"
+        ]
+    },
+    "itunes": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/itunes",
+        "domain": "itunes",
+        "name": "Apple iTunes"
+    },
+    "izone": {
+        "codeowners": [
+            "@Swamp-Ig"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/izone",
+        "domain": "izone",
+        "name": "iZone",
+        "requirements": [
+            "python-izone==1.1.2"
+        ]
+    },
+    "jewish_calendar": {
+        "codeowners": [
+            "@tsvi"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/jewish_calendar",
+        "domain": "jewish_calendar",
+        "name": "Jewish Calendar",
+        "requirements": [
+            "hdate==0.9.5"
+        ]
+    },
+    "joaoapps_join": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/joaoapps_join",
+        "domain": "joaoapps_join",
+        "name": "Joaoapps Join",
+        "requirements": [
+            "python-join-api==0.0.6"
+        ]
+    },
+    "juicenet": {
+        "codeowners": [
+            "@jesserockz"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/juicenet",
+        "domain": "juicenet",
+        "name": "JuiceNet",
+        "requirements": [
+            "python-juicenet==1.0.1"
+        ]
+    },
+    "kaiterra": {
+        "codeowners": [
+            "@Michsior14"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/kaiterra",
+        "domain": "kaiterra",
+        "name": "Kaiterra",
+        "requirements": [
+            "kaiterra-async-client==0.0.2"
+        ]
+    },
+    "kankun": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/kankun",
+        "domain": "kankun",
+        "name": "Kankun"
+    },
+    "keba": {
+        "codeowners": [
+            "@dannerph"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/keba",
+        "domain": "keba",
+        "name": "Keba Charging Station",
+        "requirements": [
+            "keba-kecontact==1.1.0"
+        ]
+    },
+    "keenetic_ndms2": {
+        "codeowners": [
+            "@foxel"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/keenetic_ndms2",
+        "domain": "keenetic_ndms2",
+        "name": "Keenetic NDMS2 Routers",
+        "requirements": [
+            "ndms2_client==0.0.11"
+        ]
+    },
+    "kef": {
+        "codeowners": [
+            "@basnijholt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/kef",
+        "domain": "kef",
+        "name": "KEF",
+        "requirements": [
+            "aiokef==0.2.13",
+            "getmac==0.8.2"
+        ]
+    },
+    "keyboard": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/keyboard",
+        "domain": "keyboard",
+        "name": "Keyboard",
+        "requirements": [
+            "pyuserinput==0.1.11"
+        ]
+    },
+    "keyboard_remote": {
+        "codeowners": [
+            "@bendavid"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/keyboard_remote",
+        "domain": "keyboard_remote",
+        "name": "Keyboard Remote",
+        "requirements": [
+            "evdev==1.1.2",
+            "aionotify==0.2.0"
+        ]
+    },
+    "kira": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/kira",
+        "domain": "kira",
+        "name": "Kira",
+        "requirements": [
+            "pykira==0.1.1"
+        ]
+    },
+    "kiwi": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/kiwi",
+        "domain": "kiwi",
+        "name": "KIWI",
+        "requirements": [
+            "kiwiki-client==0.1.1"
+        ]
+    },
+    "knx": {
+        "codeowners": [
+            "@Julius2342",
+            "@farmio",
+            "@marvin-w"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/knx",
+        "domain": "knx",
+        "name": "KNX",
+        "requirements": [
+            "xknx==0.12.0"
+        ]
+    },
+    "kodi": {
+        "codeowners": [
+            "@armills",
+            "@OnFreund"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/kodi",
+        "domain": "kodi",
+        "name": "Kodi",
+        "requirements": [
+            "pykodi==0.1"
+        ],
+        "zeroconf": [
+            "_xbmc-jsonrpc-h._tcp.local."
+        ]
+    },
+    "konnected": {
+        "codeowners": [
+            "@heythisisnate",
+            "@kit-klein"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/konnected",
+        "domain": "konnected",
+        "name": "Konnected.io",
+        "requirements": [
+            "konnected==1.2.0"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "konnected.io"
+            }
+        ]
+    },
+    "kwb": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/kwb",
+        "domain": "kwb",
+        "name": "KWB Easyfire",
+        "requirements": [
+            "pykwb==0.0.8"
+        ]
+    },
+    "lacrosse": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lacrosse",
+        "domain": "lacrosse",
+        "name": "LaCrosse",
+        "requirements": [
+            "pylacrosse==0.4.0"
+        ]
+    },
+    "lametric": {
+        "codeowners": [
+            "@robbiet480"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/lametric",
+        "domain": "lametric",
+        "name": "LaMetric",
+        "requirements": [
+            "lmnotify==0.0.4"
+        ]
+    },
+    "lannouncer": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lannouncer",
+        "domain": "lannouncer",
+        "name": "LANnouncer"
+    },
+    "lastfm": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lastfm",
+        "domain": "lastfm",
+        "name": "Last.fm",
+        "requirements": [
+            "pylast==3.3.0"
+        ]
+    },
+    "launch_library": {
+        "codeowners": [
+            "@ludeeus"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/launch_library",
+        "domain": "launch_library",
+        "name": "Launch Library",
+        "requirements": [
+            "pylaunches==0.2.0"
+        ]
+    },
+    "lcn": {
+        "codeowners": [
+            "@alengwenus"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/lcn",
+        "domain": "lcn",
+        "name": "LCN",
+        "requirements": [
+            "pypck==0.6.4"
+        ]
+    },
+    "lg_netcast": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lg_netcast",
+        "domain": "lg_netcast",
+        "name": "LG Netcast",
+        "requirements": [
+            "pylgnetcast-homeassistant==0.2.0.dev0"
+        ]
+    },
+    "lg_soundbar": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lg_soundbar",
+        "domain": "lg_soundbar",
+        "name": "LG Soundbars",
+        "requirements": [
+            "temescal==0.2"
+        ]
+    },
+    "life360": {
+        "codeowners": [
+            "@pnbruckner"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/life360",
+        "domain": "life360",
+        "name": "Life360",
+        "requirements": [
+            "life360==4.1.1"
+        ]
+    },
+    "lifx": {
+        "codeowners": [],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/lifx",
+        "domain": "lifx",
+        "homekit": {
+            "models": [
+                "LIFX"
+            ]
+        },
+        "name": "LIFX",
+        "requirements": [
+            "aiolifx==0.6.7",
+            "aiolifx_effects==0.2.2"
+        ]
+    },
+    "lifx_cloud": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lifx_cloud",
+        "domain": "lifx_cloud",
+        "name": "LIFX Cloud"
+    },
+    "lifx_legacy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lifx_legacy",
+        "domain": "lifx_legacy",
+        "name": "LIFX Legacy",
+        "requirements": [
+            "liffylights==0.9.4"
+        ]
+    },
+    "light": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/light",
+        "domain": "light",
+        "name": "Light",
+        "quality_scale": "internal"
+    },
+    "lightwave": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lightwave",
+        "domain": "lightwave",
+        "name": "Lightwave",
+        "requirements": [
+            "lightwave==0.18"
+        ]
+    },
+    "limitlessled": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/limitlessled",
+        "domain": "limitlessled",
+        "name": "LimitlessLED",
+        "requirements": [
+            "limitlessled==1.1.3"
+        ]
+    },
+    "linksys_smart": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/linksys_smart",
+        "domain": "linksys_smart",
+        "name": "Linksys Smart Wi-Fi"
+    },
+    "linode": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/linode",
+        "domain": "linode",
+        "name": "Linode",
+        "requirements": [
+            "linode-api==4.1.9b1"
+        ]
+    },
+    "linux_battery": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/linux_battery",
+        "domain": "linux_battery",
+        "name": "Linux Battery",
+        "requirements": [
+            "batinfo==0.4.2"
+        ]
+    },
+    "lirc": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lirc",
+        "domain": "lirc",
+        "name": "LIRC",
+        "requirements": [
+            "python-lirc==1.2.3"
+        ]
+    },
+    "litejet": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/litejet",
+        "domain": "litejet",
+        "name": "LiteJet",
+        "requirements": [
+            "pylitejet==0.1"
+        ]
+    },
+    "llamalab_automate": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/llamalab_automate",
+        "domain": "llamalab_automate",
+        "name": "LlamaLab Automate"
+    },
+    "local_file": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/local_file",
+        "domain": "local_file",
+        "name": "Local File"
+    },
+    "local_ip": {
+        "codeowners": [
+            "@issacg"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/local_ip",
+        "domain": "local_ip",
+        "name": "Local IP Address"
+    },
+    "locative": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/locative",
+        "domain": "locative",
+        "name": "Locative"
+    },
+    "lock": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lock",
+        "domain": "lock",
+        "name": "Lock",
+        "quality_scale": "internal"
+    },
+    "logbook": {
+        "codeowners": [],
+        "dependencies": [
+            "frontend",
+            "http",
+            "recorder"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/logbook",
+        "domain": "logbook",
+        "name": "Logbook"
+    },
+    "logentries": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/logentries",
+        "domain": "logentries",
+        "name": "Logentries"
+    },
+    "logger": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/logger",
+        "domain": "logger",
+        "name": "Logger",
+        "quality_scale": "internal"
+    },
+    "logi_circle": {
+        "codeowners": [
+            "@evanjd"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "ffmpeg",
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/logi_circle",
+        "domain": "logi_circle",
+        "name": "Logi Circle",
+        "requirements": [
+            "logi_circle==0.2.2"
+        ]
+    },
+    "london_air": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/london_air",
+        "domain": "london_air",
+        "name": "London Air"
+    },
+    "london_underground": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/london_underground",
+        "domain": "london_underground",
+        "name": "London Underground",
+        "requirements": [
+            "london-tube-status==0.2"
+        ]
+    },
+    "loopenergy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/loopenergy",
+        "domain": "loopenergy",
+        "name": "Loop Energy",
+        "requirements": [
+            "pyloopenergy==0.1.3"
+        ]
+    },
+    "lovelace": {
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/lovelace",
+        "domain": "lovelace",
+        "name": "Lovelace"
+    },
+    "luci": {
+        "codeowners": [
+            "@fbradyirl",
+            "@mzdrale"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/luci",
+        "domain": "luci",
+        "name": "OpenWRT (luci)",
+        "requirements": [
+            "openwrt-luci-rpc==1.1.3"
+        ]
+    },
+    "luftdaten": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/luftdaten",
+        "domain": "luftdaten",
+        "name": "Luftdaten",
+        "quality_scale": "gold",
+        "requirements": [
+            "luftdaten==0.6.4"
+        ]
+    },
+    "lupusec": {
+        "codeowners": [
+            "@majuss"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/lupusec",
+        "domain": "lupusec",
+        "name": "Lupus Electronics LUPUSEC",
+        "requirements": [
+            "lupupy==0.0.18"
+        ]
+    },
+    "lutron": {
+        "codeowners": [
+            "@JonGilmore"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/lutron",
+        "domain": "lutron",
+        "name": "Lutron",
+        "requirements": [
+            "pylutron==0.2.5"
+        ]
+    },
+    "lutron_caseta": {
+        "codeowners": [
+            "@swails"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/lutron_caseta",
+        "domain": "lutron_caseta",
+        "name": "Lutron Cas\u00e9ta",
+        "requirements": [
+            "pylutron-caseta==0.6.1"
+        ]
+    },
+    "lw12wifi": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lw12wifi",
+        "domain": "lw12wifi",
+        "name": "LAGUTE LW-12",
+        "requirements": [
+            "lw12==0.9.2"
+        ]
+    },
+    "lyft": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/lyft",
+        "domain": "lyft",
+        "name": "Lyft",
+        "requirements": [
+            "lyft_rides==0.2"
+        ]
+    },
+    "magicseaweed": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/magicseaweed",
+        "domain": "magicseaweed",
+        "name": "Magicseaweed",
+        "requirements": [
+            "magicseaweed==1.0.3"
+        ]
+    },
+    "mailbox": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mailbox",
+        "domain": "mailbox",
+        "name": "Mailbox"
+    },
+    "mailgun": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mailgun",
+        "domain": "mailgun",
+        "name": "Mailgun",
+        "requirements": [
+            "pymailgunner==1.4"
+        ]
+    },
+    "manual": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/manual",
+        "domain": "manual",
+        "name": "Manual",
+        "quality_scale": "internal"
+    },
+    "manual_mqtt": {
+        "codeowners": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/manual_mqtt",
+        "domain": "manual_mqtt",
+        "name": "Manual MQTT"
+    },
+    "map": {
+        "codeowners": [],
+        "dependencies": [
+            "frontend"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/map",
+        "domain": "map",
+        "name": "Map",
+        "quality_scale": "internal"
+    },
+    "marytts": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/marytts",
+        "domain": "marytts",
+        "name": "MaryTTS",
+        "requirements": [
+            "speak2mary==1.4.0"
+        ]
+    },
+    "mastodon": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mastodon",
+        "domain": "mastodon",
+        "name": "Mastodon",
+        "requirements": [
+            "Mastodon.py==1.5.1"
+        ]
+    },
+    "matrix": {
+        "codeowners": [
+            "@tinloaf"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/matrix",
+        "domain": "matrix",
+        "name": "Matrix",
+        "requirements": [
+            "matrix-client==0.3.2"
+        ]
+    },
+    "maxcube": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/maxcube",
+        "domain": "maxcube",
+        "name": "eQ-3 MAX!",
+        "requirements": [
+            "maxcube-api==0.1.0"
+        ]
+    },
+    "mcp23017": {
+        "codeowners": [
+            "@jardiamj"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mcp23017",
+        "domain": "mcp23017",
+        "name": "MCP23017 I/O Expander",
+        "requirements": [
+            "RPi.GPIO==0.7.0",
+            "adafruit-blinka==3.9.0",
+            "adafruit-circuitpython-mcp230xx==2.2.2"
+        ]
+    },
+    "media_extractor": {
+        "codeowners": [],
+        "dependencies": [
+            "media_player"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/media_extractor",
+        "domain": "media_extractor",
+        "name": "Media Extractor",
+        "quality_scale": "internal",
+        "requirements": [
+            "youtube_dl==2020.07.28"
+        ]
+    },
+    "media_player": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/media_player",
+        "domain": "media_player",
+        "name": "Media Player",
+        "quality_scale": "internal"
+    },
+    "mediaroom": {
+        "codeowners": [
+            "@dgomes"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mediaroom",
+        "domain": "mediaroom",
+        "name": "Mediaroom",
+        "requirements": [
+            "pymediaroom==0.6.4"
+        ]
+    },
+    "melcloud": {
+        "codeowners": [
+            "@vilppuvuorinen"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/melcloud",
+        "domain": "melcloud",
+        "name": "MELCloud",
+        "requirements": [
+            "pymelcloud==2.5.2"
+        ]
+    },
+    "melissa": {
+        "codeowners": [
+            "@kennedyshead"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/melissa",
+        "domain": "melissa",
+        "name": "Melissa",
+        "requirements": [
+            "py-melissa-climate==2.0.0"
+        ]
+    },
+    "meraki": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/meraki",
+        "domain": "meraki",
+        "name": "Meraki"
+    },
+    "message_bird": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/message_bird",
+        "domain": "message_bird",
+        "name": "MessageBird",
+        "requirements": [
+            "messagebird==1.2.0"
+        ]
+    },
+    "met": {
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/met",
+        "domain": "met",
+        "name": "Meteorologisk institutt (Met.no)",
+        "requirements": [
+            "pyMetno==0.7.1"
+        ]
+    },
+    "meteo_france": {
+        "codeowners": [
+            "@hacf-fr",
+            "@oncleben31",
+            "@Quentame"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/meteo_france",
+        "domain": "meteo_france",
+        "name": "M\u00e9t\u00e9o-France",
+        "requirements": [
+            "meteofrance-api==0.1.1"
+        ]
+    },
+    "meteoalarm": {
+        "codeowners": [
+            "@rolfberkenbosch"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/meteoalarm",
+        "domain": "meteoalarm",
+        "name": "MeteoAlarm",
+        "requirements": [
+            "meteoalertapi==0.1.6"
+        ]
+    },
+    "metoffice": {
+        "codeowners": [
+            "@MrHarcombe"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/metoffice",
+        "domain": "metoffice",
+        "name": "Met Office",
+        "requirements": [
+            "datapoint==0.9.5"
+        ]
+    },
+    "mfi": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mfi",
+        "domain": "mfi",
+        "name": "Ubiquiti mFi mPort",
+        "requirements": [
+            "mficlient==0.3.0"
+        ]
+    },
+    "mhz19": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mhz19",
+        "domain": "mhz19",
+        "name": "MH-Z19 CO2 Sensor",
+        "requirements": [
+            "pmsensor==0.4"
+        ]
+    },
+    "microsoft": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/microsoft",
+        "domain": "microsoft",
+        "name": "Microsoft Text-to-Speech (TTS)",
+        "requirements": [
+            "pycsspeechtts==1.0.3"
+        ]
+    },
+    "microsoft_face": {
+        "codeowners": [],
+        "dependencies": [
+            "camera"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face",
+        "domain": "microsoft_face",
+        "name": "Microsoft Face"
+    },
+    "microsoft_face_detect": {
+        "codeowners": [],
+        "dependencies": [
+            "microsoft_face"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face_detect",
+        "domain": "microsoft_face_detect",
+        "name": "Microsoft Face Detect"
+    },
+    "microsoft_face_identify": {
+        "codeowners": [],
+        "dependencies": [
+            "microsoft_face"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face_identify",
+        "domain": "microsoft_face_identify",
+        "name": "Microsoft Face Identify"
+    },
+    "miflora": {
+        "codeowners": [
+            "@danielhiversen",
+            "@ChristianKuehnel"
+        ],
+        "disabled": "Dependency contains code that breaks Home Assistant.",
+        "documentation": "https://www.home-assistant.io/integrations/miflora",
+        "domain": "miflora",
+        "name": "Mi Flora",
+        "requirements": [
+            "bluepy==1.3.0",
+            "miflora==0.6.0"
+        ]
+    },
+    "mikrotik": {
+        "codeowners": [
+            "@engrbm87"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mikrotik",
+        "domain": "mikrotik",
+        "name": "Mikrotik",
+        "requirements": [
+            "librouteros==3.0.0"
+        ]
+    },
+    "mill": {
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mill",
+        "domain": "mill",
+        "name": "Mill",
+        "requirements": [
+            "millheater==0.3.4"
+        ]
+    },
+    "min_max": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/min_max",
+        "domain": "min_max",
+        "name": "Min/Max",
+        "quality_scale": "internal"
+    },
+    "minecraft_server": {
+        "codeowners": [
+            "@elmurato"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/minecraft_server",
+        "domain": "minecraft_server",
+        "name": "Minecraft Server",
+        "quality_scale": "silver",
+        "requirements": [
+            "aiodns==2.0.0",
+            "getmac==0.8.2",
+            "mcstatus==2.3.0"
+        ]
+    },
+    "minio": {
+        "codeowners": [
+            "@tkislan"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/minio",
+        "domain": "minio",
+        "name": "Minio",
+        "requirements": [
+            "minio==4.0.9"
+        ]
+    },
+    "mitemp_bt": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mitemp_bt",
+        "domain": "mitemp_bt",
+        "name": "Xiaomi Mijia BLE Temperature and Humidity Sensor",
+        "requirements": [
+            "mitemp_bt==0.0.3"
+        ]
+    },
+    "mjpeg": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mjpeg",
+        "domain": "mjpeg",
+        "name": "MJPEG IP Camera"
+    },
+    "mobile_app": {
+        "after_dependencies": [
+            "cloud",
+            "camera"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http",
+            "webhook",
+            "person",
+            "tag"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mobile_app",
+        "domain": "mobile_app",
+        "name": "Mobile App",
+        "quality_scale": "internal",
+        "requirements": [
+            "PyNaCl==1.3.0",
+            "emoji==0.5.4"
+        ]
+    },
+    "mochad": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mochad",
+        "domain": "mochad",
+        "name": "Mochad",
+        "requirements": [
+            "pymochad==0.2.0"
+        ]
+    },
+    "modbus": {
+        "codeowners": [
+            "@adamchengtkc",
+            "@janiversen"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/modbus",
+        "domain": "modbus",
+        "name": "Modbus",
+        "requirements": [
+            "pymodbus==2.3.0"
+        ]
+    },
+    "modem_callerid": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/modem_callerid",
+        "domain": "modem_callerid",
+        "name": "Modem Caller ID",
+        "requirements": [
+            "basicmodem==0.7"
+        ]
+    },
+    "mold_indicator": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mold_indicator",
+        "domain": "mold_indicator",
+        "name": "Mold Indicator",
+        "quality_scale": "internal"
+    },
+    "monoprice": {
+        "codeowners": [
+            "@etsinko",
+            "@OnFreund"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/monoprice",
+        "domain": "monoprice",
+        "name": "Monoprice 6-Zone Amplifier",
+        "requirements": [
+            "pymonoprice==0.3"
+        ]
+    },
+    "moon": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/moon",
+        "domain": "moon",
+        "name": "Moon",
+        "quality_scale": "internal"
+    },
+    "mpchc": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mpchc",
+        "domain": "mpchc",
+        "name": "Media Player Classic Home Cinema (MPC-HC)"
+    },
+    "mpd": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mpd",
+        "domain": "mpd",
+        "name": "Music Player Daemon (MPD)",
+        "requirements": [
+            "python-mpd2==1.0.0"
+        ]
+    },
+    "mqtt": {
+        "codeowners": [
+            "@home-assistant/core",
+            "@emontnemery"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mqtt",
+        "domain": "mqtt",
+        "name": "MQTT",
+        "requirements": [
+            "paho-mqtt==1.5.0"
+        ]
+    },
+    "mqtt_eventstream": {
+        "codeowners": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_eventstream",
+        "domain": "mqtt_eventstream",
+        "name": "MQTT Eventstream"
+    },
+    "mqtt_json": {
+        "codeowners": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_json",
+        "domain": "mqtt_json",
+        "name": "MQTT JSON"
+    },
+    "mqtt_room": {
+        "codeowners": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_room",
+        "domain": "mqtt_room",
+        "name": "MQTT Room Presence"
+    },
+    "mqtt_statestream": {
+        "codeowners": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_statestream",
+        "domain": "mqtt_statestream",
+        "name": "MQTT Statestream"
+    },
+    "msteams": {
+        "codeowners": [
+            "@peroyvind"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/msteams",
+        "domain": "msteams",
+        "name": "Microsoft Teams",
+        "requirements": [
+            "pymsteams==0.1.12"
+        ]
+    },
+    "mvglive": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mvglive",
+        "domain": "mvglive",
+        "name": "MVG",
+        "requirements": [
+            "PyMVGLive==1.1.4"
+        ]
+    },
+    "mychevy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mychevy",
+        "domain": "mychevy",
+        "name": "myChevrolet",
+        "requirements": [
+            "mychevy==2.0.1"
+        ]
+    },
+    "mycroft": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mycroft",
+        "domain": "mycroft",
+        "name": "Mycroft",
+        "requirements": [
+            "mycroftapi==2.0"
+        ]
+    },
+    "myq": {
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/myq",
+        "domain": "myq",
+        "homekit": {
+            "models": [
+                "819LMB"
+            ]
+        },
+        "name": "MyQ",
+        "requirements": [
+            "pymyq==2.0.5"
+        ]
+    },
+    "mysensors": {
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "codeowners": [
+            "@MartinHjelmare"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mysensors",
+        "domain": "mysensors",
+        "name": "MySensors",
+        "requirements": [
+            "pymysensors==0.18.0"
+        ]
+    },
+    "mystrom": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/mystrom",
+        "domain": "mystrom",
+        "name": "myStrom",
+        "requirements": [
+            "python-mystrom==1.1.2"
+        ]
+    },
+    "mythicbeastsdns": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/mythicbeastsdns",
+        "domain": "mythicbeastsdns",
+        "name": "Mythic Beasts DNS",
+        "requirements": [
+            "mbddns==0.1.2"
+        ]
+    },
+    "n26": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/n26",
+        "domain": "n26",
+        "name": "N26",
+        "requirements": [
+            "n26==0.2.7"
+        ]
+    },
+    "nad": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/nad",
+        "domain": "nad",
+        "name": "NAD",
+        "requirements": [
+            "nad_receiver==0.0.12"
+        ]
+    },
+    "namecheapdns": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/namecheapdns",
+        "domain": "namecheapdns",
+        "name": "Namecheap FreeDNS",
+        "requirements": [
+            "defusedxml==0.6.0"
+        ]
+    },
+    "nanoleaf": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/nanoleaf",
+        "domain": "nanoleaf",
+        "name": "Nanoleaf",
+        "requirements": [
+            "pynanoleaf==0.0.5"
+        ]
+    },
+    "neato": {
+        "codeowners": [
+            "@dshokouhi",
+            "@Santobert"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/neato",
+        "domain": "neato",
+        "name": "Neato Botvac",
+        "requirements": [
+            "pybotvac==0.0.17"
+        ]
+    },
+    "nederlandse_spoorwegen": {
+        "codeowners": [
+            "@YarmoM"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nederlandse_spoorwegen",
+        "domain": "nederlandse_spoorwegen",
+        "name": "Nederlandse Spoorwegen (NS)",
+        "requirements": [
+            "nsapi==3.0.4"
+        ]
+    },
+    "nello": {
+        "codeowners": [
+            "@pschmitt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nello",
+        "domain": "nello",
+        "name": "Nello",
+        "requirements": [
+            "pynello==2.0.2"
+        ]
+    },
+    "ness_alarm": {
+        "codeowners": [
+            "@nickw444"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ness_alarm",
+        "domain": "ness_alarm",
+        "name": "Ness Alarm",
+        "requirements": [
+            "nessclient==0.9.15"
+        ]
+    },
+    "nest": {
+        "codeowners": [
+            "@awarecan"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nest",
+        "domain": "nest",
+        "name": "Nest",
+        "requirements": [
+            "python-nest==4.1.0"
+        ]
+    },
+    "netatmo": {
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@cgtobi"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/netatmo",
+        "domain": "netatmo",
+        "homekit": {
+            "models": [
+                "Healty Home Coach",
+                "Netatmo Relay",
+                "Presence",
+                "Welcome"
+            ]
+        },
+        "name": "Netatmo",
+        "requirements": [
+            "pyatmo==4.0.0"
+        ]
+    },
+    "netdata": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/netdata",
+        "domain": "netdata",
+        "name": "Netdata",
+        "requirements": [
+            "netdata==0.2.0"
+        ]
+    },
+    "netgear": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/netgear",
+        "domain": "netgear",
+        "name": "NETGEAR",
+        "requirements": [
+            "pynetgear==0.6.1"
+        ]
+    },
+    "netgear_lte": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/netgear_lte",
+        "domain": "netgear_lte",
+        "name": "NETGEAR LTE",
+        "requirements": [
+            "eternalegypt==0.0.11"
+        ]
+    },
+    "netio": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/netio",
+        "domain": "netio",
+        "name": "Netio",
+        "requirements": [
+            "pynetio==0.1.9.1"
+        ]
+    },
+    "neurio_energy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/neurio_energy",
+        "domain": "neurio_energy",
+        "name": "Neurio energy",
+        "requirements": [
+            "neurio==0.3.1"
+        ]
+    },
+    "nexia": {
+        "codeowners": [
+            "@ryannazaretian",
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nexia",
+        "domain": "nexia",
+        "name": "Nexia",
+        "requirements": [
+            "nexia==0.9.3"
+        ]
+    },
+    "nextbus": {
+        "codeowners": [
+            "@vividboarder"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nextbus",
+        "domain": "nextbus",
+        "name": "NextBus",
+        "requirements": [
+            "py_nextbusnext==0.1.4"
+        ]
+    },
+    "nextcloud": {
+        "codeowners": [
+            "@meichthys"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nextcloud",
+        "domain": "nextcloud",
+        "name": "Nextcloud",
+        "requirements": [
+            "nextcloudmonitor==1.1.0"
+        ]
+    },
+    "nfandroidtv": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/nfandroidtv",
+        "domain": "nfandroidtv",
+        "name": "Notifications for Android TV / FireTV"
+    },
+    "nightscout": {
+        "codeowners": [
+            "@marciogranzotto"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nightscout",
+        "domain": "nightscout",
+        "name": "Nightscout",
+        "quality_scale": "platinum",
+        "requirements": [
+            "py-nightscout==1.2.1"
+        ]
+    },
+    "niko_home_control": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/niko_home_control",
+        "domain": "niko_home_control",
+        "name": "Niko Home Control",
+        "requirements": [
+            "niko-home-control==0.2.1"
+        ]
+    },
+    "nilu": {
+        "codeowners": [
+            "@hfurubotten"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nilu",
+        "domain": "nilu",
+        "name": "Norwegian Institute for Air Research (NILU)",
+        "requirements": [
+            "niluclient==0.1.2"
+        ]
+    },
+    "nissan_leaf": {
+        "codeowners": [
+            "@filcole"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nissan_leaf",
+        "domain": "nissan_leaf",
+        "name": "Nissan Leaf",
+        "requirements": [
+            "pycarwings2==2.9"
+        ]
+    },
+    "nmap_tracker": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/nmap_tracker",
+        "domain": "nmap_tracker",
+        "name": "Nmap Tracker",
+        "requirements": [
+            "python-nmap==0.6.1",
+            "getmac==0.8.2"
+        ]
+    },
+    "nmbs": {
+        "codeowners": [
+            "@thibmaek"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nmbs",
+        "domain": "nmbs",
+        "name": "NMBS",
+        "requirements": [
+            "pyrail==0.0.3"
+        ]
+    },
+    "no_ip": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/no_ip",
+        "domain": "no_ip",
+        "name": "No-IP.com"
+    },
+    "noaa_tides": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/noaa_tides",
+        "domain": "noaa_tides",
+        "name": "NOAA Tides",
+        "requirements": [
+            "py_noaa==0.3.0"
+        ]
+    },
+    "norway_air": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/norway_air",
+        "domain": "norway_air",
+        "name": "Om Luftkvalitet i Norge (Norway Air)",
+        "requirements": [
+            "pyMetno==0.7.1"
+        ]
+    },
+    "notify": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/notify",
+        "domain": "notify",
+        "name": "Notifications",
+        "quality_scale": "internal"
+    },
+    "notify_events": {
+        "codeowners": [
+            "@matrozov",
+            "@papajojo"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/notify_events",
+        "domain": "notify_events",
+        "name": "Notify.Events",
+        "requirements": [
+            "notify-events==1.0.4"
+        ]
+    },
+    "notion": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/notion",
+        "domain": "notion",
+        "name": "Notion",
+        "requirements": [
+            "aionotion==1.1.0"
+        ]
+    },
+    "nsw_fuel_station": {
+        "codeowners": [
+            "@nickw444"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nsw_fuel_station",
+        "domain": "nsw_fuel_station",
+        "name": "NSW Fuel Station Price",
+        "requirements": [
+            "nsw-fuel-api-client==1.0.10"
+        ]
+    },
+    "nsw_rural_fire_service_feed": {
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nsw_rural_fire_service_feed",
+        "domain": "nsw_rural_fire_service_feed",
+        "name": "NSW Rural Fire Service Incidents",
+        "requirements": [
+            "aio_geojson_nsw_rfs_incidents==0.3"
+        ]
+    },
+    "nuheat": {
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nuheat",
+        "domain": "nuheat",
+        "name": "NuHeat",
+        "requirements": [
+            "nuheat==0.3.0"
+        ]
+    },
+    "nuimo_controller": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/nuimo_controller",
+        "domain": "nuimo_controller",
+        "name": "Nuimo controller",
+        "requirements": [
+            "--only-binary=all nuimo==0.1.0"
+        ]
+    },
+    "nuki": {
+        "codeowners": [
+            "@pschmitt",
+            "@pvizeli"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nuki",
+        "domain": "nuki",
+        "name": "Nuki",
+        "requirements": [
+            "pynuki==1.3.8"
+        ]
+    },
+    "numato": {
+        "codeowners": [
+            "@clssn"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/numato",
+        "domain": "numato",
+        "name": "Numato USB GPIO Expander",
+        "requirements": [
+            "numato-gpio==0.8.0"
+        ]
+    },
+    "nut": {
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nut",
+        "domain": "nut",
+        "name": "Network UPS Tools (NUT)",
+        "requirements": [
+            "pynut2==2.1.2"
+        ],
+        "zeroconf": [
+            "_nut._tcp.local."
+        ]
+    },
+    "nws": {
+        "codeowners": [
+            "@MatthewFlamm"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nws",
+        "domain": "nws",
+        "name": "National Weather Service (NWS)",
+        "quality_scale": "platinum",
+        "requirements": [
+            "pynws==1.2.1"
+        ]
+    },
+    "nx584": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/nx584",
+        "domain": "nx584",
+        "name": "NX584",
+        "requirements": [
+            "pynx584==0.5"
+        ]
+    },
+    "nzbget": {
+        "codeowners": [
+            "@chriscla"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nzbget",
+        "domain": "nzbget",
+        "name": "NZBGet",
+        "requirements": [
+            "pynzbgetapi==0.2.0"
+        ]
+    },
+    "oasa_telematics": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/oasa_telematics/",
+        "domain": "oasa_telematics",
+        "name": "OASA Telematics",
+        "requirements": [
+            "oasatelematics==0.3"
+        ]
+    },
+    "obihai": {
+        "codeowners": [
+            "@dshokouhi"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/obihai",
+        "domain": "obihai",
+        "name": "Obihai",
+        "requirements": [
+            "pyobihai==1.2.3"
+        ]
+    },
+    "octoprint": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/octoprint",
+        "domain": "octoprint",
+        "name": "OctoPrint"
+    },
+    "oem": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/oem",
+        "domain": "oem",
+        "name": "OpenEnergyMonitor WiFi Thermostat",
+        "requirements": [
+            "oemthermostat==1.1"
+        ]
+    },
+    "ohmconnect": {
+        "codeowners": [
+            "@robbiet480"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ohmconnect",
+        "domain": "ohmconnect",
+        "name": "OhmConnect",
+        "requirements": [
+            "defusedxml==0.6.0"
+        ]
+    },
+    "ombi": {
+        "codeowners": [
+            "@larssont"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ombi/",
+        "domain": "ombi",
+        "name": "Ombi",
+        "requirements": [
+            "pyombi==0.1.10"
+        ]
+    },
+    "onboarding": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "auth",
+            "http",
+            "person"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/onboarding",
+        "domain": "onboarding",
+        "name": "Home Assistant Onboarding",
+        "quality_scale": "internal"
+    },
+    "onewire": {
+        "codeowners": [
+            "@garbled1"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/onewire",
+        "domain": "onewire",
+        "name": "1-Wire",
+        "requirements": [
+            "pyownet==0.10.0.post1"
+        ]
+    },
+    "onkyo": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/onkyo",
+        "domain": "onkyo",
+        "name": "Onkyo",
+        "requirements": [
+            "onkyo-eiscp==1.2.7"
+        ]
+    },
+    "onvif": {
+        "codeowners": [
+            "@hunterjm"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/onvif",
+        "domain": "onvif",
+        "name": "ONVIF",
+        "requirements": [
+            "onvif-zeep-async==0.5.0",
+            "WSDiscovery==2.0.0"
+        ]
+    },
+    "openalpr_cloud": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/openalpr_cloud",
+        "domain": "openalpr_cloud",
+        "name": "OpenALPR Cloud"
+    },
+    "openalpr_local": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/openalpr_local",
+        "domain": "openalpr_local",
+        "name": "OpenALPR Local"
+    },
+    "opencv": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/opencv",
+        "domain": "opencv",
+        "name": "OpenCV",
+        "requirements": [
+            "numpy==1.19.1",
+            "opencv-python-headless==4.3.0.36"
+        ]
+    },
+    "openerz": {
+        "codeowners": [
+            "@misialq"
+        ],
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/openerz",
+        "domain": "openerz",
+        "name": "Open ERZ",
+        "requirements": [
+            "openerz-api==0.1.0"
+        ]
+    },
+    "openevse": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/openevse",
+        "domain": "openevse",
+        "name": "OpenEVSE",
+        "requirements": [
+            "openevsewifi==1.1.0"
+        ]
+    },
+    "openexchangerates": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/openexchangerates",
+        "domain": "openexchangerates",
+        "name": "Open Exchange Rates"
+    },
+    "opengarage": {
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/opengarage",
+        "domain": "opengarage",
+        "name": "OpenGarage",
+        "requirements": [
+            "open-garage==0.1.4"
+        ]
+    },
+    "openhardwaremonitor": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/openhardwaremonitor",
+        "domain": "openhardwaremonitor",
+        "name": "Open Hardware Monitor"
+    },
+    "openhome": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/openhome",
+        "domain": "openhome",
+        "name": "Linn / OpenHome",
+        "requirements": [
+            "openhomedevice==0.7.2"
+        ]
+    },
+    "opensensemap": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/opensensemap",
+        "domain": "opensensemap",
+        "name": "openSenseMap",
+        "requirements": [
+            "opensensemap-api==0.1.5"
+        ]
+    },
+    "opensky": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/opensky",
+        "domain": "opensky",
+        "name": "OpenSky Network"
+    },
+    "opentherm_gw": {
+        "codeowners": [
+            "@mvn23"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/opentherm_gw",
+        "domain": "opentherm_gw",
+        "name": "OpenTherm Gateway",
+        "requirements": [
+            "pyotgw==0.6b1"
+        ]
+    },
+    "openuv": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/openuv",
+        "domain": "openuv",
+        "name": "OpenUV",
+        "requirements": [
+            "pyopenuv==1.0.9"
+        ]
+    },
+    "openweathermap": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/openweathermap",
+        "domain": "openweathermap",
+        "name": "Openweathermap",
+        "requirements": [
+            "pyowm==2.10.0"
+        ]
+    },
+    "opnsense": {
+        "codeowners": [
+            "@mtreinish"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/opnsense",
+        "domain": "opnsense",
+        "name": "OPNSense",
+        "requirements": [
+            "pyopnsense==0.2.0"
+        ]
+    },
+    "opple": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/opple",
+        "domain": "opple",
+        "name": "Opple",
+        "requirements": [
+            "pyoppleio==1.0.5"
+        ]
+    },
+    "orangepi_gpio": {
+        "codeowners": [
+            "@pascallj"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/orangepi_gpio",
+        "domain": "orangepi_gpio",
+        "name": "Orange Pi GPIO",
+        "requirements": [
+            "OPi.GPIO==0.4.0"
+        ]
+    },
+    "oru": {
+        "codeowners": [
+            "@bvlaicu"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/oru",
+        "domain": "oru",
+        "name": "Orange and Rockland Utility (ORU)",
+        "requirements": [
+            "oru==0.1.11"
+        ]
+    },
+    "orvibo": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/orvibo",
+        "domain": "orvibo",
+        "name": "Orvibo",
+        "requirements": [
+            "orvibo==1.1.1"
+        ]
+    },
+    "osramlightify": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/osramlightify",
+        "domain": "osramlightify",
+        "name": "Osramlightify",
+        "requirements": [
+            "lightify==1.0.7.2"
+        ]
+    },
+    "otp": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/otp",
+        "domain": "otp",
+        "name": "One-Time Password (OTP)",
+        "quality_scale": "internal",
+        "requirements": [
+            "pyotp==2.3.0"
+        ]
+    },
+    "ovo_energy": {
+        "codeowners": [
+            "@timmo001"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ovo_energy",
+        "domain": "ovo_energy",
+        "name": "OVO Energy",
+        "requirements": [
+            "ovoenergy==1.1.7"
+        ]
+    },
+    "owntracks": {
+        "after_dependencies": [
+            "mqtt",
+            "cloud"
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/owntracks",
+        "domain": "owntracks",
+        "name": "OwnTracks",
+        "requirements": [
+            "PyNaCl==1.3.0"
+        ]
+    },
+    "ozw": {
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "codeowners": [
+            "@cgarwood",
+            "@marcelveldt",
+            "@MartinHjelmare"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ozw",
+        "domain": "ozw",
+        "name": "OpenZWave (beta)",
+        "requirements": [
+            "python-openzwave-mqtt==1.0.5"
+        ]
+    },
+    "panasonic_bluray": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/panasonic_bluray",
+        "domain": "panasonic_bluray",
+        "name": "Panasonic Blu-Ray Player",
+        "requirements": [
+            "panacotta==0.1"
+        ]
+    },
+    "panasonic_viera": {
+        "codeowners": [
+            "@joogps"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/panasonic_viera",
+        "domain": "panasonic_viera",
+        "name": "Panasonic Viera",
+        "requirements": [
+            "panasonic_viera==0.3.6"
+        ]
+    },
+    "pandora": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pandora",
+        "domain": "pandora",
+        "name": "Pandora",
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "panel_custom": {
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "dependencies": [
+            "frontend"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/panel_custom",
+        "domain": "panel_custom",
+        "name": "Custom Panel",
+        "quality_scale": "internal"
+    },
+    "panel_iframe": {
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "dependencies": [
+            "frontend"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/panel_iframe",
+        "domain": "panel_iframe",
+        "name": "iframe Panel",
+        "quality_scale": "internal"
+    },
+    "pcal9535a": {
+        "codeowners": [
+            "@Shulyaka"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/pcal9535a",
+        "domain": "pcal9535a",
+        "name": "PCAL9535A I/O Expander",
+        "requirements": [
+            "pcal9535a==0.7"
+        ]
+    },
+    "pencom": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pencom",
+        "domain": "pencom",
+        "name": "Pencom",
+        "requirements": [
+            "pencompy==0.0.3"
+        ]
+    },
+    "persistent_notification": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/persistent_notification",
+        "domain": "persistent_notification",
+        "name": "Persistent Notification",
+        "quality_scale": "internal"
+    },
+    "person": {
+        "after_dependencies": [
+            "device_tracker"
+        ],
+        "codeowners": [],
+        "dependencies": [
+            "image"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/person",
+        "domain": "person",
+        "name": "Person",
+        "quality_scale": "internal"
+    },
+    "philips_js": {
+        "codeowners": [
+            "@elupus"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/philips_js",
+        "domain": "philips_js",
+        "name": "Philips TV",
+        "requirements": [
+            "ha-philipsjs==0.0.8"
+        ]
+    },
+    "pi4ioe5v9xxxx": {
+        "codeowners": [
+            "@antonverburg"
+        ],
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/pi4ioe5v9xxxx",
+        "domain": "pi4ioe5v9xxxx",
+        "name": "pi4ioe5v9xxxx IO Expander",
+        "requirements": [
+            "pi4ioe5v9xxxx==0.0.2"
+        ]
+    },
+    "pi_hole": {
+        "codeowners": [
+            "@fabaff",
+            "@johnluetke",
+            "@shenxn"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/pi_hole",
+        "domain": "pi_hole",
+        "name": "Pi-hole",
+        "requirements": [
+            "hole==0.5.1"
+        ]
+    },
+    "picotts": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/picotts",
+        "domain": "picotts",
+        "name": "Pico TTS"
+    },
+    "piglow": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/piglow",
+        "domain": "piglow",
+        "name": "Piglow",
+        "requirements": [
+            "piglow==1.2.4"
+        ]
+    },
+    "pilight": {
+        "codeowners": [
+            "@trekky12"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/pilight",
+        "domain": "pilight",
+        "name": "Pilight",
+        "requirements": [
+            "pilight==0.1.1"
+        ]
+    },
+    "ping": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ping",
+        "domain": "ping",
+        "name": "Ping (ICMP)",
+        "quality_scale": "internal"
+    },
+    "pioneer": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pioneer",
+        "domain": "pioneer",
+        "name": "Pioneer"
+    },
+    "pjlink": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pjlink",
+        "domain": "pjlink",
+        "name": "PJLink",
+        "requirements": [
+            "pypjlink2==1.2.1"
+        ]
+    },
+    "plaato": {
+        "codeowners": [
+            "@JohNan"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/plaato",
+        "domain": "plaato",
+        "name": "Plaato Airlock"
+    },
+    "plant": {
+        "after_dependencies": [
+            "recorder"
+        ],
+        "codeowners": [
+            "@ChristianKuehnel"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/plant",
+        "domain": "plant",
+        "name": "Plant Monitor",
+        "quality_scale": "internal"
+    },
+    "plex": {
+        "after_dependencies": [
+            "sonos"
+        ],
+        "codeowners": [
+            "@jjlawren"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/plex",
+        "domain": "plex",
+        "name": "Plex Media Server",
+        "requirements": [
+            "plexapi==4.1.0",
+            "plexauth==0.0.5",
+            "plexwebsocket==0.0.11"
+        ]
+    },
+    "plugwise": {
+        "codeowners": [
+            "@CoMPaTech",
+            "@bouwew"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/plugwise",
+        "domain": "plugwise",
+        "name": "Plugwise",
+        "requirements": [
+            "Plugwise_Smile==1.1.0"
+        ],
+        "zeroconf": [
+            "_plugwise._tcp.local."
+        ]
+    },
+    "plum_lightpad": {
+        "codeowners": [
+            "@ColinHarrington",
+            "@prystupa"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/plum_lightpad",
+        "domain": "plum_lightpad",
+        "name": "Plum Lightpad",
+        "requirements": [
+            "plumlightpad==0.0.11"
+        ]
+    },
+    "pocketcasts": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pocketcasts",
+        "domain": "pocketcasts",
+        "name": "Pocket Casts",
+        "requirements": [
+            "pocketcasts==0.1"
+        ]
+    },
+    "point": {
+        "codeowners": [
+            "@fredrike"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "webhook",
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/point",
+        "domain": "point",
+        "name": "Minut Point",
+        "quality_scale": "gold",
+        "requirements": [
+            "pypoint==1.1.2"
+        ]
+    },
+    "poolsense": {
+        "codeowners": [
+            "@haemishkyd"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/poolsense",
+        "domain": "poolsense",
+        "name": "PoolSense",
+        "requirements": [
+            "poolsense==0.0.8"
+        ]
+    },
+    "powerwall": {
+        "codeowners": [
+            "@bdraco",
+            "@jrester"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/powerwall",
+        "domain": "powerwall",
+        "name": "Tesla Powerwall",
+        "requirements": [
+            "tesla-powerwall==0.2.12"
+        ]
+    },
+    "proliphix": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/proliphix",
+        "domain": "proliphix",
+        "name": "Proliphix",
+        "requirements": [
+            "proliphix==0.4.1"
+        ]
+    },
+    "prometheus": {
+        "codeowners": [
+            "@knyar"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/prometheus",
+        "domain": "prometheus",
+        "name": "Prometheus",
+        "requirements": [
+            "prometheus_client==0.7.1"
+        ]
+    },
+    "prowl": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/prowl",
+        "domain": "prowl",
+        "name": "Prowl"
+    },
+    "proximity": {
+        "codeowners": [],
+        "dependencies": [
+            "device_tracker",
+            "zone"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/proximity",
+        "domain": "proximity",
+        "name": "Proximity",
+        "quality_scale": "internal"
+    },
+    "proxmoxve": {
+        "codeowners": [
+            "@k4ds3",
+            "@jhollowe"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/proxmoxve",
+        "domain": "proxmoxve",
+        "name": "Proxmox VE",
+        "requirements": [
+            "proxmoxer==1.1.1"
+        ]
+    },
+    "proxy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/proxy",
+        "domain": "proxy",
+        "name": "Camera Proxy",
+        "requirements": [
+            "pillow==7.2.0"
+        ]
+    },
+    "ps4": {
+        "codeowners": [
+            "@ktnrg45"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ps4",
+        "domain": "ps4",
+        "name": "Sony PlayStation 4",
+        "requirements": [
+            "pyps4-2ndscreen==1.1.1"
+        ]
+    },
+    "ptvsd": {
+        "codeowners": [
+            "@swamp-ig"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ptvsd",
+        "domain": "ptvsd",
+        "name": "PTVSD - Python Tools for Visual Studio Debug Server",
+        "requirements": [
+            "ptvsd==4.3.2"
+        ]
+    },
+    "pulseaudio_loopback": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pulseaudio_loopback",
+        "domain": "pulseaudio_loopback",
+        "name": "PulseAudio Loopback",
+        "requirements": [
+            "pulsectl==20.2.4"
+        ]
+    },
+    "push": {
+        "codeowners": [
+            "@dgomes"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/push",
+        "domain": "push",
+        "name": "Push"
+    },
+    "pushbullet": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pushbullet",
+        "domain": "pushbullet",
+        "name": "Pushbullet",
+        "requirements": [
+            "pushbullet.py==0.11.0"
+        ]
+    },
+    "pushover": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pushover",
+        "domain": "pushover",
+        "name": "Pushover",
+        "requirements": [
+            "pushover_complete==1.1.1"
+        ]
+    },
+    "pushsafer": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pushsafer",
+        "domain": "pushsafer",
+        "name": "Pushsafer"
+    },
+    "pvoutput": {
+        "after_dependencies": [
+            "rest"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/pvoutput",
+        "domain": "pvoutput",
+        "name": "PVOutput"
+    },
+    "pvpc_hourly_pricing": {
+        "codeowners": [
+            "@azogue"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/pvpc_hourly_pricing",
+        "domain": "pvpc_hourly_pricing",
+        "name": "Spain electricity hourly pricing (PVPC)",
+        "quality_scale": "platinum",
+        "requirements": [
+            "aiopvpc==2.0.2"
+        ]
+    },
+    "pyload": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/pyload",
+        "domain": "pyload",
+        "name": "pyLoad"
+    },
+    "python_script": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/python_script",
+        "domain": "python_script",
+        "name": "Python Scripts",
+        "quality_scale": "internal",
+        "requirements": [
+            "restrictedpython==5.0"
+        ]
+    },
+    "qbittorrent": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/qbittorrent",
+        "domain": "qbittorrent",
+        "name": "qBittorrent",
+        "requirements": [
+            "python-qbittorrent==0.4.1"
+        ]
+    },
+    "qld_bushfire": {
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/qld_bushfire",
+        "domain": "qld_bushfire",
+        "name": "Queensland Bushfire Alert",
+        "requirements": [
+            "georss_qld_bushfire_alert_client==0.3"
+        ]
+    },
+    "qnap": {
+        "codeowners": [
+            "@colinodell"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/qnap",
+        "domain": "qnap",
+        "name": "QNAP",
+        "requirements": [
+            "qnapstats==0.3.0"
+        ]
+    },
+    "qrcode": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/qrcode",
+        "domain": "qrcode",
+        "name": "QR Code",
+        "requirements": [
+            "pillow==7.2.0",
+            "pyzbar==0.1.7"
+        ]
+    },
+    "quantum_gateway": {
+        "codeowners": [
+            "@cisasteelersfan"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/quantum_gateway",
+        "domain": "quantum_gateway",
+        "name": "Quantum Gateway",
+        "requirements": [
+            "quantum-gateway==0.0.5"
+        ]
+    },
+    "qvr_pro": {
+        "codeowners": [
+            "@oblogic7"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/qvr_pro",
+        "domain": "qvr_pro",
+        "name": "QVR Pro",
+        "requirements": [
+            "pyqvrpro==0.52"
+        ]
+    },
+    "qwikswitch": {
+        "codeowners": [
+            "@kellerza"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/qwikswitch",
+        "domain": "qwikswitch",
+        "name": "QwikSwitch QSUSB",
+        "requirements": [
+            "pyqwikswitch==0.93"
+        ]
+    },
+    "rachio": {
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/rachio",
+        "domain": "rachio",
+        "homekit": {
+            "models": [
+                "Rachio"
+            ]
+        },
+        "name": "Rachio",
+        "requirements": [
+            "rachiopy==0.1.4"
+        ]
+    },
+    "radarr": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/radarr",
+        "domain": "radarr",
+        "name": "Radarr"
+    },
+    "radiotherm": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/radiotherm",
+        "domain": "radiotherm",
+        "name": "Radio Thermostat",
+        "requirements": [
+            "radiotherm==2.0.0"
+        ]
+    },
+    "rainbird": {
+        "codeowners": [
+            "@konikvranik"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/rainbird",
+        "domain": "rainbird",
+        "name": "Rain Bird",
+        "requirements": [
+            "pyrainbird==0.4.2"
+        ]
+    },
+    "raincloud": {
+        "codeowners": [
+            "@vanstinator"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/raincloud",
+        "domain": "raincloud",
+        "name": "Melnor RainCloud",
+        "requirements": [
+            "raincloudy==0.0.7"
+        ]
+    },
+    "rainforest_eagle": {
+        "codeowners": [
+            "@gtdiehl",
+            "@jcalbert"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/rainforest_eagle",
+        "domain": "rainforest_eagle",
+        "name": "Rainforest Eagle-200",
+        "requirements": [
+            "eagle200_reader==0.2.4",
+            "uEagle==0.0.1"
+        ]
+    },
+    "rainmachine": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/rainmachine",
+        "domain": "rainmachine",
+        "name": "RainMachine",
+        "requirements": [
+            "regenmaschine==2.1.0"
+        ]
+    },
+    "random": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/random",
+        "domain": "random",
+        "name": "Random",
+        "quality_scale": "internal"
+    },
+    "raspihats": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/raspihats",
+        "domain": "raspihats",
+        "name": "Raspihats",
+        "requirements": [
+            "raspihats==2.2.3",
+            "smbus-cffi==0.5.1"
+        ]
+    },
+    "raspyrfm": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/raspyrfm",
+        "domain": "raspyrfm",
+        "name": "RaspyRFM",
+        "requirements": [
+            "raspyrfm-client==1.2.8"
+        ]
+    },
+    "recollect_waste": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/recollect_waste",
+        "domain": "recollect_waste",
+        "name": "ReCollect Waste",
+        "requirements": [
+            "recollect-waste==1.0.1"
+        ]
+    },
+    "recorder": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/recorder",
+        "domain": "recorder",
+        "name": "Recorder",
+        "quality_scale": "internal",
+        "requirements": [
+            "sqlalchemy==1.3.19"
+        ]
+    },
+    "recswitch": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/recswitch",
+        "domain": "recswitch",
+        "name": "Ankuoo REC Switch",
+        "requirements": [
+            "pyrecswitch==1.0.2"
+        ]
+    },
+    "reddit": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/reddit",
+        "domain": "reddit",
+        "name": "Reddit",
+        "requirements": [
+            "praw==7.1.0"
+        ]
+    },
+    "rejseplanen": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rejseplanen",
+        "domain": "rejseplanen",
+        "name": "Rejseplanen",
+        "requirements": [
+            "rjpl==0.3.6"
+        ]
+    },
+    "remember_the_milk": {
+        "codeowners": [],
+        "dependencies": [
+            "configurator"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/remember_the_milk",
+        "domain": "remember_the_milk",
+        "name": "Remember The Milk",
+        "requirements": [
+            "RtmAPI==0.7.2",
+            "httplib2==0.10.3"
+        ]
+    },
+    "remote": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/remote",
+        "domain": "remote",
+        "name": "Remote"
+    },
+    "remote_rpi_gpio": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/remote_rpi_gpio",
+        "domain": "remote_rpi_gpio",
+        "name": "remote_rpi_gpio",
+        "requirements": [
+            "gpiozero==1.5.1"
+        ]
+    },
+    "repetier": {
+        "codeowners": [
+            "@MTrab"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/repetier",
+        "domain": "repetier",
+        "name": "Repetier-Server",
+        "requirements": [
+            "pyrepetier==3.0.5"
+        ]
+    },
+    "rest": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rest",
+        "domain": "rest",
+        "name": "RESTful",
+        "requirements": [
+            "jsonpath==0.82",
+            "xmltodict==0.12.0"
+        ]
+    },
+    "rest_command": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rest_command",
+        "domain": "rest_command",
+        "name": "RESTful Command"
+    },
+    "rflink": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rflink",
+        "domain": "rflink",
+        "name": "RFLink",
+        "requirements": [
+            "rflink==0.0.52"
+        ]
+    },
+    "rfxtrx": {
+        "codeowners": [
+            "@danielhiversen",
+            "@elupus"
+        ],
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/rfxtrx",
+        "domain": "rfxtrx",
+        "name": "RFXCOM RFXtrx",
+        "requirements": [
+            "pyRFXtrx==0.25"
+        ]
+    },
+    "ring": {
+        "codeowners": [
+            "@balloob"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ring",
+        "domain": "ring",
+        "name": "Ring",
+        "requirements": [
+            "ring_doorbell==0.6.0"
+        ]
+    },
+    "ripple": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ripple",
+        "domain": "ripple",
+        "name": "Ripple",
+        "requirements": [
+            "python-ripple-api==0.0.3"
+        ]
+    },
+    "risco": {
+        "codeowners": [
+            "@OnFreund"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/risco",
+        "domain": "risco",
+        "name": "Risco",
+        "quality_scale": "platinum",
+        "requirements": [
+            "pyrisco==0.2.1"
+        ]
+    },
+    "rmvtransport": {
+        "codeowners": [
+            "@cgtobi"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/rmvtransport",
+        "domain": "rmvtransport",
+        "name": "RMV",
+        "requirements": [
+            "PyRMVtransport==0.2.9"
+        ]
+    },
+    "rocketchat": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rocketchat",
+        "domain": "rocketchat",
+        "name": "Rocket.Chat",
+        "requirements": [
+            "rocketchat-API==0.6.1"
+        ]
+    },
+    "roku": {
+        "codeowners": [
+            "@ctalkington"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/roku",
+        "domain": "roku",
+        "name": "Roku",
+        "quality_scale": "silver",
+        "requirements": [
+            "rokuecp==0.6.0"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:roku-com:device:player:1-0",
+                "manufacturer": "Roku",
+                "st": "roku:ecp"
+            }
+        ]
+    },
+    "roomba": {
+        "codeowners": [
+            "@pschmitt",
+            "@cyr-ius",
+            "@shenxn"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/roomba",
+        "domain": "roomba",
+        "name": "iRobot Roomba",
+        "requirements": [
+            "roombapy==1.6.1"
+        ]
+    },
+    "roon": {
+        "codeowners": [
+            "@pavoni"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/roon",
+        "domain": "roon",
+        "name": "RoonLabs music player",
+        "requirements": [
+            "roonapi==0.0.21"
+        ]
+    },
+    "route53": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/route53",
+        "domain": "route53",
+        "name": "AWS Route53",
+        "requirements": [
+            "boto3==1.9.252"
+        ]
+    },
+    "rova": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rova",
+        "domain": "rova",
+        "name": "ROVA",
+        "requirements": [
+            "rova==0.1.0"
+        ]
+    },
+    "rpi_camera": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rpi_camera",
+        "domain": "rpi_camera",
+        "name": "Raspberry Pi Camera"
+    },
+    "rpi_gpio": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rpi_gpio",
+        "domain": "rpi_gpio",
+        "name": "Raspberry Pi GPIO",
+        "requirements": [
+            "RPi.GPIO==0.7.0"
+        ]
+    },
+    "rpi_gpio_pwm": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rpi_gpio_pwm",
+        "domain": "rpi_gpio_pwm",
+        "name": "pigpio Daemon PWM LED",
+        "requirements": [
+            "pwmled==1.5.0"
+        ]
+    },
+    "rpi_pfio": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rpi_pfio",
+        "domain": "rpi_pfio",
+        "name": "PiFace Digital I/O (PFIO)",
+        "requirements": [
+            "pifacecommon==4.2.2",
+            "pifacedigitalio==3.0.5"
+        ]
+    },
+    "rpi_rf": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rpi_rf",
+        "domain": "rpi_rf",
+        "name": "Raspberry Pi RF",
+        "requirements": [
+            "rpi-rf==0.9.7"
+        ]
+    },
+    "rss_feed_template": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/rss_feed_template",
+        "domain": "rss_feed_template",
+        "name": "RSS Feed Template",
+        "quality_scale": "internal"
+    },
+    "rtorrent": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/rtorrent",
+        "domain": "rtorrent",
+        "name": "rTorrent"
+    },
+    "russound_rio": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/russound_rio",
+        "domain": "russound_rio",
+        "name": "Russound RIO",
+        "requirements": [
+            "russound_rio==0.1.7"
+        ]
+    },
+    "russound_rnet": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/russound_rnet",
+        "domain": "russound_rnet",
+        "name": "Russound RNET",
+        "requirements": [
+            "russound==0.1.9"
+        ]
+    },
+    "sabnzbd": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [],
+        "dependencies": [
+            "configurator"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sabnzbd",
+        "domain": "sabnzbd",
+        "name": "SABnzbd",
+        "requirements": [
+            "pysabnzbd==1.1.0"
+        ]
+    },
+    "safe_mode": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "config_flow": False,
+        "dependencies": [
+            "frontend",
+            "persistent_notification",
+            "cloud"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/safe_mode",
+        "domain": "safe_mode",
+        "name": "Safe Mode"
+    },
+    "saj": {
+        "codeowners": [
+            "@fredericvl"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/saj",
+        "domain": "saj",
+        "name": "SAJ Solar Inverter",
+        "requirements": [
+            "pysaj==0.0.16"
+        ]
+    },
+    "salt": {
+        "codeowners": [
+            "@bjornorri"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/salt",
+        "domain": "salt",
+        "name": "Salt Fiber Box",
+        "requirements": [
+            "saltbox==0.1.3"
+        ]
+    },
+    "samsungtv": {
+        "codeowners": [
+            "@escoand"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/samsungtv",
+        "domain": "samsungtv",
+        "name": "Samsung Smart TV",
+        "requirements": [
+            "samsungctl[websocket]==0.7.1",
+            "samsungtvws[websocket]==1.4.0"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:samsung.com:device:RemoteControlReceiver:1"
+            }
+        ]
+    },
+    "satel_integra": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/satel_integra",
+        "domain": "satel_integra",
+        "name": "Satel Integra",
+        "requirements": [
+            "satel_integra==0.3.4"
+        ]
+    },
+    "scene": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/scene",
+        "domain": "scene",
+        "name": "Scenes",
+        "quality_scale": "internal"
+    },
+    "schluter": {
+        "codeowners": [
+            "@prairieapps"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/schluter",
+        "domain": "schluter",
+        "name": "Schluter",
+        "requirements": [
+            "py-schluter==0.1.7"
+        ]
+    },
+    "scrape": {
+        "after_dependencies": [
+            "rest"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/scrape",
+        "domain": "scrape",
+        "name": "Scrape",
+        "requirements": [
+            "beautifulsoup4==4.9.1"
+        ]
+    },
+    "script": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/script",
+        "domain": "script",
+        "name": "Scripts",
+        "quality_scale": "internal"
+    },
+    "scsgate": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/scsgate",
+        "domain": "scsgate",
+        "name": "SCSGate",
+        "requirements": [
+            "scsgate==0.1.0"
+        ]
+    },
+    "search": {
+        "after_dependencies": [
+            "scene",
+            "group",
+            "automation",
+            "script"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "websocket_api"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/search",
+        "domain": "search",
+        "name": "Search"
+    },
+    "season": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/season",
+        "domain": "season",
+        "name": "Season",
+        "quality_scale": "internal",
+        "requirements": [
+            "ephem==3.7.7.0"
+        ]
+    },
+    "sendgrid": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sendgrid",
+        "domain": "sendgrid",
+        "name": "SendGrid",
+        "requirements": [
+            "sendgrid==6.4.6"
+        ]
+    },
+    "sense": {
+        "codeowners": [
+            "@kbickar"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sense",
+        "domain": "sense",
+        "name": "Sense",
+        "requirements": [
+            "sense_energy==0.7.2"
+        ]
+    },
+    "sensehat": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sensehat",
+        "domain": "sensehat",
+        "name": "Sense HAT",
+        "requirements": [
+            "sense-hat==2.2.0"
+        ]
+    },
+    "sensibo": {
+        "codeowners": [
+            "@andrey-git"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sensibo",
+        "domain": "sensibo",
+        "name": "Sensibo",
+        "requirements": [
+            "pysensibo==1.0.3"
+        ]
+    },
+    "sensor": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sensor",
+        "domain": "sensor",
+        "name": "Sensor",
+        "quality_scale": "internal"
+    },
+    "sentry": {
+        "codeowners": [
+            "@dcramer",
+            "@frenck"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sentry",
+        "domain": "sentry",
+        "name": "Sentry",
+        "requirements": [
+            "sentry-sdk==0.16.5"
+        ]
+    },
+    "serial": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/serial",
+        "domain": "serial",
+        "name": "Serial",
+        "requirements": [
+            "pyserial-asyncio==0.4"
+        ]
+    },
+    "serial_pm": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/serial_pm",
+        "domain": "serial_pm",
+        "name": "Serial Particulate Matter",
+        "requirements": [
+            "pmsensor==0.4"
+        ]
+    },
+    "sesame": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sesame",
+        "domain": "sesame",
+        "name": "Sesame Smart Lock",
+        "requirements": [
+            "pysesame2==1.0.1"
+        ]
+    },
+    "seven_segments": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/seven_segments",
+        "domain": "seven_segments",
+        "name": "Seven Segments OCR",
+        "requirements": [
+            "pillow==7.2.0"
+        ]
+    },
+    "seventeentrack": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/seventeentrack",
+        "domain": "seventeentrack",
+        "name": "17TRACK",
+        "requirements": [
+            "py17track==2.2.2"
+        ]
+    },
+    "shell_command": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/shell_command",
+        "domain": "shell_command",
+        "name": "Shell Command",
+        "quality_scale": "internal"
+    },
+    "shelly": {
+        "codeowners": [
+            "@balloob"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/shelly2",
+        "domain": "shelly",
+        "name": "Shelly",
+        "requirements": [
+            "aioshelly==0.1.2"
+        ],
+        "zeroconf": [
+            "_http._tcp.local."
+        ]
+    },
+    "shiftr": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/shiftr",
+        "domain": "shiftr",
+        "name": "shiftr.io",
+        "requirements": [
+            "paho-mqtt==1.5.0"
+        ]
+    },
+    "shodan": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/shodan",
+        "domain": "shodan",
+        "name": "Shodan",
+        "requirements": [
+            "shodan==1.23.0"
+        ]
+    },
+    "shopping_list": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/shopping_list",
+        "domain": "shopping_list",
+        "name": "Shopping List",
+        "quality_scale": "internal"
+    },
+    "sht31": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sht31",
+        "domain": "sht31",
+        "name": "Sensirion SHT31",
+        "requirements": [
+            "Adafruit-GPIO==1.0.3",
+            "Adafruit-SHT31==1.0.2"
+        ]
+    },
+    "sigfox": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sigfox",
+        "domain": "sigfox",
+        "name": "Sigfox"
+    },
+    "sighthound": {
+        "codeowners": [
+            "@robmarkcole"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sighthound",
+        "domain": "sighthound",
+        "name": "Sighthound",
+        "requirements": [
+            "pillow==7.2.0",
+            "simplehound==0.3"
+        ]
+    },
+    "signal_messenger": {
+        "codeowners": [
+            "@bbernhard"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/signal_messenger",
+        "domain": "signal_messenger",
+        "name": "Signal Messenger",
+        "requirements": [
+            "pysignalclirestapi==0.3.4"
+        ]
+    },
+    "simplepush": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/simplepush",
+        "domain": "simplepush",
+        "name": "Simplepush",
+        "requirements": [
+            "simplepush==1.1.4"
+        ]
+    },
+    "simplisafe": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/simplisafe",
+        "domain": "simplisafe",
+        "name": "SimpliSafe",
+        "requirements": [
+            "simplisafe-python==9.3.0"
+        ]
+    },
+    "simulated": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/simulated",
+        "domain": "simulated",
+        "name": "Simulated",
+        "quality_scale": "internal"
+    },
+    "sinch": {
+        "codeowners": [
+            "@bendikrb"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sinch",
+        "domain": "sinch",
+        "name": "Sinch SMS",
+        "requirements": [
+            "clx-sdk-xms==1.0.0"
+        ]
+    },
+    "sisyphus": {
+        "codeowners": [
+            "@jkeljo"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sisyphus",
+        "domain": "sisyphus",
+        "name": "Sisyphus",
+        "requirements": [
+            "sisyphus-control==2.2.1"
+        ]
+    },
+    "sky_hub": {
+        "codeowners": [
+            "@rogerselwyn"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sky_hub",
+        "domain": "sky_hub",
+        "name": "Sky Hub",
+        "requirements": [
+            "pyskyqhub==0.1.1"
+        ]
+    },
+    "skybeacon": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/skybeacon",
+        "domain": "skybeacon",
+        "name": "Skybeacon",
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ]
+    },
+    "skybell": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/skybell",
+        "domain": "skybell",
+        "name": "SkyBell",
+        "requirements": [
+            "skybellpy==0.6.1"
+        ]
+    },
+    "slack": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/slack",
+        "domain": "slack",
+        "name": "Slack",
+        "requirements": [
+            "slackclient==2.5.0"
+        ]
+    },
+    "sleepiq": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sleepiq",
+        "domain": "sleepiq",
+        "name": "SleepIQ",
+        "requirements": [
+            "sleepyq==0.7"
+        ]
+    },
+    "slide": {
+        "codeowners": [
+            "@ualex73"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/slide",
+        "domain": "slide",
+        "name": "Slide",
+        "requirements": [
+            "goslide-api==0.5.1"
+        ]
+    },
+    "sma": {
+        "codeowners": [
+            "@kellerza"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sma",
+        "domain": "sma",
+        "name": "SMA Solar",
+        "requirements": [
+            "pysma==0.3.5"
+        ]
+    },
+    "smappee": {
+        "codeowners": [
+            "@bsmappee"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/smappee",
+        "domain": "smappee",
+        "name": "Smappee",
+        "requirements": [
+            "pysmappee==0.2.10"
+        ],
+        "zeroconf": [
+            "_ssh._tcp.local."
+        ]
+    },
+    "smart_meter_texas": {
+        "codeowners": [
+            "@grahamwetzler"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smart_meter_texas",
+        "domain": "smart_meter_texas",
+        "name": "Smart Meter Texas",
+        "requirements": [
+            "smart-meter-texas==0.4.0"
+        ]
+    },
+    "smarthab": {
+        "codeowners": [
+            "@outadoc"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smarthab",
+        "domain": "smarthab",
+        "name": "SmartHab",
+        "requirements": [
+            "smarthab==0.21"
+        ]
+    },
+    "smartthings": {
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@andrewsayre"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/smartthings",
+        "domain": "smartthings",
+        "name": "SmartThings",
+        "requirements": [
+            "pysmartapp==0.3.2",
+            "pysmartthings==0.7.3"
+        ]
+    },
+    "smarty": {
+        "codeowners": [
+            "@z0mbieprocess"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/smarty",
+        "domain": "smarty",
+        "name": "Salda Smarty",
+        "requirements": [
+            "pysmarty==0.8"
+        ]
+    },
+    "smhi": {
+        "codeowners": [],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smhi",
+        "domain": "smhi",
+        "name": "SMHI",
+        "requirements": [
+            "smhi-pkg==1.0.13"
+        ]
+    },
+    "sms": {
+        "codeowners": [
+            "@ocalvo"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sms",
+        "domain": "sms",
+        "name": "SMS notifications via GSM-modem",
+        "requirements": [
+            "python-gammu==3.0"
+        ]
+    },
+    "smtp": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/smtp",
+        "domain": "smtp",
+        "name": "SMTP"
+    },
+    "snapcast": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/snapcast",
+        "domain": "snapcast",
+        "name": "Snapcast",
+        "requirements": [
+            "snapcast==2.0.10"
+        ]
+    },
+    "snips": {
+        "codeowners": [],
+        "dependencies": [
+            "mqtt"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/snips",
+        "domain": "snips",
+        "name": "Snips"
+    },
+    "snmp": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/snmp",
+        "domain": "snmp",
+        "name": "SNMP",
+        "requirements": [
+            "pysnmp==4.4.12"
+        ]
+    },
+    "sochain": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sochain",
+        "domain": "sochain",
+        "name": "SoChain",
+        "requirements": [
+            "python-sochain-api==0.0.2"
+        ]
+    },
+    "socialblade": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/socialblade",
+        "domain": "socialblade",
+        "name": "Social Blade",
+        "requirements": [
+            "socialbladeclient==0.5"
+        ]
+    },
+    "solaredge": {
+        "codeowners": [],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/solaredge",
+        "domain": "solaredge",
+        "name": "SolarEdge",
+        "requirements": [
+            "solaredge==0.0.2",
+            "stringcase==1.2.0"
+        ]
+    },
+    "solaredge_local": {
+        "codeowners": [
+            "@drobtravels",
+            "@scheric"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/solaredge_local",
+        "domain": "solaredge_local",
+        "name": "SolarEdge Local",
+        "requirements": [
+            "solaredge-local==0.2.0"
+        ]
+    },
+    "solarlog": {
+        "codeowners": [
+            "@Ernst79"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/solarlog",
+        "domain": "solarlog",
+        "name": "Solar-Log",
+        "requirements": [
+            "sunwatcher==0.2.1"
+        ]
+    },
+    "solax": {
+        "codeowners": [
+            "@squishykid"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/solax",
+        "domain": "solax",
+        "name": "SolaX Power",
+        "requirements": [
+            "solax==0.2.3"
+        ]
+    },
+    "soma": {
+        "codeowners": [
+            "@ratsept"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/soma",
+        "domain": "soma",
+        "name": "Soma Connect",
+        "requirements": [
+            "pysoma==0.0.10"
+        ]
+    },
+    "somfy": {
+        "codeowners": [
+            "@tetienne"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/somfy",
+        "domain": "somfy",
+        "name": "Somfy",
+        "requirements": [
+            "pymfy==0.9.0"
+        ]
+    },
+    "somfy_mylink": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/somfy_mylink",
+        "domain": "somfy_mylink",
+        "name": "Somfy MyLink",
+        "requirements": [
+            "somfy-mylink-synergy==1.0.6"
+        ]
+    },
+    "sonarr": {
+        "codeowners": [
+            "@ctalkington"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sonarr",
+        "domain": "sonarr",
+        "name": "Sonarr",
+        "quality_scale": "silver",
+        "requirements": [
+            "sonarr==0.2.3"
+        ]
+    },
+    "songpal": {
+        "codeowners": [
+            "@rytilahti",
+            "@shenxn"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/songpal",
+        "domain": "songpal",
+        "name": "Sony Songpal",
+        "quality_scale": "gold",
+        "requirements": [
+            "python-songpal==0.12"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Sony Corporation",
+                "st": "urn:schemas-sony-com:service:ScalarWebAPI:1"
+            }
+        ]
+    },
+    "sonos": {
+        "codeowners": [],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sonos",
+        "domain": "sonos",
+        "name": "Sonos",
+        "requirements": [
+            "pysonos==0.0.32"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:ZonePlayer:1"
+            }
+        ]
+    },
+    "sony_projector": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/sony_projector",
+        "domain": "sony_projector",
+        "name": "Sony Projector",
+        "requirements": [
+            "pysdcp==1"
+        ]
+    },
+    "soundtouch": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/soundtouch",
+        "domain": "soundtouch",
+        "name": "Bose Soundtouch",
+        "requirements": [
+            "libsoundtouch==0.8"
+        ]
+    },
+    "spaceapi": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/spaceapi",
+        "domain": "spaceapi",
+        "name": "Space API"
+    },
+    "spc": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/spc",
+        "domain": "spc",
+        "name": "Vanderbilt SPC",
+        "requirements": [
+            "pyspcwebgw==0.4.0"
+        ]
+    },
+    "speedtestdotnet": {
+        "codeowners": [
+            "@rohankapoorcom",
+            "@engrbm87"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/speedtestdotnet",
+        "domain": "speedtestdotnet",
+        "name": "Speedtest.net",
+        "requirements": [
+            "speedtest-cli==2.1.2"
+        ]
+    },
+    "spider": {
+        "codeowners": [
+            "@peternijssen"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/spider",
+        "domain": "spider",
+        "name": "Itho Daalderop Spider",
+        "requirements": [
+            "spiderpy==1.3.1"
+        ]
+    },
+    "splunk": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/splunk",
+        "domain": "splunk",
+        "name": "Splunk"
+    },
+    "spotcrime": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/spotcrime",
+        "domain": "spotcrime",
+        "name": "Spot Crime",
+        "requirements": [
+            "spotcrime==1.0.4"
+        ]
+    },
+    "spotify": {
+        "codeowners": [
+            "@frenck"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/spotify",
+        "domain": "spotify",
+        "name": "Spotify",
+        "quality_scale": "silver",
+        "requirements": [
+            "spotipy==2.12.0"
+        ],
+        "zeroconf": [
+            "_spotify-connect._tcp.local."
+        ]
+    },
+    "sql": {
+        "codeowners": [
+            "@dgomes"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sql",
+        "domain": "sql",
+        "name": "SQL",
+        "requirements": [
+            "sqlalchemy==1.3.19"
+        ]
+    },
+    "squeezebox": {
+        "codeowners": [
+            "@rajlaud"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/squeezebox",
+        "domain": "squeezebox",
+        "name": "Logitech Squeezebox",
+        "requirements": [
+            "pysqueezebox==0.2.4"
+        ]
+    },
+    "ssdp": {
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ssdp",
+        "domain": "ssdp",
+        "name": "Simple Service Discovery Protocol (SSDP)",
+        "requirements": [
+            "defusedxml==0.6.0",
+            "netdisco==2.8.2"
+        ]
+    },
+    "starline": {
+        "codeowners": [
+            "@anonym-tsk"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/starline",
+        "domain": "starline",
+        "name": "StarLine",
+        "requirements": [
+            "starline==0.1.3"
+        ]
+    },
+    "starlingbank": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/starlingbank",
+        "domain": "starlingbank",
+        "name": "Starling Bank",
+        "requirements": [
+            "starlingbank==3.2"
+        ]
+    },
+    "startca": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/startca",
+        "domain": "startca",
+        "name": "Start.ca",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "statistics": {
+        "after_dependencies": [
+            "recorder"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/statistics",
+        "domain": "statistics",
+        "name": "Statistics",
+        "quality_scale": "internal"
+    },
+    "statsd": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/statsd",
+        "domain": "statsd",
+        "name": "StatsD",
+        "requirements": [
+            "statsd==3.2.1"
+        ]
+    },
+    "steam_online": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/steam_online",
+        "domain": "steam_online",
+        "name": "Steam",
+        "requirements": [
+            "steamodd==4.21"
+        ]
+    },
+    "stiebel_eltron": {
+        "codeowners": [
+            "@fucm"
+        ],
+        "dependencies": [
+            "modbus"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/stiebel_eltron",
+        "domain": "stiebel_eltron",
+        "name": "STIEBEL ELTRON",
+        "requirements": [
+            "pystiebeleltron==0.0.1.dev2"
+        ]
+    },
+    "stookalert": {
+        "codeowners": [
+            "@fwestenberg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/stookalert",
+        "domain": "stookalert",
+        "name": "RIVM Stookalert",
+        "requirements": [
+            "stookalert==0.1.4"
+        ]
+    },
+    "stream": {
+        "codeowners": [
+            "@hunterjm"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/stream",
+        "domain": "stream",
+        "name": "Stream",
+        "quality_scale": "internal",
+        "requirements": [
+            "av==8.0.2"
+        ]
+    },
+    "streamlabswater": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/streamlabswater",
+        "domain": "streamlabswater",
+        "name": "StreamLabs",
+        "requirements": [
+            "streamlabswater==1.0.1"
+        ]
+    },
+    "stt": {
+        "codeowners": [
+            "@pvizeli"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/stt",
+        "domain": "stt",
+        "name": "Speech-to-Text (STT)"
+    },
+    "suez_water": {
+        "codeowners": [
+            "@ooii"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/suez_water",
+        "domain": "suez_water",
+        "name": "Suez Water",
+        "requirements": [
+            "pysuez==0.1.19"
+        ]
+    },
+    "sun": {
+        "codeowners": [
+            "@Swamp-Ig"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/sun",
+        "domain": "sun",
+        "name": "Sun",
+        "quality_scale": "internal"
+    },
+    "supervisord": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/supervisord",
+        "domain": "supervisord",
+        "name": "Supervisord"
+    },
+    "supla": {
+        "codeowners": [
+            "@mwegrzynek"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/supla",
+        "domain": "supla",
+        "name": "Supla",
+        "requirements": [
+            "pysupla==0.0.3"
+        ]
+    },
+    "surepetcare": {
+        "codeowners": [
+            "@benleb"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/surepetcare",
+        "domain": "surepetcare",
+        "name": "Sure Petcare",
+        "requirements": [
+            "surepy==0.2.5"
+        ]
+    },
+    "swiss_hydrological_data": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/swiss_hydrological_data",
+        "domain": "swiss_hydrological_data",
+        "name": "Swiss Hydrological Data",
+        "requirements": [
+            "swisshydrodata==0.0.3"
+        ]
+    },
+    "swiss_public_transport": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/swiss_public_transport",
+        "domain": "swiss_public_transport",
+        "name": "Swiss public transport",
+        "requirements": [
+            "python_opendata_transport==0.2.1"
+        ]
+    },
+    "swisscom": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/swisscom",
+        "domain": "swisscom",
+        "name": "Swisscom Internet-Box"
+    },
+    "switch": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/switch",
+        "domain": "switch",
+        "name": "Switch",
+        "quality_scale": "internal"
+    },
+    "switchbot": {
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/switchbot",
+        "domain": "switchbot",
+        "name": "SwitchBot",
+        "requirements": [
+            "PySwitchbot==0.8.0"
+        ]
+    },
+    "switcher_kis": {
+        "codeowners": [
+            "@tomerfi"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/switcher_kis/",
+        "domain": "switcher_kis",
+        "name": "Switcher",
+        "requirements": [
+            "aioswitcher==1.2.0"
+        ]
+    },
+    "switchmate": {
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/switchmate",
+        "domain": "switchmate",
+        "name": "Switchmate SimplySmart Home",
+        "requirements": [
+            "pySwitchmate==0.4.6"
+        ]
+    },
+    "syncthru": {
+        "codeowners": [
+            "@nielstron"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/syncthru",
+        "domain": "syncthru",
+        "name": "Samsung SyncThru Printer",
+        "requirements": [
+            "pysyncthru==0.7.0",
+            "url-normalize==1.4.1"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:Printer:1",
+                "manufacturer": "Samsung Electronics"
+            }
+        ]
+    },
+    "synology": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/synology",
+        "domain": "synology",
+        "name": "Synology",
+        "requirements": [
+            "py-synology==0.2.0"
+        ]
+    },
+    "synology_chat": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/synology_chat",
+        "domain": "synology_chat",
+        "name": "Synology Chat"
+    },
+    "synology_dsm": {
+        "codeowners": [
+            "@ProtoThis",
+            "@Quentame"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/synology_dsm",
+        "domain": "synology_dsm",
+        "name": "Synology DSM",
+        "requirements": [
+            "python-synology==0.8.2"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:Basic:1",
+                "manufacturer": "Synology"
+            }
+        ]
+    },
+    "synology_srm": {
+        "codeowners": [
+            "@aerialls"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/synology_srm",
+        "domain": "synology_srm",
+        "name": "Synology SRM",
+        "requirements": [
+            "synology-srm==0.2.0"
+        ]
+    },
+    "syslog": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/syslog",
+        "domain": "syslog",
+        "name": "Syslog"
+    },
+    "system_health": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/system_health",
+        "domain": "system_health",
+        "name": "System Health",
+        "quality_scale": "internal"
+    },
+    "system_log": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/system_log",
+        "domain": "system_log",
+        "name": "System Log",
+        "quality_scale": "internal"
+    },
+    "systemmonitor": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/systemmonitor",
+        "domain": "systemmonitor",
+        "name": "System Monitor",
+        "requirements": [
+            "psutil==5.7.2"
+        ]
+    },
+    "tado": {
+        "codeowners": [
+            "@michaelarnauts",
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tado",
+        "domain": "tado",
+        "homekit": {
+            "models": [
+                "tado",
+                "AC02"
+            ]
+        },
+        "name": "Tado",
+        "requirements": [
+            "python-tado==0.8.1"
+        ]
+    },
+    "tag": {
+        "codeowners": [
+            "@balloob",
+            "@dmulcahey"
+        ],
+        "config_flow": False,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/tag",
+        "domain": "tag",
+        "homekit": {},
+        "name": "Tag",
+        "requirements": [],
+        "ssdp": [],
+        "zeroconf": []
+    },
+    "tahoma": {
+        "codeowners": [
+            "@philklei"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/tahoma",
+        "domain": "tahoma",
+        "name": "Tahoma",
+        "requirements": [
+            "tahoma-api==0.0.16"
+        ]
+    },
+    "tank_utility": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tank_utility",
+        "domain": "tank_utility",
+        "name": "Tank Utility",
+        "requirements": [
+            "tank_utility==1.4.0"
+        ]
+    },
+    "tankerkoenig": {
+        "codeowners": [
+            "@guillempages"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/tankerkoenig",
+        "domain": "tankerkoenig",
+        "name": "Tankerkoenig",
+        "requirements": [
+            "pytankerkoenig==0.0.6"
+        ]
+    },
+    "tapsaff": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tapsaff",
+        "domain": "tapsaff",
+        "name": "Taps Aff",
+        "requirements": [
+            "tapsaff==0.2.1"
+        ]
+    },
+    "tautulli": {
+        "codeowners": [
+            "@ludeeus"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/tautulli",
+        "domain": "tautulli",
+        "name": "Tautulli",
+        "requirements": [
+            "pytautulli==0.5.0"
+        ]
+    },
+    "tcp": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tcp",
+        "domain": "tcp",
+        "name": "TCP"
+    },
+    "ted5000": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ted5000",
+        "domain": "ted5000",
+        "name": "The Energy Detective TED5000",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "teksavvy": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/teksavvy",
+        "domain": "teksavvy",
+        "name": "TekSavvy"
+    },
+    "telegram": {
+        "codeowners": [],
+        "dependencies": [
+            "telegram_bot"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/telegram",
+        "domain": "telegram",
+        "name": "Telegram"
+    },
+    "telegram_bot": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/telegram_bot",
+        "domain": "telegram_bot",
+        "name": "Telegram bot",
+        "requirements": [
+            "python-telegram-bot==11.1.0",
+            "PySocks==1.7.1"
+        ]
+    },
+    "tellduslive": {
+        "codeowners": [
+            "@fredrike"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tellduslive",
+        "domain": "tellduslive",
+        "name": "Telldus Live",
+        "quality_scale": "gold",
+        "requirements": [
+            "tellduslive==0.10.11"
+        ]
+    },
+    "tellstick": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tellstick",
+        "domain": "tellstick",
+        "name": "TellStick",
+        "requirements": [
+            "tellcore-net==0.4",
+            "tellcore-py==1.1.2"
+        ]
+    },
+    "telnet": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/telnet",
+        "domain": "telnet",
+        "name": "Telnet"
+    },
+    "temper": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/temper",
+        "domain": "temper",
+        "name": "TEMPer",
+        "requirements": [
+            "temperusb==1.5.3"
+        ]
+    },
+    "template": {
+        "after_dependencies": [
+            "group"
+        ],
+        "codeowners": [
+            "@PhracturedBlue",
+            "@tetienne"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/template",
+        "domain": "template",
+        "name": "Template",
+        "quality_scale": "internal"
+    },
+    "tensorflow": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tensorflow",
+        "domain": "tensorflow",
+        "name": "TensorFlow",
+        "requirements": [
+            "tensorflow==2.2.0",
+            "tf-slim==1.1.0",
+            "tf-models-official==2.2.1",
+            "pycocotools==2.0.1",
+            "numpy==1.19.1",
+            "protobuf==3.12.2",
+            "pillow==7.2.0"
+        ]
+    },
+    "tesla": {
+        "codeowners": [
+            "@zabuldon",
+            "@alandtse"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tesla",
+        "domain": "tesla",
+        "name": "Tesla",
+        "requirements": [
+            "teslajsonpy==0.10.4"
+        ]
+    },
+    "tfiac": {
+        "codeowners": [
+            "@fredrike",
+            "@mellado"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/tfiac",
+        "domain": "tfiac",
+        "name": "Tfiac",
+        "requirements": [
+            "pytfiac==0.4"
+        ]
+    },
+    "thermoworks_smoke": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/thermoworks_smoke",
+        "domain": "thermoworks_smoke",
+        "name": "ThermoWorks Smoke",
+        "requirements": [
+            "stringcase==1.2.0",
+            "thermoworks_smoke==0.1.8"
+        ]
+    },
+    "thethingsnetwork": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/thethingsnetwork",
+        "domain": "thethingsnetwork",
+        "name": "The Things Network"
+    },
+    "thingspeak": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/thingspeak",
+        "domain": "thingspeak",
+        "name": "ThingSpeak",
+        "requirements": [
+            "thingspeak==1.0.0"
+        ]
+    },
+    "thinkingcleaner": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/thinkingcleaner",
+        "domain": "thinkingcleaner",
+        "name": "Thinking Cleaner",
+        "requirements": [
+            "pythinkingcleaner==0.0.3"
+        ]
+    },
+    "thomson": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/thomson",
+        "domain": "thomson",
+        "name": "Thomson"
+    },
+    "threshold": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/threshold",
+        "domain": "threshold",
+        "name": "Threshold",
+        "quality_scale": "internal"
+    },
+    "tibber": {
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tibber",
+        "domain": "tibber",
+        "name": "Tibber",
+        "quality_scale": "silver",
+        "requirements": [
+            "pyTibber==0.14.0"
+        ]
+    },
+    "tikteck": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tikteck",
+        "domain": "tikteck",
+        "name": "Tikteck",
+        "requirements": [
+            "tikteck==0.4"
+        ]
+    },
+    "tile": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tile",
+        "domain": "tile",
+        "name": "Tile",
+        "requirements": [
+            "pytile==4.0.0"
+        ]
+    },
+    "time_date": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/time_date",
+        "domain": "time_date",
+        "name": "Time & Date",
+        "quality_scale": "internal"
+    },
+    "timer": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/timer",
+        "domain": "timer",
+        "name": "Timer",
+        "quality_scale": "internal"
+    },
+    "tmb": {
+        "codeowners": [
+            "@alemuro"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/tmb",
+        "domain": "tmb",
+        "name": "Transports Metropolitans de Barcelona",
+        "requirements": [
+            "tmb==0.0.4"
+        ]
+    },
+    "tod": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tod",
+        "domain": "tod",
+        "name": "Times of the Day",
+        "quality_scale": "internal"
+    },
+    "todoist": {
+        "codeowners": [
+            "@boralyl"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/todoist",
+        "domain": "todoist",
+        "name": "Todoist",
+        "requirements": [
+            "todoist-python==8.0.0"
+        ]
+    },
+    "tof": {
+        "codeowners": [],
+        "dependencies": [
+            "rpi_gpio"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/tof",
+        "domain": "tof",
+        "name": "Time of Flight",
+        "requirements": [
+            "VL53L1X2==0.1.5"
+        ]
+    },
+    "tomato": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tomato",
+        "domain": "tomato",
+        "name": "Tomato"
+    },
+    "toon": {
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/toon",
+        "domain": "toon",
+        "name": "Toon",
+        "requirements": [
+            "toonapi==0.2.0"
+        ]
+    },
+    "torque": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/torque",
+        "domain": "torque",
+        "name": "Torque"
+    },
+    "totalconnect": {
+        "codeowners": [
+            "@austinmroczek"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/totalconnect",
+        "domain": "totalconnect",
+        "name": "Honeywell Total Connect Alarm",
+        "requirements": [
+            "total_connect_client==0.55"
+        ]
+    },
+    "touchline": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/touchline",
+        "domain": "touchline",
+        "name": "Roth Touchline",
+        "requirements": [
+            "pytouchline==0.7"
+        ]
+    },
+    "tplink": {
+        "codeowners": [
+            "@rytilahti"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tplink",
+        "domain": "tplink",
+        "name": "TP-Link Kasa Smart",
+        "requirements": [
+            "pyHS100==0.3.5.1"
+        ]
+    },
+    "tplink_lte": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/tplink_lte",
+        "domain": "tplink_lte",
+        "name": "TP-Link LTE",
+        "requirements": [
+            "tp-connected==0.0.4"
+        ]
+    },
+    "traccar": {
+        "codeowners": [
+            "@ludeeus"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/traccar",
+        "domain": "traccar",
+        "name": "Traccar",
+        "requirements": [
+            "pytraccar==0.9.0",
+            "stringcase==1.2.0"
+        ]
+    },
+    "trackr": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/trackr",
+        "domain": "trackr",
+        "name": "TrackR",
+        "requirements": [
+            "pytrackr==0.0.5"
+        ]
+    },
+    "tradfri": {
+        "codeowners": [
+            "@ggravlingen"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tradfri",
+        "domain": "tradfri",
+        "homekit": {
+            "models": [
+                "TRADFRI"
+            ]
+        },
+        "name": "IKEA TR\u00c5DFRI",
+        "requirements": [
+            "pytradfri[async]==6.4.0"
+        ]
+    },
+    "trafikverket_train": {
+        "codeowners": [
+            "@endor-force"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/trafikverket_train",
+        "domain": "trafikverket_train",
+        "name": "Trafikverket Train",
+        "requirements": [
+            "pytrafikverket==0.1.6.2"
+        ]
+    },
+    "trafikverket_weatherstation": {
+        "codeowners": [
+            "@endor-force"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/trafikverket_weatherstation",
+        "domain": "trafikverket_weatherstation",
+        "name": "Trafikverket Weather Station",
+        "requirements": [
+            "pytrafikverket==0.1.6.2"
+        ]
+    },
+    "transmission": {
+        "codeowners": [
+            "@engrbm87",
+            "@JPHutchins"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/transmission",
+        "domain": "transmission",
+        "name": "Transmission",
+        "requirements": [
+            "transmissionrpc==0.11"
+        ]
+    },
+    "transport_nsw": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/transport_nsw",
+        "domain": "transport_nsw",
+        "name": "Transport NSW",
+        "requirements": [
+            "PyTransportNSW==0.1.1"
+        ]
+    },
+    "travisci": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/travisci",
+        "domain": "travisci",
+        "name": "Travis-CI",
+        "requirements": [
+            "TravisPy==0.3.5"
+        ]
+    },
+    "trend": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/trend",
+        "domain": "trend",
+        "name": "Trend",
+        "quality_scale": "internal",
+        "requirements": [
+            "numpy==1.19.1"
+        ]
+    },
+    "tts": {
+        "after_dependencies": [
+            "media_player"
+        ],
+        "codeowners": [
+            "@pvizeli"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/tts",
+        "domain": "tts",
+        "name": "Text-to-Speech (TTS)",
+        "requirements": [
+            "mutagen==1.45.1"
+        ]
+    },
+    "tuya": {
+        "codeowners": [
+            "@ollo69"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tuya",
+        "domain": "tuya",
+        "name": "Tuya",
+        "requirements": [
+            "tuyaha==0.0.7"
+        ]
+    },
+    "twentemilieu": {
+        "codeowners": [
+            "@frenck"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/twentemilieu",
+        "domain": "twentemilieu",
+        "name": "Twente Milieu",
+        "requirements": [
+            "twentemilieu==0.3.0"
+        ]
+    },
+    "twilio": {
+        "codeowners": [],
+        "config_flow": True,
+        "dependencies": [
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/twilio",
+        "domain": "twilio",
+        "name": "Twilio",
+        "requirements": [
+            "twilio==6.32.0"
+        ]
+    },
+    "twilio_call": {
+        "codeowners": [],
+        "dependencies": [
+            "twilio"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/twilio_call",
+        "domain": "twilio_call",
+        "name": "Twilio Call"
+    },
+    "twilio_sms": {
+        "codeowners": [],
+        "dependencies": [
+            "twilio"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/twilio_sms",
+        "domain": "twilio_sms",
+        "name": "Twilio SMS"
+    },
+    "twitch": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/twitch",
+        "domain": "twitch",
+        "name": "Twitch",
+        "requirements": [
+            "python-twitch-client==0.6.0"
+        ]
+    },
+    "twitter": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/twitter",
+        "domain": "twitter",
+        "name": "Twitter",
+        "requirements": [
+            "TwitterAPI==2.5.13"
+        ]
+    },
+    "ubee": {
+        "codeowners": [
+            "@mzdrale"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/ubee",
+        "domain": "ubee",
+        "name": "Ubee Router",
+        "requirements": [
+            "pyubee==0.10"
+        ]
+    },
+    "ubus": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ubus",
+        "domain": "ubus",
+        "name": "OpenWrt (ubus)"
+    },
+    "ue_smart_radio": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ue_smart_radio",
+        "domain": "ue_smart_radio",
+        "name": "Logitech UE Smart Radio"
+    },
+    "uk_transport": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/uk_transport",
+        "domain": "uk_transport",
+        "name": "UK Transport"
+    },
+    "unifi": {
+        "codeowners": [
+            "@Kane610"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/unifi",
+        "domain": "unifi",
+        "name": "Ubiquiti UniFi",
+        "quality_scale": "platinum",
+        "requirements": [
+            "aiounifi==23"
+        ]
+    },
+    "unifi_direct": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/unifi_direct",
+        "domain": "unifi_direct",
+        "name": "Ubiquiti UniFi AP",
+        "requirements": [
+            "pexpect==4.6.0"
+        ]
+    },
+    "unifiled": {
+        "codeowners": [
+            "@florisvdk"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/unifiled",
+        "domain": "unifiled",
+        "name": "Ubiquiti UniFi LED",
+        "requirements": [
+            "unifiled==0.11"
+        ]
+    },
+    "universal": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/universal",
+        "domain": "universal",
+        "name": "Universal Media Player",
+        "quality_scale": "internal"
+    },
+    "upb": {
+        "codeowners": [
+            "@gwww"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/upb",
+        "domain": "upb",
+        "name": "Universal Powerline Bus (UPB)",
+        "requirements": [
+            "upb_lib==0.4.11"
+        ]
+    },
+    "upc_connect": {
+        "codeowners": [
+            "@pvizeli",
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/upc_connect",
+        "domain": "upc_connect",
+        "name": "UPC Connect Box",
+        "requirements": [
+            "connect-box==0.2.7"
+        ]
+    },
+    "upcloud": {
+        "codeowners": [
+            "@scop"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/upcloud",
+        "domain": "upcloud",
+        "name": "UpCloud",
+        "requirements": [
+            "upcloud-api==0.4.5"
+        ]
+    },
+    "updater": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/updater",
+        "domain": "updater",
+        "name": "Updater",
+        "quality_scale": "internal",
+        "requirements": [
+            "distro==1.5.0"
+        ]
+    },
+    "upnp": {
+        "codeowners": [
+            "@StevenLooman"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/upnp",
+        "domain": "upnp",
+        "name": "UPnP",
+        "requirements": [
+            "async-upnp-client==0.14.13"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:InternetGatewayDevice:1"
+            },
+            {
+                "st": "urn:schemas-upnp-org:device:InternetGatewayDevice:2"
+            }
+        ]
+    },
+    "uptime": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/uptime",
+        "domain": "uptime",
+        "name": "Uptime",
+        "quality_scale": "internal"
+    },
+    "uptimerobot": {
+        "codeowners": [
+            "@ludeeus"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/uptimerobot",
+        "domain": "uptimerobot",
+        "name": "Uptime Robot",
+        "requirements": [
+            "pyuptimerobot==0.0.5"
+        ]
+    },
+    "uscis": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/uscis",
+        "domain": "uscis",
+        "name": "U.S. Citizenship and Immigration Services (USCIS)",
+        "requirements": [
+            "uscisstatus==0.1.1"
+        ]
+    },
+    "usgs_earthquakes_feed": {
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/usgs_earthquakes_feed",
+        "domain": "usgs_earthquakes_feed",
+        "name": "U.S. Geological Survey Earthquake Hazards (USGS)",
+        "requirements": [
+            "geojson_client==0.4"
+        ]
+    },
+    "utility_meter": {
+        "codeowners": [
+            "@dgomes"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/utility_meter",
+        "domain": "utility_meter",
+        "name": "Utility Meter",
+        "quality_scale": "internal"
+    },
+    "uvc": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/uvc",
+        "domain": "uvc",
+        "name": "Ubiquiti UniFi Video",
+        "requirements": [
+            "uvcclient==0.11.0"
+        ]
+    },
+    "vacuum": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/vacuum",
+        "domain": "vacuum",
+        "name": "Vacuum"
+    },
+    "vallox": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/vallox",
+        "domain": "vallox",
+        "name": "Valloxs",
+        "requirements": [
+            "vallox-websocket-api==2.4.0"
+        ]
+    },
+    "vasttrafik": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/vasttrafik",
+        "domain": "vasttrafik",
+        "name": "V\u00e4sttrafik",
+        "requirements": [
+            "vtjp==0.1.14"
+        ]
+    },
+    "velbus": {
+        "codeowners": [
+            "@Cereal2nd",
+            "@brefra"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/velbus",
+        "domain": "velbus",
+        "name": "Velbus",
+        "requirements": [
+            "python-velbus==2.0.44"
+        ]
+    },
+    "velux": {
+        "codeowners": [
+            "@Julius2342"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/velux",
+        "domain": "velux",
+        "name": "Velux",
+        "requirements": [
+            "pyvlx==0.2.16"
+        ]
+    },
+    "venstar": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/venstar",
+        "domain": "venstar",
+        "name": "Venstar",
+        "requirements": [
+            "venstarcolortouch==0.12"
+        ]
+    },
+    "vera": {
+        "codeowners": [
+            "@vangorra"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/vera",
+        "domain": "vera",
+        "name": "Vera",
+        "requirements": [
+            "pyvera==0.3.9"
+        ]
+    },
+    "verisure": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/verisure",
+        "domain": "verisure",
+        "name": "Verisure",
+        "requirements": [
+            "jsonpath==0.82",
+            "vsure==1.5.4"
+        ]
+    },
+    "versasense": {
+        "codeowners": [
+            "@flamm3blemuff1n"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/versasense",
+        "domain": "versasense",
+        "name": "VersaSense",
+        "requirements": [
+            "pyversasense==0.0.6"
+        ]
+    },
+    "version": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/version",
+        "domain": "version",
+        "name": "Version",
+        "quality_scale": "internal",
+        "requirements": [
+            "pyhaversion==3.3.0"
+        ]
+    },
+    "vesync": {
+        "codeowners": [
+            "@markperdue",
+            "@webdjoe"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/vesync",
+        "domain": "vesync",
+        "name": "Etekcity VeSync",
+        "requirements": [
+            "pyvesync==1.1.0"
+        ]
+    },
+    "viaggiatreno": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/viaggiatreno",
+        "domain": "viaggiatreno",
+        "name": "Trenitalia ViaggiaTreno"
+    },
+    "vicare": {
+        "codeowners": [
+            "@oischinger"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/vicare",
+        "domain": "vicare",
+        "name": "Viessmann ViCare",
+        "requirements": [
+            "PyViCare==0.2.0"
+        ]
+    },
+    "vilfo": {
+        "codeowners": [
+            "@ManneW"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/vilfo",
+        "domain": "vilfo",
+        "name": "Vilfo Router",
+        "requirements": [
+            "vilfo-api-client==0.3.2"
+        ]
+    },
+    "vivotek": {
+        "codeowners": [
+            "@HarlemSquirrel"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/vivotek",
+        "domain": "vivotek",
+        "name": "VIVOTEK",
+        "requirements": [
+            "libpyvivotek==0.4.0"
+        ]
+    },
+    "vizio": {
+        "codeowners": [
+            "@raman325"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/vizio",
+        "domain": "vizio",
+        "name": "VIZIO SmartCast",
+        "quality_scale": "platinum",
+        "requirements": [
+            "pyvizio==0.1.51"
+        ],
+        "zeroconf": [
+            "_viziocast._tcp.local."
+        ]
+    },
+    "vlc": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/vlc",
+        "domain": "vlc",
+        "name": "VLC media player",
+        "requirements": [
+            "python-vlc==1.1.2"
+        ]
+    },
+    "vlc_telnet": {
+        "codeowners": [
+            "@rodripf"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/vlc-telnet",
+        "domain": "vlc_telnet",
+        "name": "VLC media player Telnet",
+        "requirements": [
+            "python-telnet-vlc==1.0.4"
+        ]
+    },
+    "voicerss": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/voicerss",
+        "domain": "voicerss",
+        "name": "VoiceRSS"
+    },
+    "volkszaehler": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/volkszaehler",
+        "domain": "volkszaehler",
+        "name": "Volkszaehler",
+        "requirements": [
+            "volkszaehler==0.1.3"
+        ]
+    },
+    "volumio": {
+        "codeowners": [
+            "@OnFreund"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/volumio",
+        "domain": "volumio",
+        "name": "Volumio",
+        "requirements": [
+            "pyvolumio==0.1.1"
+        ],
+        "zeroconf": [
+            "_Volumio._tcp.local."
+        ]
+    },
+    "volvooncall": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/volvooncall",
+        "domain": "volvooncall",
+        "name": "Volvo On Call",
+        "requirements": [
+            "volvooncall==0.8.12"
+        ]
+    },
+    "vultr": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/vultr",
+        "domain": "vultr",
+        "name": "Vultr",
+        "requirements": [
+            "vultr==0.1.2"
+        ]
+    },
+    "w800rf32": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/w800rf32",
+        "domain": "w800rf32",
+        "name": "WGL Designs W800RF32",
+        "requirements": [
+            "pyW800rf32==0.1"
+        ]
+    },
+    "wake_on_lan": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/wake_on_lan",
+        "domain": "wake_on_lan",
+        "name": "Wake on LAN",
+        "requirements": [
+            "wakeonlan==1.1.6"
+        ]
+    },
+    "waqi": {
+        "codeowners": [
+            "@andrey-git"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/waqi",
+        "domain": "waqi",
+        "name": "World Air Quality Index (WAQI)",
+        "requirements": [
+            "waqiasync==1.0.0"
+        ]
+    },
+    "water_heater": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/water_heater",
+        "domain": "water_heater",
+        "name": "Water Heater"
+    },
+    "waterfurnace": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/waterfurnace",
+        "domain": "waterfurnace",
+        "name": "WaterFurnace",
+        "requirements": [
+            "waterfurnace==1.1.0"
+        ]
+    },
+    "watson_iot": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/watson_iot",
+        "domain": "watson_iot",
+        "name": "IBM Watson IoT Platform",
+        "requirements": [
+            "ibmiotf==0.3.4"
+        ]
+    },
+    "watson_tts": {
+        "codeowners": [
+            "@rutkai"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/watson_tts",
+        "domain": "watson_tts",
+        "name": "IBM Watson TTS",
+        "requirements": [
+            "ibm-watson==4.0.1"
+        ]
+    },
+    "waze_travel_time": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/waze_travel_time",
+        "domain": "waze_travel_time",
+        "name": "Waze Travel Time",
+        "requirements": [
+            "WazeRouteCalculator==0.12"
+        ]
+    },
+    "weather": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/weather",
+        "domain": "weather",
+        "name": "Weather",
+        "quality_scale": "internal"
+    },
+    "webhook": {
+        "codeowners": [],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/webhook",
+        "domain": "webhook",
+        "name": "Webhook"
+    },
+    "webostv": {
+        "codeowners": [
+            "@bendavid"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/webostv",
+        "domain": "webostv",
+        "name": "LG webOS Smart TV",
+        "requirements": [
+            "aiopylgtv==0.3.3"
+        ]
+    },
+    "websocket_api": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/websocket_api",
+        "domain": "websocket_api",
+        "name": "Home Assistant WebSocket API",
+        "quality_scale": "internal"
+    },
+    "wemo": {
+        "codeowners": [],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wemo",
+        "domain": "wemo",
+        "homekit": {
+            "models": [
+                "Socket",
+                "Wemo"
+            ]
+        },
+        "name": "Belkin WeMo",
+        "requirements": [
+            "pywemo==0.4.46"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Belkin International Inc."
+            }
+        ]
+    },
+    "whois": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/whois",
+        "domain": "whois",
+        "name": "Whois",
+        "requirements": [
+            "python-whois==0.7.3"
+        ]
+    },
+    "wiffi": {
+        "codeowners": [
+            "@mampfes"
+        ],
+        "config_flow": True,
+        "dependencies": [],
+        "documentation": "https://www.home-assistant.io/integrations/wiffi",
+        "domain": "wiffi",
+        "name": "Wiffi",
+        "requirements": [
+            "wiffi==1.0.1"
+        ]
+    },
+    "wilight": {
+        "codeowners": [
+            "@leofig-rj"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wilight",
+        "domain": "wilight",
+        "name": "WiLight",
+        "quality_scale": "silver",
+        "requirements": [
+            "pywilight==0.0.65"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "All Automacao Ltda"
+            }
+        ]
+    },
+    "wink": {
+        "codeowners": [],
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/wink",
+        "domain": "wink",
+        "name": "Wink",
+        "requirements": [
+            "pubnubsub-handler==1.0.8",
+            "python-wink==1.10.5"
+        ]
+    },
+    "wirelesstag": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/wirelesstag",
+        "domain": "wirelesstag",
+        "name": "Wireless Sensor Tags",
+        "requirements": [
+            "wirelesstagpy==0.4.1"
+        ]
+    },
+    "withings": {
+        "codeowners": [
+            "@vangorra"
+        ],
+        "config_flow": True,
+        "dependencies": [
+            "http",
+            "webhook"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/withings",
+        "domain": "withings",
+        "name": "Withings",
+        "requirements": [
+            "withings-api==2.1.6"
+        ]
+    },
+    "wled": {
+        "codeowners": [
+            "@frenck"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wled",
+        "domain": "wled",
+        "name": "WLED",
+        "quality_scale": "platinum",
+        "requirements": [
+            "wled==0.4.3"
+        ],
+        "zeroconf": [
+            "_wled._tcp.local."
+        ]
+    },
+    "wolflink": {
+        "codeowners": [
+            "@adamkrol93"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wolflink",
+        "domain": "wolflink",
+        "name": "Wolf SmartSet Service",
+        "requirements": [
+            "wolf_smartset==0.1.4"
+        ]
+    },
+    "workday": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/workday",
+        "domain": "workday",
+        "name": "Workday",
+        "quality_scale": "internal",
+        "requirements": [
+            "holidays==0.10.3"
+        ]
+    },
+    "worldclock": {
+        "codeowners": [
+            "@fabaff"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/worldclock",
+        "domain": "worldclock",
+        "name": "Worldclock",
+        "quality_scale": "internal"
+    },
+    "worldtidesinfo": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/worldtidesinfo",
+        "domain": "worldtidesinfo",
+        "name": "World Tides"
+    },
+    "worxlandroid": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/worxlandroid",
+        "domain": "worxlandroid",
+        "name": "Worx Landroid"
+    },
+    "wsdot": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/wsdot",
+        "domain": "wsdot",
+        "name": "Washington State Department of Transportation (WSDOT)"
+    },
+    "wunderground": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/wunderground",
+        "domain": "wunderground",
+        "name": "Weather Underground (WUnderground)"
+    },
+    "x10": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/x10",
+        "domain": "x10",
+        "name": "Heyu X10"
+    },
+    "xbee": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/xbee",
+        "domain": "xbee",
+        "name": "XBee",
+        "requirements": [
+            "xbee-helper==0.0.7"
+        ]
+    },
+    "xbox_live": {
+        "codeowners": [
+            "@MartinHjelmare"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/xbox_live",
+        "domain": "xbox_live",
+        "name": "Xbox Live",
+        "requirements": [
+            "xboxapi==2.0.1"
+        ]
+    },
+    "xeoma": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/xeoma",
+        "domain": "xeoma",
+        "name": "Xeoma",
+        "requirements": [
+            "pyxeoma==1.4.1"
+        ]
+    },
+    "xfinity": {
+        "codeowners": [
+            "@cisasteelersfan"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/xfinity",
+        "domain": "xfinity",
+        "name": "Xfinity Gateway",
+        "requirements": [
+            "xfinity-gateway==0.0.4"
+        ]
+    },
+    "xiaomi": {
+        "codeowners": [],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi",
+        "domain": "xiaomi",
+        "name": "Xiaomi"
+    },
+    "xiaomi_aqara": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@syssi"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_aqara",
+        "domain": "xiaomi_aqara",
+        "name": "Xiaomi Gateway (Aqara)",
+        "requirements": [
+            "PyXiaomiGateway==0.13.2"
+        ],
+        "zeroconf": [
+            "_miio._udp.local."
+        ]
+    },
+    "xiaomi_miio": {
+        "codeowners": [
+            "@rytilahti",
+            "@syssi",
+            "@starkillerOG"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_miio",
+        "domain": "xiaomi_miio",
+        "name": "Xiaomi Miio",
+        "requirements": [
+            "construct==2.9.45",
+            "python-miio==0.5.3"
+        ],
+        "zeroconf": [
+            "_miio._udp.local."
+        ]
+    },
+    "xiaomi_tv": {
+        "codeowners": [
+            "@simse"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_tv",
+        "domain": "xiaomi_tv",
+        "name": "Xiaomi TV",
+        "requirements": [
+            "pymitv==1.4.3"
+        ]
+    },
+    "xmpp": {
+        "codeowners": [
+            "@fabaff",
+            "@flowolf"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/xmpp",
+        "domain": "xmpp",
+        "name": "Jabber (XMPP)",
+        "requirements": [
+            "slixmpp==1.5.2"
+        ]
+    },
+    "xs1": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/xs1",
+        "domain": "xs1",
+        "name": "EZcontrol XS1",
+        "requirements": [
+            "xs1-api-client==3.0.0"
+        ]
+    },
+    "yale_smart_alarm": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/yale_smart_alarm",
+        "domain": "yale_smart_alarm",
+        "name": "Yale Smart Living",
+        "requirements": [
+            "yalesmartalarmclient==0.1.6"
+        ]
+    },
+    "yamaha": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/yamaha",
+        "domain": "yamaha",
+        "name": "Yamaha Network Receivers",
+        "requirements": [
+            "rxv==0.6.0"
+        ]
+    },
+    "yamaha_musiccast": {
+        "codeowners": [
+            "@jalmeroth"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/yamaha_musiccast",
+        "domain": "yamaha_musiccast",
+        "name": "Yamaha MusicCast",
+        "requirements": [
+            "pymusiccast==0.1.6"
+        ]
+    },
+    "yandex_transport": {
+        "codeowners": [
+            "@rishatik92",
+            "@devbis"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/yandex_transport",
+        "domain": "yandex_transport",
+        "name": "Yandex Transport",
+        "requirements": [
+            "aioymaps==1.1.0"
+        ]
+    },
+    "yandextts": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/yandextts",
+        "domain": "yandextts",
+        "name": "Yandex TTS"
+    },
+    "yeelight": {
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@zewelor"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/yeelight",
+        "domain": "yeelight",
+        "name": "Yeelight",
+        "requirements": [
+            "yeelight==0.5.2"
+        ]
+    },
+    "yeelightsunflower": {
+        "codeowners": [
+            "@lindsaymarkward"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/yeelightsunflower",
+        "domain": "yeelightsunflower",
+        "name": "Yeelight Sunflower",
+        "requirements": [
+            "yeelightsunflower==0.0.10"
+        ]
+    },
+    "yessssms": {
+        "codeowners": [
+            "@flowolf"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/yessssms",
+        "domain": "yessssms",
+        "name": "yesss! SMS",
+        "requirements": [
+            "YesssSMS==0.4.1"
+        ]
+    },
+    "yi": {
+        "codeowners": [
+            "@bachya"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/yi",
+        "domain": "yi",
+        "name": "Yi Home Cameras",
+        "requirements": [
+            "aioftp==0.12.0"
+        ]
+    },
+    "zabbix": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/zabbix",
+        "domain": "zabbix",
+        "name": "Zabbix",
+        "requirements": [
+            "pyzabbix==0.7.4"
+        ]
+    },
+    "zamg": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/zamg",
+        "domain": "zamg",
+        "name": "Zentralanstalt f\u00fcr Meteorologie und Geodynamik (ZAMG)"
+    },
+    "zengge": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/zengge",
+        "domain": "zengge",
+        "name": "Zengge",
+        "requirements": [
+            "zengge==0.2"
+        ]
+    },
+    "zeroconf": {
+        "codeowners": [
+            "@Kane610"
+        ],
+        "dependencies": [
+            "api"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/zeroconf",
+        "domain": "zeroconf",
+        "name": "Zero-configuration networking (zeroconf)",
+        "quality_scale": "internal",
+        "requirements": [
+            "zeroconf==0.28.1"
+        ]
+    },
+    "zerproc": {
+        "codeowners": [
+            "@emlove"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zerproc",
+        "domain": "zerproc",
+        "name": "Zerproc",
+        "requirements": [
+            "pyzerproc==0.2.5"
+        ]
+    },
+    "zestimate": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/zestimate",
+        "domain": "zestimate",
+        "name": "Zestimate",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ]
+    },
+    "zha": {
+        "codeowners": [
+            "@dmulcahey",
+            "@adminiuga"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zha",
+        "domain": "zha",
+        "name": "Zigbee Home Automation",
+        "requirements": [
+            "bellows==0.18.1",
+            "pyserial==3.4",
+            "zha-quirks==0.0.43",
+            "zigpy-cc==0.4.4",
+            "zigpy-deconz==0.9.2",
+            "zigpy==0.22.2",
+            "zigpy-xbee==0.12.1",
+            "zigpy-zigate==0.6.1"
+        ]
+    },
+    "zhong_hong": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/zhong_hong",
+        "domain": "zhong_hong",
+        "name": "ZhongHong",
+        "requirements": [
+            "zhong_hong_hvac==1.0.9"
+        ]
+    },
+    "ziggo_mediabox_xl": {
+        "codeowners": [],
+        "documentation": "https://www.home-assistant.io/integrations/ziggo_mediabox_xl",
+        "domain": "ziggo_mediabox_xl",
+        "name": "Ziggo Mediabox XL",
+        "requirements": [
+            "ziggo-mediabox-xl==1.1.0"
+        ]
+    },
+    "zone": {
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/zone",
+        "domain": "zone",
+        "name": "Zone",
+        "quality_scale": "internal"
+    },
+    "zoneminder": {
+        "codeowners": [
+            "@rohankapoorcom"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/zoneminder",
+        "domain": "zoneminder",
+        "name": "ZoneMinder",
+        "requirements": [
+            "zm-py==0.4.0"
+        ]
+    },
+    "zwave": {
+        "codeowners": [
+            "@home-assistant/z-wave"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zwave",
+        "domain": "zwave",
+        "name": "Z-Wave",
+        "requirements": [
+            "homeassistant-pyozw==0.1.10",
+            "pydispatcher==2.0.5"
+        ]
+    }
+}
@@ -32,6 +32,8 @@ CONNECTION_NETWORK_MAC = "mac"
 CONNECTION_UPNP = "upnp"
 CONNECTION_ZIGBEE = "zigbee"
 
+IDX_AREA_ID = "area_id"
+IDX_CONFIG_ENTRY_ID = "config_entry_id"
 IDX_CONNECTIONS = "connections"
 IDX_IDENTIFIERS = "identifiers"
 REGISTERED_DEVICE = "registered"
@@ -103,7 +105,7 @@ class DeviceRegistry:
 
     devices: Dict[str, DeviceEntry]
     deleted_devices: Dict[str, DeletedDeviceEntry]
-    _devices_index: Dict[str, Dict[str, Dict[str, str]]]
+    _devices_index: Dict[str, Dict[str, Dict[Any, Any]]]
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
@@ -187,7 +189,12 @@ class DeviceRegistry:
     def _clear_index(self):
         """Clear the index."""
         self._devices_index = {
-            REGISTERED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
+            REGISTERED_DEVICE: {
+                IDX_IDENTIFIERS: {},
+                IDX_CONNECTIONS: {},
+                IDX_AREA_ID: {},
+                IDX_CONFIG_ENTRY_ID: {},
+            },
             DELETED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
         }
 
@@ -507,7 +514,7 @@ class DeviceRegistry:
             else:
                 config_entries = config_entries - {config_entry_id}
                 # No need to reindex here since we currently
-                # do not have a lookup by config entry
+                # do not have a lookup by config entry for deleted devices
                 self.deleted_devices[deleted_device.id] = attr.evolve(
                     deleted_device, config_entries=config_entries
                 )
@@ -516,9 +523,10 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(
+            self._devices_index[REGISTERED_DEVICE][IDX_AREA_ID].get(area_id, ())
+        ):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @singleton(DATA_REGISTRY)
@@ -532,7 +540,12 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable=protected-access
+    devices_index = registry._devices_index[REGISTERED_DEVICE]
+    return [
+        registry.devices[device_id]
+        for device_id in devices_index[IDX_AREA_ID].get(area_id, ())
+    ]
 
 
 @callback
@@ -540,10 +553,11 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> List[DeviceEntry]:
     """Return entries that match a config entry."""
+    # pylint: disable=protected-access
+    devices_index = registry._devices_index[REGISTERED_DEVICE]
     return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
+        registry.devices[device_id]
+        for device_id in devices_index[IDX_CONFIG_ENTRY_ID].get(config_entry_id, ())
     ]
 
 
@@ -637,6 +651,14 @@ def _add_device_to_index(
         devices_index[IDX_IDENTIFIERS][identifier] = device.id
     for connection in device.connections:
         devices_index[IDX_CONNECTIONS][connection] = device.id
+    if isinstance(device, DeletedDeviceEntry):
+        return
+    # Ordered sets of device ids
+    devices_index[IDX_AREA_ID].setdefault(device.area_id, {})[device.id] = None
+    for config_entry_id in device.config_entries:
+        devices_index[IDX_CONFIG_ENTRY_ID].setdefault(config_entry_id, {})[
+            device.id
+        ] = None
 
 
 def _remove_device_from_index(
@@ -649,3 +671,20 @@ def _remove_device_from_index(
     for connection in device.connections:
         if connection in devices_index[IDX_CONNECTIONS]:
             del devices_index[IDX_CONNECTIONS][connection]
+    if isinstance(device, DeletedDeviceEntry):
+        return
+    _remove_id_from_index(devices_index[IDX_AREA_ID], device.area_id, device.id)
+    for config_entry_id in device.config_entries:
+        _remove_id_from_index(
+            devices_index[IDX_CONFIG_ENTRY_ID], config_entry_id, device.id
+        )
+
+
+def _remove_id_from_index(index: dict, key: Optional[str], device_id: str) -> None:
+    """Remove a device id from a secondary index, dropping the key when empty."""
+    device_ids = index.get(key)
+    if device_ids is None:
+        return
+    device_ids.pop(device_id, None)
+    if not device_ids:
+        del index[key]
@@ -78,6 +78,8 @@ class EntityComponent:
 
         self.config: Optional[ConfigType] = None
 
+        # Entities of all platforms by entity id
+        self._entities: Dict[str, entity.Entity] = {}
         self._platforms: Dict[
             Union[str, Tuple[str, Optional[timedelta], Optional[str]]], EntityPlatform
         ] = {domain: self._async_init_entity_platform(domain, None)}
@@ -95,11 +97,7 @@ class EntityComponent:
 
     def get_entity(self, entity_id: str) -> Optional[entity.Entity]:
         """Get an entity."""
-        for platform in self._platforms.values():
-            entity_obj = platform.entities.get(entity_id)
-            if entity_obj is not None:
-                return entity_obj
-        return None
+        return self._entities.get(entity_id)
 
     def setup(self, config: ConfigType) -> None:
         """Set up a full entity component.
@@ -266,15 +264,10 @@ class EntityComponent:
 
     async def async_remove_entity(self, entity_id: str) -> None:
         """Remove an entity managed by one of the platforms."""
-        found = None
+        entity_obj = self._entities.get(entity_id)
 
-        for platform in self._platforms.values():
-            if entity_id in platform.entities:
-                found = platform
-                break
-
-        if found:
-            await found.async_remove_entity(entity_id)
+        if entity_obj is not None and entity_obj.platform is not None:
+            await entity_obj.platform.async_remove_entity(entity_id)
 
     async def async_prepare_reload(self, *, skip_reset: bool = False) -> Optional[dict]:
         """Prepare reloading this entity component.
@@ -321,4 +314,5 @@ class EntityComponent:
             platform=platform,
             scan_interval=scan_interval,
             entity_namespace=entity_namespace,
+            component_entities=self._entities,
         )
@@ -18,6 +18,7 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.setup import PHASE_PLATFORMS, async_track_setup_phase
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
@@ -51,6 +52,7 @@ class EntityPlatform:
         platform: Optional[ModuleType],
         scan_interval: timedelta,
         entity_namespace: Optional[str],
+        component_entities: Optional[Dict[str, "Entity"]] = None,
     ):
         """Initialize the entity platform."""
         self.hass = hass
@@ -62,6 +64,11 @@ class EntityPlatform:
         self.entity_namespace = entity_namespace
         self.config_entry: Optional[config_entries.ConfigEntry] = None
         self.entities: Dict[str, Entity] = {}  # pylint: disable=used-before-assignment
+        # Entity id -> position in which the entity was added
+        self.entity_order: Dict[str, int] = {}
+        self._entities_added = 0
+        # Entity id index shared by the platforms of an entity component
+        self._component_entities = component_entities
         self._tasks: List[asyncio.Future] = []
         # Method to cancel the state change listener
         self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
@@ -187,18 +194,19 @@ class EntityPlatform:
         )
 
         try:
-            task = async_create_setup_task()
+            with async_track_setup_phase(hass, self.platform_name, PHASE_PLATFORMS):
+                task = async_create_setup_task()
 
-            async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, self.domain):
-                await asyncio.shield(task)
+                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, self.domain):
+                    await asyncio.shield(task)
 
-            # Block till all entities are done
-            if self._tasks:
-                pending = [task for task in self._tasks if not task.done()]
-                self._tasks.clear()
+                # Block till all entities are done
+                if self._tasks:
+                    pending = [task for task in self._tasks if not task.done()]
+                    self._tasks.clear()
 
-                if pending:
-                    await asyncio.gather(*pending)
+                    if pending:
+                        await asyncio.gather(*pending)
 
             hass.config.components.add(full_name)
             return True
@@ -475,6 +483,14 @@ class EntityPlatform:
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
         entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        self.entity_order[entity_id] = self._entities_added
+        self._entities_added += 1
+        entity.async_on_remove(lambda: self.entity_order.pop(entity_id))
+
+        component_entities = self._component_entities
+        if component_entities is not None:
+            component_entities[entity_id] = entity
+            entity.async_on_remove(lambda: component_entities.pop(entity_id, None))
 
         await entity.add_to_platform_finish()
 
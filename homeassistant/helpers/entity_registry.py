@@ -125,6 +125,9 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
+        # Entity ids by device and config entry, the dicts are ordered sets
+        self._device_index: Dict[str, Dict[str, None]] = {}
+        self._config_entry_index: Dict[str, Dict[str, None]] = {}
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_removed
@@ -477,11 +480,7 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._config_entry_index.get(config_entry, ())):
             self.async_remove(entity_id)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
@@ -490,6 +489,12 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        if entry.device_id is not None:
+            self._device_index.setdefault(entry.device_id, {})[entry.entity_id] = None
+        if entry.config_entry_id is not None:
+            self._config_entry_index.setdefault(entry.config_entry_id, {})[
+                entry.entity_id
+            ] = None
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -497,9 +502,17 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        if entry.device_id is not None:
+            _remove_from_index(self._device_index, entry.device_id, entry.entity_id)
+        if entry.config_entry_id is not None:
+            _remove_from_index(
+                self._config_entry_index, entry.config_entry_id, entry.entity_id
+            )
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._device_index = {}
+        self._config_entry_index = {}
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -517,8 +530,10 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a device."""
+    # pylint: disable=protected-access
     return [
-        entry for entry in registry.entities.values() if entry.device_id == device_id
+        registry.entities[entity_id]
+        for entity_id in registry._device_index.get(device_id, ())
     ]
 
 
@@ -527,13 +542,23 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> List[RegistryEntry]:
     """Return entries that match a config entry."""
+    # pylint: disable=protected-access
     return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
+        registry.entities[entity_id]
+        for entity_id in registry._config_entry_index.get(config_entry_id, ())
     ]
 
 
+def _remove_from_index(index: Dict[str, Dict[str, None]], key: str, value: str) -> None:
+    """Remove a value from a secondary index, dropping the key when empty."""
+    values = index.get(key)
+    if values is None:
+        return
+    values.pop(value, None)
+    if not values:
+        del index[key]
+
+
 async def _async_migrate(entities: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
     """Migrate the YAML config file to storage helper format."""
     return {
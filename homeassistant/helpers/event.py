@@ -2,17 +2,16 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools as ft
+from itertools import count
 import logging
 import time
-from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple, Union
 
 import attr
 
 from homeassistant.const import (
-    ATTR_NOW,
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
-    EVENT_TIME_CHANGED,
     MATCH_ALL,
     SUN_EVENT_SUNRISE,
     SUN_EVENT_SUNSET,
@@ -43,6 +42,8 @@ TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIME_SCHEDULER = "track_time_scheduler"
+
 _LOGGER = logging.getLogger(__name__)
 
 # PyLint does not like the use of threaded_listener_factory
@@ -89,20 +90,23 @@ def async_track_state_change(
 
     Returns a function that can be called to remove the listener.
 
-    If entity_ids are not MATCH_ALL along with from_state and to_state
-    being None, async_track_state_change_event should be used instead
-    as it is slightly faster.
+    Listeners are routed through the same entity_id index as
+    async_track_state_change_event, so the cost of a state change does
+    not grow with the number of trackers for other entities.
 
     Must be run within the event loop.
     """
-    if from_state is not None:
-        match_from_state = process_state_match(from_state)
-    if to_state is not None:
-        match_to_state = process_state_match(to_state)
+    # Matching every state is the same as not matching at all
+    match_from_state = (
+        None if from_state in (None, MATCH_ALL) else process_state_match(from_state)
+    )
+    match_to_state = (
+        None if to_state in (None, MATCH_ALL) else process_state_match(to_state)
+    )
 
     # Ensure it is a lowercase list with entity ids we want to match on
     if entity_ids == MATCH_ALL:
-        pass
+        entity_ids = (MATCH_ALL,)
     elif isinstance(entity_ids, str):
         entity_ids = (entity_ids.lower(),)
     else:
@@ -111,40 +115,21 @@ def async_track_state_change(
     @callback
     def state_change_listener(event: Event) -> None:
         """Handle specific state changes."""
-        if from_state is not None:
-            old_state = event.data.get("old_state")
-            if old_state is not None:
-                old_state = old_state.state
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
 
-            if not match_from_state(old_state):
-                return
-        if to_state is not None:
-            new_state = event.data.get("new_state")
-            if new_state is not None:
-                new_state = new_state.state
-
-            if not match_to_state(new_state):
-                return
-
-        hass.async_run_job(
-            action,
-            event.data.get("entity_id"),
-            event.data.get("old_state"),
-            event.data.get("new_state"),
-        )
+        if match_from_state is not None and not match_from_state(
+            old_state.state if old_state is not None else None
+        ):
+            return
+        if match_to_state is not None and not match_to_state(
+            new_state.state if new_state is not None else None
+        ):
+            return
 
-    if entity_ids != MATCH_ALL:
-        # If we have a list of entity ids we use
-        # async_track_state_change_event to route
-        # by entity_id to avoid iterating though state change
-        # events and creating a jobs where the most
-        # common outcome is to return right away because
-        # the entity_id does not match since usually
-        # only one or two listeners want that specific
-        # entity_id.
-        return async_track_state_change_event(hass, entity_ids, state_change_listener)
+        hass.async_run_job(action, event.data.get("entity_id"), old_state, new_state)
 
-    return hass.bus.async_listen(EVENT_STATE_CHANGED, state_change_listener)
+    return async_track_state_change_event(hass, entity_ids, state_change_listener)
 
 
 track_state_change = threaded_listener_factory(async_track_state_change)
@@ -166,30 +151,43 @@ def async_track_state_change_event(
     for each one, we keep a dict of entity ids that
     care about the state change events so we can
     do a fast dict lookup to route events.
+
+    Pass MATCH_ALL as entity_ids to receive the events of all entities.
     """
 
     entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
 
     if TRACK_STATE_CHANGE_LISTENER not in hass.data:
 
+        @callback
+        def _async_state_change_filter(event: Event) -> bool:
+            """Filter state changes nobody is tracking."""
+            return (
+                event.data.get("entity_id") in entity_callbacks
+                or MATCH_ALL in entity_callbacks
+            )
+
         @callback
         def _async_state_change_dispatcher(event: Event) -> None:
             """Dispatch state changes by entity_id."""
             entity_id = event.data.get("entity_id")
 
-            if entity_id not in entity_callbacks:
-                return
+            for storage_key in (entity_id, MATCH_ALL):
+                if storage_key not in entity_callbacks:
+                    continue
 
-            for action in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_job(action, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state changed for %s", entity_id
-                    )
+                for action in entity_callbacks[storage_key][:]:
+                    try:
+                        hass.async_run_job(action, event)
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception(
+                            "Error while processing state changed for %s", entity_id
+                        )
 
         hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED, _async_state_change_dispatcher
+            EVENT_STATE_CHANGED,
+            _async_state_change_dispatcher,
+            event_filter=_async_state_change_filter,
         )
 
     if isinstance(entity_ids, str):
@@ -444,6 +442,7 @@ class _TrackTemplateResultInfo:
         template: Template,
         action: Callable,
         variables: Optional[TemplateVarsType],
+        rate_limit: Optional[timedelta] = None,
     ):
         """Handle removal / refresh of tracker init."""
         self.hass = hass
@@ -451,6 +450,10 @@ class _TrackTemplateResultInfo:
         self._template.hass = hass
         self._action = action
         self._variables = variables
+        self._rate_limit = rate_limit
+        self._last_render: Optional[datetime] = None
+        self._pending_event: Optional[Event] = None
+        self._pending_refresh: Optional[CALLBACK_TYPE] = None
         self._last_result: Optional[Union[str, TemplateError]] = None
         self._all_listener: Optional[Callable] = None
         self._domains_listener: Optional[Callable] = None
@@ -460,6 +463,7 @@ class _TrackTemplateResultInfo:
 
     def async_setup(self) -> None:
         """Activation of template tracking."""
+        self._last_render = dt_util.utcnow()
         self._info = self._template.async_render_to_info(self._variables)
         if self._info.exception:
             _LOGGER.error(
@@ -568,7 +572,7 @@ class _TrackTemplateResultInfo:
             return
 
         self._entities_listener = async_track_state_change_event(
-            self.hass, entities, self._refresh
+            self.hass, entities, self._async_state_changed
         )
 
     @callback
@@ -580,13 +584,13 @@ class _TrackTemplateResultInfo:
             return
 
         self._domains_listener = async_track_state_added_domain(
-            self.hass, self._info.domains, self._refresh
+            self.hass, self._info.domains, self._async_state_changed
         )
 
     @callback
     def _setup_all_listener(self) -> None:
         self._all_listener = self.hass.bus.async_listen(
-            EVENT_STATE_CHANGED, self._refresh
+            EVENT_STATE_CHANGED, self._async_state_changed
         )
 
     @callback
@@ -595,6 +599,7 @@ class _TrackTemplateResultInfo:
         self._cancel_all_listener()
         self._cancel_domains_listener()
         self._cancel_entities_listener()
+        self._cancel_pending_refresh()
 
     @callback
     def async_refresh(self, variables: Any = _UNCHANGED) -> None:
@@ -603,8 +608,72 @@ class _TrackTemplateResultInfo:
             self._variables = variables
         self._refresh(None)
 
+    @callback
+    def _cancel_pending_refresh(self) -> None:
+        if self._pending_refresh is None:
+            return
+        self._pending_refresh()
+        self._pending_refresh = None
+        self._pending_event = None
+
+    @callback
+    def _event_is_rate_limited(self, event: Event) -> bool:
+        """Return if the render for a state change falls under the rate limit.
+
+        Only changes that reach the template through iterating all states
+        or the states of a domain are limited. Changes to other entities
+        that are referenced directly are rendered right away. An entity
+        in an iterated domain cannot be told apart from the iterated ones,
+        so it is limited too.
+        """
+        assert self._info
+
+        if self._rate_limit is None:
+            return False
+
+        if self._info.all_states or self._info.exception:
+            return True
+
+        entity_id = event.data.get("entity_id")
+        return entity_id is None or split_entity_id(entity_id)[0] in self._info.domains
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Render for a state change, coalescing changes under the rate limit."""
+        if not self._event_is_rate_limited(event):
+            self._refresh(event)
+            return
+
+        assert self._rate_limit is not None
+        assert self._last_render is not None
+
+        # A render is already scheduled, it will pick up this change
+        self._pending_event = event
+        if self._pending_refresh is not None:
+            return
+
+        next_render = self._last_render + self._rate_limit
+        if dt_util.utcnow() >= next_render:
+            self._refresh(event)
+            return
+
+        self._pending_refresh = async_track_point_in_utc_time(
+            self.hass, self._async_rate_limit_elapsed, next_render
+        )
+
+    @callback
+    def _async_rate_limit_elapsed(self, _now: datetime) -> None:
+        """Render the changes coalesced while rate limited."""
+        event = self._pending_event
+        self._pending_refresh = None
+        self._pending_event = None
+        self._refresh(event)
+
     @callback
     def _refresh(self, event: Optional[Event]) -> None:
+        # A render always reflects the latest states
+        self._cancel_pending_refresh()
+        self._last_render = dt_util.utcnow()
         self._info = self._template.async_render_to_info(self._variables)
         self._update_listeners()
         self._last_info = self._info
@@ -657,6 +726,7 @@ def async_track_template_result(
     template: Template,
     action: TrackTemplateResultListener,
     variables: Optional[TemplateVarsType] = None,
+    rate_limit: Optional[timedelta] = None,
 ) -> _TrackTemplateResultInfo:
     """Add a listener that fires when a the result of a template changes.
 
@@ -672,6 +742,12 @@ def async_track_template_result(
     Once the template returns to a non-error condition the result is sent
     to the action as usual.
 
+    When a rate_limit is given, state changes that reach the template by
+    iterating all states or the states of a domain render it at most once
+    per rate_limit. Changes within the window are coalesced into a single
+    render at the end of it. Changes to entities referenced directly, outside
+    of the iterated domains, and manual refreshes always render right away.
+
     Parameters
     ----------
     hass
@@ -682,13 +758,15 @@ def async_track_template_result(
         Callable to call with results.
     variables
         Variables to pass to the template.
+    rate_limit
+        Minimum time between renders caused by iterated states.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = _TrackTemplateResultInfo(hass, template, action, variables)
+    tracker = _TrackTemplateResultInfo(hass, template, action, variables, rate_limit)
     tracker.async_setup()
     return tracker
 
@@ -761,6 +839,85 @@ def async_track_same_state(
 track_same_state = threaded_listener_factory(async_track_same_state)
 
 
+class _TimeScheduler:
+    """Schedule time based listeners on the event loop.
+
+    Listeners that are due at the same time share a single timer, so the
+    loop wakes up once for all trackers firing on the same pattern.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._timers: Dict[
+            float, Tuple[asyncio.TimerHandle, Dict[int, Callable[[], Any]]]
+        ] = {}
+        self._ids = count()
+
+    @callback
+    def async_schedule(
+        self, utc_point_in_time: datetime, job: Callable[[], Any]
+    ) -> CALLBACK_TYPE:
+        """Call job at a point in UTC time."""
+        timestamp = utc_point_in_time.timestamp()
+        timer = self._timers.get(timestamp)
+
+        if timer is None:
+            # We always get time.time() first to avoid time.time()
+            # ticking forward after fetching hass.loop.time()
+            # and callback being scheduled a few microseconds early
+            handle = self.hass.loop.call_at(
+                -time.time() + self.hass.loop.time() + timestamp,
+                self._async_fire,
+                timestamp,
+            )
+            timer = self._timers[timestamp] = (handle, {})
+
+        handle, jobs = timer
+        job_id = next(self._ids)
+        jobs[job_id] = job
+
+        @callback
+        def cancel() -> None:
+            """Cancel the scheduled job."""
+            if jobs.pop(job_id, None) is None:
+                return
+            if not jobs and self._timers.get(timestamp) is timer:
+                handle.cancel()
+                del self._timers[timestamp]
+
+        return cancel
+
+    @callback
+    def _async_fire(self, timestamp: float) -> None:
+        """Call the jobs that are due."""
+        timer = self._timers.pop(timestamp, None)
+        if timer is None:
+            return
+        jobs = timer[1]
+        for job_id in list(jobs):
+            # A job can cancel other jobs that are due at the same time
+            job = jobs.pop(job_id, None)
+            if job is None:
+                continue
+            try:
+                job()
+            except Exception as err:  # pylint: disable=broad-except
+                # Report like the loop does for a failing timer callback
+                self.hass.loop.call_exception_handler(
+                    {"message": f"Error calling scheduled job {job}", "exception": err}
+                )
+
+
+@callback
+def _async_get_time_scheduler(hass: HomeAssistant) -> _TimeScheduler:
+    """Return the time scheduler of the instance."""
+    scheduler = hass.data.get(TRACK_TIME_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[TRACK_TIME_SCHEDULER] = _TimeScheduler(hass)
+    return scheduler
+
+
 @callback
 @bind_hass
 def async_track_point_in_time(
@@ -788,20 +945,10 @@ def async_track_point_in_utc_time(
     # Ensure point_in_time is UTC
     utc_point_in_time = dt_util.as_utc(point_in_time)
 
-    cancel_callback = hass.loop.call_at(
-        hass.loop.time() + point_in_time.timestamp() - time.time(),
-        hass.async_run_job,
-        action,
-        utc_point_in_time,
+    return _async_get_time_scheduler(hass).async_schedule(
+        utc_point_in_time, ft.partial(hass.async_run_job, action, utc_point_in_time)
     )
 
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        cancel_callback.cancel()
-
-    return unsub_point_in_time_listener
-
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
 
@@ -955,69 +1102,42 @@ def async_track_utc_time_change(
     local: bool = False,
 ) -> CALLBACK_TYPE:
     """Add a listener that will fire if time matches a pattern."""
-    # We do not have to wrap the function with time pattern matching logic
-    # if no pattern given
-    if all(val is None for val in (hour, minute, second)):
-
-        @callback
-        def time_change_listener(event: Event) -> None:
-            """Fire every time event that comes in."""
-            hass.async_run_job(action, event.data[ATTR_NOW])
-
-        return hass.bus.async_listen(EVENT_TIME_CHANGED, time_change_listener)
-
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
+    scheduler = _async_get_time_scheduler(hass)
 
-    next_time: datetime = dt_util.utcnow()
-
-    def calculate_next(now: datetime) -> None:
-        """Calculate and set the next time the trigger should fire."""
-        nonlocal next_time
-
+    def calculate_next(now: datetime) -> datetime:
+        """Calculate the next time the trigger should fire."""
         localized_now = dt_util.as_local(now) if local else now
-        next_time = dt_util.find_next_time_expression_time(
+        return dt_util.find_next_time_expression_time(
             localized_now, matching_seconds, matching_minutes, matching_hours
         )
 
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    cancel_callback: Optional[asyncio.TimerHandle] = None
-    calculate_next(next_time)
-
     @callback
     def pattern_time_change_listener() -> None:
         """Listen for matching time_changed events."""
-        nonlocal next_time, cancel_callback
+        nonlocal cancel_callback
 
         now = pattern_utc_now()
         hass.async_run_job(action, dt_util.as_local(now) if local else now)
 
-        calculate_next(now + timedelta(seconds=1))
-
-        # We always get time.time() first to avoid time.time()
-        # ticking forward after fetching hass.loop.time()
-        # and callback being scheduled a few microseconds early
-        cancel_callback = hass.loop.call_at(
-            -time.time() + hass.loop.time() + next_time.timestamp(),
-            pattern_time_change_listener,
+        # Make sure rolling back the clock doesn't prevent the timer from
+        # triggering.
+        cancel_callback = scheduler.async_schedule(
+            calculate_next(now + timedelta(seconds=1)), pattern_time_change_listener
         )
 
-    # We always get time.time() first to avoid time.time()
-    # ticking forward after fetching hass.loop.time()
-    # and callback being scheduled a few microseconds early
-    cancel_callback = hass.loop.call_at(
-        -time.time() + hass.loop.time() + next_time.timestamp(),
+    # The current second has started already, the next match comes after it
+    cancel_callback = scheduler.async_schedule(
+        calculate_next(dt_util.utcnow() + timedelta(seconds=1)),
         pattern_time_change_listener,
     )
 
     @callback
     def unsub_pattern_time_change_listener() -> None:
-        """Cancel the call_later."""
-        nonlocal cancel_callback
-        assert cancel_callback is not None
-        cancel_callback.cancel()
+        """Cancel the scheduled listener."""
+        cancel_callback()
 
     return unsub_pattern_time_change_listener
 
@@ -380,13 +380,7 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
             if target_all_entities:
                 entity_candidates.extend(platform.entities.values())
             else:
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in entity_ids
-                    ]
-                )
+                entity_candidates.extend(_get_platform_entities(platform, entity_ids))
 
     elif target_all_entities:
         # If we target all entities, we will select all entities the user
@@ -403,10 +397,7 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
     else:
         for platform in platforms:
             platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in entity_ids:
-                    continue
+            for entity in _get_platform_entities(platform, entity_ids):
 
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
@@ -476,6 +467,23 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
             future.result()  # pop exception if have
 
 
+def _get_platform_entities(platform, entity_ids):
+    """Return the entities of a platform that are targeted.
+
+    Looks up the targets by entity id, so the cost scales with the number of
+    targets. Entities are returned in the order they were added.
+    """
+    platform_entities = platform.entities
+    entities = [
+        platform_entities[entity_id]
+        for entity_id in entity_ids
+        if entity_id in platform_entities
+    ]
+    entity_order = platform.entity_order
+    entities.sort(key=lambda entity: entity_order[entity.entity_id])
+    return entities
+
+
 async def _handle_entity_call(hass, entity, func, data, context):
     """Handle calling service method."""
     entity.async_set_context(context)
@@ -1,5 +1,6 @@
 """Template helper methods for rendering strings with Home Assistant data."""
 import base64
+from collections import OrderedDict
 import collections.abc
 from datetime import datetime
 from functools import wraps
@@ -8,7 +9,8 @@ import logging
 import math
 import random
 import re
-from typing import Any, Iterable, List, Optional, Union
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Union
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
@@ -58,6 +60,9 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# Number of compiled templates kept in the process wide cache
+COMPILED_CACHE_SIZE = 1024
+
 
 @bind_hass
 def attach(hass: HomeAssistantType, obj: Any) -> None:
@@ -201,6 +206,71 @@ class RenderInfo:
             self.filter_lifecycle = self._filter_lifecycle
 
 
+class _CompiledCodeCache:
+    """LRU of compiled template code shared by all template environments.
+
+    The same template strings are used in many places, only compile them
+    once. Compiled code is keyed by the environment class, if the
+    environment has hass and the template source, as only environments with
+    hass register the filters and globals that need it. The counters are
+    logged at debug level every maxsize compiles.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict = OrderedDict()
+        # Templates are also compiled from the executor
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached code or None."""
+        with self._lock:
+            code = self._cache.get(key)
+            if code is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return code
+
+    def set(self, key: Any, code: Any) -> None:
+        """Store compiled code and evict the least recently used."""
+        with self._lock:
+            self._cache[key] = code
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+            if self.misses % self.maxsize == 0:
+                _LOGGER.debug("Compiled template cache: %s", self.info())
+
+    def clear(self) -> None:
+        """Remove all compiled code and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """Return the cache counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+        }
+
+
+_COMPILED_CODE_CACHE = _CompiledCodeCache(COMPILED_CACHE_SIZE)
+
+
+def compiled_cache_info() -> Dict[str, int]:
+    """Return hits, misses and size of the compiled template cache."""
+    return _COMPILED_CODE_CACHE.info()
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -358,9 +428,13 @@ class Template:
 
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        # Templates with the same source share the template object
+        compiled = env.template_cache.get(self.template)
+        if compiled is None:
+            compiled = env.template_cache[self.template] = jinja2.Template.from_code(
+                env, self._compiled_code, env.globals, None
+            )
+        self._compiled = compiled
 
         return self._compiled
 
@@ -1137,10 +1211,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        key = (self.__class__, self.hass is not None, source)
+        cached = _COMPILED_CODE_CACHE.get(key)
 
         if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = super().compile(source)
+            _COMPILED_CODE_CACHE.set(key, cached)
 
         return cached
 
@@ -25,6 +25,7 @@ from typing import (
     cast,
 )
 
+from homeassistant.generated.manifests import MANIFESTS
 from homeassistant.generated.ssdp import SSDP
 from homeassistant.generated.zeroconf import HOMEKIT, ZEROCONF
 
@@ -223,6 +224,26 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_index(
+        cls, hass: "HomeAssistant", root_module: ModuleType, domain: str
+    ) -> "Optional[Integration]":
+        """Resolve a built-in integration from the generated manifest index.
+
+        Async friendly.
+        """
+        manifest = MANIFESTS.get(domain)
+
+        if manifest is None:
+            return None
+
+        return cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            pathlib.Path(root_module.__path__[0]) / domain,  # type: ignore
+            dict(manifest),
+        )
+
     @classmethod
     def resolve_legacy(
         cls, hass: "HomeAssistant", domain: str
@@ -437,9 +458,13 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    # The manifests of the built-in integrations are indexed by hassfest
+    integration = Integration.resolve_from_index(hass, components, domain)
+
+    if integration is None:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
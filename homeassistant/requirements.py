@@ -4,7 +4,7 @@ import logging
 import os
 from typing import Any, Dict, Iterable, List, Optional, Set, Union, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 import homeassistant.util.package as pkg_util
@@ -12,6 +12,10 @@ import homeassistant.util.package as pkg_util
 DATA_PIP_LOCK = "pip_lock"
 DATA_PKG_CACHE = "pkg_cache"
 DATA_INTEGRATIONS_WITH_REQS = "integrations_with_reqs"
+DATA_INSTALLED_REQS = "installed_reqs"
+STORAGE_KEY = "core.requirements"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
 CONSTRAINT_FILE = "package_constraints.txt"
 _LOGGER = logging.getLogger(__name__)
 DISCOVERY_INTEGRATIONS: Dict[str, Iterable[str]] = {
@@ -21,6 +25,57 @@ DISCOVERY_INTEGRATIONS: Dict[str, Iterable[str]] = {
 _UNDEF = object()
 
 
+class InstalledRequirements:
+    """Requirements known to be satisfied by the installed distributions.
+
+    The requirements are stored together with a fingerprint of the
+    directories on the Python path. When the fingerprint no longer matches
+    on the next start the stored requirements are discarded and checked
+    again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the installed requirements."""
+        self.hass = hass
+        self.requirements: Set[str] = set()
+        self._fingerprint: Dict[str, int] = {}
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, private=True
+        )
+
+    async def async_load(self) -> None:
+        """Load the requirements that are still satisfied."""
+        self._fingerprint, data = await asyncio.gather(
+            self.hass.async_add_executor_job(pkg_util.environment_fingerprint),
+            self._store.async_load(),
+        )
+        if data is not None and data["fingerprint"] == self._fingerprint:
+            self.requirements = set(data["requirements"])
+
+    async def async_add(self, requirements: Iterable[str], installed: bool) -> None:
+        """Add satisfied requirements.
+
+        Installing packages changes the environment, so the requirements
+        that were satisfied before are forgotten and checked again.
+        """
+        if installed:
+            self._fingerprint = await self.hass.async_add_executor_job(
+                pkg_util.environment_fingerprint
+            )
+            self.requirements.clear()
+
+        self.requirements.update(requirements)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return data of the installed requirements to store in a file."""
+        return {
+            "fingerprint": self._fingerprint,
+            "requirements": sorted(self.requirements),
+        }
+
+
 class RequirementsNotFound(HomeAssistantError):
     """Raised when a component is not found."""
 
@@ -118,18 +173,40 @@ async def async_process_requirements(
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
-        for req in requirements:
-            if pkg_util.is_installed(req):
-                continue
+        installed = hass.data.get(DATA_INSTALLED_REQS)
+        if installed is None:
+            installed = hass.data[DATA_INSTALLED_REQS] = InstalledRequirements(hass)
+            await installed.async_load()
+
+        to_check = [req for req in requirements if req not in installed.requirements]
+        if not to_check:
+            return
+
+        missing = await hass.async_add_executor_job(_find_missing, to_check)
+
+        if missing:
+            failed = await hass.async_add_executor_job(_install, missing, kwargs)
+            if failed:
+                raise RequirementsNotFound(name, failed)
 
-            def _install(req: str, kwargs: Dict) -> bool:
-                """Install requirement."""
-                return pkg_util.install_package(req, **kwargs)
+        await installed.async_add(to_check, bool(missing))
 
-            ret = await hass.async_add_executor_job(_install, req, kwargs)
 
-            if not ret:
-                raise RequirementsNotFound(name, [req])
+def _find_missing(requirements: List[str]) -> List[str]:
+    """Return the requirements that are not installed."""
+    return [req for req in requirements if not pkg_util.is_installed(req)]
+
+
+def _install(requirements: List[str], kwargs: Dict[str, Any]) -> List[str]:
+    """Install requirements and return the ones that failed to install.
+
+    Several requirements are installed with a single pip run. If that fails
+    they are installed one by one to find out which one is the culprit.
+    """
+    if len(requirements) > 1 and pkg_util.install_packages(requirements, **kwargs):
+        return []
+
+    return [req for req in requirements if not pkg_util.install_package(req, **kwargs)]
 
 
 def pip_kwargs(config_dir: Optional[str]) -> Dict[str, Any]:
@@ -31,6 +31,7 @@ class RuntimeConfig:
     config_dir: str
     skip_pip: bool = False
     safe_mode: bool = False
+    fast_yaml: bool = False
 
     verbose: bool = False
 
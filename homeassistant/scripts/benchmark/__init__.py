@@ -9,12 +9,18 @@ import logging
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
-from homeassistant import core
+from homeassistant import config_entries, core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+    MATCH_ALL,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
+from homeassistant.util.rolling import RollingWindow
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -149,6 +155,46 @@ async def state_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_helper_match_all(hass):
+    """Run a million events through a match all state changed helper.
+
+    The events are for an entity none of the other 400 trackers follow.
+    """
+    count = 0
+    entity_id = "light.kitchen"
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 6:
+            event.set()
+
+    for idx in range(400):
+        hass.helpers.event.async_track_state_change(
+            f"{entity_id}{idx}", listener, "off", "on"
+        )
+    hass.helpers.event.async_track_state_change(MATCH_ALL, listener, "off", "on")
+    event_data = {
+        "entity_id": "light.living_room",
+        "old_state": core.State("light.living_room", "off"),
+        "new_state": core.State("light.living_room", "on"),
+    }
+
+    for _ in range(10 ** 6):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+    start = timer()
+
+    await event.wait()
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_event_helper(hass):
     """Run a million events through state changed event helper with 1000 entities."""
@@ -323,6 +369,180 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_dispatch(hass):
+    """Dispatch 100k MQTT messages with 10k subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import mqtt
+
+    count = 0
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+        if count == 10 ** 5:
+            event.set()
+
+    entry = config_entries.ConfigEntry(
+        1,
+        mqtt.DOMAIN,
+        "benchmark",
+        {},
+        config_entries.SOURCE_USER,
+        config_entries.CONN_CLASS_LOCAL_PUSH,
+        {},
+    )
+    conf = mqtt.CONFIG_SCHEMA({mqtt.DOMAIN: {mqtt.CONF_BROKER: "localhost"}})
+    client = mqtt.MQTT(hass, entry, conf[mqtt.DOMAIN])
+
+    for idx in range(10 ** 4 - 2):
+        await client.async_subscribe(f"zigbee2mqtt/device{idx}", listener, 0)
+    await client.async_subscribe("tasmota/+/state", listener, 0)
+    await client.async_subscribe("homeassistant/#", listener, 0)
+
+    msg = mqtt.Message("zigbee2mqtt/device5000", b'{"temperature": 21.5}', 0, False)
+
+    start = timer()
+
+    for _ in range(10 ** 5):
+        # pylint: disable=protected-access
+        client._mqtt_handle_message(msg)
+
+    await event.wait()
+
+    return timer() - start
+
+
+@benchmark
+async def registry_entries_for_device(hass):
+    """Look up the entities of 2000 devices in a 20k entity registry."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import entity_registry
+
+    registry = entity_registry.EntityRegistry(hass)
+    registry.entities = collections.OrderedDict()
+    registry._rebuild_index()  # pylint: disable=protected-access
+
+    for idx in range(2 * 10 ** 4):
+        # pylint: disable=protected-access
+        registry._register_entry(
+            entity_registry.RegistryEntry(
+                entity_id=f"sensor.benchmark_{idx}",
+                unique_id=str(idx),
+                platform="benchmark",
+                config_entry_id=f"entry_{idx % 20}",
+                device_id=f"device_{idx % 2000}",
+            )
+        )
+
+    start = timer()
+
+    for idx in range(2000):
+        entity_registry.async_entries_for_device(registry, f"device_{idx}")
+
+    return timer() - start
+
+
+@benchmark
+async def rolling_statistics(hass):
+    """Update the statistics of a 10k sample window 10k times."""
+    window = RollingWindow(max_samples=10 ** 4)
+    now = dt_util.utcnow()
+
+    start = timer()
+
+    for idx in range(2 * 10 ** 4):
+        window.add(float(idx % 97), now)
+        if idx >= 10 ** 4:
+            _ = (window.mean, window.median, window.stdev, window.variance)
+
+    return timer() - start
+
+
+@benchmark
+async def rolling_statistics_recompute(hass):
+    """Recompute the statistics of a 10k sample deque 10k times."""
+    # pylint: disable=import-outside-toplevel
+    import statistics
+
+    samples = collections.deque(maxlen=10 ** 4)
+
+    start = timer()
+
+    for idx in range(2 * 10 ** 4):
+        samples.append(float(idx % 97))
+        if idx >= 10 ** 4:
+            _ = (
+                statistics.mean(samples),
+                statistics.median(samples),
+                statistics.stdev(samples),
+                statistics.variance(samples),
+            )
+
+    return timer() - start
+
+
+@benchmark
+async def auth_middleware(hass):
+    """Authenticate 100k requests made with 500 long-lived access tokens."""
+    # pylint: disable=import-outside-toplevel,protected-access
+    from datetime import timedelta
+
+    from aiohttp import hdrs, web
+    from aiohttp.test_utils import make_mocked_request
+    import jwt
+
+    from homeassistant.auth import AuthManager, auth_store, models
+    from homeassistant.components.http.auth import setup_auth
+
+    store = auth_store.AuthStore(hass)
+    store._set_defaults()
+    hass.auth = AuthManager(hass, store, {}, {})
+
+    now = dt_util.utcnow()
+    requests = []
+    for idx in range(500):
+        user = models.User(name=f"user_{idx}", perm_lookup=None)
+        store._users[user.id] = user
+        refresh_token = models.RefreshToken(
+            user=user,
+            client_id=None,
+            client_name=f"client_{idx}",
+            token_type=models.TOKEN_TYPE_LONG_LIVED_ACCESS_TOKEN,
+            access_token_expiration=timedelta(days=3650),
+        )
+        user.refresh_tokens[refresh_token.id] = refresh_token
+        store._add_refresh_token_index(refresh_token)
+        access_token = jwt.encode(
+            {"iss": refresh_token.id, "iat": now, "exp": now + timedelta(days=1)},
+            refresh_token.jwt_key,
+            algorithm="HS256",
+        ).decode()
+        requests.append(
+            make_mocked_request(
+                "GET", "/api/", headers={hdrs.AUTHORIZATION: f"Bearer {access_token}"}
+            )
+        )
+
+    app = web.Application()
+    setup_auth(hass, app)
+    middleware = app.middlewares[-1]
+
+    async def handler(request):
+        """Handle the request."""
+
+    start = timer()
+
+    for idx in range(10 ** 5):
+        await middleware(requests[idx % 500], handler)
+
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -1,9 +1,23 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+from contextlib import contextmanager
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Set
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import attr
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -20,11 +34,149 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIME = "setup_time"
+DATA_SETUP_REPORT = "setup_report"
+
+PHASE_DEPENDENCIES = "dependencies"
+PHASE_REQUIREMENTS = "requirements"
+PHASE_IMPORT = "import"
+PHASE_CONFIG = "config"
+PHASE_SETUP = "setup"
+PHASE_CONFIG_ENTRIES = "config_entries"
+PHASE_PLATFORMS = "platforms"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
 
+def _wall_time(spans: Iterable[Tuple[float, float]]) -> float:
+    """Return the time covered by spans, counting overlapping time once."""
+    total = 0.0
+    covered = float("-inf")
+    for start, end in sorted(spans):
+        if end > covered:
+            total += end - max(start, covered)
+            covered = end
+    return total
+
+
+@attr.s(slots=True)
+class SetupTiming:
+    """Wall-clock timings of setting up an integration.
+
+    Each phase keeps the spans it ran in. Spans of a phase that run in
+    parallel are counted once, and phases can be nested, like the platforms
+    set up by config entries. Busy is the time any phase besides waiting on
+    dependencies ran.
+    """
+
+    started: float = attr.ib()
+    finished: float = attr.ib()
+    waited_on: List[str] = attr.ib(factory=list)
+    spans: Dict[str, List[Tuple[float, float]]] = attr.ib(factory=dict)
+
+    def as_dict(self, offset: float) -> Dict[str, Any]:
+        """Return a dictionary version with times relative to offset."""
+        return {
+            "started": round(self.started - offset, 3),
+            "finished": round(self.finished - offset, 3),
+            "waited_on": self.waited_on,
+            "phases": {
+                phase: round(_wall_time(spans), 3)
+                for phase, spans in self.spans.items()
+            },
+            "busy": round(
+                _wall_time(
+                    span
+                    for phase, spans in self.spans.items()
+                    if phase != PHASE_DEPENDENCIES
+                    for span in spans
+                ),
+                3,
+            ),
+        }
+
+
+@core.callback
+def _async_get_setup_timing(
+    hass: core.HomeAssistant, domain: str
+) -> Optional[SetupTiming]:
+    """Return the setup timing of a domain, starting it if needed.
+
+    Returns None once the setup report is frozen.
+    """
+    if DATA_SETUP_REPORT in hass.data:
+        return None
+
+    timings: Dict[str, SetupTiming] = hass.data.setdefault(DATA_SETUP_TIME, {})
+    timing = timings.get(domain)
+    if timing is None:
+        now = timer()
+        timing = timings[domain] = SetupTiming(now, now)
+    return timing
+
+
+@contextmanager
+def async_track_setup_phase(
+    hass: core.HomeAssistant, domain: str, phase: str
+) -> Generator[None, None, None]:
+    """Record the time spent in the block as a span of a setup phase of a domain."""
+    timing = _async_get_setup_timing(hass, domain)
+    if timing is None:
+        yield
+        return
+
+    start = timer()
+    try:
+        yield
+    finally:
+        end = timer()
+        timing.spans.setdefault(phase, []).append((start, end))
+        timing.finished = max(timing.finished, end)
+
+
+@core.callback
+def async_get_setup_report(hass: core.HomeAssistant) -> Dict[str, Any]:
+    """Return the setup timings of all integrations and the critical path.
+
+    The critical path starts at the integration that finished last and
+    follows the dependency it waited on that finished last. Once frozen,
+    the report of the startup is returned.
+    """
+    if DATA_SETUP_REPORT in hass.data:
+        return hass.data[DATA_SETUP_REPORT]  # type: ignore
+
+    timings: Dict[str, SetupTiming] = hass.data.get(DATA_SETUP_TIME, {})
+    if not timings:
+        return {"integrations": {}, "critical_path": []}
+
+    critical_path: List[str] = []
+    domain: Optional[str] = max(timings, key=lambda dom: timings[dom].finished)
+    while domain is not None and domain not in critical_path:
+        critical_path.append(domain)
+        waited_on = [dep for dep in timings[domain].waited_on if dep in timings]
+        domain = (
+            max(waited_on, key=lambda dep: timings[dep].finished) if waited_on else None
+        )
+    critical_path.reverse()
+
+    offset = min(timing.started for timing in timings.values())
+    return {
+        "integrations": {
+            domain: timing.as_dict(offset) for domain, timing in timings.items()
+        },
+        "critical_path": critical_path,
+    }
+
+
+@core.callback
+def async_freeze_setup_report(hass: core.HomeAssistant) -> Dict[str, Any]:
+    """Stop recording setup timings and keep the report of the startup."""
+    report = hass.data[DATA_SETUP_REPORT] = async_get_setup_report(hass)
+    hass.data.pop(DATA_SETUP_TIME, None)
+    return report
+
+
 @core.callback
 def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str]) -> None:
     """Set domains that are going to be loaded from the config.
@@ -56,6 +208,7 @@ async def async_setup_component(
     if domain in setup_tasks:
         return await setup_tasks[domain]  # type: ignore
 
+    _async_get_setup_timing(hass, domain)
     task = setup_tasks[domain] = hass.async_create_task(
         _async_setup_component(hass, domain, config)
     )
@@ -63,6 +216,9 @@ async def async_setup_component(
     try:
         return await task  # type: ignore
     finally:
+        timing = hass.data.get(DATA_SETUP_TIME, {}).get(domain)
+        if timing is not None:
+            timing.finished = max(timing.finished, timer())
         if domain in hass.data.get(DATA_SETUP_DONE, {}):
             hass.data[DATA_SETUP_DONE].pop(domain).set()
 
@@ -85,8 +241,12 @@ async def _async_process_dependencies(
         return True
 
     _LOGGER.debug("Dependency %s will wait for %s", integration.domain, list(tasks))
+    timing = _async_get_setup_timing(hass, integration.domain)
+    if timing is not None:
+        timing.waited_on.extend(tasks)
     async with hass.timeout.async_freeze(integration.domain):
-        results = await asyncio.gather(*tasks.values())
+        with async_track_setup_phase(hass, integration.domain, PHASE_DEPENDENCIES):
+            results = await asyncio.gather(*tasks.values())
 
     failed = [
         domain
@@ -143,7 +303,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_track_setup_phase(hass, domain, PHASE_IMPORT):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -151,9 +312,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_track_setup_phase(hass, domain, PHASE_CONFIG):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -192,7 +354,8 @@ async def _async_setup_component(
             return False
 
         async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-            result = await task
+            with async_track_setup_phase(hass, domain, PHASE_SETUP):
+                result = await task
     except asyncio.TimeoutError:
         _LOGGER.error(
             "Setup of %s is taking longer than %s seconds."
@@ -229,12 +392,13 @@ async def _async_setup_component(
     await asyncio.sleep(0)
     await hass.config_entries.flow.async_wait_init_flow_finish(domain)
 
-    await asyncio.gather(
-        *[
-            entry.async_setup(hass, integration=integration)
-            for entry in hass.config_entries.async_entries(domain)
-        ]
-    )
+    with async_track_setup_phase(hass, domain, PHASE_CONFIG_ENTRIES):
+        await asyncio.gather(
+            *[
+                entry.async_setup(hass, integration=integration)
+                for entry in hass.config_entries.async_entries(domain)
+            ]
+        )
 
     hass.config.components.add(domain)
     hass.data[DATA_SETUP_STARTED].pop(domain)
@@ -277,7 +441,8 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        with async_track_setup_phase(hass, integration.domain, PHASE_IMPORT):
+            platform = integration.get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -322,9 +487,10 @@ async def async_process_deps_reqs(
 
     if not hass.config.skip_pip and integration.requirements:
         async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+            with async_track_setup_phase(hass, integration.domain, PHASE_REQUIREMENTS):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
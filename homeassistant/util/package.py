@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 from subprocess import PIPE, Popen
 import sys
-from typing import Optional
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 import pkg_resources
@@ -56,6 +56,21 @@ def is_installed(package: str) -> bool:
         return False
 
 
+def environment_fingerprint() -> Dict[str, int]:
+    """Return the modification times of the directories on the Python path.
+
+    Installing, upgrading or removing a distribution changes its
+    .dist-info or .egg-info entry, which changes the fingerprint.
+    """
+    fingerprint = {}
+    for path in sys.path:
+        try:
+            fingerprint[path] = os.stat(path or ".").st_mtime_ns
+        except OSError:
+            continue
+    return fingerprint
+
+
 def install_package(
     package: str,
     upgrade: bool = True,
@@ -68,10 +83,33 @@ def install_package(
 
     Return boolean if install successful.
     """
+    return install_packages(
+        [package],
+        upgrade=upgrade,
+        target=target,
+        constraints=constraints,
+        find_links=find_links,
+        no_cache_dir=no_cache_dir,
+    )
+
+
+def install_packages(
+    packages: List[str],
+    upgrade: bool = True,
+    target: Optional[str] = None,
+    constraints: Optional[str] = None,
+    find_links: Optional[str] = None,
+    no_cache_dir: Optional[bool] = False,
+) -> bool:
+    """Install packages on PyPi with a single pip run.
+
+    Return boolean if install successful.
+    """
+    package = ", ".join(packages)
     # Not using 'import pip; pip.main([])' because it breaks the logger
     _LOGGER.info("Attempting install of %s", package)
     env = os.environ.copy()
-    args = [sys.executable, "-m", "pip", "install", "--quiet", package]
+    args = [sys.executable, "-m", "pip", "install", "--quiet", *packages]
     if no_cache_dir:
         args.append("--no-cache-dir")
     if upgrade:
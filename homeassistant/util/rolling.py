@@ -0,0 +1,155 @@
+"""Rolling window statistics helpers."""
+from bisect import bisect_left, insort
+from collections import deque
+from datetime import datetime, timedelta
+import math
+from typing import Deque, List, Optional, Tuple
+
+
+class RollingWindow:
+    """Statistics over a window of timestamped samples.
+
+    The window holds at most max_samples samples and purge drops the
+    samples older than max_age. Statistics are updated when samples are
+    added or removed instead of being recomputed over the whole window:
+    the total and Welford's sum of squared differences are kept running
+    and a sorted copy of the values gives the median, min and max. The
+    running statistics are recomputed once as many samples were removed as
+    the window holds, so rounding errors do not add up.
+    """
+
+    def __init__(
+        self, max_samples: Optional[int] = None, max_age: Optional[timedelta] = None
+    ) -> None:
+        """Initialize the window."""
+        self.max_samples = max_samples
+        self.max_age = max_age
+        self._samples: Deque[Tuple[float, datetime]] = deque()
+        self._sorted: List[float] = []
+        self._total = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._removed = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def add(self, value: float, timestamp: datetime) -> None:
+        """Add a sample, evicting the oldest one when the window is full.
+
+        Raises ValueError for values that are not finite.
+        """
+        if not math.isfinite(value):
+            raise ValueError(f"Value {value} is not finite")
+
+        if self.max_samples is not None and len(self._samples) >= self.max_samples:
+            self._remove_oldest()
+
+        self._samples.append((value, timestamp))
+        insort(self._sorted, value)
+        self._total += value
+        delta = value - self._mean
+        self._mean += delta / len(self._samples)
+        self._m2 += delta * (value - self._mean)
+
+    def purge(self, now: datetime) -> int:
+        """Remove the samples older than max_age and return how many."""
+        if self.max_age is None:
+            return 0
+
+        removed = 0
+        while self._samples and now - self._samples[0][1] > self.max_age:
+            self._remove_oldest()
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._samples.clear()
+        self._sorted.clear()
+        self._total = self._mean = self._m2 = 0.0
+        self._removed = 0
+
+    def _remove_oldest(self) -> None:
+        """Remove the oldest sample and revert its contribution."""
+        value, _ = self._samples.popleft()
+        del self._sorted[bisect_left(self._sorted, value)]
+
+        count = len(self._samples)
+        if not count:
+            self._total = self._mean = self._m2 = 0.0
+            self._removed = 0
+            return
+
+        self._removed += 1
+        if self._removed >= count:
+            self._recompute()
+            return
+
+        self._total -= value
+        delta = value - self._mean
+        self._mean -= delta / count
+        # Rounding errors can not make a sum of squares negative
+        self._m2 = max(self._m2 - delta * (value - self._mean), 0.0)
+
+    def _recompute(self) -> None:
+        """Compute the running statistics from the samples."""
+        values = [value for value, _ in self._samples]
+        self._total = math.fsum(values)
+        self._mean = self._total / len(values)
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in values)
+        self._removed = 0
+
+    @property
+    def total(self) -> Optional[float]:
+        """Return the sum of the values."""
+        return self._total if self._samples else None
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the mean of the values."""
+        return self._total / len(self._samples) if self._samples else None
+
+    @property
+    def median(self) -> Optional[float]:
+        """Return the median of the values."""
+        count = len(self._sorted)
+        if not count:
+            return None
+        middle = count // 2
+        if count % 2:
+            return self._sorted[middle]
+        return (self._sorted[middle - 1] + self._sorted[middle]) / 2
+
+    @property
+    def variance(self) -> Optional[float]:
+        """Return the sample variance, it needs at least two samples."""
+        count = len(self._samples)
+        return self._m2 / (count - 1) if count > 1 else None
+
+    @property
+    def stdev(self) -> Optional[float]:
+        """Return the sample standard deviation."""
+        variance = self.variance
+        return None if variance is None else math.sqrt(variance)
+
+    @property
+    def min(self) -> Optional[float]:
+        """Return the smallest value."""
+        return self._sorted[0] if self._sorted else None
+
+    @property
+    def max(self) -> Optional[float]:
+        """Return the largest value."""
+        return self._sorted[-1] if self._sorted else None
+
+    @property
+    def first(self) -> Optional[Tuple[float, datetime]]:
+        """Return the oldest value and its timestamp."""
+        return self._samples[0] if self._samples else None
+
+    @property
+    def last(self) -> Optional[Tuple[float, datetime]]:
+        """Return the newest value and its timestamp."""
+        return self._samples[-1] if self._samples else None
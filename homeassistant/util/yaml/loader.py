@@ -1,10 +1,14 @@
 """Custom loader."""
 from collections import OrderedDict
+from contextlib import contextmanager
 import fnmatch
+import json
 import logging
 import os
+from pathlib import Path
 import sys
-from typing import Dict, Iterator, List, TypeVar, Union, overload
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypeVar, Union, overload
 
 import yaml
 
@@ -32,6 +36,15 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
 
+PARSE_CACHE_VERSION = 2
+# Dependency key of parses that can not be cached, like keyring secrets
+_UNCACHEABLE = ("uncacheable", "")
+
+_PARSE_CACHES: Dict[str, "ParseCache"] = {}
+_PARSE_CACHES_LOCK = threading.Lock()
+# The parse cache and the dependencies of the files being loaded by a thread
+_LOCAL = threading.local()
+
 
 def clear_secret_cache() -> None:
     """Clear the secret cache.
@@ -52,13 +65,297 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+if yaml.__with_libyaml__:
+
+    class FastSafeLoader(yaml.CSafeLoader):  # type: ignore
+        """Loader class backed by libyaml.
+
+        libyaml composes the nodes in C, the line numbers of the loaded
+        objects come from the start marks of the nodes instead.
+        """
+
+        def __init__(self, stream: Any) -> None:
+            """Initialize the loader."""
+            super().__init__(stream)
+            self.name = getattr(stream, "name", "<file>")
+            self.stream = stream
+
+
+else:
+    FastSafeLoader = None  # pylint: disable=invalid-name
+
+
+LOADER: Any = SafeLineLoader
+
+
+def enable_fast_loader() -> bool:
+    """Load YAML files with libyaml from now on if it is available."""
+    global LOADER  # pylint: disable=global-statement
+
+    if FastSafeLoader is None:
+        return False
+    LOADER = FastSafeLoader
+    return True
+
+
+class ParseCache:
+    """Results of parsed YAML files, stored on disk as JSON.
+
+    Each entry keeps the fingerprints of everything its parse read: the
+    file and the files it included, the directories searched for
+    includes, the secrets files consulted and the environment variables
+    used. An entry is only used when none of them changed.
+
+    Secrets are stored as references to their secrets file and resolved
+    again when an entry is used, so their values never end up in the cache.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self._entries: Dict[str, Tuple[List[list], Any]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load the cache from disk."""
+        try:
+            data = json.loads(Path(self.path).read_text(encoding="utf-8"))
+            if data["version"] != PARSE_CACHE_VERSION:
+                return
+            self._entries = {
+                fname: (entry["dependencies"], entry["data"])
+                for fname, entry in data["entries"].items()
+            }
+        except FileNotFoundError:
+            return
+        except (ValueError, TypeError, KeyError, OSError) as err:
+            _LOGGER.warning("Unable to load YAML parse cache %s: %s", self.path, err)
+
+    def save(self) -> None:
+        """Write the cache to disk when it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(
+                {
+                    "version": PARSE_CACHE_VERSION,
+                    "entries": {
+                        fname: {"dependencies": dependencies, "data": data}
+                        for fname, (dependencies, data) in self._entries.items()
+                    },
+                }
+            )
+            self._dirty = False
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with os.fdopen(
+                os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600),
+                "w",
+                encoding="utf-8",
+            ) as cache_file:
+                cache_file.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to save YAML parse cache %s: %s", self.path, err)
+
+    def get(self, fname: str) -> Optional[Tuple[Dict[Tuple[str, str], Any], JSON_TYPE]]:
+        """Return the dependencies and a copy of the parsed file if unchanged."""
+        entry = self._entries.get(fname)
+        if entry is None:
+            return None
+
+        dependencies = {}
+        for kind, name, fingerprint in entry[0]:
+            key = (kind, name)
+            if _fingerprint(key) != fingerprint:
+                return None
+            dependencies[key] = fingerprint
+
+        try:
+            return dependencies, _decode(entry[1])
+        except (KeyError, TypeError, ValueError, HomeAssistantError):
+            return None
+
+    def set(
+        self, fname: str, dependencies: Dict[Tuple[str, str], Any], result: JSON_TYPE
+    ) -> None:
+        """Store a parsed file."""
+        if _UNCACHEABLE in dependencies or dependencies.get(("file", fname)) is None:
+            return
+
+        try:
+            data = _encode(result)
+        except TypeError:
+            return
+
+        with self._lock:
+            self._entries[fname] = (
+                [[kind, name, value] for (kind, name), value in dependencies.items()],
+                data,
+            )
+            self._dirty = True
+
+
+def _secret_reference(value: Any, name: str, secret_path: str) -> Any:
+    """Return a secret that is stored as a reference by the parse cache."""
+    references = getattr(_LOCAL, "secrets", None)
+    if references is None:
+        return value
+    if not isinstance(value, str):
+        # Only strings can be told apart from the other values
+        _record_dependency(*_UNCACHEABLE)
+        return value
+
+    secret = NodeStrClass(value)
+    references[id(secret)] = (name, secret_path, secret)
+    return secret
+
+
+def _encode(obj: Any) -> Any:
+    """Encode a parsed object, its file references and secrets as JSON types."""
+    reference = _LOCAL.secrets.get(id(obj))
+    if reference is not None and reference[2] is obj:
+        return {"secret": reference[0], "dir": reference[1]}
+
+    encoded: Dict[str, Any] = {}
+    if isinstance(obj, dict):
+        encoded["map"] = [[_encode(key), _encode(value)] for key, value in obj.items()]
+    elif isinstance(obj, list):
+        encoded["seq"] = [_encode(value) for value in obj]
+    elif isinstance(obj, str):
+        if not hasattr(obj, "__config_file__"):
+            return str(obj)
+        encoded["str"] = str(obj)
+    elif obj is None or isinstance(obj, (bool, int, float)):
+        return obj
+    else:
+        raise TypeError(f"Unable to cache {type(obj).__name__}")
+
+    if hasattr(obj, "__config_file__"):
+        encoded["file"] = obj.__config_file__
+        encoded["line"] = obj.__line__
+    return encoded
+
+
+def _decode(data: Any) -> Any:
+    """Decode a parsed object encoded by _encode."""
+    if not isinstance(data, dict):
+        return data
+
+    if "secret" in data:
+        value = _load_secret_yaml(data["dir"])[data["secret"]]
+        if not isinstance(value, str):
+            raise TypeError("Secret is no longer a string")
+        return _secret_reference(value, data["secret"], data["dir"])
+
+    obj: Any
+    if "map" in data:
+        obj = OrderedDict((_decode(key), _decode(value)) for key, value in data["map"])
+    elif "seq" in data:
+        obj = NodeListClass(_decode(value) for value in data["seq"])
+    else:
+        obj = NodeStrClass(data["str"])
+
+    if "file" in data:
+        setattr(obj, "__config_file__", data["file"])
+        setattr(obj, "__line__", data["line"])
+    return obj
+
+
+@contextmanager
+def parse_cache(path: str) -> Iterator[None]:
+    """Use the parse cache at path for the files loaded in this thread.
+
+    This method needs to run in an executor.
+    """
+    with _PARSE_CACHES_LOCK:
+        cache = _PARSE_CACHES.get(path)
+        if cache is None:
+            cache = _PARSE_CACHES[path] = ParseCache(path)
+            cache.load()
+
+    previous = getattr(_LOCAL, "parse_cache", None)
+    previous_secrets = getattr(_LOCAL, "secrets", None)
+    _LOCAL.parse_cache = cache
+    # Secrets loaded in this thread, by id, to store them as references
+    _LOCAL.secrets = {}
+    try:
+        yield
+    finally:
+        _LOCAL.parse_cache = previous
+        _LOCAL.secrets = previous_secrets
+        cache.save()
+
+
+def _fingerprint(key: Tuple[str, str]) -> Any:
+    """Return the current fingerprint of a dependency."""
+    kind, name = key
+    if kind == "env":
+        return os.environ.get(name)
+    if kind == "uncacheable":
+        return None
+    try:
+        stat = os.stat(name)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _record_dependencies(dependencies: Dict[Tuple[str, str], Any]) -> None:
+    """Add dependencies to the file that is being loaded."""
+    stack = getattr(_LOCAL, "dependencies", None)
+    if stack:
+        stack[-1].update(dependencies)
+
+
+def _record_dependency(kind: str, name: str) -> None:
+    """Add a dependency to the file that is being loaded."""
+    stack = getattr(_LOCAL, "dependencies", None)
+    if stack:
+        key = (kind, name)
+        stack[-1][key] = True if key == _UNCACHEABLE else _fingerprint(key)
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
     """Load a YAML file."""
+    cache: Optional[ParseCache] = getattr(_LOCAL, "parse_cache", None)
+    # Secrets files are never cached
+    if cache is None or os.path.basename(fname) == SECRET_YAML:
+        return _load_yaml(fname)
+
+    cached = cache.get(fname)
+    if cached is not None:
+        dependencies, result = cached
+        _record_dependencies(dependencies)
+        return result
+
+    stack = getattr(_LOCAL, "dependencies", None)
+    if stack is None:
+        stack = _LOCAL.dependencies = []
+
+    # Fingerprint the file before reading it, a change while it is
+    # parsed invalidates the entry.
+    dependencies = {("file", fname): _fingerprint(("file", fname))}
+    stack.append(dependencies)
+    try:
+        result = _load_yaml(fname)
+    finally:
+        stack.pop()
+
+    cache.set(fname, dependencies, result)
+    _record_dependencies(dependencies)
+    return result
+
+
+def _load_yaml(fname: str) -> JSON_TYPE:
+    """Parse a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
             # If configuration file is empty YAML returns None
             # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+            return yaml.load(conf_file, Loader=LOADER) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc)
@@ -123,6 +420,7 @@ def _is_file_valid(name: str) -> bool:
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
     for root, dirs, files in os.walk(directory, topdown=True):
+        _record_dependency("dir", root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -227,6 +525,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _record_dependency("env", args[0])
 
     # Check for a default value
     if len(args) > 1:
@@ -268,6 +567,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     secret_path = os.path.dirname(loader.name)
     while True:
+        _record_dependency("file", os.path.join(secret_path, SECRET_YAML))
         secrets = _load_secret_yaml(secret_path)
 
         if node.value in secrets:
@@ -276,7 +576,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
                 node.value,
                 secret_path,
             )
-            return secrets[node.value]
+            return _secret_reference(secrets[node.value], node.value, secret_path)
 
         if secret_path == os.path.dirname(sys.path[0]):
             break  # sys.path[0] set to config/deps folder by bootstrap
@@ -285,6 +585,9 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
         if not os.path.exists(secret_path) or len(secret_path) < 5:
             break  # Somehow we got past the .homeassistant config folder
 
+    # Secrets from keyring and credstash can change without us noticing
+    _record_dependency(*_UNCACHEABLE)
+
     if keyring:
         # do some keyring stuff
         pwd = keyring.get_password(_SECRET_NAMESPACE, node.value)
@@ -310,18 +613,19 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     raise HomeAssistantError(f"Secret {node.value} not defined")
 
 
-yaml.SafeLoader.add_constructor("!include", _include_yaml)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-yaml.SafeLoader.add_constructor("!env_var", _env_var_yaml)
-yaml.SafeLoader.add_constructor("!secret", secret_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-yaml.SafeLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
+def add_constructor(tag: Optional[str], constructor: Any) -> None:
+    """Add a constructor to the loaders."""
+    yaml.SafeLoader.add_constructor(tag, constructor)
+    if FastSafeLoader is not None:
+        FastSafeLoader.add_constructor(tag, constructor)
+
+
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
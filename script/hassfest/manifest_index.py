@@ -0,0 +1,79 @@
+"""Generate the manifest index file."""
+import json
+from typing import Any, Dict
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {}
+""".strip()
+
+
+def to_python(value: Any, level: int = 0) -> str:
+    """Format a JSON value as a Python literal."""
+    indent = "    " * level
+
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        items = ",\n".join(
+            f"{indent}    {json.dumps(key)}: {to_python(value[key], level + 1)}"
+            for key in sorted(value)
+        )
+        return f"{{\n{items}\n{indent}}}"
+
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        items = ",\n".join(
+            f"{indent}    {to_python(item, level + 1)}" for item in value
+        )
+        return f"[\n{items}\n{indent}]"
+
+    if isinstance(value, str):
+        return json.dumps(value)
+
+    return repr(value)
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate the manifest index."""
+    manifests = {
+        domain: integrations[domain].manifest
+        for domain in sorted(integrations)
+        if integrations[domain].manifest
+    }
+
+    return BASE.format(to_python(manifests))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate manifest index file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    config.cache["manifest_index"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(manifests_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "manifest_index",
+                "File manifests.py is not up to date. Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate manifest index file."""
+    manifests_path = config.root / "homeassistant/generated/manifests.py"
+    with open(str(manifests_path), "w") as fp:
+        fp.write(f"{config.cache['manifest_index']}\n")
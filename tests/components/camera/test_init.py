@@ -109,6 +109,86 @@ async def test_get_image_fails(hass, image_mock_url):
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_get_image_shares_fetch(hass, image_mock_url):
+    """Test concurrent requests for an image share a single fetch."""
+    fetched = asyncio.Event()
+
+    async def mock_camera_image():
+        await fetched.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=mock_camera_image,
+    ) as mock_image:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*tasks)
+
+        assert [image.content for image in images] == [b"Test"] * 3
+        assert len(mock_image.mock_calls) == 1
+
+        # Without a stream every still image is fetched fresh
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_image.mock_calls) == 2
+
+
+async def test_frame_broker_reuses_streamed_frames(hass, image_mock_url):
+    """Test frames of a watched stream are shared with other consumers."""
+    entity = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    broker = entity.frame_broker
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_image:
+        with broker.async_watch(0.5):
+            assert await broker.async_get_frame(0.5) == b"Test"
+            assert await broker.async_get_frame(0.5) == b"Test"
+            image = await camera.async_get_image(hass, "camera.demo_camera")
+            assert image.content == b"Test"
+            assert len(mock_image.mock_calls) == 1
+
+            with patch(
+                "homeassistant.components.camera.broker.monotonic",
+                return_value=float("inf"),
+            ):
+                assert await broker.async_get_frame(0.5) == b"Test"
+            assert len(mock_image.mock_calls) == 2
+
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_image.mock_calls) == 3
+
+
+async def test_frame_broker_fetch_timeout(hass, image_mock_url):
+    """Test a stuck fetch is given up so the next consumer fetches again."""
+    entity = hass.data[DOMAIN].get_entity("camera.demo_camera")
+    broker = entity.frame_broker
+
+    async def stuck_camera_image():
+        await asyncio.Event().wait()
+
+    with patch("homeassistant.components.camera.broker.FETCH_TIMEOUT", 0), patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=stuck_camera_image,
+    ):
+        with pytest.raises(asyncio.TimeoutError):
+            await broker.async_get_frame()
+
+    await asyncio.sleep(0)
+    assert broker._fetch is None
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ):
+        assert await broker.async_get_frame() == b"Test"
+
+
 async def test_snapshot_service(hass, mock_camera):
     """Test snapshot service."""
     mopen = mock_open()
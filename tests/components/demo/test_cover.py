@@ -59,6 +59,7 @@ async def test_supported_features(hass, setup_comp):
 
 async def test_close_cover(hass, setup_comp):
     """Test closing the cover."""
+    future = dt_util.utcnow()
     state = hass.states.get(ENTITY_COVER)
     assert state.state == STATE_OPEN
     assert state.attributes[ATTR_CURRENT_POSITION] == 70
@@ -69,7 +70,7 @@ async def test_close_cover(hass, setup_comp):
     state = hass.states.get(ENTITY_COVER)
     assert state.state == STATE_CLOSING
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -80,6 +81,7 @@ async def test_close_cover(hass, setup_comp):
 
 async def test_open_cover(hass, setup_comp):
     """Test opening the cover."""
+    future = dt_util.utcnow()
     state = hass.states.get(ENTITY_COVER)
     assert state.state == STATE_OPEN
     assert state.attributes[ATTR_CURRENT_POSITION] == 70
@@ -89,7 +91,7 @@ async def test_open_cover(hass, setup_comp):
     state = hass.states.get(ENTITY_COVER)
     assert state.state == STATE_OPENING
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -100,12 +102,13 @@ async def test_open_cover(hass, setup_comp):
 
 async def test_toggle_cover(hass, setup_comp):
     """Test toggling the cover."""
+    future = dt_util.utcnow()
     # Start open
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -117,7 +120,7 @@ async def test_toggle_cover(hass, setup_comp):
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -129,7 +132,7 @@ async def test_toggle_cover(hass, setup_comp):
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -140,6 +143,7 @@ async def test_toggle_cover(hass, setup_comp):
 
 async def test_set_cover_position(hass, setup_comp):
     """Test moving the cover to a specific position."""
+    future = dt_util.utcnow()
     state = hass.states.get(ENTITY_COVER)
     assert state.attributes[ATTR_CURRENT_POSITION] == 70
     await hass.services.async_call(
@@ -149,7 +153,7 @@ async def test_set_cover_position(hass, setup_comp):
         blocking=True,
     )
     for _ in range(6):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -159,12 +163,13 @@ async def test_set_cover_position(hass, setup_comp):
 
 async def test_stop_cover(hass, setup_comp):
     """Test stopping the cover."""
+    future = dt_util.utcnow()
     state = hass.states.get(ENTITY_COVER)
     assert state.attributes[ATTR_CURRENT_POSITION] == 70
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    future = dt_util.utcnow() + timedelta(seconds=1)
+    future += timedelta(seconds=1)
     async_fire_time_changed(hass, future)
     await hass.async_block_till_done()
     await hass.services.async_call(
@@ -178,13 +183,14 @@ async def test_stop_cover(hass, setup_comp):
 
 async def test_close_cover_tilt(hass, setup_comp):
     """Test closing the cover tilt."""
+    future = dt_util.utcnow()
     state = hass.states.get(ENTITY_COVER)
     assert state.attributes[ATTR_CURRENT_TILT_POSITION] == 50
     await hass.services.async_call(
         DOMAIN, SERVICE_CLOSE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -194,13 +200,14 @@ async def test_close_cover_tilt(hass, setup_comp):
 
 async def test_open_cover_tilt(hass, setup_comp):
     """Test opening the cover tilt."""
+    future = dt_util.utcnow()
     state = hass.states.get(ENTITY_COVER)
     assert state.attributes[ATTR_CURRENT_TILT_POSITION] == 50
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -210,12 +217,13 @@ async def test_open_cover_tilt(hass, setup_comp):
 
 async def test_toggle_cover_tilt(hass, setup_comp):
     """Test toggling the cover tilt."""
+    future = dt_util.utcnow()
     # Start open
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -226,7 +234,7 @@ async def test_toggle_cover_tilt(hass, setup_comp):
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -237,7 +245,7 @@ async def test_toggle_cover_tilt(hass, setup_comp):
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -247,6 +255,7 @@ async def test_toggle_cover_tilt(hass, setup_comp):
 
 async def test_set_cover_tilt_position(hass, setup_comp):
     """Test moving the cover til to a specific position."""
+    future = dt_util.utcnow()
     state = hass.states.get(ENTITY_COVER)
     assert state.attributes[ATTR_CURRENT_TILT_POSITION] == 50
     await hass.services.async_call(
@@ -256,7 +265,7 @@ async def test_set_cover_tilt_position(hass, setup_comp):
         blocking=True,
     )
     for _ in range(7):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -266,12 +275,13 @@ async def test_set_cover_tilt_position(hass, setup_comp):
 
 async def test_stop_cover_tilt(hass, setup_comp):
     """Test stopping the cover tilt."""
+    future = dt_util.utcnow()
     state = hass.states.get(ENTITY_COVER)
     assert state.attributes[ATTR_CURRENT_TILT_POSITION] == 50
     await hass.services.async_call(
         DOMAIN, SERVICE_CLOSE_COVER_TILT, {ATTR_ENTITY_ID: ENTITY_COVER}, blocking=True
     )
-    future = dt_util.utcnow() + timedelta(seconds=1)
+    future += timedelta(seconds=1)
     async_fire_time_changed(hass, future)
     await hass.async_block_till_done()
     await hass.services.async_call(
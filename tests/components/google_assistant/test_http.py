@@ -160,3 +160,14 @@ async def test_report_state(hass, aioclient_mock, hass_storage):
             REPORT_STATE_BASE_URL,
             {"requestId": ANY, "agentUserId": agent_user_id, "payload": message},
         )
+
+
+async def test_report_state_window(hass):
+    """Test the report state window is read from the config."""
+    config = GoogleConfig(hass, DUMMY_CONFIG)
+    assert config.report_state_window == 1
+
+    config = GoogleConfig(
+        hass, GOOGLE_ASSISTANT_SCHEMA({**DUMMY_CONFIG, "report_state_window": 5})
+    )
+    assert config.report_state_window == 5
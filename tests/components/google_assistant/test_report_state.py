@@ -1,4 +1,6 @@
 """Test Google report state."""
+from datetime import timedelta
+
 from homeassistant.components.google_assistant import error, report_state
 from homeassistant.util.dt import utcnow
 
@@ -38,6 +40,11 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
 
+        # Changes are reported after the batch window
+        assert len(mock_report.mock_calls) == 0
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+        await hass.async_block_till_done()
+
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
         "devices": {"states": {"light.kitchen": {"on": True, "online": True}}}
@@ -51,6 +58,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         hass.states.async_set(
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=4))
         await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
@@ -63,6 +71,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         side_effect=error.SmartHomeError("mock-error", "mock-msg"),
     ):
         hass.states.async_set("light.kitchen", "off")
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=6))
         await hass.async_block_till_done()
 
     assert "Not reporting state for light.kitchen: mock-error"
@@ -74,6 +83,88 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=8))
         await hass.async_block_till_done()
 
     assert len(mock_report.mock_calls) == 0
+    BASIC_CONFIG.report_state_stats = None
+
+
+async def test_report_state_batched(hass, legacy_patchable_time):
+    """Test state changes within the batch window are reported together."""
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("switch.ac", "on")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 100):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("switch.ac", "off")
+        hass.states.async_set("light.kitchen", "on")
+        hass.states.async_set("light.kitchen", "off")
+        await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+        await hass.async_block_till_done()
+
+        unsub()
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.ceiling": {"on": True, "online": True},
+                "switch.ac": {"on": False, "online": True},
+                "light.kitchen": {"on": False, "online": True},
+            }
+        }
+    }
+    assert BASIC_CONFIG.report_state_stats.changes == 4
+    assert BASIC_CONFIG.report_state_stats.reports == 1
+    assert BASIC_CONFIG.report_state_stats.calls_saved == 3
+    BASIC_CONFIG.report_state_stats = None
+
+
+async def test_report_state_failed(hass, caplog, legacy_patchable_time):
+    """Test states are compared with the last report that was sent."""
+    hass.states.async_set("light.kitchen", "on")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock(side_effect=Exception)
+    ) as mock_report:
+        hass.states.async_set("light.kitchen", "off")
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert "Error reporting state for ['light.kitchen']" in caplog.text
+
+    # The failed state is reported again on the next change
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report:
+        hass.states.async_set("light.kitchen", "off", {"irrelevant": "changed"})
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, utcnow() + timedelta(seconds=4))
+        await hass.async_block_till_done()
+
+    unsub()
+    BASIC_CONFIG.report_state_stats = None
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {"states": {"light.kitchen": {"on": False, "online": True}}}
+    }
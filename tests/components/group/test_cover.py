@@ -214,12 +214,13 @@ async def test_attributes(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_open_covers(hass, setup_comp):
     """Test open cover function."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
 
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -235,12 +236,13 @@ async def test_open_covers(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_close_covers(hass, setup_comp):
     """Test close cover function."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN, SERVICE_CLOSE_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
 
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -256,12 +258,13 @@ async def test_close_covers(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_toggle_covers(hass, setup_comp):
     """Test toggle cover function."""
+    future = dt_util.utcnow()
     # Start covers in open state
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -273,7 +276,7 @@ async def test_toggle_covers(hass, setup_comp):
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -290,7 +293,7 @@ async def test_toggle_covers(hass, setup_comp):
         DOMAIN, SERVICE_TOGGLE, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -306,17 +309,18 @@ async def test_toggle_covers(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_stop_covers(hass, setup_comp):
     """Test stop cover function."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    future = dt_util.utcnow() + timedelta(seconds=1)
+    future += timedelta(seconds=1)
     async_fire_time_changed(hass, future)
     await hass.async_block_till_done()
 
     await hass.services.async_call(
         DOMAIN, SERVICE_STOP_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    future = dt_util.utcnow() + timedelta(seconds=1)
+    future += timedelta(seconds=1)
     async_fire_time_changed(hass, future)
     await hass.async_block_till_done()
 
@@ -332,6 +336,7 @@ async def test_stop_covers(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_set_cover_position(hass, setup_comp):
     """Test set cover position function."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN,
         SERVICE_SET_COVER_POSITION,
@@ -339,7 +344,7 @@ async def test_set_cover_position(hass, setup_comp):
         blocking=True,
     )
     for _ in range(4):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -355,11 +360,12 @@ async def test_set_cover_position(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_open_tilts(hass, setup_comp):
     """Test open tilt function."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
     for _ in range(5):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -375,11 +381,12 @@ async def test_open_tilts(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_close_tilts(hass, setup_comp):
     """Test close tilt function."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN, SERVICE_CLOSE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
     for _ in range(5):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -393,12 +400,13 @@ async def test_close_tilts(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_toggle_tilts(hass, setup_comp):
     """Test toggle tilt function."""
+    future = dt_util.utcnow()
     # Start tilted open
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -415,7 +423,7 @@ async def test_toggle_tilts(hass, setup_comp):
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -430,7 +438,7 @@ async def test_toggle_tilts(hass, setup_comp):
         DOMAIN, SERVICE_TOGGLE_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -446,17 +454,18 @@ async def test_toggle_tilts(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_stop_tilts(hass, setup_comp):
     """Test stop tilts function."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    future = dt_util.utcnow() + timedelta(seconds=1)
+    future += timedelta(seconds=1)
     async_fire_time_changed(hass, future)
     await hass.async_block_till_done()
 
     await hass.services.async_call(
         DOMAIN, SERVICE_STOP_COVER_TILT, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
-    future = dt_util.utcnow() + timedelta(seconds=1)
+    future += timedelta(seconds=1)
     async_fire_time_changed(hass, future)
     await hass.async_block_till_done()
 
@@ -470,6 +479,7 @@ async def test_stop_tilts(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_ALL, 2)])
 async def test_set_tilt_positions(hass, setup_comp):
     """Test set tilt position function."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN,
         SERVICE_SET_COVER_TILT_POSITION,
@@ -477,7 +487,7 @@ async def test_set_tilt_positions(hass, setup_comp):
         blocking=True,
     )
     for _ in range(3):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
@@ -491,6 +501,7 @@ async def test_set_tilt_positions(hass, setup_comp):
 @pytest.mark.parametrize("config_count", [(CONFIG_POS, 2)])
 async def test_is_opening_closing(hass, setup_comp):
     """Test is_opening property."""
+    future = dt_util.utcnow()
     await hass.services.async_call(
         DOMAIN, SERVICE_OPEN_COVER, {ATTR_ENTITY_ID: COVER_GROUP}, blocking=True
     )
@@ -500,7 +511,7 @@ async def test_is_opening_closing(hass, setup_comp):
     assert hass.states.get(COVER_GROUP).state == STATE_OPENING
 
     for _ in range(10):
-        future = dt_util.utcnow() + timedelta(seconds=1)
+        future += timedelta(seconds=1)
         async_fire_time_changed(hass, future)
         await hass.async_block_till_done()
 
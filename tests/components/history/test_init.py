@@ -6,7 +6,8 @@ import json
 import unittest
 
 from homeassistant.components import history, recorder
-from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.models import Statistics, process_timestamp
+from homeassistant.components.recorder.statistics import PERIOD_5MINUTE
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component, setup_component
@@ -18,7 +19,7 @@ from tests.common import (
     init_recorder_component,
     mock_state_change_event,
 )
-from tests.components.recorder.common import wait_recording_done
+from tests.components.recorder.common import trigger_db_commit, wait_recording_done
 
 
 class TestComponentHistory(unittest.TestCase):
@@ -822,3 +823,52 @@ async def test_fetch_period_api_with_include_order(hass, hass_client):
         params={"filter_entity_id": "non.existing,something.else"},
     )
     assert response.status == 200
+
+
+async def test_fetch_period_api_with_statistics(hass, hass_client):
+    """Test long ranges are served from statistics that cover the range."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    now = dt_util.utcnow()
+    start = now - timedelta(days=3)
+    hass.states.async_set("sensor.power", "42")
+    hass.states.async_set("sensor.energy", "10")
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def _add_statistics():
+        with recorder.session_scope(hass=hass) as session:
+            for statistic_id, offset in (
+                ("sensor.power", timedelta(minutes=2)),
+                ("sensor.power", timedelta(hours=1)),
+                # Compiled only after the start of the range
+                ("sensor.energy", timedelta(hours=2)),
+            ):
+                session.add(
+                    Statistics(
+                        statistic_id=statistic_id,
+                        period=PERIOD_5MINUTE,
+                        start=start + offset,
+                        mean=20,
+                        min=10,
+                        max=30,
+                    )
+                )
+
+    await hass.async_add_executor_job(_add_statistics)
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={
+            "filter_entity_id": "sensor.power,sensor.energy",
+            "end_time": (now + timedelta(minutes=1)).isoformat(),
+        },
+    )
+    assert response.status == 200
+    power, energy = await response.json()
+
+    assert [state["state"] for state in power] == ["20.0", "20.0", "42"]
+    assert power[0]["attributes"] == {"min": 10, "max": 30}
+    assert dt_util.parse_datetime(power[0]["last_changed"]) == start
+    assert [state["state"] for state in energy] == ["10"]
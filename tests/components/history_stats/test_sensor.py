@@ -149,6 +149,72 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor3.state == 2
         assert sensor4.state == 50
 
+    def test_measure_incremental(self):
+        """Test the period is only loaded once and then follows state changes."""
+        t0 = dt_util.utcnow() - timedelta(minutes=40)
+        t1 = t0 + timedelta(minutes=20)
+        t2 = dt_util.utcnow() - timedelta(minutes=10)
+
+        # Start     t0        t1        t2        End
+        # |--20min--|--20min--|--10min--|--10min--|
+        # |---off---|---on----|---off---|---on----|
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+                ha.State("binary_sensor.test_id", "off", last_changed=t1),
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "test"
+        )
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes, patch(
+            "homeassistant.components.history.get_state", return_value=None
+        ):
+            sensor.update()
+            assert sensor.state == 1
+            assert sensor.value == pytest.approx(1 / 3, abs=0.01)
+
+            old_state = ha.State("binary_sensor.test_id", "off", last_changed=t1)
+            new_state = ha.State("binary_sensor.test_id", "on", last_changed=t2)
+            sensor._async_record_state_change(
+                ha.Event(
+                    "state_changed",
+                    {
+                        "entity_id": "binary_sensor.test_id",
+                        "old_state": old_state,
+                        "new_state": new_state,
+                    },
+                )
+            )
+            # Attribute only changes are not state changes
+            sensor._async_record_state_change(
+                ha.Event(
+                    "state_changed",
+                    {
+                        "entity_id": "binary_sensor.test_id",
+                        "old_state": new_state,
+                        "new_state": new_state,
+                    },
+                )
+            )
+            # An update within the same second of an ended period is skipped
+            p_start, p_end = sensor._period
+            sensor._period = (p_start, p_end - timedelta(minutes=1))
+            sensor.update()
+
+        assert mock_changes.call_count == 1
+        assert sensor.state == 2
+        assert sensor.value == pytest.approx(0.5, abs=0.01)
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template("{{ now() }}", self.hass)
@@ -0,0 +1,170 @@
+"""The tests for the static file handling of the HTTP component."""
+import gzip
+
+from aiohttp import hdrs, web
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.components.http.static import CachingStaticResource
+
+from tests.async_mock import patch
+
+CONTENT = b"console.log('Hello World');\n" * 100
+
+
+@pytest.fixture
+def www_dir(tmp_path):
+    """Return a directory with a file and its precompressed variants."""
+    (tmp_path / "app.js").write_bytes(CONTENT)
+    (tmp_path / "app.js.gz").write_bytes(gzip.compress(CONTENT))
+    (tmp_path / "app.js.br").write_bytes(b"brotli")
+    (tmp_path / "plain.txt").write_bytes(b"plain")
+    return tmp_path
+
+
+@pytest.fixture
+def mock_static_client(loop, aiohttp_client, www_dir):
+    """Return a client for a caching static resource."""
+    app = web.Application()
+    app.router.register_resource(CachingStaticResource("/static", str(www_dir)))
+    return loop.run_until_complete(aiohttp_client(app, auto_decompress=False))
+
+
+async def test_serve_precompressed(mock_static_client, www_dir):
+    """Test the precompressed variant the client accepts is served."""
+    resp = await mock_static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip, deflate, br"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert resp.headers[hdrs.CACHE_CONTROL] == static.CACHE_HEADERS[hdrs.CACHE_CONTROL]
+    assert await resp.read() == b"brotli"
+
+    resp = await mock_static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert "javascript" in resp.headers[hdrs.CONTENT_TYPE]
+    assert await resp.read() == (www_dir / "app.js.gz").read_bytes()
+
+    resp = await mock_static_client.get(
+        "/static/plain.txt", headers={hdrs.ACCEPT_ENCODING: "gzip"}
+    )
+    assert resp.status == 200
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert hdrs.VARY not in resp.headers
+    assert await resp.read() == b"plain"
+
+    resp = await mock_static_client.get("/static/missing.js")
+    assert resp.status == 404
+
+
+async def test_accept_encoding_quality(mock_static_client):
+    """Test encodings the client refuses are not served."""
+    resp = await mock_static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "br;q=0, gzip"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+
+    resp = await mock_static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip;q=0.5, br;q=0.8"}
+    )
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+
+    resp = await mock_static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "*;q=0"}
+    )
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == CONTENT
+
+    with patch.object(static, "MAX_CACHED_FILE_SIZE", 10), patch.object(
+        static, "REVALIDATE_TIME", -1
+    ):
+        resp = await mock_static_client.get(
+            "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip;q=0"}
+        )
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == CONTENT
+
+
+async def test_range_request(mock_static_client):
+    """Test range requests are served from the identity file."""
+    resp = await mock_static_client.get(
+        "/static/app.js",
+        headers={hdrs.ACCEPT_ENCODING: "br, gzip", hdrs.RANGE: "bytes=0-9"},
+    )
+    assert resp.status == 206
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == CONTENT[:10]
+
+
+async def test_conditional_request_from_cache(mock_static_client, www_dir):
+    """Test hot files and conditional requests are served from memory."""
+    resp = await mock_static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "identity"}
+    )
+    assert resp.status == 200
+    etag = resp.headers[hdrs.ETAG]
+    assert await resp.read() == CONTENT
+
+    (www_dir / "app.js").unlink()
+
+    resp = await mock_static_client.get(
+        "/static/app.js", headers={hdrs.IF_NONE_MATCH: etag}
+    )
+    assert resp.status == 304
+    assert resp.headers[hdrs.ETAG] == etag
+
+    resp = await mock_static_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "identity"}
+    )
+    assert resp.status == 200
+    assert await resp.read() == CONTENT
+
+    # The file is checked on disk again after a while
+    with patch.object(static, "REVALIDATE_TIME", -1):
+        resp = await mock_static_client.get("/static/app.js")
+    assert resp.status == 404
+
+
+async def test_large_files_streamed(mock_static_client, www_dir):
+    """Test files that are too large to keep in memory are streamed."""
+    (www_dir / "large.bin").write_bytes(b"x" * 100)
+
+    with patch.object(static, "MAX_CACHED_FILE_SIZE", 10):
+        resp = await mock_static_client.get("/static/large.bin")
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_TYPE] == "application/octet-stream"
+    assert await resp.read() == b"x" * 100
+
+    (www_dir / "large.bin").write_bytes(b"y" * 100)
+    with patch.object(static, "REVALIDATE_TIME", -1):
+        resp = await mock_static_client.get("/static/large.bin")
+    assert await resp.read() == b"y" * 100
+
+
+async def test_cache_shared_by_resources(loop, aiohttp_client, tmp_path_factory):
+    """Test all static resources share one cache budget."""
+    first_dir = tmp_path_factory.mktemp("first")
+    second_dir = tmp_path_factory.mktemp("second")
+    (first_dir / "app.js").write_bytes(b"first")
+    (second_dir / "app.js").write_bytes(b"second")
+
+    app = web.Application()
+    app.router.register_resource(CachingStaticResource("/first", str(first_dir)))
+    app.router.register_resource(CachingStaticResource("/second", str(second_dir)))
+    client = await aiohttp_client(app)
+
+    with patch.object(static, "MAX_CACHED_FILES", 1):
+        resp = await client.get("/first/app.js")
+        assert await resp.read() == b"first"
+        resp = await client.get("/second/app.js")
+        assert await resp.read() == b"second"
+
+        # Caching the second file evicted the first one
+        (first_dir / "app.js").unlink()
+        resp = await client.get("/first/app.js")
+        assert resp.status == 404
@@ -1363,6 +1363,89 @@ async def test_logbook_view(hass, hass_client):
     assert response.status == 200
 
 
+async def test_logbook_view_pagination(hass, hass_client):
+    """Test the logbook view pages with a limit and cursor."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    context = ha.Context()
+    pointA = dt_util.utcnow().replace(minute=2) - timedelta(hours=2)
+    # One window per switch, with two switches in the last window
+    for minutes, entity_id in (
+        (0, "switch.one"),
+        (logbook.GROUP_BY_MINUTES, "switch.two"),
+        (logbook.GROUP_BY_MINUTES * 2, "switch.three"),
+        (logbook.GROUP_BY_MINUTES * 2 + 1, "switch.four"),
+    ):
+        with patch(
+            "homeassistant.core.dt_util.utcnow",
+            return_value=pointA + timedelta(minutes=minutes),
+        ):
+            hass.states.async_set(entity_id, STATE_OFF)
+            hass.states.async_set(entity_id, STATE_ON, context=context)
+    await hass.async_add_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    url = f"/api/logbook/{(pointA - timedelta(minutes=1)).isoformat()}"
+    end_time = (pointA + timedelta(hours=1)).isoformat()
+
+    response = await client.get(
+        url, params={"end_time": end_time, "entity": "switch.two", "limit": 1}
+    )
+    assert response.status == 200
+    response_json = await response.json()
+    assert [entry["entity_id"] for entry in response_json["entries"]] == ["switch.two"]
+    assert response_json["next_cursor"] is None
+
+    pages = []
+    params = {"end_time": end_time, "limit": 1}
+    while True:
+        response = await client.get(url, params=params)
+        assert response.status == 200
+        response_json = await response.json()
+        pages.append(response_json["entries"])
+        cursor = response_json["next_cursor"]
+        if cursor is None:
+            break
+        params = {"end_time": end_time, "limit": 1, "cursor": cursor}
+
+    # Pages end at the end of a window
+    assert [[entry["entity_id"] for entry in entries] for entries in pages] == [
+        ["switch.one"],
+        ["switch.two"],
+        ["switch.three", "switch.four"],
+    ]
+    # The context is looked up on earlier pages
+    assert "context_entity_id" not in pages[0][0]
+    assert pages[1][0]["context_entity_id"] == "switch.one"
+    assert pages[2][1]["context_entity_id"] == "switch.one"
+
+    response = await client.get(url, params={"limit": 0})
+    assert response.status == 400
+    response = await client.get(url, params={"cursor": "invalid"})
+    assert response.status == 400
+
+
+async def test_logbook_view_error(hass, hass_client):
+    """Test the logbook view reports an error fetching the entries."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.logbook._iter_events",
+        side_effect=RuntimeError("Database is locked"),
+    ):
+        response = await client.get(f"/api/logbook/{dt_util.utcnow().isoformat()}")
+    assert response.status == 500
+    response_json = await response.json()
+    assert response_json == {"message": "Error fetching logbook entries"}
+
+
 async def test_logbook_view_period_entity(hass, hass_client):
     """Test the logbook view with period and entity."""
     await hass.async_add_executor_job(init_recorder_component, hass)
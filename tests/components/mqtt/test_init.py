@@ -18,6 +18,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
 )
 from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry
 from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
@@ -332,6 +333,41 @@ async def test_subscribe_topic(hass, mqtt_mock, calls, record_calls):
     assert len(calls) == 1
 
 
+async def test_subscribe_same_and_overlapping_topics(
+    hass, mqtt_mock, calls, record_calls
+):
+    """Test matching subscriptions are tracked per topic filter."""
+    unsub_exact = await mqtt.async_subscribe(hass, "test-topic/bier/on", record_calls)
+    unsub_level = await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls, encoding=None)
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+    assert sorted(call[0].subscribed_topic for call in calls) == [
+        "test-topic/#",
+        "test-topic/#",
+        "test-topic/+/on",
+        "test-topic/bier/on",
+    ]
+    assert [call[0].payload for call in calls].count(b"test-payload") == 1
+
+    unsub_exact()
+    unsub_level()
+    calls.clear()
+
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert {call[0].subscribed_topic for call in calls} == {"test-topic/#"}
+
+    with pytest.raises(HomeAssistantError):
+        unsub_exact()
+
+
 async def test_subscribe_deprecated(hass, mqtt_mock):
     """Test the subscription of a topic using deprecated callback signature."""
     calls = []
@@ -1,11 +1,7 @@
 """Common test utils for working with recorder."""
 
 from homeassistant.components import recorder
-from homeassistant.util import dt as dt_util
-
-from tests.common import fire_time_changed
-
-DB_COMMIT_INTERVAL = 50
+from homeassistant.core import callback
 
 
 def wait_recording_done(hass):
@@ -17,6 +13,14 @@ def wait_recording_done(hass):
 
 def trigger_db_commit(hass):
     """Force the recorder to commit."""
-    for _ in range(DB_COMMIT_INTERVAL):
-        # We only commit on time change
-        fire_time_changed(hass, dt_util.utcnow())
+
+    @callback
+    def async_commit():
+        """Queue the commit behind the events fired before."""
+        instance = hass.data[recorder.DATA_INSTANCE]
+        # The queue is empty once the last task is taken, queue a second
+        # commit so the first one is done when the queue is empty
+        instance.queue.put(recorder.CommitTask())
+        instance.queue.put(recorder.CommitTask())
+
+    hass.add_job(async_commit)
@@ -1,6 +1,7 @@
 """The tests for the Recorder component."""
 # pylint: disable=protected-access
 from datetime import datetime, timedelta
+import threading
 import unittest
 
 import pytest
@@ -14,7 +15,12 @@ from homeassistant.components.recorder import (
     run_information_with_session,
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import MATCH_ALL, STATE_LOCKED, STATE_UNLOCKED
 from homeassistant.core import Context, callback
@@ -26,6 +32,7 @@ from .common import wait_recording_done
 from tests.async_mock import patch
 from tests.common import (
     async_fire_time_changed,
+    fire_time_changed,
     get_test_home_assistant,
     init_recorder_component,
 )
@@ -330,6 +337,25 @@ async def test_defaults_set(hass):
     assert recorder_config["purge_keep_days"] == 10
 
 
+def test_commit_after_commit_interval(hass_recorder):
+    """Test pending events are committed once the commit interval has passed."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    committed = threading.Event()
+
+    with patch.object(
+        instance, "_commit_event_session_or_retry", side_effect=committed.set
+    ):
+        hass.states.set("test.recorder", "on")
+        hass.block_till_done()
+        instance.block_till_done()
+        assert not committed.is_set()
+
+        fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+        hass.block_till_done()
+        assert committed.wait(5)
+
+
 def test_auto_purge(hass_recorder):
     """Test saving and restoring a state."""
     hass = hass_recorder()
@@ -382,6 +408,79 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_state_deduplicates_attributes(hass_recorder):
+    """Test identical attributes are stored once."""
+    hass = hass_recorder()
+    attributes = {"friendly_name": "Power", "unit_of_measurement": "W"}
+
+    hass.states.set("sensor.power", "10", attributes)
+    wait_recording_done(hass)
+    hass.states.set("sensor.power", "11", attributes)
+    hass.states.set("sensor.other", "11", {"friendly_name": "Other"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert len(states) == 3
+        assert all(state.attributes is None for state in states)
+        assert states[0].attributes_id == states[1].attributes_id
+        assert states[0].attributes_id != states[2].attributes_id
+        assert session.query(StateAttributes).count() == 2
+
+        assert states[1].to_native().attributes == attributes
+        assert states[2].to_native().attributes == {"friendly_name": "Other"}
+
+
+def test_failed_commit_forgets_cached_rows(hass_recorder):
+    """Test states do not refer to rows of a failed commit."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+
+    hass.states.set("sensor.power", "10", {"unit_of_measurement": "W"})
+    wait_recording_done(hass)
+
+    with patch.object(
+        instance.event_session, "commit", side_effect=ValueError("mock error")
+    ):
+        hass.states.set("sensor.power", "11", {"unit_of_measurement": "kW"})
+        wait_recording_done(hass)
+
+    hass.states.set("sensor.power", "12", {"unit_of_measurement": "kW"})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States))
+        assert [state.state for state in states] == ["10", "12"]
+        assert states[1].old_state_id is None
+        assert states[1].to_native().attributes == {"unit_of_measurement": "kW"}
+        assert session.query(StateAttributes).count() == 2
+
+
+def test_saving_state_significant_change(hass_recorder):
+    """Test state changes shown in the logbook are flagged when recorded."""
+    hass = hass_recorder()
+    power_attributes = {"unit_of_measurement": "W"}
+
+    hass.states.set("light.kitchen", "on")
+    hass.states.set("light.kitchen", "off")
+    hass.states.set("light.kitchen", "off", {"brightness": 10})
+    hass.states.set("sensor.power", "10", power_attributes)
+    hass.states.set("sensor.power", "11", power_attributes)
+    hass.states.remove("light.kitchen")
+    wait_recording_done(hass)
+
+    # Batched rows are inserted in order per entity
+    significant = {"light.kitchen": [], "sensor.power": []}
+    with session_scope(hass=hass) as session:
+        for state in session.query(States).order_by(States.state_id):
+            significant[state.entity_id].append(state.significant_change)
+
+    assert significant == {
+        "light.kitchen": [False, True, False, False],
+        "sensor.power": [False, False],
+    }
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
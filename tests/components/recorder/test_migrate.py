@@ -1,10 +1,12 @@
 """The tests for the Recorder component."""
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from homeassistant.bootstrap import async_setup_component
 from homeassistant.components.recorder import const, migration, models
+import homeassistant.util.dt as dt_util
 
 # pylint: disable=protected-access
 from tests.async_mock import call, patch
@@ -78,3 +80,51 @@ def test_forgiving_add_index():
     engine = create_engine("sqlite://", poolclass=StaticPool)
     models.Base.metadata.create_all(engine)
     migration._create_index(engine, "states", "ix_states_context_id")
+
+
+def test_backfill_significant_change():
+    """Test existing states get their significant_change computed in chunks."""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    models.Base.metadata.create_all(engine)
+    session = Session(bind=engine)
+
+    def add_state(entity_id, state, old_state_id=None, attributes="{}"):
+        dbstate = models.States(
+            entity_id=entity_id,
+            domain=entity_id.split(".")[0],
+            state=state,
+            attributes=attributes,
+            last_changed=dt_util.utcnow(),
+        )
+        dbstate.last_updated = dbstate.last_changed
+        dbstate.old_state_id = old_state_id
+        session.add(dbstate)
+        session.commit()
+        return dbstate.state_id
+
+    light_on = add_state("light.kitchen", "on")
+    light_off = add_state("light.kitchen", "off", light_on)
+    light_same = add_state("light.kitchen", "off", light_off)
+    power_1 = add_state("sensor.power", "1", attributes='{"unit_of_measurement": "W"}')
+    power_2 = add_state(
+        "sensor.power", "2", power_1, attributes='{"unit_of_measurement": "W"}'
+    )
+    session.close()
+
+    with patch.object(migration, "BACKFILL_CHUNK_SIZE", 2):
+        migration._backfill_significant_change(engine)
+
+    session = Session(bind=engine)
+    significant = {
+        state.state_id: state.significant_change
+        for state in session.query(models.States)
+    }
+    session.close()
+
+    assert significant == {
+        light_on: False,
+        light_off: True,
+        light_same: False,
+        power_1: False,
+        power_2: False,
+    }
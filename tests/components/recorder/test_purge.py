@@ -5,7 +5,12 @@ import unittest
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.util import dt as dt_util
@@ -147,6 +152,55 @@ class TestRecorderPurge(unittest.TestCase):
             assert finished
             assert states.count() == 2
 
+    def test_purge_orphaned_state_attributes(self):
+        """Test deleting attributes no longer used by any state."""
+        wait_recording_done(self.hass)
+
+        with session_scope(hass=self.hass) as session:
+            used = StateAttributes.from_shared_attrs('{"used": true}')
+            orphaned = StateAttributes.from_shared_attrs('{"orphaned": true}')
+            session.add_all([used, orphaned])
+            session.flush()
+            session.add(
+                States(
+                    entity_id="test.recorder2",
+                    domain="sensor",
+                    state="dontpurgeme",
+                    attributes_id=used.attributes_id,
+                    last_changed=datetime.now(),
+                    last_updated=datetime.now(),
+                )
+            )
+
+        with session_scope(hass=self.hass) as session:
+            state_attributes = session.query(StateAttributes.shared_attrs)
+
+            while not purge_old_data(self.hass.data[DATA_INSTANCE], 4, repack=False):
+                pass
+
+            assert [row[0] for row in state_attributes if "orphaned" in row[0]] == []
+            assert any("used" in row[0] for row in state_attributes)
+
+    def test_purge_commits_pending_states(self):
+        """Test pending states are committed before purging."""
+        instance = self.hass.data[DATA_INSTANCE]
+        wait_recording_done(self.hass)
+        calls = []
+
+        with patch.object(
+            instance,
+            "_commit_event_session_or_retry",
+            side_effect=lambda: calls.append("commit"),
+        ), patch(
+            "homeassistant.components.recorder.purge.purge_old_data",
+            side_effect=lambda *args: calls.append("purge") or True,
+        ):
+            self.hass.services.call("recorder", "purge")
+            self.hass.block_till_done()
+            instance.block_till_done()
+
+        assert calls[calls.index("purge") - 1] == "commit"
+
     def test_purge_old_events(self):
         """Test deleting old events."""
         self._add_test_events()
@@ -233,6 +287,6 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 wait_recording_done(self.hass)
                 assert (
-                    mock_logger.debug.mock_calls[5][1][0]
+                    mock_logger.debug.mock_calls[7][1][0]
                     == "Vacuuming SQL DB to free space"
                 )
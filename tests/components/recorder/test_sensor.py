@@ -0,0 +1,31 @@
+"""The tests for the recorder queue sensor."""
+from homeassistant.components.recorder.sensor import ATTR_COMMIT_LATENCY
+from homeassistant.setup import setup_component
+
+from .common import wait_recording_done
+
+from tests.common import get_test_home_assistant, init_recorder_component
+
+
+def test_recorder_queue_sensor():
+    """Test the queue depth and commit latency are reported."""
+    hass = get_test_home_assistant()
+    init_recorder_component(hass)
+    hass.start()
+
+    assert setup_component(hass, "sensor", {"sensor": {"platform": "recorder"}})
+    hass.states.set("test.recorder", "on")
+    wait_recording_done(hass)
+
+    entity = hass.data["entity_components"]["sensor"].get_entity(
+        "sensor.recorder_queue"
+    )
+    hass.add_job(entity.async_write_ha_state)
+    hass.block_till_done()
+
+    state = hass.states.get("sensor.recorder_queue")
+    assert state.attributes["unit_of_measurement"] == "events"
+    assert int(state.state) >= 0
+    assert state.attributes[ATTR_COMMIT_LATENCY] >= 0
+
+    hass.stop()
@@ -0,0 +1,124 @@
+"""The tests for the recorder statistics."""
+from datetime import datetime, timedelta
+
+import pytest
+
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.statistics import (
+    PERIOD_5MINUTE,
+    PERIOD_HOUR,
+    compile_statistics,
+    period_start,
+    statistics_during_period,
+)
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.util import dt as dt_util
+
+from .common import wait_recording_done
+
+from tests.async_mock import patch
+from tests.common import get_test_home_assistant, init_recorder_component
+
+
+@pytest.fixture
+def hass_recorder():
+    """Home Assistant fixture with in-memory recorder."""
+    hass = get_test_home_assistant()
+
+    def setup_recorder(config=None):
+        """Set up with params."""
+        init_recorder_component(hass, config)
+        hass.start()
+        hass.block_till_done()
+        hass.data[DATA_INSTANCE].block_till_done()
+        return hass
+
+    yield setup_recorder
+    hass.stop()
+
+
+def _set_states(hass, states):
+    """Set states at specific points in time."""
+    for point, entity_id, state in states:
+        attributes = {ATTR_UNIT_OF_MEASUREMENT: "W"}
+        if entity_id == "sensor.count":
+            attributes = {}
+        with patch("homeassistant.core.dt_util.utcnow", return_value=point):
+            hass.states.set(entity_id, state, attributes)
+    wait_recording_done(hass)
+
+
+def test_period_start():
+    """Test the start of the last completed period."""
+    assert period_start(
+        datetime(2020, 9, 1, 10, 7, 10, 5, tzinfo=dt_util.UTC)
+    ) == datetime(2020, 9, 1, 10, 0, tzinfo=dt_util.UTC)
+    assert period_start(
+        datetime(2020, 9, 1, 10, 0, 10, tzinfo=dt_util.UTC)
+    ) == datetime(2020, 9, 1, 9, 55, tzinfo=dt_util.UTC)
+
+
+def test_compile_statistics(hass_recorder):
+    """Test compiling 5 minute and hourly statistics."""
+    hass = hass_recorder()
+    start = datetime(2020, 9, 1, 9, 50, tzinfo=dt_util.UTC)
+    last = start + timedelta(minutes=5)
+
+    _set_states(
+        hass,
+        [
+            (start + timedelta(minutes=1), "sensor.power", "10"),
+            (start + timedelta(minutes=2), "sensor.power", "20"),
+            (start + timedelta(minutes=3), "sensor.power", "unavailable"),
+            (start + timedelta(minutes=4), "sensor.text", "on"),
+            (start + timedelta(minutes=4), "light.kitchen", "5"),
+            (start + timedelta(minutes=4), "sensor.count", "5"),
+            (last + timedelta(minutes=1), "sensor.power", "60"),
+        ],
+    )
+
+    instance = hass.data[DATA_INSTANCE]
+    compile_statistics(instance, start)
+    compile_statistics(instance, last)
+
+    stats = statistics_during_period(hass, start, period=PERIOD_5MINUTE)
+    assert list(stats) == ["sensor.power"]
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.power"]
+    ] == [(15, 10, 20), (60, 60, 60)]
+    assert stats["sensor.power"][0]["start"] == start
+
+    stats = statistics_during_period(hass, start - timedelta(hours=1))
+    assert stats == {
+        "sensor.power": [
+            {
+                "start": datetime(2020, 9, 1, 9, tzinfo=dt_util.UTC),
+                # 10 and 20 for a minute each, 60 for the last 4 minutes
+                "mean": 45,
+                "min": 10,
+                "max": 60,
+            }
+        ]
+    }
+    assert statistics_during_period(hass, start, period=PERIOD_HOUR) == {}
+
+
+def test_compile_statistics_again(hass_recorder):
+    """Test compiling a period again keeps the stored statistics."""
+    hass = hass_recorder()
+    start = datetime(2020, 9, 1, 9, 55, tzinfo=dt_util.UTC)
+
+    _set_states(hass, [(start + timedelta(minutes=1), "sensor.power", "10")])
+
+    instance = hass.data[DATA_INSTANCE]
+    compile_statistics(instance, start)
+    _set_states(hass, [(start + timedelta(minutes=3), "sensor.power", "40")])
+    compile_statistics(instance, start)
+
+    stats = statistics_during_period(hass, start, period=PERIOD_5MINUTE)
+    assert [
+        (stat["mean"], stat["min"], stat["max"]) for stat in stats["sensor.power"]
+    ] == [(10, 10, 10)]
+
+    stats = statistics_during_period(hass, start - timedelta(hours=1))
+    assert len(stats["sensor.power"]) == 1
@@ -1,4 +1,5 @@
 """The tests the cover command line platform."""
+from datetime import timedelta
 import logging
 
 import pytest
@@ -22,8 +23,13 @@ from homeassistant.const import (
     STATE_OPEN,
     STATE_UNAVAILABLE,
 )
+import homeassistant.util.dt as dt_util
 
-from tests.common import assert_setup_component, async_mock_service
+from tests.common import (
+    assert_setup_component,
+    async_fire_time_changed,
+    async_mock_service,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -151,6 +157,9 @@ async def test_template_position(hass, calls):
     attrs["position"] = 42
     hass.states.async_set(entity.entity_id, entity.state, attributes=attrs)
     await hass.async_block_till_done()
+    # The template failed while cover.test was missing, which rate limits it
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
 
     state = hass.states.get("cover.test_template_cover")
     assert state.attributes.get("current_position") == 42.0
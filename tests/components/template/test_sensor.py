@@ -1,5 +1,6 @@
 """The test for the Template sensor platform."""
 from asyncio import Event
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant.bootstrap import async_from_config_dict
@@ -15,7 +16,11 @@ from homeassistant.helpers.template import Template
 from homeassistant.setup import ATTR_COMPONENT, async_setup_component, setup_component
 import homeassistant.util.dt as dt_util
 
-from tests.common import assert_setup_component, get_test_home_assistant
+from tests.common import (
+    assert_setup_component,
+    async_fire_time_changed,
+    get_test_home_assistant,
+)
 
 
 class TestTemplateSensor:
@@ -757,3 +762,38 @@ async def test_sun_renders_once_per_sensor(hass):
         "{{ state_attr('sun.sun', 'elevation') }}",
         "{{ state_attr('sun.sun', 'next_rising') }}",
     }
+
+
+async def test_iterated_states_rate_limit(hass):
+    """Test changes to iterated states are coalesced under the rate limit."""
+    await async_setup_component(
+        hass,
+        "sensor",
+        {
+            "sensor": {
+                "platform": "template",
+                "sensors": {
+                    "lights_on": {
+                        "value_template": (
+                            "{{ states.light | selectattr('state', 'eq', 'on') "
+                            "| list | count }}"
+                        ),
+                    },
+                },
+            }
+        },
+    )
+    await hass.async_block_till_done()
+    await hass.async_start()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.lights_on").state == "0"
+
+    hass.states.async_set("light.one", STATE_ON)
+    hass.states.async_set("light.two", STATE_ON)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.lights_on").state == "0"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.lights_on").state == "2"
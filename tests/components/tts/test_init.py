@@ -1,4 +1,8 @@
 """The tests for the TTS component."""
+# pylint: disable=protected-access
+import asyncio
+import os
+
 import pytest
 import yarl
 
@@ -715,3 +719,135 @@ async def test_setup_component_and_web_get_url_bad_config(hass, hass_client):
 
     req = await client.post(url, json=data)
     assert req.status == 400
+
+
+async def test_service_say_shares_generation(hass, empty_cache_dir):
+    """Test identical concurrent requests share one synthesis."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+
+    config = {tts.DOMAIN: {"platform": "demo"}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    with patch.object(
+        DemoProvider,
+        "get_tts_audio",
+        autospec=True,
+        side_effect=DemoProvider.get_tts_audio,
+    ) as mock_get_tts_audio:
+        await asyncio.gather(
+            *(
+                hass.services.async_call(
+                    tts.DOMAIN,
+                    "demo_say",
+                    {
+                        "entity_id": f"media_player.speaker_{idx}",
+                        tts.ATTR_MESSAGE: "There is someone at the door.",
+                    },
+                    blocking=True,
+                )
+                for idx in range(12)
+            )
+        )
+
+    assert len(mock_get_tts_audio.mock_calls) == 1
+    assert len(calls) == 12
+    assert len({call.data[ATTR_MEDIA_CONTENT_ID] for call in calls}) == 1
+
+
+async def test_service_say_shares_generation_with_cache(hass, empty_cache_dir):
+    """Test a request without cache does not keep the speech from the cache."""
+    async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+
+    config = {tts.DOMAIN: {"platform": "demo"}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    with patch.object(
+        DemoProvider,
+        "get_tts_audio",
+        autospec=True,
+        side_effect=DemoProvider.get_tts_audio,
+    ) as mock_get_tts_audio:
+        await asyncio.gather(
+            *(
+                hass.services.async_call(
+                    tts.DOMAIN,
+                    "demo_say",
+                    {
+                        "entity_id": "media_player.something",
+                        tts.ATTR_MESSAGE: "There is someone at the door.",
+                        tts.ATTR_CACHE: cache,
+                    },
+                    blocking=True,
+                )
+                for cache in (False, True)
+            )
+        )
+        await hass.async_block_till_done()
+
+    assert len(mock_get_tts_audio.mock_calls) == 2
+    assert (
+        empty_cache_dir / "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    ).is_file()
+
+
+async def test_file_cache_size(hass, empty_cache_dir):
+    """Test the least recently used files are removed when over the budget."""
+    cache_files = [
+        empty_cache_dir / f"{str(idx) * 40}_en_-_demo.mp3" for idx in range(3)
+    ]
+    for idx, cache_file in enumerate(cache_files):
+        cache_file.write_bytes(b"0" * 600 * 1024)
+        os.utime(cache_file, (idx, idx))
+
+    config = {tts.DOMAIN: {"platform": "demo", "cache_size": 1}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    assert [cache_file.is_file() for cache_file in cache_files] == [
+        False,
+        False,
+        True,
+    ]
+
+
+async def test_memory_cache_size(hass):
+    """Test the least recently used speech is removed from memory."""
+    manager = tts.SpeechManager(hass)
+    manager.memory_size = 10
+    keys = [f"{str(idx) * 40}_en_-_demo" for idx in range(4)]
+
+    for key in keys[:3]:
+        manager._async_store_to_memcache(key, f"{key}.mp3", b"12345")
+
+    # Speech that was not read yet is kept over the budget
+    assert list(manager.mem_cache) == keys[:3]
+
+    await manager.async_read_tts(f"{keys[0]}.mp3")
+    await manager.async_read_tts(f"{keys[1]}.mp3")
+    manager._async_store_to_memcache(keys[3], f"{keys[3]}.mp3", b"12345")
+    assert list(manager.mem_cache) == [keys[2], keys[3]]
+
+
+async def test_memory_cache_url_handed_out_again(hass, demo_provider):
+    """Test speech is kept in memory until every URL handed out is read."""
+    manager = tts.SpeechManager(hass)
+    manager.async_register_engine("demo", demo_provider, {})
+    manager.base_url = "http://example.local:8123"
+    manager.memory_size = 1
+
+    url = await manager.async_get_url("demo", "Announcement", cache=False)
+    filename = url.rsplit("/", 1)[1]
+    await manager.async_read_tts(filename)
+
+    # The speech is requested again before the other speakers read it
+    assert await manager.async_get_url("demo", "Announcement", cache=False) == url
+    other_key = f"{'1' * 40}_en_-_demo"
+    manager._async_store_to_memcache(other_key, f"{other_key}.mp3", b"12345")
+
+    _, data = await manager.async_read_tts(filename)
+    assert data
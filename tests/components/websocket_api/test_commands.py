@@ -517,6 +517,19 @@ async def test_manifest_list(hass, websocket_client):
     ]
 
 
+async def test_setup_report(hass, websocket_client):
+    """Test getting the setup report."""
+    await websocket_client.send_json({"id": 5, "type": "setup/report"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert "websocket_api" in msg["result"]["integrations"]
+    assert "setup" in msg["result"]["integrations"]["websocket_api"]["phases"]
+    assert msg["result"]["critical_path"]
+
+
 async def test_manifest_get(hass, websocket_client):
     """Test getting a manifest."""
     hue = await async_get_integration(hass, "hue")
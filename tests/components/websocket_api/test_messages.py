@@ -0,0 +1,49 @@
+"""Test Websocket API messages module."""
+import json
+
+from homeassistant.components.websocket_api.messages import EventMessageCache
+from homeassistant.core import Context, Event
+
+
+def test_event_message_cache_reuses_serialization():
+    """Test an event is serialized once for multiple subscriptions."""
+    cache = EventMessageCache()
+    event = Event("test_event", {"hello": "__IDEN__"}, context=Context())
+
+    first = json.loads(cache.event_message(1, event))
+    second = json.loads(cache.event_message(2, event))
+
+    assert first["id"] == 1
+    assert second["id"] == 2
+    assert first["type"] == second["type"] == "event"
+    assert first["event"] == second["event"]
+    assert first["event"]["data"] == {"hello": "__IDEN__"}
+    assert cache.misses == 1
+    assert cache.hits == 1
+    assert cache.bytes_saved > 0
+    assert cache.time_saved > 0
+
+    cache.event_message(3, Event("test_event"))
+    assert cache.misses == 2
+
+
+def test_event_message_cache_size_bound():
+    """Test the cache evicts the least recently used events."""
+    cache = EventMessageCache(maxsize=2)
+    events = [Event("test_event") for _ in range(3)]
+
+    for idx, event in enumerate(events):
+        cache.event_message(idx, event)
+
+    cache.event_message(5, events[0])
+    assert cache.misses == 4
+    cache.event_message(5, events[2])
+    assert cache.hits == 1
+
+
+def test_event_message_cache_unserializable():
+    """Test unserializable events are returned as a message dict."""
+    cache = EventMessageCache()
+    event = Event("test_event", {"bad": object()})
+
+    assert cache.event_message(1, event) == {"id": 1, "type": "event", "event": event}
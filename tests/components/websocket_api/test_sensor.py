@@ -2,7 +2,10 @@
 
 from homeassistant.bootstrap import async_setup_component
 from homeassistant.components.websocket_api.auth import TYPE_AUTH_REQUIRED
+from homeassistant.components.websocket_api.const import DATA_EVENT_MESSAGE_CACHE
 from homeassistant.components.websocket_api.http import URL
+from homeassistant.components.websocket_api.messages import EventMessageCache
+from homeassistant.core import Event
 
 from .test_auth import test_auth_active_with_token
 
@@ -36,3 +39,29 @@ async def test_websocket_api(hass, aiohttp_client, hass_access_token, legacy_aut
 
     state = hass.states.get("sensor.connected_clients")
     assert state.state == "0"
+
+
+async def test_event_serializations_saved(hass):
+    """Test the event serialization statistics."""
+    await async_setup_component(
+        hass, "sensor", {"sensor": {"platform": "websocket_api"}}
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.event_serializations_saved")
+    assert state.state == "0"
+
+    cache = hass.data[DATA_EVENT_MESSAGE_CACHE] = EventMessageCache()
+    event = Event("test_event")
+    for iden in range(3):
+        cache.event_message(iden, event)
+
+    await hass.helpers.entity_component.async_update_entity(
+        "sensor.event_serializations_saved"
+    )
+
+    state = hass.states.get("sensor.event_serializations_saved")
+    assert state.state == "2"
+    assert state.attributes["serialized_events"] == 1
+    assert state.attributes["bytes_saved"] == cache.bytes_saved
+    assert state.attributes["time_saved"] == round(cache.time_saved, 3)
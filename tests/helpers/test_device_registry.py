@@ -370,6 +370,50 @@ async def test_deleted_device_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_for_area_and_config_entry(registry):
+    """Test the area and config entry lookups follow updates and removal."""
+    entry1 = registry.async_get_or_create(
+        config_entry_id="123", connections=set(), identifiers={("bridgeid", "0123")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="456", connections=set(), identifiers={("bridgeid", "4567")},
+    )
+    entry2 = registry.async_get_or_create(
+        config_entry_id="123", connections=set(), identifiers={("bridgeid", "4567")},
+    )
+
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        entry1,
+        entry2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "456") == [entry2]
+
+    entry1 = registry.async_update_device(entry1.id, area_id="12345A")
+    entry2 = registry.async_update_device(entry2.id, area_id="12345A")
+    assert device_registry.async_entries_for_area(registry, "12345A") == [
+        entry1,
+        entry2,
+    ]
+
+    entry1 = registry.async_update_device(entry1.id, area_id="67890B")
+    assert device_registry.async_entries_for_area(registry, "12345A") == [entry2]
+    assert device_registry.async_entries_for_area(registry, "67890B") == [entry1]
+
+    registry.async_clear_area_id("12345A")
+    assert device_registry.async_entries_for_area(registry, "12345A") == []
+
+    registry.async_remove_device(entry1.id)
+    assert device_registry.async_entries_for_area(registry, "67890B") == []
+    assert device_registry.async_entries_for_config_entry(registry, "123") == [
+        registry.async_get(entry2.id)
+    ]
+
+    registry.async_clear_config_entry("456")
+    entry2 = registry.async_get(entry2.id)
+    assert entry2.config_entries == {"123"}
+    assert device_registry.async_entries_for_config_entry(registry, "456") == []
+
+
 async def test_specifying_via_device_create(registry):
     """Test specifying a via_device and updating."""
     via = registry.async_get_or_create(
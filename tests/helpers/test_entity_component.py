@@ -359,6 +359,38 @@ async def test_unload_entry_resets_platform(hass):
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_get_entity_across_platforms(hass):
+    """Test entities of all platforms are indexed by entity id."""
+    mock_setup_entry = AsyncMock(return_value=True)
+    mock_entity_platform(
+        hass,
+        "test_domain.entry_domain",
+        MockPlatform(async_setup_entry=mock_setup_entry),
+    )
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entry = MockConfigEntry(domain="entry_domain")
+
+    assert await component.async_setup_entry(entry)
+    add_entities = mock_setup_entry.mock_calls[0][1][2]
+    entry_entity = MockEntity(entity_id="test_domain.entry")
+    add_entities([entry_entity])
+    domain_entity = MockEntity(entity_id="test_domain.domain")
+    await component.async_add_entities([domain_entity])
+    await hass.async_block_till_done()
+
+    assert component.get_entity("test_domain.entry") is entry_entity
+    assert component.get_entity("test_domain.domain") is domain_entity
+    assert component.get_entity("test_domain.unknown") is None
+
+    await component.async_remove_entity("test_domain.domain")
+    assert component.get_entity("test_domain.domain") is None
+    assert hass.states.get("test_domain.domain") is None
+
+    assert await component.async_unload_entry(entry)
+    assert component.get_entity("test_domain.entry") is None
+
+
 async def test_unload_entry_fails_if_never_loaded(hass):
     """."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
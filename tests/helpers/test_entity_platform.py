@@ -375,6 +375,22 @@ async def test_async_remove_with_platform(hass):
     assert len(hass.states.async_entity_ids()) == 0
 
 
+async def test_entity_order(hass):
+    """Test the platform keeps the order in which entities were added."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    entity1 = MockEntity(entity_id="test_domain.b")
+    entity2 = MockEntity(entity_id="test_domain.a")
+    await component.async_add_entities([entity1])
+    await component.async_add_entities([entity2])
+    platform = entity1.platform
+    assert (
+        platform.entity_order["test_domain.b"] < platform.entity_order["test_domain.a"]
+    )
+
+    await entity1.async_remove()
+    assert list(platform.entity_order) == ["test_domain.a"]
+
+
 async def test_not_adding_duplicate_entities_with_unique_id(hass, caplog):
     """Test for not adding duplicate entities."""
     caplog.set_level(logging.ERROR)
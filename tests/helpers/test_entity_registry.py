@@ -330,6 +330,49 @@ async def test_removing_config_entry_id(hass, registry, update_events):
     assert update_events[1]["entity_id"] == entry.entity_id
 
 
+async def test_entries_for_device_and_config_entry(registry):
+    """Test the device and config entry lookups follow create, update and remove."""
+    mock_config_1 = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    mock_config_2 = MockConfigEntry(domain="light", entry_id="mock-id-2")
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=mock_config_1, device_id="mock-dev-1"
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config_1, device_id="mock-dev-1"
+    )
+
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-1") == [
+        entry1,
+        entry2,
+    ]
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == [
+        entry1,
+        entry2,
+    ]
+
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config_2, device_id="mock-dev-2"
+    )
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-1") == [entry1]
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-2") == [entry2]
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-2") == [
+        entry2
+    ]
+
+    entry2 = registry.async_update_entity(
+        entry2.entity_id, new_entity_id="light.renamed"
+    )
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-2") == [entry2]
+
+    registry.async_remove(entry1.entity_id)
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-1") == []
+    assert entity_registry.async_entries_for_config_entry(registry, "mock-id-1") == []
+
+    registry.async_clear_config_entry("mock-id-2")
+    assert not registry.entities
+    assert entity_registry.async_entries_for_device(registry, "mock-dev-2") == []
+
+
 async def test_migration(hass):
     """Test migration from old data to new."""
     mock_config = MockConfigEntry(domain="test-platform", entry_id="test-config-id")
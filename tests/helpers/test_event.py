@@ -8,12 +8,14 @@ import jinja2
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    TRACK_STATE_CHANGE_CALLBACKS,
+    TRACK_TIME_SCHEDULER,
     async_call_later,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -252,6 +254,45 @@ async def test_track_state_change(hass):
     assert len(wildercard_runs) == 6
 
 
+async def test_track_state_change_shares_dispatcher(hass):
+    """Test legacy trackers are routed through the entity_id index."""
+    runs = []
+
+    @ha.callback
+    def run_callback(entity_id, old_state, new_state):
+        runs.append(entity_id)
+
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    unsubs = [
+        async_track_state_change(hass, MATCH_ALL, run_callback, to_state="on"),
+        async_track_state_change(hass, "light.bowl", run_callback),
+        async_track_state_change(hass, ["light.bowl", "light.ceiling"], run_callback),
+    ]
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS][MATCH_ALL]) == 1
+    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS]["light.bowl"]) == 2
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+    assert runs == ["light.bowl", "light.bowl", "light.bowl"]
+
+    hass.states.async_set("switch.kitchen", "off")
+    await hass.async_block_till_done()
+    assert len(runs) == 3
+
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert runs[-1] == "switch.kitchen"
+
+    for unsub in unsubs:
+        unsub()
+
+    assert not hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
 async def test_async_track_state_change_event(hass):
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -728,6 +769,58 @@ async def test_track_template_result_complex(hass):
     assert specific_runs[9].strip() == "['lock.one']"
 
 
+async def test_track_template_result_rate_limit(hass):
+    """Test iterated state changes are coalesced under the rate limit."""
+    refresh_runs = []
+    template_refresh = Template(
+        "{{ states('input_number.direct') }} "
+        "{{ states.sensor | map(attribute='state') | list }}",
+        hass,
+    )
+
+    def refresh_listener(event, template, old_result, new_result):
+        refresh_runs.append(new_result)
+
+    info = async_track_template_result(
+        hass, template_refresh, refresh_listener, rate_limit=timedelta(seconds=5)
+    )
+    await hass.async_block_till_done()
+    assert refresh_runs == []
+
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.one", "2")
+    hass.states.async_set("sensor.two", "3")
+    await hass.async_block_till_done()
+    assert refresh_runs == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await hass.async_block_till_done()
+    assert len(refresh_runs) == 1
+    assert refresh_runs[0] == "unknown ['2', '3']"
+
+    # Directly referenced entities are not rate limited
+    hass.states.async_set("input_number.direct", "7")
+    await hass.async_block_till_done()
+    assert len(refresh_runs) == 2
+    assert refresh_runs[1] == "7 ['2', '3']"
+
+    hass.states.async_set("sensor.two", "4")
+    await hass.async_block_till_done()
+    assert len(refresh_runs) == 2
+
+    # A manual refresh renders right away and drops the pending render
+    info.async_refresh()
+    await hass.async_block_till_done()
+    assert len(refresh_runs) == 3
+    assert refresh_runs[2] == "7 ['2', '4']"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=12))
+    await hass.async_block_till_done()
+    assert len(refresh_runs) == 3
+
+    info.async_remove()
+
+
 async def test_track_template_result_with_wildcard(hass):
     """Test tracking template with a wildcard."""
     specific_runs = []
@@ -1376,6 +1469,67 @@ async def test_async_track_time_change(hass):
     assert len(wildcard_runs) == 3
 
 
+async def test_track_time_change_shares_timer(hass):
+    """Test trackers due at the same time share a single timer."""
+    runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsub = async_track_utc_time_change(
+            hass, callback(lambda x: runs.append("first")), second=0
+        )
+        async_track_utc_time_change(
+            hass, callback(lambda x: runs.append("second")), minute="/5", second=0
+        )
+
+    assert len(hass.data[TRACK_TIME_SCHEDULER]._timers) == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert runs == ["first", "second"]
+
+    # The trackers are due at different times now
+    assert len(hass.data[TRACK_TIME_SCHEDULER]._timers) == 2
+
+    unsub()
+    assert len(hass.data[TRACK_TIME_SCHEDULER]._timers) == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert runs == ["first", "second", "second"]
+
+
+async def test_cancel_job_due_at_same_time(hass):
+    """Test a job cancelled by a job due at the same time does not run."""
+    runs = []
+    point_in_time = dt_util.utcnow() + timedelta(seconds=10)
+
+    @callback
+    def cancel_second(now):
+        runs.append("first")
+        unsub_second()
+
+    async_track_point_in_utc_time(hass, cancel_second, point_in_time)
+    unsub_second = async_track_point_in_utc_time(
+        hass, callback(lambda now: runs.append("second")), point_in_time
+    )
+
+    async_fire_time_changed(hass, point_in_time)
+    await hass.async_block_till_done()
+    assert runs == ["first"]
+
+
 async def test_periodic_task_minute(hass):
     """Test periodic tasks per minute."""
     specific_runs = []
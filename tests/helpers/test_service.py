@@ -84,6 +84,14 @@ def mock_entities(hass):
     return entities
 
 
+def mock_platform(entities):
+    """Return a mock platform with the entities added in order."""
+    return Mock(
+        entities=entities,
+        entity_order={entity_id: index for index, entity_id in enumerate(entities)},
+    )
+
+
 @pytest.fixture
 def area_mock(hass):
     """Mock including area info."""
@@ -342,7 +350,7 @@ async def test_call_with_required_features(hass, mock_entities):
     test_service_mock = AsyncMock(return_value=None)
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         test_service_mock,
         ha.ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
         required_features=[SUPPORT_A],
@@ -362,7 +370,7 @@ async def test_call_with_both_required_features(hass, mock_entities):
     test_service_mock = AsyncMock(return_value=None)
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         test_service_mock,
         ha.ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
         required_features=[SUPPORT_A | SUPPORT_B],
@@ -379,7 +387,7 @@ async def test_call_with_one_of_required_features(hass, mock_entities):
     test_service_mock = AsyncMock(return_value=None)
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         test_service_mock,
         ha.ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
         required_features=[SUPPORT_A, SUPPORT_C],
@@ -400,7 +408,7 @@ async def test_call_with_sync_func(hass, mock_entities):
     test_service_mock = Mock(return_value=None)
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         test_service_mock,
         ha.ServiceCall("test_domain", "test_service", {"entity_id": "light.kitchen"}),
     )
@@ -412,7 +420,7 @@ async def test_call_with_sync_attr(hass, mock_entities):
     mock_method = mock_entities["light.kitchen"].sync_method = Mock(return_value=None)
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         "sync_method",
         ha.ServiceCall(
             "test_domain",
@@ -454,7 +462,7 @@ async def test_call_context_target_all(hass, mock_handle_entity_call, mock_entit
     ):
         await service.entity_service_call(
             hass,
-            [Mock(entities=mock_entities)],
+            [mock_platform(mock_entities)],
             Mock(),
             ha.ServiceCall(
                 "test_domain",
@@ -482,7 +490,7 @@ async def test_call_context_target_specific(
     ):
         await service.entity_service_call(
             hass,
-            [Mock(entities=mock_entities)],
+            [mock_platform(mock_entities)],
             Mock(),
             ha.ServiceCall(
                 "test_domain",
@@ -507,7 +515,7 @@ async def test_call_context_target_specific_no_auth(
         ):
             await service.entity_service_call(
                 hass,
-                [Mock(entities=mock_entities)],
+                [mock_platform(mock_entities)],
                 Mock(),
                 ha.ServiceCall(
                     "test_domain",
@@ -525,7 +533,7 @@ async def test_call_no_context_target_all(hass, mock_handle_entity_call, mock_en
     """Check we target all if no user context given."""
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         Mock(),
         ha.ServiceCall(
             "test_domain", "test_service", data={"entity_id": ENTITY_MATCH_ALL}
@@ -544,7 +552,7 @@ async def test_call_no_context_target_specific(
     """Check we can target specified entities."""
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         Mock(),
         ha.ServiceCall(
             "test_domain",
@@ -557,13 +565,35 @@ async def test_call_no_context_target_specific(
     assert mock_handle_entity_call.mock_calls[0][1][1].entity_id == "light.kitchen"
 
 
+async def test_call_target_specific_in_entity_order(
+    hass, mock_handle_entity_call, mock_entities
+):
+    """Check targeted entities are called in the order they were added."""
+    await service.entity_service_call(
+        hass,
+        [mock_platform(mock_entities)],
+        Mock(),
+        ha.ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.bathroom", "light.bedroom", "light.kitchen"]},
+        ),
+    )
+
+    assert [call[1][1].entity_id for call in mock_handle_entity_call.mock_calls] == [
+        "light.kitchen",
+        "light.bedroom",
+        "light.bathroom",
+    ]
+
+
 async def test_call_with_match_all(
     hass, mock_handle_entity_call, mock_entities, caplog
 ):
     """Check we only target allowed entities if targeting all."""
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         Mock(),
         ha.ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
     )
@@ -578,7 +608,7 @@ async def test_call_with_omit_entity_id(hass, mock_handle_entity_call, mock_enti
     """Check service call if we do not pass an entity ID."""
     await service.entity_service_call(
         hass,
-        [Mock(entities=mock_entities)],
+        [mock_platform(mock_entities)],
         Mock(),
         ha.ServiceCall("test_domain", "test_service"),
     )
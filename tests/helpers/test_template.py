@@ -1,5 +1,6 @@
 """Test Home Assistant template helper methods."""
 from datetime import datetime
+import logging
 import math
 import random
 
@@ -2230,27 +2231,79 @@ def test_urlencode(hass):
 
 
 async def test_cache_garbage_collection():
-    """Test caching a template."""
+    """Test compiled code outlives the templates using it."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
+    # pylint: disable=protected-access
+    key = (template.TemplateEnvironment, False, template_string)
     tpl = template.Template((template_string),)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template._COMPILED_CODE_CACHE.get(key)
 
     tpl2 = template.Template((template_string),)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert tpl2._compiled_code is tpl._compiled_code
 
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert template._COMPILED_CODE_CACHE.get(key)
+
+
+async def test_compiled_cache_shared(hass):
+    """Test templates with the same source share the compiled template."""
+    template_string = "{{ value_json.temperature }} compiled cache"
+    template._COMPILED_CODE_CACHE.clear()  # pylint: disable=protected-access
+
+    tpl = template.Template(template_string, hass)
+    tpl2 = template.Template(template_string, hass)
+
+    assert tpl.async_render_with_possible_json_value('{"temperature": 20}') == (
+        "20 compiled cache"
+    )
+    assert tpl2.async_render_with_possible_json_value('{"temperature": 21}') == (
+        "21 compiled cache"
+    )
+    # pylint: disable=protected-access
+    assert tpl._compiled is tpl2._compiled
+
+    info = template.compiled_cache_info()
+    assert info["misses"] == 1
+    assert info["hits"] == 1
+    assert info["size"] == 1
+
+
+async def test_compiled_cache_per_environment(hass):
+    """Test code compiled with hass filters is not used without hass."""
+    template._COMPILED_CODE_CACHE.clear()  # pylint: disable=protected-access
+    template_string = "{{ 'light.kitchen' | expand | list }}"
+
+    assert template.Template(template_string, hass).async_render() == "[]"
+
+    with pytest.raises(TemplateError):
+        template.Template(template_string).ensure_valid()
+
+
+async def test_compiled_cache_lru():
+    """Test the compiled code cache evicts the least recently used code."""
+    cache = template._CompiledCodeCache(2)  # pylint: disable=protected-access
+    cache.set("one", 1)
+    cache.set("two", 2)
+    assert cache.get("one") == 1
+    cache.set("three", 3)
+
+    assert cache.get("two") is None
+    assert cache.get("one") == 1
+    assert cache.get("three") == 3
+    assert cache.info() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
+
+
+async def test_compiled_cache_logs_counters(caplog):
+    """Test the compiled code cache logs its counters every maxsize compiles."""
+    caplog.set_level(logging.DEBUG, logger="homeassistant.helpers.template")
+    cache = template._CompiledCodeCache(2)  # pylint: disable=protected-access
+    for key in ("one", "two"):
+        assert cache.get(key) is None
+        cache.set(key, key)
+
+    assert "Compiled template cache: {'hits': 0, 'misses': 2" in caplog.text
@@ -7,7 +7,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
@@ -242,6 +242,33 @@ async def test_setup_after_deps_via_platform(hass):
     assert order == ["after_dep_of_platform_int", "platform_int"]
 
 
+async def test_preimport_integrations(hass):
+    """Test integrations and their configured platforms are imported up front."""
+    mock_integration(hass, MockModule(domain="platform_int"))
+    integration = await loader.async_get_integration(hass, "light")
+
+    with patch(
+        "homeassistant.bootstrap._import_modules", return_value=0.5
+    ) as mock_import:
+        await bootstrap._async_preimport_integrations(
+            hass,
+            {"light": integration},
+            {"light": [{"platform": "platform_int"}, {"platform": "not_exist"}]},
+        )
+
+    assert sorted(call[1][0] for call in mock_import.mock_calls) == [
+        ["homeassistant.components.light"],
+        [
+            "homeassistant.components.platform_int",
+            "homeassistant.components.platform_int.light",
+        ],
+    ]
+    assert hass.data[bootstrap.DATA_IMPORT_TIMES] == {
+        "light": 0.5,
+        "platform_int": 0.5,
+    }
+
+
 async def test_setup_after_deps_not_trigger_load(hass):
     """Test after_dependencies does not trigger loading it."""
     order = []
@@ -456,6 +456,108 @@ class TestEventBus(unittest.TestCase):
         assert len(coroutine_calls) == 1
 
 
+async def test_eventbus_filtered_listener(hass):
+    """Test a listener only receives events passing its filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def event_filter(event):
+        """Mock filter."""
+        return not event.data["filtered"]
+
+    unsub = hass.bus.async_listen("test", listener, event_filter=event_filter)
+
+    hass.bus.async_fire("test", {"filtered": True})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"filtered": False})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub()
+
+
+async def test_eventbus_filter_exception(hass, caplog):
+    """Test an event filter raising does not break dispatch."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def bad_filter(event):
+        """Mock filter that raises."""
+        raise ValueError("bad filter")
+
+    hass.bus.async_listen("test", listener, event_filter=bad_filter)
+    hass.bus.async_listen("test", listener)
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "Error in event filter" in caplog.text
+
+
+async def test_eventbus_match_cache_invalidated(hass):
+    """Test listeners added after a fire are picked up by the next fire."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.event_type)
+
+    hass.bus.async_fire("test")
+    unsub_all = hass.bus.async_listen(MATCH_ALL, listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["test"]
+
+    unsub_test = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["test", "test", "test"]
+
+    unsub_all()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert calls == ["test", "test", "test", "test"]
+
+    unsub_test()
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+
+
+async def test_eventbus_listen_once_removed(hass):
+    """Test listen_once listeners are removed from the bus after firing."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_once("test", listener)
+    assert hass.bus.async_listeners()["test"] == 1
+
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert "test" not in hass.bus.async_listeners()
+
+    # Removing it again is a no-op
+    unsub()
+
+
 def test_state_init():
     """Test state.init."""
     with pytest.raises(InvalidEntityFormatError):
@@ -991,6 +1093,7 @@ async def test_bad_timezone_raises_value_error(hass):
 def test_create_timer(mock_monotonic, loop):
     """Test create timer."""
     hass = MagicMock()
+    hass.bus._listeners = {EVENT_TIME_CHANGED: [None]}
     funcs = []
     orig_callback = ha.callback
 
@@ -1006,8 +1109,8 @@ def test_create_timer(mock_monotonic, loop):
     ):
         ha._async_create_timer(hass)
 
-    assert len(funcs) == 2
-    fire_time_event, stop_timer = funcs
+    assert len(funcs) == 3
+    fire_time_event, _, stop_timer = funcs
 
     assert len(hass.loop.call_later.mock_calls) == 1
     delay, callback, target = hass.loop.call_later.mock_calls[0][1]
@@ -1043,6 +1146,7 @@ def test_create_timer(mock_monotonic, loop):
 def test_timer_out_of_sync(mock_monotonic, loop):
     """Test create timer."""
     hass = MagicMock()
+    hass.bus._listeners = {EVENT_TIME_CHANGED: [None]}
     funcs = []
     orig_callback = ha.callback
 
@@ -1081,8 +1185,8 @@ def test_timer_out_of_sync(mock_monotonic, loop):
 
         assert event_context_0 == event_context_1
 
-        assert len(funcs) == 2
-        fire_time_event, _ = funcs
+        assert len(funcs) == 3
+        fire_time_event, _, _ = funcs
 
     assert len(hass.loop.call_later.mock_calls) == 2
 
@@ -1092,6 +1196,37 @@ def test_timer_out_of_sync(mock_monotonic, loop):
     assert abs(target - 14.2) < 0.001
 
 
+async def test_timer_ticks_while_listened_to(hass):
+    """Test the timer only ticks while there are time changed listeners."""
+    with patch.object(hass.loop, "call_later") as mock_call_later:
+        ha._async_create_timer(hass)
+        assert len(mock_call_later.mock_calls) == 1
+
+        _, fire_time_event, target = mock_call_later.mock_calls[0][1]
+        fire_time_event(target)
+        assert len(mock_call_later.mock_calls) == 1
+
+        unsub = hass.bus.async_listen(EVENT_TIME_CHANGED, lambda event: None)
+        assert len(mock_call_later.mock_calls) == 2
+
+        hass.bus.async_listen(EVENT_TIME_CHANGED, lambda event: None)()
+        assert len(mock_call_later.mock_calls) == 2
+
+        _, fire_time_event, target = mock_call_later.mock_calls[1][1]
+        fire_time_event(target)
+        assert len(mock_call_later.mock_calls) == 3
+
+        unsub()
+        _, fire_time_event, target = mock_call_later.mock_calls[2][1]
+        fire_time_event(target)
+        assert len(mock_call_later.mock_calls) == 3
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        hass.bus.async_listen(EVENT_TIME_CHANGED, lambda event: None)
+        assert len(mock_call_later.mock_calls) == 3
+
+
 async def test_hass_start_starts_the_timer(loop):
     """Test when hass starts, it starts the timer."""
     hass = ha.HomeAssistant()
@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+import json
+
 import pytest
 
 from homeassistant.components import http, hue
@@ -142,6 +144,23 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_index(hass):
+    """Test built-in integrations are resolved without reading their manifest."""
+    with patch(
+        "homeassistant.loader.Integration.resolve_from_root"
+    ) as mock_resolve_from_root:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve_from_root.called
+    assert integration.pkg_path == "homeassistant.components.hue"
+    assert integration.file_path.name == "hue"
+    assert integration.is_built_in
+    assert integration.manifest == {
+        **json.loads((integration.file_path / "manifest.json").read_text()),
+        "is_built_in": True,
+    }
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -6,6 +6,8 @@ import pytest
 from homeassistant import loader, setup
 from homeassistant.requirements import (
     CONSTRAINT_FILE,
+    DATA_INSTALLED_REQS,
+    STORAGE_KEY,
     RequirementsNotFound,
     async_get_integration_with_requirements,
     async_process_requirements,
@@ -91,6 +93,75 @@ async def test_install_missing_package(hass):
     assert len(mock_inst.mock_calls) == 1
 
 
+async def test_installed_requirements_persisted(hass, hass_storage):
+    """Test satisfied requirements are not checked again after a restart."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"fingerprint": {"site": 1}, "requirements": ["hello==1.0.0"]},
+    }
+
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value={"site": 1},
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(
+            hass, "test_component", ["hello==1.0.0", "world==1.0.0"]
+        )
+
+    assert [mock_call[1][0] for mock_call in mock_is_installed.mock_calls] == [
+        "world==1.0.0"
+    ]
+    assert hass.data[DATA_INSTALLED_REQS].requirements == {
+        "hello==1.0.0",
+        "world==1.0.0",
+    }
+
+    # The installed distributions changed since the requirements were stored
+    hass.data.pop(DATA_INSTALLED_REQS)
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value={"site": 2},
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+
+
+async def test_install_missing_packages_batched(hass):
+    """Test missing requirements are installed with a single pip run."""
+    with patch("homeassistant.util.package.is_installed", return_value=False), patch(
+        "homeassistant.util.package.install_packages", return_value=True
+    ) as mock_inst_batch, patch(
+        "homeassistant.util.package.install_package"
+    ) as mock_inst:
+        await async_process_requirements(
+            hass, "test_component", ["hello==1.0.0", "world==1.0.0"]
+        )
+
+    assert len(mock_inst_batch.mock_calls) == 1
+    assert mock_inst_batch.mock_calls[0][1][0] == ["hello==1.0.0", "world==1.0.0"]
+    assert len(mock_inst.mock_calls) == 0
+
+
+async def test_install_missing_packages_batch_fails(hass):
+    """Test the failing requirement is found when the batched install fails."""
+    with patch("homeassistant.util.package.is_installed", return_value=False), patch(
+        "homeassistant.util.package.install_packages", return_value=False
+    ), patch(
+        "homeassistant.util.package.install_package", side_effect=[True, False]
+    ) as mock_inst:
+        with pytest.raises(RequirementsNotFound) as err:
+            await async_process_requirements(
+                hass, "test_component", ["hello==1.0.0", "world==1.0.0"]
+            )
+
+    assert err.value.requirements == ["world==1.0.0"]
+    assert len(mock_inst.mock_calls) == 2
+
+
 async def test_get_integration_with_requirements(hass):
     """Check getting an integration with loaded requirements."""
     hass.config.skip_pip = False
@@ -595,3 +595,60 @@ async def test_integration_disabled(hass, caplog):
     result = await setup.async_setup_component(hass, "test_component1", {})
     assert not result
     assert disabled_reason in caplog.text
+
+
+async def test_setup_report(hass):
+    """Test the setup phases and the critical path are recorded."""
+    mock_integration(hass, MockModule("comp2"))
+    mock_integration(hass, MockModule("comp1", dependencies=["comp2"]))
+
+    assert await setup.async_setup_component(hass, "comp1", {})
+
+    report = setup.async_get_setup_report(hass)
+    assert report["critical_path"] == ["comp2", "comp1"]
+
+    comp1 = report["integrations"]["comp1"]
+    assert comp1["waited_on"] == ["comp2"]
+    assert set(comp1["phases"]) == {
+        setup.PHASE_DEPENDENCIES,
+        setup.PHASE_IMPORT,
+        setup.PHASE_CONFIG,
+        setup.PHASE_SETUP,
+        setup.PHASE_CONFIG_ENTRIES,
+    }
+    comp2 = report["integrations"]["comp2"]
+    assert comp2["waited_on"] == []
+    assert comp1["started"] <= comp2["started"] <= comp2["finished"]
+    assert comp2["finished"] <= comp1["finished"]
+
+
+async def test_setup_report_wall_time(hass):
+    """Test nested and parallel phases are counted once."""
+    with patch("homeassistant.setup.timer", side_effect=[0, 1, 2, 3, 5, 6, 8, 9, 10]):
+        with setup.async_track_setup_phase(hass, "comp", setup.PHASE_CONFIG_ENTRIES):
+            with setup.async_track_setup_phase(hass, "comp", setup.PHASE_PLATFORMS):
+                with setup.async_track_setup_phase(hass, "comp", setup.PHASE_PLATFORMS):
+                    pass
+        with setup.async_track_setup_phase(hass, "comp", setup.PHASE_DEPENDENCIES):
+            pass
+
+    comp = setup.async_get_setup_report(hass)["integrations"]["comp"]
+    assert comp["phases"] == {
+        setup.PHASE_CONFIG_ENTRIES: 7,
+        setup.PHASE_PLATFORMS: 4,
+        setup.PHASE_DEPENDENCIES: 1,
+    }
+    assert comp["busy"] == 7
+
+
+async def test_freeze_setup_report(hass):
+    """Test the setup report does not change once frozen."""
+    mock_integration(hass, MockModule("comp1"))
+    mock_integration(hass, MockModule("comp2"))
+
+    assert await setup.async_setup_component(hass, "comp1", {})
+    report = setup.async_freeze_setup_report(hass)
+
+    assert await setup.async_setup_component(hass, "comp2", {})
+    assert setup.async_get_setup_report(hass) == report
+    assert "comp2" not in report["integrations"]
@@ -99,6 +99,39 @@ def test_install(mock_sys, mock_popen, mock_env_copy, mock_venv):
     assert mock_popen.return_value.communicate.call_count == 1
 
 
+def test_install_packages(mock_sys, mock_popen, mock_env_copy, mock_venv):
+    """Test installing several packages with a single pip run."""
+    env = mock_env_copy()
+    assert package.install_packages([TEST_NEW_REQ, "hello==1.0.0"], False)
+    assert mock_popen.call_count == 1
+    assert mock_popen.call_args == call(
+        [
+            mock_sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--quiet",
+            TEST_NEW_REQ,
+            "hello==1.0.0",
+        ],
+        stdin=PIPE,
+        stdout=PIPE,
+        stderr=PIPE,
+        env=env,
+    )
+
+
+def test_environment_fingerprint(tmp_path):
+    """Test the fingerprint changes when a distribution is installed."""
+    with patch("homeassistant.util.package.sys.path", [str(tmp_path), "/missing"]):
+        before = package.environment_fingerprint()
+        assert list(before) == [str(tmp_path)]
+
+        os.utime(tmp_path, ns=(0, 0))
+        (tmp_path / "hello-1.0.0.dist-info").mkdir()
+        assert package.environment_fingerprint() != before
+
+
 def test_install_upgrade(mock_sys, mock_popen, mock_env_copy, mock_venv):
     """Test an upgrade attempt on a package."""
     env = mock_env_copy()
@@ -0,0 +1,130 @@
+"""Test Home Assistant rolling window statistics."""
+from datetime import datetime, timedelta
+import statistics
+
+import pytest
+
+from homeassistant.util.rolling import RollingWindow
+
+START = datetime(2020, 10, 1, 12, 0, 0)
+VALUES = [17, 20, 15.2, 5, 3.8, 9.2, 6.7, 14, 6]
+
+
+def _fill(window, values):
+    """Add values to a window one minute apart."""
+    for idx, value in enumerate(values):
+        window.add(value, START + timedelta(minutes=idx))
+
+
+def _assert_matches(window, values):
+    """Assert the window statistics match a full recompute."""
+    assert len(window) == len(values)
+    assert window.total == pytest.approx(sum(values))
+    assert window.mean == pytest.approx(statistics.mean(values))
+    assert window.median == pytest.approx(statistics.median(values))
+    assert window.min == min(values)
+    assert window.max == max(values)
+    assert window.variance == pytest.approx(statistics.variance(values))
+    assert window.stdev == pytest.approx(statistics.stdev(values))
+
+
+def test_empty_window():
+    """Test an empty window has no statistics."""
+    window = RollingWindow()
+    assert len(window) == 0
+    assert window.total is None
+    assert window.mean is None
+    assert window.median is None
+    assert window.variance is None
+    assert window.stdev is None
+    assert window.min is None
+    assert window.max is None
+    assert window.first is None
+    assert window.last is None
+
+
+def test_single_sample():
+    """Test the variance needs two samples."""
+    window = RollingWindow()
+    window.add(4.0, START)
+    assert window.mean == 4.0
+    assert window.median == 4.0
+    assert window.variance is None
+    assert window.stdev is None
+    assert window.first == window.last == (4.0, START)
+
+
+def test_statistics():
+    """Test the statistics of a window that is not full."""
+    window = RollingWindow(max_samples=20)
+    _fill(window, VALUES)
+    _assert_matches(window, VALUES)
+    assert window.first == (17, START)
+    assert window.last == (6, START + timedelta(minutes=8))
+
+
+def test_max_samples():
+    """Test the oldest samples are evicted when the window is full."""
+    window = RollingWindow(max_samples=4)
+    _fill(window, VALUES)
+    _assert_matches(window, VALUES[-4:])
+    assert window.first == (9.2, START + timedelta(minutes=5))
+
+
+def test_purge():
+    """Test samples older than max_age are purged."""
+    window = RollingWindow(max_age=timedelta(minutes=3))
+    _fill(window, VALUES)
+
+    assert window.purge(START + timedelta(minutes=8)) == 5
+    _assert_matches(window, VALUES[-4:])
+
+    assert window.purge(START + timedelta(hours=1)) == 4
+    assert len(window) == 0
+    assert window.mean is None
+
+    window.add(2.0, START + timedelta(hours=1))
+    assert window.mean == 2.0
+
+
+def test_purge_without_max_age():
+    """Test purge keeps all samples without a max_age."""
+    window = RollingWindow()
+    _fill(window, VALUES)
+    assert window.purge(START + timedelta(days=365)) == 0
+    assert len(window) == len(VALUES)
+
+
+def test_duplicate_values():
+    """Test removing a value that occurs more than once."""
+    window = RollingWindow(max_samples=3)
+    _fill(window, [1, 1, 2, 1, 3])
+    _assert_matches(window, [2, 1, 3])
+
+
+def test_clear():
+    """Test clearing the window."""
+    window = RollingWindow()
+    _fill(window, VALUES)
+    window.clear()
+    assert len(window) == 0
+    _fill(window, VALUES[:2])
+    _assert_matches(window, VALUES[:2])
+
+
+def test_non_finite_value():
+    """Test values that are not finite are rejected."""
+    window = RollingWindow()
+    for value in (float("nan"), float("inf"), float("-inf")):
+        with pytest.raises(ValueError):
+            window.add(value, START)
+    assert len(window) == 0
+
+
+def test_rounding_errors_do_not_add_up():
+    """Test the statistics are recomputed after a large value is evicted."""
+    window = RollingWindow(max_samples=3)
+    _fill(window, [1e16, 1.0, 1.0, 1.0, 1.0])
+    assert window.total == 3.0
+    assert window.mean == 1.0
+    assert window.variance == 0.0
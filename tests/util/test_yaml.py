@@ -461,3 +461,85 @@ def test_duplicate_key(caplog):
     with patch_yaml_files(files):
         load_yaml_config_file(YAML_CONFIG_FILE)
     assert "contains duplicate key" in caplog.text
+
+
+def _touch_later(path):
+    """Move the modification time forward, file systems can be too coarse."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_parse_cache(tmp_path):
+    """Test unchanged files are not parsed again."""
+    (tmp_path / YAML_CONFIG_FILE).write_text(
+        "included: !include included.yaml\npassword: !secret password\n"
+        "named: !include_dir_merge_named named\n"
+    )
+    (tmp_path / "included.yaml").write_text("key: value\n")
+    (tmp_path / "secrets.yaml").write_text("password: pwhome\n")
+    (tmp_path / "named").mkdir()
+    (tmp_path / "named" / "first.yaml").write_text("first: 1\n")
+    config_path = str(tmp_path / YAML_CONFIG_FILE)
+    cache_path = str(tmp_path / ".yaml_cache")
+
+    def load():
+        """Load the configuration as after a restart."""
+        yaml.clear_secret_cache()
+        with patch.dict(yaml_loader._PARSE_CACHES, clear=True), patch.object(
+            yaml_loader, "_load_yaml", wraps=yaml_loader._load_yaml
+        ) as mock_load, yaml.parse_cache(cache_path):
+            config = yaml.load_yaml(config_path)
+        return config, sorted(call[1][0] for call in mock_load.mock_calls)
+
+    config, parsed = load()
+    assert config == {
+        "included": {"key": "value"},
+        "password": "pwhome",
+        "named": {"first": 1},
+    }
+    assert len(parsed) == 4
+
+    # Secrets are stored as references
+    assert "pwhome" not in (tmp_path / ".yaml_cache").read_text()
+
+    # Only the secrets are loaded again
+    cached_config, parsed = load()
+    assert parsed == [str(tmp_path / "secrets.yaml")]
+    assert cached_config == config
+    assert cached_config["included"].__config_file__ == config_path
+    assert cached_config["included"].__line__ == 0
+
+    (tmp_path / "named" / "second.yaml").write_text("second: 2\n")
+    _touch_later(tmp_path / "named")
+    config, parsed = load()
+    assert config["named"] == {"first": 1, "second": 2}
+    assert parsed == [
+        config_path,
+        str(tmp_path / "named" / "second.yaml"),
+        str(tmp_path / "secrets.yaml"),
+    ]
+
+    (tmp_path / "secrets.yaml").write_text("password: changed\n")
+    _touch_later(tmp_path / "secrets.yaml")
+    config, parsed = load()
+    assert config["password"] == "changed"
+    assert parsed == [config_path, str(tmp_path / "secrets.yaml")]
+
+
+@pytest.mark.skipif(
+    yaml_loader.FastSafeLoader is None, reason="PyYAML is built without libyaml"
+)
+def test_fast_loader(tmp_path):
+    """Test libyaml is used once enabled and keeps the file references."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text("key:\n  nested: value\nlist:\n  - item\n")
+
+    with patch.object(yaml_loader, "LOADER", yaml_loader.SafeLineLoader):
+        assert yaml.enable_fast_loader()
+        assert yaml_loader.LOADER is yaml_loader.FastSafeLoader
+        config = yaml.load_yaml(str(config_path))
+
+    assert config == {"key": {"nested": "value"}, "list": ["item"]}
+    assert config["key"].__config_file__ == str(config_path)
+    assert config["key"].__line__ == 1
+    assert config["list"].__line__ == 3